@@ -0,0 +1,190 @@
+"""
+Benchmark the capture path against a fake Roku server.
+
+The fake server runs in a subprocess so the CPU numbers only cover the
+capture side. Every line is stamped with its send time, which gives the
+socket-to-file latency when the writer puts it on disk.
+
+Usage:
+    python benchmarks/bench_capture.py [--lines N] [--burst N] [--rate LINES_PER_S]
+        [--line-length MIN MAX] [--fixture LOG]
+"""
+
+import argparse
+import io
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from roku_psdk_log_instrument.monitor import MonitorConfig, PSDKEventMonitor
+from roku_psdk_log_instrument.telnet import FlushPolicy, RokuTelnetClient, SessionLogWriter
+from roku_psdk_log_instrument.testing import parse_stamp
+
+
+class LatencyProbeWriter(SessionLogWriter):
+    """SessionLogWriter recording socket-to-file latency of stamped lines."""
+
+    def __init__(self, path: Path, policy: Optional[FlushPolicy] = None):
+        super().__init__(path, policy)
+        self.latencies_ns: List[int] = []
+        self._batch_lines: List[str] = []
+
+    def take_pending(self):
+        self._batch_lines = list(self._pending)
+        return super().take_pending()
+
+    def write_batch(self, data: bytes, line_count: int) -> None:
+        super().write_batch(data, line_count)
+        written = time.monotonic_ns()
+        for line in self._batch_lines:
+            sent = parse_stamp(line)
+            if sent is not None:
+                self.latencies_ns.append(written - sent)
+
+
+def start_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, int]:
+    """Start the fake Roku server subprocess and return it with its port."""
+    cmd = [sys.executable, "-m", "roku_psdk_log_instrument.testing",
+           "--port", "0", "--lines", str(args.lines), "--burst", str(args.burst), "--stamp"]
+    if args.rate:
+        cmd += ["--rate", str(args.rate)]
+    if args.line_length:
+        cmd += ["--line-length", *map(str, args.line_length)]
+    if args.fixture:
+        cmd += ["--fixture", str(args.fixture), "--loop"]
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    # First line is "LISTENING host:port"
+    banner = proc.stdout.readline().split()
+    return proc, int(banner[1].rsplit(":", 1)[1])
+
+
+def percentile(values: List[int], pct: float) -> float:
+    """Return the pct-th percentile of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_scenario(args: argparse.Namespace, body: Callable[[RokuTelnetClient], int]) -> Dict:
+    """Connect to a fresh server, run body, and measure rate and CPU."""
+    server, port = start_server(args)
+    client = RokuTelnetClient("127.0.0.1", port)
+    client.connect()
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    lines = body(client)
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+
+    client.disconnect()
+    server.wait(timeout=10)
+    return {
+        "lines": lines,
+        "rate": lines / wall if wall else 0.0,
+        "cpu_ms_per_10k": cpu * 1000 * 10000 / lines if lines else 0.0,
+        "syscalls_per_line": client.stats.syscalls / lines if lines else 0.0,
+    }
+
+
+def read_line_loop(client: RokuTelnetClient) -> int:
+    """Read with read_line() until the server closes."""
+    count = 0
+    while client.read_line(timeout=2.0) is not None:
+        count += 1
+    return count
+
+
+def read_lines_loop(client: RokuTelnetClient) -> int:
+    """Read with read_lines() until the server closes."""
+    count = 0
+    while True:
+        lines = client.read_lines(timeout=2.0)
+        if lines is None:
+            return count
+        count += len(lines)
+
+
+def capture_raw(client: RokuTelnetClient) -> int:
+    """Run capture_logs in raw mode; nothing is decoded."""
+    with tempfile.TemporaryDirectory() as tmp:
+        client.capture_logs(Path(tmp) / "capture.log", raw=True)
+    return client.writer_stats["lines_written"]
+
+
+def capture(probe: List[LatencyProbeWriter], callback=None) -> Callable[[RokuTelnetClient], int]:
+    """Build a capture_logs scenario that records its writer in probe."""
+    def factory(path: Path, policy: Optional[FlushPolicy]) -> LatencyProbeWriter:
+        writer = LatencyProbeWriter(path, policy)
+        probe.append(writer)
+        return writer
+
+    def body(client: RokuTelnetClient) -> int:
+        with tempfile.TemporaryDirectory() as tmp:
+            client.capture_logs(Path(tmp) / "capture.log", callback=callback, writer_factory=factory)
+        return probe[0].lines_written
+
+    return body
+
+
+def main() -> None:
+    """Run the capture benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=200_000, help="Lines sent per scenario")
+    parser.add_argument("--burst", type=int, default=50, help="Lines per server write")
+    parser.add_argument("--rate", type=float, help="Server rate in lines/s (default: unthrottled)")
+    parser.add_argument("--line-length", type=int, nargs=2, metavar=("MIN", "MAX"),
+                        help="Pad lines to a random length in this range")
+    parser.add_argument("--fixture", type=Path, help="Replay a captured log instead of synthetic traffic")
+    args = parser.parse_args()
+
+    # Keep capture_logs' progress output out of the report
+    real_stdout = sys.stdout
+    results = {}
+    latencies = {}
+
+    scenarios = [
+        ("read_line", read_line_loop),
+        ("read_lines", read_lines_loop),
+        ("capture_logs raw", capture_raw),
+    ]
+    for name, body in scenarios:
+        sys.stdout = io.StringIO()
+        try:
+            results[name] = run_scenario(args, body)
+        finally:
+            sys.stdout = real_stdout
+
+    for name, with_monitor in (("capture_logs", False), ("capture_logs+monitor", True)):
+        probe: List[LatencyProbeWriter] = []
+        callback = None
+        if with_monitor:
+            monitor = PSDKEventMonitor(MonitorConfig.load(), stream=io.StringIO(), term_width=160)
+            callback = monitor.process_line
+        sys.stdout = io.StringIO()
+        try:
+            results[name] = run_scenario(args, capture(probe, callback))
+        finally:
+            sys.stdout = real_stdout
+        latencies[name] = probe[0].latencies_ns
+
+    print(f"{args.lines:,} lines, burst {args.burst}, rate {args.rate or 'unthrottled'}")
+    print(f"{'scenario':<22} {'lines/s':>12} {'CPU ms/10k':>11} {'syscalls/line':>14} "
+          f"{'p50 ms':>8} {'p99 ms':>8}")
+    for name, result in results.items():
+        p50 = p99 = ""
+        if name in latencies:
+            p50 = f"{percentile(latencies[name], 50) / 1e6:8.2f}"
+            p99 = f"{percentile(latencies[name], 99) / 1e6:8.2f}"
+        print(f"{name:<22} {result['rate']:12,.0f} {result['cpu_ms_per_10k']:11.1f} "
+              f"{result['syscalls_per_line']:14.3f} {p50:>8} {p99:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare memory and speed of LogEntry and CompactEntry for a parsed log.
+
+Usage:
+    python benchmarks/bench_entries.py [--lines N] [--repeat R]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from roku_psdk_log_instrument.parsers import LogParser
+from roku_psdk_log_instrument.testing import generate_lines
+
+LEVELS = ["INFO"] * 6 + ["DEBUG"] * 3 + ["WARNING", "ERROR"]
+
+
+def write_log(path: Path, count: int) -> None:
+    """Write count timestamped device lines in the default parser layout."""
+    rng = random.Random(42)
+    moment = datetime(2024, 3, 1, 12, 0, 0)
+    with open(path, "w") as f:
+        for line in generate_lines(count):
+            moment += timedelta(microseconds=rng.randint(0, 20_000))
+            stamp = moment.isoformat(sep=" ", timespec="milliseconds")
+            f.write(f"{stamp} [{rng.choice(LEVELS)}] {line}\n")
+
+
+def retained(build: Callable[[], List]) -> Tuple[List, int]:
+    """Build a list and return it with the bytes it keeps allocated."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entries = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return entries, after - before
+
+
+def best_time(run: Callable[[], List], repeat: int) -> float:
+    """Return the fastest of repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the entry benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000, help="Synthetic lines to parse")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per parser; the best is reported")
+    args = parser.parse_args()
+
+    log_parser = LogParser()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "roku.log"
+        write_log(log_file, args.lines)
+
+        def entries() -> List:
+            return log_parser.parse_file(log_file)
+
+        def compact() -> List:
+            return list(log_parser.iter_compact(log_file))
+
+        full, full_bytes = retained(entries)
+        small, compact_bytes = retained(compact)
+        assert [entry.to_entry().message for entry in small] == [entry.message for entry in full]
+        message_bytes = sum(sys.getsizeof(entry.message) for entry in small)
+        del full, small
+
+        full_time = best_time(entries, args.repeat)
+        compact_time = best_time(compact, args.repeat)
+
+    count = args.lines
+    message_size = message_bytes / count
+    full_size = full_bytes / count
+    compact_size = compact_bytes / count
+    print(f"log           : {count:,} lines, {message_size:.0f} bytes of message text per entry")
+    print(f"LogEntry      : {full_size:8,.0f} bytes/entry ({full_size - message_size:,.0f} without the message), "
+          f"{count / full_time:10,.0f} lines/s")
+    print(f"CompactEntry  : {compact_size:8,.0f} bytes/entry ({compact_size - message_size:,.0f} without the message), "
+          f"{count / compact_time:10,.0f} lines/s")
+    print(f"ratio         : {full_size / compact_size:8,.1f}x memory "
+          f"({(full_size - message_size) / (compact_size - message_size):,.1f}x without messages), "
+          f"{full_time / compact_time:,.1f}x speed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark LineFramer against the original bytes-concatenation reader.
+
+Usage:
+    python benchmarks/bench_framing.py [--lines N] [--huge-kb K]
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from roku_psdk_log_instrument.testing import generate_lines
+from roku_psdk_log_instrument.telnet import LineFramer
+
+CHUNK_SIZE = 4096
+
+
+def chunked(data: bytes, size: int = CHUNK_SIZE) -> List[bytes]:
+    """Split data into recv-sized chunks."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def frame_bytes_concat(chunks: List[bytes]) -> int:
+    """Original read_line framing: buffer += data, then split(b'\\n', 1)."""
+    buffer = b""
+    count = 0
+    for data in chunks:
+        buffer += data
+        while b'\n' in buffer:
+            line, buffer = buffer.split(b'\n', 1)
+            line.decode('utf-8', errors='ignore').rstrip()
+            count += 1
+    return count
+
+
+def frame_line_framer(chunks: List[bytes]) -> int:
+    """LineFramer framing with one read_lines() batch per chunk."""
+    framer = LineFramer()
+    count = 0
+    for data in chunks:
+        framer.feed(data)
+        count += len(framer.read_lines())
+    return count
+
+
+def timed(func: Callable[[List[bytes]], int], chunks: List[bytes]) -> float:
+    """Return seconds taken by func(chunks)."""
+    start = time.perf_counter()
+    func(chunks)
+    return time.perf_counter() - start
+
+
+def report(name: str, chunks: List[bytes]) -> None:
+    """Time both framers on the same input and print the comparison."""
+    total = sum(len(c) for c in chunks)
+    old = timed(frame_bytes_concat, chunks)
+    new = timed(frame_line_framer, chunks)
+    print(f"{name}")
+    print(f"  bytes concat : {old * 1000:10.1f} ms  ({total / old / 1e6:8.1f} MB/s)")
+    print(f"  LineFramer   : {new * 1000:10.1f} ms  ({total / new / 1e6:8.1f} MB/s)")
+    print(f"  speedup      : {old / new:10.1f}x")
+
+
+def main() -> None:
+    """Run the framing benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000, help="Lines in the small-line flood")
+    parser.add_argument("--huge-kb", type=int, default=2048, help="Size of the single huge line in KB")
+    args = parser.parse_args()
+
+    flood = ("\n".join(generate_lines(args.lines)) + "\n").encode()
+    report(f"small-line flood ({args.lines:,} lines, {len(flood) / 1e6:.1f} MB)", chunked(flood))
+    # Large reads hold many lines; split(b'\n', 1) re-copies the rest per line
+    report("small-line flood, 256 KB reads", chunked(flood, 256 * 1024))
+
+    huge = b'PSDK:: key playbackBufferingStartEvent value: {"data":"' + b"x" * (args.huge_kb * 1024) + b'"}\n'
+    report(f"single huge line ({args.huge_kb:,} KB)", chunked(huge))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark the Python PSDK monitor engine against monitor_psdk_events.sh.
+
+Usage:
+    python benchmarks/bench_monitor.py [--lines N] [--bash-seconds S]
+"""
+
+import argparse
+import io
+import os
+import signal
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from roku_psdk_log_instrument.testing import generate_lines
+from roku_psdk_log_instrument.monitor import MonitorConfig, PSDKEventMonitor
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BASH_MONITOR = PROJECT_ROOT / "scripts" / "monitor_psdk_events.sh"
+
+
+def bench_python(lines: list) -> float:
+    """Return lines/s processed by the Python monitor engine."""
+    monitor = PSDKEventMonitor(MonitorConfig.load(), stream=io.StringIO(), term_width=160)
+
+    start = time.perf_counter()
+    # Feed in tail-sized batches like follow_file does
+    for i in range(0, len(lines), 1000):
+        monitor.process_lines(lines[i:i + 1000])
+    elapsed = time.perf_counter() - start
+
+    return len(lines) / elapsed
+
+
+def bench_bash(lines: list, seconds: float) -> float:
+    """Return lines/s processed by the bash monitor within a time budget."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "roku.log"
+        out_file = Path(tmp) / "monitor.out"
+        log_file.touch()
+
+        with open(out_file, "w") as out:
+            # New session so tail -f and the read loop die with the script
+            proc = subprocess.Popen(
+                ["bash", str(BASH_MONITOR), str(log_file)],
+                stdout=out,
+                stderr=subprocess.DEVNULL,
+                env={"TERM": "dumb", "PATH": os.environ.get("PATH", "/usr/bin:/bin")},
+                start_new_session=True,
+            )
+            # Config loading forks jq a dozen times; wait for the banner so
+            # tail -f is attached before the burst arrives
+            deadline = time.monotonic() + 15
+            while "MUX Events" not in out_file.read_text(errors="ignore"):
+                if time.monotonic() > deadline:
+                    break
+                time.sleep(0.1)
+            time.sleep(0.5)
+            log_file.write_text("\n".join(lines) + "\n")
+
+            time.sleep(seconds)
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+
+        output = out_file.read_text(errors="ignore")
+
+    # Every progress event renders one row; count rows to find how far bash got
+    progressed = output.count("playbackProgressEvent")
+    total_progress = sum(1 for line in lines if "playbackProgressEvent" in line)
+    processed_lines = len(lines) * progressed / max(total_progress, 1)
+    return processed_lines / seconds
+
+
+def main() -> None:
+    """Run the monitor benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000, help="Synthetic lines to process")
+    parser.add_argument("--bash-seconds", type=float, default=10.0,
+                        help="Time budget for the bash monitor (0 to skip)")
+    args = parser.parse_args()
+
+    lines = list(generate_lines(args.lines))
+    python_rate = bench_python(lines)
+    print(f"python engine : {python_rate:12,.0f} lines/s ({len(lines):,} lines)")
+
+    if args.bash_seconds > 0 and BASH_MONITOR.exists():
+        bash_rate = bench_bash(lines, args.bash_seconds)
+        print(f"bash script   : {bash_rate:12,.0f} lines/s ({args.bash_seconds:.0f}s budget)")
+        if bash_rate:
+            print(f"speedup       : {python_rate / bash_rate:12,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark columnar and parallel parsing against LogParser.parse_file().
+
+Usage:
+    python benchmarks/bench_parser.py [--lines N] [--chunk-kb K] [--workers W] [--repeat R]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+from roku_psdk_log_instrument.parsers import LogParser, ParallelParser, columnar
+from roku_psdk_log_instrument.testing import generate_lines
+
+LEVELS = ["INFO"] * 6 + ["DEBUG"] * 3 + ["WARNING", "ERROR"]
+
+
+def write_log(path: Path, count: int) -> None:
+    """Write count timestamped device lines in the default parser layout."""
+    rng = random.Random(42)
+    moment = datetime(2024, 3, 1, 12, 0, 0)
+    with open(path, "w") as f:
+        for line in generate_lines(count):
+            moment += timedelta(microseconds=rng.randint(0, 20_000))
+            stamp = moment.isoformat(sep=" ", timespec="milliseconds")
+            f.write(f"{stamp} [{rng.choice(LEVELS)}] {line}\n")
+
+
+def best_time(run: Callable[[], int], repeat: int) -> float:
+    """Return the fastest of repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the parser benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=500_000, help="Synthetic lines to parse")
+    parser.add_argument("--chunk-kb", type=int, default=2048, help="Columnar chunk size")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes for the parallel parser")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per parser; the best is reported")
+    args = parser.parse_args()
+
+    log_parser = LogParser()
+    chunk_size = args.chunk_kb * 1024
+    parallel = ParallelParser(log_parser, args.workers, chunk_size)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "roku.log"
+        write_log(log_file, args.lines)
+        size_mb = log_file.stat().st_size / 1e6
+
+        def objects() -> int:
+            return len(log_parser.parse_file(log_file))
+
+        def columns() -> int:
+            return sum(len(batch) for batch in log_parser.iter_columnar(log_file, chunk_size))
+
+        def stats() -> int:
+            return parallel.stats(log_file).entries
+
+        rows = objects()
+        assert columns() == stats() == rows
+
+        object_time = best_time(objects, args.repeat)
+        column_time = best_time(columns, args.repeat)
+        parallel_time = best_time(stats, args.repeat)
+
+    backend = "numpy" if columnar.np is not None else "pure python"
+    print(f"log           : {rows:,} entries, {size_mb:,.0f} MB")
+    print(f"parse_file    : {rows / object_time:12,.0f} lines/s ({object_time:.2f}s)")
+    print(f"iter_columnar : {rows / column_time:12,.0f} lines/s ({column_time:.2f}s, {backend})")
+    print(f"parallel stats: {rows / parallel_time:12,.0f} lines/s ({parallel_time:.2f}s, {args.workers} workers)")
+    print(f"speedup       : {object_time / column_time:12,.1f}x columnar, {object_time / parallel_time:,.1f}x parallel")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark TimestampDecoder against datetime.fromisoformat() for epoch nanoseconds.
+
+Usage:
+    python benchmarks/bench_timestamps.py [--stamps N] [--per-second S] [--repeat R]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from roku_psdk_log_instrument.parsers.timestamps import TimestampDecoder, datetime_ns
+
+
+def make_stamps(count: int, per_second: int) -> List[str]:
+    """Return count millisecond stamps, about per_second of them in each second."""
+    moment = datetime(2024, 3, 1, 12, 0, 0)
+    step = timedelta(seconds=1) / per_second
+    stamps = []
+    for _ in range(count):
+        moment += step
+        stamps.append(moment.isoformat(sep=" ", timespec="milliseconds"))
+    return stamps
+
+
+def best_time(run: Callable[[], int], repeat: int) -> float:
+    """Return the fastest of repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the timestamp benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stamps", type=int, default=500_000, help="Timestamps to decode")
+    parser.add_argument("--per-second", type=int, default=1000, help="Stamps sharing each second")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per decoder; the best is reported")
+    args = parser.parse_args()
+
+    stamps = make_stamps(args.stamps, args.per_second)
+    clocks = [stamp[11:] for stamp in stamps]
+
+    def isoformat() -> List[int]:
+        # The previous per-line path: parse a datetime, then convert it
+        return [datetime_ns(datetime.fromisoformat(stamp.replace(" ", "T"))) for stamp in stamps]
+
+    def decoder() -> List[int]:
+        decode = TimestampDecoder().decode_datetime
+        return [decode(stamp) for stamp in stamps]
+
+    def clock() -> List[int]:
+        decode = TimestampDecoder().decode_clock
+        return [decode(stamp) for stamp in clocks]
+
+    assert isoformat() == decoder()
+
+    iso_time = best_time(isoformat, args.repeat)
+    decoder_time = best_time(decoder, args.repeat)
+    clock_time = best_time(clock, args.repeat)
+
+    count = len(stamps)
+    print(f"stamps        : {count:,}, {args.per_second:,} per second")
+    print(f"fromisoformat : {count / iso_time:12,.0f} stamps/s ({iso_time * 1e9 / count:.0f} ns each)")
+    print(f"decoder       : {count / decoder_time:12,.0f} stamps/s ({decoder_time * 1e9 / count:.0f} ns each)")
+    print(f"clock stamps  : {count / clock_time:12,.0f} stamps/s ({clock_time * 1e9 / count:.0f} ns each)")
+    print(f"speedup       : {iso_time / decoder_time:12,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
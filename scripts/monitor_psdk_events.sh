@@ -1321,7 +1321,7 @@ if [ ${#CUSTOM_PATTERNS[@]} -gt 0 ]; then
 fi
 
 # Monitor the log file and filter for PSDK events
-tail -f "$LOG_FILE" | while IFS= read -r line; do
+tail -F "$LOG_FILE" 2>/dev/null | while IFS= read -r line; do
     # Check for content load start
     if [[ "$line" == *"$CONTENT_LOAD_PATTERN"* ]]; then
         CONTENT_LOAD_ACTIVE=true
@@ -12,6 +12,7 @@ from roku_psdk_log_instrument.validation.validator import LogValidator
 from roku_psdk_log_instrument.parsers.log_parser import LogParser
 from roku_psdk_log_instrument.telnet.client import RokuTelnetClient
 from roku_psdk_log_instrument.telnet.session_manager import SessionManager
+from roku_psdk_log_instrument.monitor.engine import PSDKEventMonitor
 
 __all__ = [
     "LogInstrumenter",
@@ -19,5 +20,6 @@ __all__ = [
     "LogParser",
     "RokuTelnetClient",
     "SessionManager",
+    "PSDKEventMonitor",
 ]
 
@@ -3,15 +3,26 @@ Command-line interface for the Roku PSDK Log Instrumentation tool.
 """
 
 import click
+import json
 import subprocess
 import os
 import sys
 import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from roku_psdk_log_instrument.telnet.client import RokuTelnetClient
 from roku_psdk_log_instrument.telnet.session_manager import SessionManager
+from roku_psdk_log_instrument.telnet.capture_engine import MultiDeviceCaptureEngine
+from roku_psdk_log_instrument.telnet.writers import FlushPolicy, RotationPolicy
+from roku_psdk_log_instrument.telnet.dispatch import LineDispatcher, OverflowPolicy
+from roku_psdk_log_instrument.telnet.reconnect import ReconnectPolicy
+from roku_psdk_log_instrument.telnet.retention import RetentionManager, RetentionPolicy
+from roku_psdk_log_instrument.telnet.log_index import SessionLogIndex, read_hit
+from roku_psdk_log_instrument.monitor.classifier import CUSTOM, ERROR, PSDK, WARNING, LineClassifier
+from roku_psdk_log_instrument.monitor.config import MonitorConfig
+from roku_psdk_log_instrument.validation.online import OnlineValidator
+from roku_psdk_log_instrument.validation.validator import LogValidator, ValidationResult
 
 
 def get_monitor_script_path() -> Optional[Path]:
@@ -61,19 +72,19 @@ def get_config_path() -> Optional[Path]:
     return None
 
 
-def launch_psdk_monitor(log_file_path: str, custom_patterns: tuple = ()) -> Optional[subprocess.Popen]:
+def get_monitor_command(log_file_path: str, custom_patterns: tuple = (), engine: str = "python") -> Optional[str]:
     """
-    Launch a new terminal window to monitor PSDK events.
-    Cross-platform support for macOS, Linux, and Windows.
+    Build the shell command that runs the PSDK monitor on a log file.
     
     Args:
         log_file_path: Path to the log file to monitor
         custom_patterns: Optional tuple of custom filter patterns to match
+        engine: "python" for the in-package monitor, "bash" for monitor_psdk_events.sh
         
     Returns:
-        Subprocess object if successful, None otherwise
+        Shell command string, or None if the bash script cannot be found
     """
-    try:
+    if engine == "bash":
         monitor_script = get_monitor_script_path()
         
         if not monitor_script:
@@ -85,13 +96,37 @@ def launch_psdk_monitor(log_file_path: str, custom_patterns: tuple = ()) -> Opti
         
         # Make script executable
         monitor_script.chmod(0o755)
-        
-        # Build pattern arguments for the script
-        # Format: script log_file [pattern1] [pattern2] ...
-        pattern_args = ' '.join([f"'{p}'" for p in custom_patterns]) if custom_patterns else ''
         script_cmd = f"'{monitor_script}' '{log_file_path}'"
-        if pattern_args:
-            script_cmd = f"{script_cmd} {pattern_args}"
+    else:
+        script_cmd = f"'{sys.executable}' -m roku_psdk_log_instrument.monitor '{log_file_path}'"
+    
+    # Build pattern arguments for the monitor
+    # Format: monitor log_file [pattern1] [pattern2] ...
+    pattern_args = ' '.join([f"'{p}'" for p in custom_patterns]) if custom_patterns else ''
+    if pattern_args:
+        script_cmd = f"{script_cmd} {pattern_args}"
+    
+    return script_cmd
+
+
+def launch_psdk_monitor(log_file_path: str, custom_patterns: tuple = (), engine: str = "python") -> Optional[subprocess.Popen]:
+    """
+    Launch a new terminal window to monitor PSDK events.
+    Cross-platform support for macOS, Linux, and Windows.
+    
+    Args:
+        log_file_path: Path to the log file to monitor
+        custom_patterns: Optional tuple of custom filter patterns to match
+        engine: "python" for the in-package monitor, "bash" for monitor_psdk_events.sh
+        
+    Returns:
+        Subprocess object if successful, None otherwise
+    """
+    try:
+        script_cmd = get_monitor_command(log_file_path, custom_patterns, engine)
+        
+        if not script_cmd:
+            return None
         
         # Detect platform and launch appropriate terminal
         platform = sys.platform
@@ -138,7 +173,13 @@ def launch_psdk_monitor(log_file_path: str, custom_patterns: tuple = ()) -> Opti
             return None
             
         elif platform == "win32":
-            # Windows: Use cmd or PowerShell
+            if engine != "bash":
+                # The Python monitor needs no shell; open it in a new console
+                return subprocess.Popen(
+                    [sys.executable, '-m', 'roku_psdk_log_instrument.monitor', log_file_path, *custom_patterns],
+                    creationflags=subprocess.CREATE_NEW_CONSOLE
+                )
+            
             # Note: The bash script won't work on Windows without WSL or Git Bash
             click.echo("⚠️  Windows is not fully supported. Monitor requires bash.")
             click.echo("   Try running with WSL or Git Bash.")
@@ -155,6 +196,139 @@ def launch_psdk_monitor(log_file_path: str, custom_patterns: tuple = ()) -> Opti
         return None
 
 
+def rotation_policy(rotate_mb: Optional[int], rotate_minutes: Optional[int], compress: bool) -> Optional[RotationPolicy]:
+    """
+    Build a log rotation policy from CLI options.
+    
+    Args:
+        rotate_mb: Segment size limit in megabytes
+        rotate_minutes: Segment age limit in minutes
+        compress: gzip closed segments
+        
+    Returns:
+        RotationPolicy, or None if neither limit is set
+    """
+    if not rotate_mb and not rotate_minutes:
+        return None
+    return RotationPolicy(
+        max_bytes=rotate_mb * 1024 * 1024 if rotate_mb else None,
+        max_age=rotate_minutes * 60 if rotate_minutes else None,
+        compress=compress
+    )
+
+
+def start_retention(session_manager: SessionManager, quota_gb: Optional[float]) -> Optional[RetentionManager]:
+    """
+    Enforce a disk quota on .temp in the background while capturing.
+    
+    Args:
+        session_manager: Session manager of the capture
+        quota_gb: Quota for all sessions in gigabytes (None to disable)
+        
+    Returns:
+        Running RetentionManager, or None if no quota is set
+    """
+    if not quota_gb:
+        return None
+    retention = RetentionManager(session_manager, RetentionPolicy(max_bytes=int(quota_gb * 1024 ** 3)))
+    retention.start()
+    return retention
+
+
+def format_size(size: int) -> str:
+    """
+    Format a byte count for display.
+    
+    Args:
+        size: Number of bytes
+        
+    Returns:
+        Human readable size, e.g. "1.5 GB"
+    """
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def report_recovered(sessions: List[Dict]) -> None:
+    """
+    Report sessions closed by SessionManager.recover_orphaned_sessions().
+    
+    Args:
+        sessions: Recovered session dictionaries
+    """
+    for session in sessions:
+        click.echo(
+            f"⚠️  Session {session['session_id']} was interrupted; "
+            f"closed from its last checkpoint ({session.get('line_count', 0)} lines)"
+        )
+
+
+def stop_dispatcher(dispatcher: Optional[LineDispatcher]) -> None:
+    """
+    Drain and stop a display dispatcher, reporting lines it had to skip.
+    
+    Args:
+        dispatcher: Dispatcher to stop (ignored if None)
+    """
+    if dispatcher is None:
+        return
+    
+    dispatcher.stop()
+    if dispatcher.dropped or dispatcher.coalesced:
+        click.echo(
+            f"⚠️  Display skipped {dispatcher.dropped + dispatcher.coalesced} line(s) "
+            f"(dropped: {dispatcher.dropped}, coalesced: {dispatcher.coalesced}); "
+            "all lines are in the log file"
+        )
+
+
+def echo_session_result(result: ValidationResult) -> None:
+    """
+    Print the verdict of one playback session with its errors and warnings.
+    
+    Args:
+        result: Session result from LogValidator or OnlineValidator
+    """
+    mark = "✓" if result.is_valid else "✗"
+    color = "green" if result.is_valid else "red"
+    click.echo(click.style(
+        f"{mark} Session #{result.session_number} {result.session_id} "
+        f"(lines {result.first_line}-{result.last_line}, {result.event_count} events): "
+        f"{result.valid_entries}/{result.total_entries} checks passed",
+        fg=color
+    ))
+    for error in result.errors:
+        click.echo(click.style(f"    ✗ {error}", fg="red"))
+    for warning in result.warnings:
+        click.echo(click.style(f"    ⚠️  {warning}", fg="yellow"))
+
+
+def stop_live_validation(dispatcher: Optional[LineDispatcher], online: Optional[OnlineValidator]) -> None:
+    """
+    Validate the lines still queued, report the open session and print the validation cost.
+    
+    Args:
+        dispatcher: Dispatcher feeding the online validator (ignored if None)
+        online: Online validator of the capture
+    """
+    if dispatcher is None or online is None:
+        return
+    
+    dispatcher.stop()
+    for result in online.finish():
+        echo_session_result(result)
+    stats = online.stats()
+    click.echo(
+        f"✓ Live validation: {stats['sessions']} session(s), {stats['invalid']} invalid; "
+        f"{stats['lines']} lines at {stats['mean_line_ns'] / 1000:.1f} µs/line "
+        f"(max {stats['max_line_ns'] / 1000:.1f} µs)"
+    )
+    if stats["skipped"]:
+        click.echo(f"⚠️  Validation skipped {stats['skipped']} line(s) it could not keep up with")
+
+
 @click.group()
 @click.version_option(version="0.1.0")
 def main() -> None:
@@ -174,18 +348,32 @@ def telnet() -> None:
 @click.option("--duration", "-d", type=int, help="Maximum capture duration in seconds")
 @click.option("--description", help="Session description")
 @click.option("--show/--no-show", default=True, help="Show logs in terminal while capturing (default: show)")
-def capture(host: str, port: int, duration: Optional[int], description: Optional[str], show: bool) -> None:
+@click.option("--flush-ms", default=100, help="Maximum delay before captured lines reach the log file (default: 100)")
+@click.option("--fsync", is_flag=True, help="fsync the log file when the capture ends")
+@click.option("--display-queue", default=LineDispatcher.DEFAULT_CAPACITY, help="Lines buffered for the terminal display (default: 10000)")
+@click.option("--display-policy", type=click.Choice(OverflowPolicy.ALL), default=OverflowPolicy.DROP_OLDEST, help="What to do with display lines when the terminal falls behind (log file is never affected)")
+@click.option("--reconnect/--no-reconnect", default=True, help="Reconnect with backoff when the device drops the connection (default: on)")
+@click.option("--raw", is_flag=True, help="Save the exact bytes sent by the device; lines are only decoded for display")
+@click.option("--rotate-mb", type=int, help="Start a new log segment when the current one reaches this size")
+@click.option("--rotate-minutes", type=int, help="Start a new log segment after this many minutes")
+@click.option("--compress/--no-compress", default=True, help="gzip closed log segments in the background (default: on)")
+@click.option("--quota-gb", type=float, help="Delete the oldest finished sessions in the background to keep .temp under this size")
+def capture(host: str, port: int, duration: Optional[int], description: Optional[str], show: bool, flush_ms: int, fsync: bool, display_queue: int, display_policy: str, reconnect: bool, raw: bool, rotate_mb: Optional[int], rotate_minutes: Optional[int], compress: bool, quota_gb: Optional[float]) -> None:
     """
     Capture logs from Roku device via telnet.
     
     HOST is the IP address or hostname of the Roku device.
     
     By default, logs are displayed in the terminal AND saved to .temp folder.
-    Use --no-show to only save without displaying.
+    Use --no-show to only save without displaying. With --raw --no-show
+    nothing is decoded at all.
     """
     session_manager = SessionManager()
     client = RokuTelnetClient(host, port)
     session = None
+    checkpoint = None
+    retention = None
+    dispatcher = None
     interrupted = False
     
     try:
@@ -217,6 +405,9 @@ def capture(host: str, port: int, duration: Optional[int], description: Optional
         # Create session
         session = session_manager.create_session(host, port, description)
         log_file = session_manager.get_session_log_path(session)
+        # Line count and event counters reach session_info.json while capturing
+        checkpoint = session_manager.create_checkpoint(session)
+        retention = start_retention(session_manager, quota_gb)
         
         click.echo(f"\n✓ Session created: {session['session_id']}")
         click.echo(f"✓ Telnet connection established")
@@ -227,18 +418,34 @@ def capture(host: str, port: int, duration: Optional[int], description: Optional
         
         # Create callback to display logs if show is enabled
         def display_callback(line: str):
-            if show:
-                # Highlight PSDK logs in yellow, everything else in white
-                if 'PSDK::' in line:
-                    click.echo(click.style(line, fg='yellow'))
-                else:
-                    click.echo(line)
+            # Highlight PSDK logs in yellow, everything else in white
+            if 'PSDK::' in line:
+                click.echo(click.style(line, fg='yellow'))
+            else:
+                click.echo(line)
+        
+        # Display runs on its own thread so a slow terminal never stalls socket reads
+        if show:
+            dispatcher = LineDispatcher(display_callback, display_queue, display_policy)
+            dispatcher.start()
         
         # Capture logs with callback
-        client.capture_logs(log_file, callback=display_callback, max_duration=duration)
+        flush_policy = FlushPolicy(max_interval=flush_ms / 1000, fsync_on_close=fsync)
+        client.capture_logs(
+            log_file,
+            callback=dispatcher.put if dispatcher else None,
+            max_duration=duration,
+            flush_policy=flush_policy,
+            reconnect=ReconnectPolicy() if reconnect else None,
+            on_gap=lambda gap: session_manager.record_gap(session, gap),
+            raw=raw,
+            rotation=rotation_policy(rotate_mb, rotate_minutes, compress),
+            on_segment=lambda segment: session_manager.record_segment(session, segment),
+            checkpoint=checkpoint
+        )
         
         # End session
-        session_manager.end_session(session)
+        session_manager.end_session(session, checkpoint.line_count)
         
     except KeyboardInterrupt:
         interrupted = True
@@ -248,10 +455,13 @@ def capture(host: str, port: int, duration: Optional[int], description: Optional
         
         # End session first
         if session:
-            session_manager.end_session(session)
+            session_manager.end_session(session, checkpoint.line_count if checkpoint else None)
     
     finally:
         client.disconnect()
+        stop_dispatcher(dispatcher)
+        if retention:
+            retention.stop()
         
         # Prompt for deletion if interrupted and session exists
         if interrupted and session:
@@ -263,6 +473,70 @@ def capture(host: str, port: int, duration: Optional[int], description: Optional
                 click.echo("✓ Logs deleted")
 
 
+@telnet.command("capture-multi")
+@click.argument("hosts", nargs=-1, required=True)
+@click.option("--port", "-p", default=8085, help="Telnet port (default: 8085)")
+@click.option("--duration", "-d", type=int, help="Maximum capture duration in seconds")
+@click.option("--description", help="Session description")
+@click.option("--show/--no-show", default=False, help="Show logs in terminal while capturing (default: hide)")
+@click.option("--display-queue", default=LineDispatcher.DEFAULT_CAPACITY, help="Lines buffered for the terminal display (default: 10000)")
+@click.option("--display-policy", type=click.Choice(OverflowPolicy.ALL), default=OverflowPolicy.DROP_OLDEST, help="What to do with display lines when the terminal falls behind (log files are never affected)")
+@click.option("--rotate-mb", type=int, help="Start a new log segment when the current one reaches this size")
+@click.option("--rotate-minutes", type=int, help="Start a new log segment after this many minutes")
+@click.option("--compress/--no-compress", default=True, help="gzip closed log segments in the background (default: on)")
+@click.option("--quota-gb", type=float, help="Delete the oldest finished sessions in the background to keep .temp under this size")
+def capture_multi(hosts: tuple, port: int, duration: Optional[int], description: Optional[str], show: bool, display_queue: int, display_policy: str, rotate_mb: Optional[int], rotate_minutes: Optional[int], compress: bool, quota_gb: Optional[float]) -> None:
+    """
+    Capture logs from several Roku devices at once.
+    
+    HOSTS are the IP addresses or hostnames of the Roku devices. All
+    devices are captured from a single thread, each into its own session.
+    """
+    def display_callback(device: str, line: str):
+        prefix = click.style(f"[{device}]", fg='cyan')
+        if 'PSDK::' in line:
+            click.echo(f"{prefix} {click.style(line, fg='yellow')}")
+        else:
+            click.echo(f"{prefix} {line}")
+    
+    dispatcher = None
+    if show:
+        dispatcher = LineDispatcher(lambda item: display_callback(*item), display_queue, display_policy)
+        dispatcher.start()
+    
+    retention = None
+    engine = MultiDeviceCaptureEngine(
+        callback=(lambda device, line: dispatcher.put((device, line))) if dispatcher else None,
+        rotation=rotation_policy(rotate_mb, rotate_minutes, compress)
+    )
+    
+    try:
+        for host in hosts:
+            try:
+                session = engine.add_device(host, port, description)
+            except ValueError as e:
+                click.echo(f"⚠️  {e}, skipping")
+                continue
+            if session:
+                click.echo(f"✓ {host}:{port} -> session {session['session_id']}")
+            else:
+                click.echo(f"✗ Skipping {host}:{port}")
+        
+        if not engine.devices:
+            click.echo("\n✗ No devices connected")
+            return
+        
+        click.echo(f"\nCapturing from {len(engine.devices)} device(s). Press Ctrl+C to stop...\n")
+        retention = start_retention(engine.session_manager, quota_gb)
+        counts = engine.run(max_duration=duration)
+        click.echo(f"\n✓ Captured {sum(counts.values())} log lines from {len(counts)} device(s)")
+    finally:
+        engine.close()
+        stop_dispatcher(dispatcher)
+        if retention:
+            retention.stop()
+
+
 @telnet.command()
 @click.argument("host")
 @click.option("--port", "-p", default=8085, help="Telnet port (default: 8085)")
@@ -286,16 +560,36 @@ def test(host: str, port: int, timeout: int) -> None:
 
 
 @telnet.command()
-def sessions() -> None:
-    """List all capture sessions."""
+@click.option("--host", help="Only sessions captured from this host")
+@click.option("--status", type=click.Choice(["active", "completed", "interrupted"]), help="Only sessions with this status")
+@click.option("--since", type=click.DateTime(), help="Only sessions started on or after this date/time")
+@click.option("--until", type=click.DateTime(), help="Only sessions started before this date/time")
+@click.option("--search", help="Only sessions whose description contains this text")
+@click.option("--limit", "-n", default=20, help="Sessions per page (default: 20, 0 for all)")
+@click.option("--page", default=1, help="Page to show (default: 1)")
+@click.option("--rebuild", is_flag=True, help="Rebuild the session catalog from the session directories first")
+def sessions(host: Optional[str], status: Optional[str], since, until, search: Optional[str], limit: int, page: int, rebuild: bool) -> None:
+    """List capture sessions, newest first."""
     session_manager = SessionManager()
-    sessions = session_manager.list_sessions()
+    
+    if rebuild:
+        click.echo(f"✓ Indexed {session_manager.rebuild_catalog()} session(s)")
+    
+    report_recovered(session_manager.recover_orphaned_sessions())
+    
+    filters = dict(host=host, status=status, since=since, until=until, description=search)
+    offset = (max(page, 1) - 1) * limit
+    sessions = session_manager.list_sessions(**filters, limit=limit or None, offset=offset)
+    total = session_manager.count_sessions(**filters)
     
     if not sessions:
         click.echo("No capture sessions found.")
         return
     
-    click.echo(f"\nFound {len(sessions)} session(s):\n")
+    click.echo(f"\nFound {total} session(s)", nl=False)
+    if len(sessions) < total:
+        click.echo(f", showing {offset + 1}-{offset + len(sessions)}", nl=False)
+    click.echo(":\n")
     
     for session in sessions:
         status_symbol = "●" if session.get("status") == "active" else "○"
@@ -308,30 +602,131 @@ def sessions() -> None:
         
         click.echo(f"  Status: {session.get('status', 'unknown')}")
         click.echo(f"  Lines: {session.get('line_count', 0)}")
+        counts = (session.get("checkpoint") or {}).get("counts")
+        if counts:
+            click.echo("  Events: " + ", ".join(f"{name.upper()} {count}" for name, count in counts.items()))
+        if session.get("segments"):
+            click.echo(f"  Segments: {len(session['segments'])} archived")
         click.echo()
+    
+    if offset + len(sessions) < total:
+        click.echo(f"More sessions available: use --page {page + 1}")
 
 
 @telnet.command()
-@click.option("--days", "-d", default=7, help="Clean sessions older than N days")
+@click.option("--event", "-e", help="PSDK, ISDK or MUX event name, e.g. playbackInfoResolutionEndEvent")
+@click.option("--session-id", help="playbackSessionId (or ISDK playbackId)")
+@click.option("--content", help="Content ID (contentMetadata id, videoid or editId)")
+@click.option("--error", help="Words that must all appear in an error line, e.g. 'Type Mismatch'")
+@click.option("--host", help="Only sessions captured from this host")
+@click.option("--limit", "-n", default=50, help="Maximum number of lines to show (default: 50, 0 for all)")
+@click.option("--list", "list_kind", type=click.Choice(["event", "session", "content", "error"]), help="List indexed values of this kind instead of searching")
+@click.option("--reindex", is_flag=True, help="Rebuild the search index from scratch first")
+def search(event: Optional[str], session_id: Optional[str], content: Optional[str], error: Optional[str], host: Optional[str], limit: int, list_kind: Optional[str], reindex: bool) -> None:
+    """
+    Search the logs of all finished capture sessions.
+    
+    All given criteria must match on the same line, e.g. --event
+    playbackInfoResolutionEndEvent --content <videoid>. Sessions finished
+    since the last search are indexed first.
+    """
+    session_manager = SessionManager()
+    index = SessionLogIndex(session_manager)
+    
+    progress = lambda s: click.echo(f"Indexing session {s['session_id']}...", err=True)
+    indexed = index.reindex(progress) if reindex else index.update(progress)
+    if indexed:
+        click.echo(f"✓ Indexed {indexed} session(s)\n", err=True)
+    
+    if list_kind:
+        for value, count in index.terms(list_kind):
+            click.echo(f"{count:>10}  {value}")
+        return
+    
+    if not (event or session_id or content or error):
+        click.echo("✗ Give at least one of --event, --session-id, --content or --error")
+        return
+    
+    started = time.perf_counter()
+    hits = index.search(event, session_id, content, error, host, limit=limit or None)
+    elapsed = (time.perf_counter() - started) * 1000
+    
+    if not hits:
+        click.echo(f"No matching lines ({elapsed:.0f} ms)")
+        return
+    
+    for hit in hits:
+        # path:line lets editors and terminals jump straight to the line
+        click.echo(click.style(f"{hit['file']}:{hit['line']}", fg="cyan") + f"  [{hit['session_id']} {hit['host']}]")
+        click.echo(f"    {read_hit(hit)}")
+    click.echo(f"\n{len(hits)} line(s) in {len({hit['session_id'] for hit in hits})} session(s) ({elapsed:.0f} ms)")
+
+
+@telnet.command()
+@click.option("--stale-minutes", type=int, help="Also close sessions without a checkpoint for this many minutes (e.g. captured on another machine)")
+def recover(stale_minutes: Optional[int]) -> None:
+    """Close sessions left active by a capture that was killed."""
+    session_manager = SessionManager()
+    recovered = session_manager.recover_orphaned_sessions(
+        stale_after=stale_minutes * 60 if stale_minutes else None
+    )
+    
+    if not recovered:
+        click.echo("No orphaned sessions found.")
+        return
+    report_recovered(recovered)
+
+
+@telnet.command()
+@click.option("--days", "-d", type=float, default=7, help="Clean sessions older than N days")
+@click.option("--quota-gb", type=float, help="Also delete the oldest sessions until .temp fits in this many gigabytes")
+@click.option("--max-per-host", type=int, help="Also keep only the newest N sessions of each device")
+@click.option("--dry-run", is_flag=True, help="Only report what would be deleted and the space reclaimed")
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
-def cleanup(days: int, yes: bool) -> None:
+def cleanup(days: float, quota_gb: Optional[float], max_per_host: Optional[int], dry_run: bool, yes: bool) -> None:
     """Clean up old capture sessions."""
     session_manager = SessionManager()
     
-    sessions = session_manager.list_sessions()
-    if not sessions:
+    if not session_manager.count_sessions():
         click.echo("No sessions to clean up.")
         return
     
-    click.echo(f"This will remove sessions older than {days} days.")
+    # Interrupted captures are old sessions like any other
+    report_recovered(session_manager.recover_orphaned_sessions())
+    
+    policy = RetentionPolicy(
+        max_bytes=int(quota_gb * 1024 ** 3) if quota_gb else None,
+        max_per_host=max_per_host,
+        max_age_days=days
+    )
+    retention = RetentionManager(session_manager, policy)
+    plan = retention.plan()
+    
+    if not plan:
+        click.echo("No sessions exceed the retention limits.")
+        return
+    
+    reclaimable = sum(eviction["bytes"] for eviction in plan)
+    click.echo(f"{len(plan)} session(s) to remove, {format_size(reclaimable)} reclaimable:\n")
+    for eviction in plan:
+        session = eviction["session"]
+        compressed = ", compressed" if eviction["compressed"] else ""
+        click.echo(
+            f"  {session['session_id']}  {session.get('host')}  "
+            f"{format_size(eviction['bytes'])}  ({eviction['reason']}{compressed})"
+        )
+    click.echo()
+    
+    if dry_run:
+        return
     
     if not yes:
         if not click.confirm("Continue?", default=True):
             click.echo("Cleanup cancelled.")
             return
     
-    cleaned = session_manager.cleanup_old_sessions(days)
-    click.echo(f"✓ Cleaned up {cleaned} session(s)")
+    evicted = retention.enforce()
+    click.echo(f"✓ Cleaned up {len(evicted)} session(s), {format_size(sum(e['bytes'] for e in evicted))} freed")
 
 
 @main.command()
@@ -350,14 +745,29 @@ def instrument(input_file: str, output_file: str, format: str) -> None:
 @click.option("--schema", "-s", type=click.Path(exists=True), help="Validation schema file")
 @click.option("--strict", is_flag=True, help="Enable strict validation mode")
 def validate(log_file: str, schema: Optional[str], strict: bool) -> None:
-    """Validate a log file against expected patterns and schemas."""
+    """Validate the playback sessions of a device log or capture session.
+    
+    The content metadata and ISDK rules come from monitor_config.json, or
+    from --schema (a file in the same format).
+    """
     click.echo(f"Validating {log_file}")
     if schema:
         click.echo(f"Using schema: {schema}")
     if strict:
         click.echo("Strict mode enabled")
-    # TODO: Implement validation logic
-    click.echo("✓ Validation complete")
+    
+    validator = LogValidator(schema=json.loads(Path(schema).read_text()) if schema else None, strict=strict)
+    sessions = 0
+    invalid = 0
+    for result in validator.validate_sessions(Path(log_file)):
+        sessions += 1
+        echo_session_result(result)
+        if not result.is_valid:
+            invalid += 1
+    
+    if not sessions:
+        click.echo("⚠️  No playback sessions found")
+    click.echo(f"✓ Validation complete: {sessions} session(s), {invalid} invalid")
 
 
 @main.command()
@@ -379,8 +789,17 @@ def parse(log_file: str, output: Optional[str]) -> None:
 @click.option("--port", "-p", default=8085, help="Telnet port (default: 8085)")
 @click.option("--monitor/--no-monitor", default=True, help="Launch PSDK event monitor in separate terminal (default: on)")
 @click.option("--pattern", "-f", multiple=True, help="Custom filter pattern(s) to show in monitor terminal (e.g., --pattern '[PLAYER_SDK]' --pattern 'ERROR')")
+@click.option("--monitor-engine", type=click.Choice(["python", "bash"]), default="python", help="PSDK monitor implementation (default: python)")
+@click.option("--display-queue", default=LineDispatcher.DEFAULT_CAPACITY, help="Lines buffered for the terminal display (default: 10000)")
+@click.option("--display-policy", type=click.Choice(OverflowPolicy.ALL), default=OverflowPolicy.DROP_OLDEST, help="What to do with display lines when the terminal falls behind (log file is never affected)")
+@click.option("--reconnect/--no-reconnect", default=True, help="Reconnect with backoff when the device drops the connection (default: on)")
+@click.option("--rotate-mb", type=int, help="Start a new log segment when the current one reaches this size")
+@click.option("--rotate-minutes", type=int, help="Start a new log segment after this many minutes")
+@click.option("--compress/--no-compress", default=True, help="gzip closed log segments in the background (default: on)")
+@click.option("--quota-gb", type=float, help="Delete the oldest finished sessions in the background to keep .temp under this size")
+@click.option("--validate/--no-validate", "validate_live", default=False, help="Validate each playback session as it ends, on its own thread (default: off)")
 @click.version_option(version="0.1.0")
-def live_main(host: str, duration: Optional[int], description: Optional[str], port: int, monitor: bool, pattern: tuple) -> None:
+def live_main(host: str, duration: Optional[int], description: Optional[str], port: int, monitor: bool, pattern: tuple, monitor_engine: str, display_queue: int, display_policy: str, reconnect: bool, rotate_mb: Optional[int], rotate_minutes: Optional[int], compress: bool, quota_gb: Optional[float], validate_live: bool) -> None:
     """
     PSDK Instrument - Live Roku log capture and viewer.
     
@@ -392,10 +811,16 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
         psdk-instrument 192.168.50.81
         psdk-instrument 192.168.50.81 --duration 300
         psdk-instrument 192.168.50.81 --description "Testing playback"
+        psdk-instrument 192.168.50.81 --validate
     """
     session_manager = SessionManager()
     client = RokuTelnetClient(host, port)
     session = None
+    checkpoint = None
+    retention = None
+    dispatcher = None
+    validation = None
+    online = None
     interrupted = False
     
     # Display banner
@@ -407,6 +832,8 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
     click.echo(f"👁️  Live display: ENABLED")
     if monitor:
         click.echo(f"📊 PSDK Monitor: ENABLED (separate terminal)")
+    if validate_live:
+        click.echo(f"🔎 Session validation: ENABLED")
     click.echo(f"⌨️  Interactive commands: ENABLED (type and press Enter)")
     click.echo("\nPress Ctrl+C to stop\n")
     click.echo("─" * 65 + "\n")
@@ -436,6 +863,9 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
         # Create session
         session = session_manager.create_session(host, port, description)
         log_file = session_manager.get_session_log_path(session)
+        # Line count and event counters reach session_info.json while capturing
+        checkpoint = session_manager.create_checkpoint(session)
+        retention = start_retention(session_manager, quota_gb)
         
         click.echo(f"✓ Session: {session['session_id']}")
         click.echo(f"✓ Telnet connection established")
@@ -453,6 +883,9 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
         # Thread-safe lock for output
         output_lock = threading.Lock()
         
+        # Same categories as the monitor, compiled once for every displayed line
+        classifier = LineClassifier(MonitorConfig.load(), pattern)
+        
         # Display callback with color coding
         def display_callback(line: str):
             nonlocal monitor_launched, monitor_process
@@ -464,7 +897,7 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
                         click.echo(f"\n🚀 Launching PSDK Event Monitor with custom patterns: {', '.join(pattern)}...\n")
                     else:
                         click.echo("\n🚀 Launching PSDK Event Monitor...\n")
-                    monitor_process = launch_psdk_monitor(str(log_file), pattern)
+                    monitor_process = launch_psdk_monitor(str(log_file), pattern, monitor_engine)
                     if monitor_process:
                         click.echo("✓ PSDK Monitor launched successfully\n")
                     else:
@@ -473,18 +906,21 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
             
             # Highlight PSDK logs in yellow, everything else in white
             # Add visual separation for different log types
+            mask = classifier.classify(line)
             with output_lock:
                 # Check if this is a new log entry (starts with INFO:, WARN:, ERROR:, DEBUG:, etc.)
                 is_new_entry = line.startswith(('INFO:', 'WARN:', 'WARNING:', 'ERROR:', 'DEBUG:', 'PSDK::'))
                 
-                if 'PSDK::' in line:
+                if mask & PSDK:
                     if is_new_entry:
                         click.echo()  # Blank line before PSDK events
                     click.echo(click.style(line, fg='yellow'))
-                elif line.startswith('ERROR:') or 'error' in line.lower():
+                elif mask & ERROR:
                     click.echo(click.style(line, fg='red'))
-                elif line.startswith(('WARN:', 'WARNING:')):
+                elif mask & WARNING:
                     click.echo(click.style(line, fg='bright_yellow'))
+                elif mask & CUSTOM:
+                    click.echo(click.style(line, fg='magenta'))
                 elif is_new_entry:
                     # Add blank line before new log entries for separation
                     click.echo()
@@ -493,9 +929,45 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
                     # Continuation lines (values, etc.) - no blank line
                     click.echo(line)
         
+        # Display runs on its own thread so a slow terminal never stalls socket reads
+        dispatcher = LineDispatcher(display_callback, display_queue, display_policy)
+        dispatcher.start()
+        capture_callback = dispatcher.put
+        
+        if validate_live:
+            online = OnlineValidator(LogValidator(config=MonitorConfig.load()))
+            
+            def validation_callback(line: str):
+                for result in online.feed(line):
+                    with output_lock:
+                        echo_session_result(result)
+            
+            def validation_skip(count: int):
+                for result in online.skip(count):
+                    with output_lock:
+                        echo_session_result(result)
+            
+            # Validation gets its own queue; if it falls behind, skipped lines
+            # cut the open session short instead of stalling the capture thread
+            validation = LineDispatcher(validation_callback, policy=OverflowPolicy.COALESCE, on_skip=validation_skip)
+            validation.start()
+            
+            def capture_callback(line: str):
+                dispatcher.put(line)
+                validation.put(line)
+        
         # Start log capture in background thread
         capture_thread = threading.Thread(
-            target=lambda: client.capture_logs(log_file, callback=display_callback, max_duration=duration),
+            target=lambda: client.capture_logs(
+                log_file,
+                callback=capture_callback,
+                max_duration=duration,
+                reconnect=ReconnectPolicy() if reconnect else None,
+                on_gap=lambda gap: session_manager.record_gap(session, gap),
+                rotation=rotation_policy(rotate_mb, rotate_minutes, compress),
+                on_segment=lambda segment: session_manager.record_segment(session, segment),
+                checkpoint=checkpoint
+            ),
             daemon=True
         )
         capture_thread.start()
@@ -505,7 +977,7 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
         
         # Input thread to handle user commands
         def handle_user_input():
-            while capture_active.is_set() and client.is_connected():
+            while capture_active.is_set():
                 try:
                     # Read user input (non-blocking with timeout would be better, but this works)
                     user_input = input()
@@ -535,7 +1007,7 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
         capture_active.clear()
         
         # End session
-        session_manager.end_session(session)
+        session_manager.end_session(session, checkpoint.line_count)
         
     except KeyboardInterrupt:
         interrupted = True
@@ -545,10 +1017,14 @@ def live_main(host: str, duration: Optional[int], description: Optional[str], po
         
         # End session first
         if session:
-            session_manager.end_session(session)
+            session_manager.end_session(session, checkpoint.line_count if checkpoint else None)
     
     finally:
         client.disconnect()
+        stop_dispatcher(dispatcher)
+        stop_live_validation(validation, online)
+        if retention:
+            retention.stop()
         
         # Prompt for deletion if interrupted and session exists
         if interrupted and session:
@@ -2,7 +2,7 @@
 Log instrumentation functionality.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from pathlib import Path
 from roku_psdk_log_instrument.models.log_entry import LogEntry
 
@@ -42,8 +42,20 @@ class LogInstrumenter:
         Returns:
             List of instrumented log entries
         """
+        return list(self.instrument_stream(entries))
+    
+    def instrument_stream(self, entries: Iterable[LogEntry]) -> Iterator[LogEntry]:
+        """
+        Instrument log entries one at a time, e.g. from LogParser.iter_file().
+        
+        Args:
+            entries: Iterable of log entries, consumed once
+            
+        Yields:
+            Instrumented log entries
+        """
         # TODO: Implement entry instrumentation logic
-        return entries
+        yield from entries
     
     def add_metadata(self, entry: LogEntry, metadata: Dict[str, Any]) -> LogEntry:
         """
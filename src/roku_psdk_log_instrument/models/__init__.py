@@ -2,7 +2,7 @@
 Data models for log entries and related structures.
 """
 
-from roku_psdk_log_instrument.models.log_entry import LogEntry, LogLevel
+from roku_psdk_log_instrument.models.log_entry import CompactEntry, LogEntry, LogLevel
 
-__all__ = ["LogEntry", "LogLevel"]
+__all__ = ["LogEntry", "LogLevel", "CompactEntry"]
 
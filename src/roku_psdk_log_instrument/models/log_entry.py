@@ -2,7 +2,7 @@
 Data models for log entries.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field
@@ -37,3 +37,84 @@ class LogEntry(BaseModel):
         """String representation of the log entry."""
         return f"[{self.timestamp.isoformat()}] {self.level.value}: {self.message}"
 
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class CompactEntry:
+    """
+    Slotted log entry for bulk parsing pipelines.
+    
+    Holds a parsed line without validation, per-entry dicts or datetime
+    objects: the timestamp as epoch nanoseconds (naive timestamps are
+    encoded as UTC), the shared LogLevel member, interned component and
+    event names, and the line number and byte offset as plain ints
+    (0 and -1 when unknown). Convert with to_entry() where a LogEntry
+    is needed.
+    """
+    
+    __slots__ = ("timestamp_ns", "level", "message", "component", "event", "line_number", "offset")
+    
+    def __init__(
+        self,
+        timestamp_ns: int,
+        level: LogLevel,
+        message: str,
+        component: Optional[str] = None,
+        event: Optional[str] = None,
+        line_number: int = 0,
+        offset: int = -1
+    ):
+        """
+        Initialize a compact entry.
+        
+        Args:
+            timestamp_ns: Nanoseconds since the epoch
+            level: Log level
+            message: Log message
+            component: Leading ``[TAG]`` of the message, interned
+            event: PSDK event name (after ``key``), interned
+            line_number: One-based line number, or 0 if unknown
+            offset: Byte offset of the line, or -1 if unknown
+        """
+        self.timestamp_ns = timestamp_ns
+        self.level = level
+        self.message = message
+        self.component = component
+        self.event = event
+        self.line_number = line_number
+        self.offset = offset
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Naive datetime of the timestamp, to the microsecond."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
+    
+    def to_entry(self) -> LogEntry:
+        """
+        Build the equivalent LogEntry.
+        
+        The line number and offset go into the metadata when known, as
+        LogParser.parse_line() and iter_file() put them there.
+        
+        Returns:
+            LogEntry
+        """
+        metadata: Dict[str, Any] = {}
+        if self.line_number:
+            metadata["line_number"] = self.line_number
+        if self.offset >= 0:
+            metadata["offset"] = self.offset
+        return LogEntry(timestamp=self.timestamp, level=self.level, message=self.message, metadata=metadata)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactEntry):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    def __repr__(self) -> str:
+        return (
+            f"CompactEntry({self.timestamp_ns}, {self.level.value}, {self.message!r}, "
+            f"line {self.line_number}, offset {self.offset})"
+        )
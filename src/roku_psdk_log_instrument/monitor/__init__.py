@@ -0,0 +1,11 @@
+"""
+PSDK event monitor modules.
+"""
+
+from roku_psdk_log_instrument.monitor.classifier import LineClassifier
+from roku_psdk_log_instrument.monitor.config import MonitorConfig
+from roku_psdk_log_instrument.monitor.engine import PSDKEventMonitor
+from roku_psdk_log_instrument.monitor.fields import EventFields
+from roku_psdk_log_instrument.monitor.follow import follow_file, run_monitor
+
+__all__ = ["LineClassifier", "MonitorConfig", "PSDKEventMonitor", "EventFields", "follow_file", "run_monitor"]
@@ -0,0 +1,28 @@
+"""
+Run the PSDK event monitor on a log file.
+
+Usage: python -m roku_psdk_log_instrument.monitor <log_file_path> [pattern1] [pattern2] ...
+"""
+
+import sys
+from pathlib import Path
+
+from roku_psdk_log_instrument.monitor.engine import PSDKEventMonitor
+from roku_psdk_log_instrument.monitor.follow import run_monitor
+
+
+def main() -> int:
+    """Entry point mirroring scripts/monitor_psdk_events.sh arguments."""
+    if len(sys.argv) < 2:
+        print("Error: No log file specified")
+        print(f"Usage: {sys.argv[0]} <log_file_path> [pattern1] [pattern2] ...")
+        return 1
+
+    log_file = Path(sys.argv[1])
+    monitor = PSDKEventMonitor(custom_patterns=sys.argv[2:])
+    run_monitor(log_file, monitor)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Single-pass line classifier compiled from monitor_config.json.
+
+The monitor, the record assembler and the live capture display all ask the
+same questions of every line: is it a lifecycle event, a PSDK/ISDK/MUX
+event, a custom match, an error or a warning? LineClassifier answers all of
+them in one call and returns a bit mask.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from roku_psdk_log_instrument.monitor.config import MonitorConfig
+
+
+# Category bits returned by LineClassifier.classify()
+PLAYER_CREATE = 1 << 0
+PLAYER_DESTROY = 1 << 1
+PLAYBACK_INITIATE = 1 << 2
+PLAYBACK_END = 1 << 3
+CONTENT_LOAD = 1 << 4
+PSDK = 1 << 5
+ISDK = 1 << 6
+MUX = 1 << 7
+CUSTOM = 1 << 8
+ERROR = 1 << 9
+WARNING = 1 << 10
+
+CATEGORY_NAMES = {
+    PLAYER_CREATE: "player_create",
+    PLAYER_DESTROY: "player_destroy",
+    PLAYBACK_INITIATE: "playback_initiate",
+    PLAYBACK_END: "playback_end",
+    CONTENT_LOAD: "content_load",
+    PSDK: "psdk",
+    ISDK: "isdk",
+    MUX: "mux",
+    CUSTOM: "custom",
+    ERROR: "error",
+    WARNING: "warning",
+}
+
+# Screening bits, confirmed by the error/warning regexes below
+_MAYBE_ERROR = 1 << 16
+_MAYBE_WARNING = 1 << 17
+_SCREEN = _MAYBE_ERROR | _MAYBE_WARNING
+
+PSDK_MARKER = "PSDK::"
+ISDK_MARKER = "[PSDK::ISDK]"
+MUX_MARKERS = ("[mux-analytics]", "mux:", "MUX:")
+ERROR_SCREEN = ("RROR", "rror", "FATAL", "fatal", "❌")
+WARNING_SCREEN = ("WARN", "arn", "mismatch occurred", "⚠️")
+
+# JSON payloads carry "error"/"warning" as field names, not log levels
+JSON_DATA_RE = re.compile(r'^\s*\{|"events":|"http')
+ERROR_RE = re.compile(
+    r"^\s*(?:ERROR|Error|FATAL|fatal):"
+    r"|\[(?:ERROR|Error|FATAL)\]"
+    r"|[0-9]{2}:[0-9]{2}:[0-9]{2}.*ERROR:"
+    r"|BRIGHTSCRIPT: ERROR:"
+    r"|❌"
+)
+WARNING_RE = re.compile(
+    r"^\s*(?:WARN|WARNING|Warning|warn|warning):"
+    r"|\[(?:WARN|WARNING|Warning)\]"
+    r"|[0-9]{2}:[0-9]{2}:[0-9]{2}.*(?:WARN|WARNING):"
+    r"|Warning occurred"
+    r"|Type mismatch occurred"
+    r"|⚠️"
+)
+
+
+def category_names(mask: int) -> List[str]:
+    """
+    Name the categories set in a classification mask.
+
+    Args:
+        mask: Value returned by LineClassifier.classify()
+
+    Returns:
+        Category names in bit order
+    """
+    return [name for bit, name in CATEGORY_NAMES.items() if mask & bit]
+
+
+class LineClassifier:
+    """
+    Finds every category a log line belongs to in one call.
+
+    All substrings are compiled once into one generated function of
+    nested containment tests: equal substrings from different categories
+    are tested once, and a substring that contains another
+    (``[PSDK::ISDK]`` contains ``PSDK::``) is only tested on lines that
+    matched the shorter one. The error and warning regexes only run on
+    lines that pass their substring screen.
+
+    Substring tests use CPython's fast search and beat a combined regex
+    alternation, which tries every alternative at every position.
+    """
+
+    def __init__(self, config: Optional[MonitorConfig] = None, custom_patterns: Sequence[str] = ()):
+        """
+        Compile the classifier.
+
+        Args:
+            config: Monitor configuration (defaults if None)
+            custom_patterns: Extra substrings reported as CUSTOM, as given with --pattern
+        """
+        config = config or MonitorConfig()
+        self.custom_patterns = tuple(p for p in custom_patterns if p)
+
+        masks: Dict[str, int] = {}
+        for literal, bit in (
+            (config.player_create_pattern, PLAYER_CREATE),
+            (config.player_destroy_pattern, PLAYER_DESTROY),
+            (config.playback_initiate_pattern, PLAYBACK_INITIATE),
+            (config.playback_end_pattern, PLAYBACK_END),
+            (config.content_load_pattern, CONTENT_LOAD),
+            (PSDK_MARKER, PSDK),
+            (ISDK_MARKER, ISDK | PSDK),
+        ):
+            if literal:
+                masks[literal] = masks.get(literal, 0) | bit
+        for literals, bit in (
+            (MUX_MARKERS, MUX),
+            (self.custom_patterns, CUSTOM),
+            (ERROR_SCREEN, _MAYBE_ERROR),
+            (WARNING_SCREEN, _MAYBE_WARNING),
+        ):
+            for literal in literals:
+                masks[literal] = masks.get(literal, 0) | bit
+        self._match = _compile(_containment_tree(masks))
+
+    def classify(self, line: str) -> int:
+        """
+        Classify one line.
+
+        Args:
+            line: Raw log line
+
+        Returns:
+            Bit mask of the category constants (0 for an uncategorized line)
+        """
+        mask = self._match(line)
+        if mask & _SCREEN:
+            mask = self._confirm(line, mask)
+        return mask
+
+    def _confirm(self, line: str, mask: int) -> int:
+        screened = mask
+        mask &= ~_SCREEN
+        if JSON_DATA_RE.search(line):
+            return mask
+        if screened & _MAYBE_ERROR and ERROR_RE.search(line):
+            return mask | ERROR
+        if screened & _MAYBE_WARNING and WARNING_RE.search(line):
+            return mask | WARNING
+        return mask
+
+    def custom_matches(self, line: str) -> List[str]:
+        """
+        List the custom patterns found in a line.
+
+        Args:
+            line: Raw log line
+
+        Returns:
+            Matching custom patterns in the order given
+        """
+        return [pattern for pattern in self.custom_patterns if pattern in line]
+
+
+# A test is (substring, mask, tests run only if the substring occurs)
+_Tests = Tuple[Tuple[str, int, tuple], ...]
+
+
+def _containment_tree(masks: Dict[str, int]) -> _Tests:
+    # Shortest first, so every substring is placed under one it contains
+    children: Dict[str, List[str]] = {}
+    roots: List[str] = []
+    placed: List[str] = []
+    for literal in sorted(masks, key=len):
+        parent = next((p for p in reversed(placed) if p in literal), None)
+        (children.setdefault(parent, []) if parent is not None else roots).append(literal)
+        placed.append(literal)
+
+    def build(literals: List[str]) -> _Tests:
+        return tuple((literal, masks[literal], build(children.get(literal, []))) for literal in literals)
+
+    return build(roots)
+
+
+def _compile(tests: _Tests):
+    lines = ["def match(line):", "    mask = 0"]
+
+    def emit(tests: _Tests, indent: str) -> None:
+        for literal, bits, nested in tests:
+            lines.append(f"{indent}if {literal!r} in line:")
+            lines.append(f"{indent}    mask |= {bits}")
+            emit(nested, indent + "    ")
+
+    emit(tests, "    ")
+    lines.append("    return mask")
+    namespace: Dict[str, object] = {}
+    exec(compile("\n".join(lines), "<line classifier>", "exec"), namespace)
+    return namespace["match"]
@@ -0,0 +1,175 @@
+"""
+Monitor configuration loaded from monitor_config.json.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Defaults mirror the fallbacks in scripts/monitor_psdk_events.sh
+DEFAULT_REQUIRED_FIELDS = ["id", "title", "playbackType"]
+DEFAULT_OPTIONAL_FIELDS = ["subtitle", "contentType", "initialPlaybackPosition"]
+DEFAULT_PLAYBACK_TYPES = [
+    "userInitiated", "AUTO", "INLINE", "continuous",
+    "confirmedContinuous", "confirmedEndCard", "autoPlayEndCard",
+]
+DEFAULT_CONTENT_TYPES = [
+    "episode", "standalone", "clip", "trailer", "live", "follow_up", "listing",
+    "movie", "podcast", "short_preview", "promo", "extra", "standalone_event",
+    "live_channel",
+]
+
+
+def find_config_path() -> Optional[Path]:
+    """
+    Find the monitor config path, checking multiple locations.
+
+    Returns:
+        Path to config file if found, None otherwise
+    """
+    package_dir = Path(__file__).parent.parent
+    possible_paths = [
+        # Installed package: config inside package
+        package_dir / "config" / "monitor_config.json",
+        # Development mode: project_root/config/
+        package_dir.parent.parent / "config" / "monitor_config.json",
+        # From current working directory
+        Path.cwd() / "config" / "monitor_config.json",
+    ]
+
+    for path in possible_paths:
+        if path.exists():
+            return path
+
+    return None
+
+
+def _section(data: Dict[str, Any], *keys: str) -> Dict[str, Any]:
+    """Walk nested config sections, returning an empty dict for missing ones."""
+    for key in keys:
+        value = data.get(key)
+        data = value if isinstance(value, dict) else {}
+    return data
+
+
+class MonitorConfig:
+    """
+    Settings for the PSDK event monitor.
+
+    Every section of monitor_config.json is resolved once at load time so
+    the monitor never touches the JSON document while processing lines.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, path: Optional[Path] = None):
+        """
+        Initialize the monitor configuration.
+
+        Args:
+            data: Parsed monitor_config.json contents (defaults if None)
+            path: Path the configuration was loaded from
+        """
+        data = data or {}
+        self.path = path
+        self.raw = data
+
+        player = _section(data, "player_lifecycle")
+        playback = _section(data, "playback_lifecycle")
+        content = _section(data, "content_metadata")
+        validation = _section(content, "validation")
+
+        self.player_create_pattern: str = player.get(
+            "creation_pattern", "PlayerSDK.Core.PlayerBuilder: new"
+        )
+        self.player_destroy_pattern: str = player.get(
+            "destruction_pattern", "playerSessionEndEvent"
+        )
+        self.playback_initiate_pattern: str = playback.get(
+            "initiation_pattern", "playbackInitiatedEvent"
+        )
+        self.playback_end_pattern: str = playback.get(
+            "end_pattern", "playbackSessionEndEvent"
+        )
+        self.content_load_pattern: str = content.get(
+            "load_pattern", "Player Controller: Load"
+        )
+
+        self.validation_enabled: bool = validation.get("enabled", True)
+        self.required_fields: List[str] = list(
+            validation.get("required_fields", DEFAULT_REQUIRED_FIELDS)
+        )
+        self.optional_fields: List[str] = list(
+            validation.get("optional_fields", DEFAULT_OPTIONAL_FIELDS)
+        )
+
+        playback_enum = _section(validation, "playback_type_enum")
+        self.playback_type_enum_enabled: bool = playback_enum.get("enabled", True)
+        self.valid_playback_types: List[str] = list(
+            playback_enum.get("valid_values", DEFAULT_PLAYBACK_TYPES)
+        )
+
+        content_enum = _section(validation, "content_type_enum")
+        self.content_type_enum_enabled: bool = content_enum.get("enabled", True)
+        self.valid_content_types: List[str] = list(
+            content_enum.get("valid_values", DEFAULT_CONTENT_TYPES)
+        )
+
+        self.show_validation_results: bool = _section(data, "display").get(
+            "show_validation_results", True
+        )
+
+        event_fields = _section(data, "event_fields")
+        # Without a config file the bash monitor has no field lists to show
+        self.event_fields_enabled: bool = bool(data) and event_fields.get("enabled", False)
+        self.event_fields: Dict[str, Dict[str, List[str]]] = {
+            "psdk": dict(_section(event_fields, "psdk_events")),
+            "isdk": dict(_section(event_fields, "isdk_events")),
+            "mux": dict(_section(event_fields, "mux_events")),
+        }
+
+        isdk = _section(data, "isdk_validation")
+        self.isdk_validation_enabled: bool = isdk.get("enabled", True)
+        self.isdk_show_event_list: bool = isdk.get("show_event_list", True)
+        self.isdk_field_validation_enabled: bool = _section(
+            isdk, "field_validation"
+        ).get("enabled", True)
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "MonitorConfig":
+        """
+        Load configuration from a file.
+
+        Args:
+            path: Path to monitor_config.json (searched for if None)
+
+        Returns:
+            MonitorConfig instance (defaults if no readable config exists)
+        """
+        path = path or find_config_path()
+
+        if path is None or not Path(path).exists():
+            return cls()
+
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, json.JSONDecodeError):
+            return cls()
+
+        return cls(data, Path(path))
+
+    def fields_for(self, event_name: str, event_type: str = "psdk") -> List[str]:
+        """
+        Get the configured display fields for an event.
+
+        Args:
+            event_name: Event name as it appears in the log
+            event_type: Event type (psdk, isdk, mux)
+
+        Returns:
+            List of field paths (falls back to the type's default list)
+        """
+        fields = self.event_fields.get(event_type, {})
+        selected = fields.get(event_name)
+        if selected is None:
+            selected = fields.get("default")
+        return list(selected or [])
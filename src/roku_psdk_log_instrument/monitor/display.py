@@ -0,0 +1,462 @@
+"""
+Three-column (PSDK | ISDK | MUX) rendering for the PSDK event monitor.
+"""
+
+import shutil
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+# Color codes (same palette as monitor_psdk_events.sh)
+YELLOW = "\033[1;33m"
+GREEN = "\033[0;32m"
+CYAN = "\033[0;36m"
+MAGENTA = "\033[0;35m"
+RED = "\033[0;31m"
+GREY = "\033[0;90m"
+NC = "\033[0m"
+
+# Fixed column widths for three-column display (PSDK | ISDK | MUX)
+COL_WIDTH = 75
+ISDK_COL_WIDTH = 75
+MUX_COL_WIDTH = 70
+TOTAL_WIDTH = COL_WIDTH + ISDK_COL_WIDTH + MUX_COL_WIDTH + 2
+
+# Width of the small playback started/aborted boxes
+SMALL_BOX_WIDTH = 67
+
+
+class MonitorDisplay:
+    """
+    Renders monitor output lines.
+
+    Output is handed to ``emit`` one line at a time; the monitor engine
+    collects those lines and writes them to the terminal in batches.
+    """
+
+    def __init__(self, emit: Callable[[str], None], term_width: Optional[int] = None):
+        """
+        Initialize the display.
+
+        Args:
+            emit: Callable receiving each rendered output line
+            term_width: Terminal width for the playback summary (auto-detected if None)
+        """
+        self.emit = emit
+        self.term_width = term_width or shutil.get_terminal_size((160, 24)).columns
+
+        # Empty column padding reused on every event row
+        self._empty_psdk = " " * COL_WIDTH
+        self._empty_isdk = " " * ISDK_COL_WIDTH
+        self._empty_mux = " " * MUX_COL_WIDTH
+        self._sep = f"{MAGENTA}│{NC}"
+
+    # ------------------------------------------------------------------
+    # Headers
+    # ------------------------------------------------------------------
+
+    def column_headers(self) -> None:
+        """Display column headers for the PSDK | ISDK | MUX layout."""
+        psdk_dashes = "─" * COL_WIDTH
+        isdk_dashes = "─" * ISDK_COL_WIDTH
+        mux_dashes = "─" * MUX_COL_WIDTH
+        self.emit(f"{CYAN}{psdk_dashes}{MAGENTA}┬{CYAN}{isdk_dashes}{MAGENTA}┬{CYAN}{mux_dashes}{NC}")
+        self.emit(
+            f"{CYAN}  {'PSDK Events':<{COL_WIDTH - 2}}{MAGENTA}│{CYAN}  "
+            f"{'ISDK Events':<{ISDK_COL_WIDTH - 2}}{MAGENTA}│{CYAN}  "
+            f"{'MUX Events':<{MUX_COL_WIDTH - 2}}{NC}"
+        )
+        self.emit(f"{CYAN}{psdk_dashes}{MAGENTA}┼{CYAN}{isdk_dashes}{MAGENTA}┼{CYAN}{mux_dashes}{NC}")
+
+    def initial_header(
+        self,
+        log_file: str,
+        config_name: str = "",
+        custom_patterns: Sequence[str] = (),
+        clear: bool = True
+    ) -> None:
+        """
+        Display the monitor banner.
+
+        Args:
+            log_file: Log file being monitored
+            config_name: Name of the loaded config file
+            custom_patterns: Custom --pattern filters
+            clear: Clear the screen first
+        """
+        if clear:
+            self.emit("\033[H\033[2J")
+
+        total = "═" * TOTAL_WIDTH
+        self.emit(f"{CYAN}{total}{NC}")
+        self.emit(f"{CYAN}  PSDK Event Monitor - Player Lifecycle Tracking{NC}")
+        self.emit(f"{CYAN}{total}{NC}")
+        self.emit("")
+        self.emit(f"{GREEN}📊 Monitoring: {log_file}{NC}")
+        self.emit(f"{GREEN}🔍 Tracking: Player creation & destruction{NC}")
+        self.emit(f"{GREEN}⚙️  Config: {config_name}{NC}")
+        self.emit("")
+        self.column_headers()
+        self.emit("")
+
+        if custom_patterns:
+            self.emit(f"{MAGENTA}📌 Custom Patterns: {' '.join(custom_patterns)}{NC}")
+            self.emit("")
+
+    # ------------------------------------------------------------------
+    # Player / playback lifecycle boxes
+    # ------------------------------------------------------------------
+
+    def player_created(self, time_str: str, session_id: Optional[str] = None) -> None:
+        """
+        Display player creation header.
+
+        Args:
+            time_str: Wall-clock time of the event
+            session_id: Player session ID (None when auto-created mid-stream)
+        """
+        box_width = TOTAL_WIDTH - 4
+        border = "═" * box_width
+
+        self.emit("")
+        self.emit(f"{MAGENTA}╔{border}╗{NC}")
+        title = f"  🎬 PLAYER SESSION STARTED  Time: {time_str}"
+        self.emit(f"{MAGENTA}║{NC}{title}{' ' * max(box_width - len(title), 0)}{MAGENTA}║{NC}")
+        self.emit(f"{MAGENTA}╠{border}╣{NC}")
+
+        if session_id:
+            content = f" Session: {session_id}"
+        else:
+            content = " (Connected mid-stream - auto-created session)"
+        self.emit(f"{MAGENTA}║{NC}{content}{' ' * max(box_width - len(content), 0)}{MAGENTA}║{NC}")
+        self.emit(f"{MAGENTA}╚{border}╝{NC}")
+        self.emit("")
+
+    def _small_box_line(self, content: str, color: str) -> None:
+        padding = max(SMALL_BOX_WIDTH - len(content), 0)
+        self.emit(f"  {color}│{NC} {content}{' ' * padding}{color}│{NC}")
+
+    def playback_started(
+        self,
+        time_str: str,
+        session_id: str,
+        session_num: int,
+        metadata: dict
+    ) -> None:
+        """
+        Display playback session started box.
+
+        Args:
+            time_str: Wall-clock time of the event
+            session_id: Playback session ID
+            session_num: Playback number within the player session
+            metadata: Content metadata captured from the last content load
+        """
+        rule = "─" * SMALL_BOX_WIDTH
+        self.emit("")
+        self.emit(f"  {CYAN}┌{rule}┐{NC}")
+        self._small_box_line(f"PLAYBACK #{session_num} STARTED  Time: {time_str}", CYAN)
+        self.emit(f"  {CYAN}├{rule}┤{NC}")
+        self._small_box_line(f"Session: {session_id}", CYAN)
+
+        if metadata.get("id"):
+            self._small_box_line(f"ID(editId): {metadata['id']}", CYAN)
+        if metadata.get("title"):
+            self._small_box_line(f"Title: {metadata['title']}", CYAN)
+        if metadata.get("subtitle"):
+            self._small_box_line(f"Subtitle: {metadata['subtitle']}", CYAN)
+        if metadata.get("contentType"):
+            self._small_box_line(f"contentType: {metadata['contentType']}", CYAN)
+        # Always show playbackType
+        self._small_box_line(
+            f"playbackType: {metadata.get('playbackType') or '(missing)'}", CYAN
+        )
+        if metadata.get("initialPlaybackPosition"):
+            self._small_box_line(
+                f"Start Position: {metadata['initialPlaybackPosition']}ms", CYAN
+            )
+
+        self.emit(f"  {CYAN}└{rule}┘{NC}")
+        self.emit("")
+        self.column_headers()
+
+    def playback_aborted(
+        self,
+        session_id: str,
+        session_num: int,
+        event_count: int,
+        duration: int
+    ) -> None:
+        """
+        Display playback session force-closed box.
+
+        Args:
+            session_id: Playback session ID
+            session_num: Playback number within the player session
+            event_count: PSDK events seen during the playback
+            duration: Playback duration in seconds
+        """
+        rule = "─" * SMALL_BOX_WIDTH
+        self.emit("")
+        self.emit(f"{RED}  ┌{rule}┐{NC}")
+        self._small_box_line(f"PLAYBACK SESSION #{session_num} ABORTED (no end event)", RED)
+        self.emit(f"{RED}  ├{rule}┤{NC}")
+        self._small_box_line(f"Session: {session_id}", RED)
+        self._small_box_line(f"Duration: {duration}s | Events: {event_count}", RED)
+        self.emit(f"{RED}  └{rule}┘{NC}")
+        self.emit("")
+
+    def player_destroyed(
+        self,
+        event_count: int,
+        duration: int,
+        playback_count: int,
+        playback_ids: List[str]
+    ) -> None:
+        """
+        Display player destruction footer with playback session IDs.
+
+        Args:
+            event_count: Total PSDK events in the player session
+            duration: Player session duration in seconds
+            playback_count: Number of playback sessions
+            playback_ids: All playback session IDs of the player session
+        """
+        self.emit("")
+        self.emit(f"{RED}╔═══════════════════════════════════════════════════╗{NC}")
+        self.emit(f"{RED}║           🛑 PLAYER SESSION ENDED                 ║{NC}")
+        self.emit(f"{RED}╠═══════════════════════════════════════════════════╣{NC}")
+
+        if playback_ids:
+            for idx, session_id in enumerate(playback_ids, start=1):
+                self.emit(f"{RED}║{NC} S{idx}: {session_id[:40]}{RED}║{NC}")
+        else:
+            self.emit(f"{RED}║{NC} No playback sessions                              {RED}║{NC}")
+
+        self.emit(f"{RED}║{NC} Duration: {duration}s                                    {RED}║{NC}")
+        self.emit(f"{RED}║{NC} Playback Sessions: {playback_count}                              {RED}║{NC}")
+        self.emit(f"{RED}║{NC} Total PSDK Events: {event_count}                             {RED}║{NC}")
+        self.emit(f"{RED}╚═══════════════════════════════════════════════════╝{NC}")
+        self.emit("")
+
+    # ------------------------------------------------------------------
+    # Playback summary
+    # ------------------------------------------------------------------
+
+    def playback_summary(self, summary: dict) -> None:
+        """
+        Display the unified playback summary box.
+
+        Args:
+            summary: Summary produced by PSDKEventMonitor when a playback ends
+        """
+        box_width = min(max(self.term_width - 6, 80), 200)
+        top_border = "═" * box_width
+        mid_border = "─" * box_width
+
+        def box_line(content: str, text_color: str = NC) -> None:
+            padding = max(box_width - len(content) - 1, 0)
+            self.emit(f"  {CYAN}│{NC} {text_color}{content}{NC}{' ' * padding}{CYAN}│{NC}")
+
+        def section_header(title: str, title_color: str) -> None:
+            padding = max(box_width - len(title) - 2, 0)
+            self.emit(f"  {CYAN}├{mid_border}┤{NC}")
+            self.emit(f"  {CYAN}│{NC} {title_color}{title}{NC}{' ' * padding}{CYAN}│{NC}")
+
+        self.emit("")
+        self.emit(f"{CYAN}  ╔{top_border}╗{NC}")
+        self.emit(
+            f"{CYAN}  ║{NC}  📊 {CYAN}PLAYBACK SUMMARY{NC}"
+            f"{' ' * max(box_width - 20, 0)}{CYAN}║{NC}"
+        )
+        self.emit(f"{CYAN}  ╠{top_border}╣{NC}")
+
+        # Session Info Section
+        box_line(f"Session #{summary['session_num']}", YELLOW)
+        box_line(f"  ID: {summary['session_id']}", GREY)
+        box_line(
+            f"  Duration: {summary['duration']}s  |  PSDK Events: {summary['event_count']}"
+            f"  |  ISDK Events: {summary['isdk_event_count']}"
+        )
+
+        # Content Metadata Validation Section
+        validation = summary.get("validation")
+        if validation is not None:
+            section_header("📋 Content Metadata Validation", YELLOW)
+
+            if validation["has_errors"]:
+                box_line("  Status: ❌ INVALID", RED)
+            elif not validation["missing_optional"]:
+                box_line("  Status: ✅ VALID (All fields present)", GREEN)
+            else:
+                box_line(
+                    f"  Status: ✅ VALID ({validation['present']}/{validation['total']} fields)",
+                    GREEN,
+                )
+
+            if validation["missing_required"]:
+                box_line(
+                    f"    ├ Missing required: {' '.join(validation['missing_required'])}", RED
+                )
+            if validation["invalid_playback_type"]:
+                box_line(
+                    f"    ├ Invalid playbackType: '{validation['invalid_playback_type']}'", RED
+                )
+            if validation["invalid_content_type"]:
+                box_line(
+                    f"    ├ Invalid contentType: '{validation['invalid_content_type']}'", RED
+                )
+            if validation["missing_optional"]:
+                box_line(
+                    f"    └ Missing optional: {' '.join(validation['missing_optional'])}", YELLOW
+                )
+
+        # ISDK Validation Section
+        isdk = summary.get("isdk")
+        if isdk is not None:
+            section_header("🔗 ISDK Validation", MAGENTA)
+
+            if isdk["show_event_list"]:
+                unique_events = isdk["unique_events"]
+                if unique_events:
+                    box_line(
+                        f"  Events Captured: {isdk['event_count']} total, "
+                        f"{len(unique_events)} unique"
+                    )
+                    for idx, event in enumerate(unique_events, start=1):
+                        tree_char = "└" if idx == len(unique_events) else "├"
+                        box_line(f"    {tree_char} {event[:95]}", GREY)
+                else:
+                    box_line("  Events Captured: 0 (No ISDK events)", YELLOW)
+
+            for check in isdk["field_checks"]:
+                if check is isdk["field_checks"][0]:
+                    box_line("")
+                    box_line("  Field Cross-Validation:", YELLOW)
+                self._field_check(box_line, check)
+
+        # Errors Section
+        self._captured_section(
+            section_header, box_line, "❌ Errors Captured", "Errors", summary["errors"], RED
+        )
+        # Warnings Section
+        self._captured_section(
+            section_header, box_line, "⚠️  Warnings Captured", "Warnings",
+            summary["warnings"], YELLOW
+        )
+
+        self.emit(f"{CYAN}  ╚{top_border}╝{NC}")
+        self.emit("")
+
+    @staticmethod
+    def _field_check(box_line: Callable[..., None], check: dict) -> None:
+        status, color = _check_status(check)
+        tree_char = "└" if check["last"] else "├"
+        detail_prefix = "       " if check["last"] else "      │"
+        box_line(f"    {tree_char} {check['label']}: {status}", color)
+        if check["isdk_value"]:
+            box_line(f"{detail_prefix} ISDK: {check['isdk_value'][:85]}", GREY)
+        if check["expected_value"]:
+            box_line(
+                f"{detail_prefix} {check['expected_name']}: {check['expected_value'][:85]}", GREY
+            )
+
+    @staticmethod
+    def _captured_section(
+        section_header: Callable[..., None],
+        box_line: Callable[..., None],
+        title: str,
+        noun: str,
+        messages: List[str],
+        color: str
+    ) -> None:
+        section_header(title, color)
+        if messages:
+            box_line(f"  Total {noun}: {len(messages)}", color)
+            box_line("")
+            for idx, message in enumerate(messages, start=1):
+                tree_char = "└" if idx == len(messages) else "├"
+                box_line(f"    {tree_char} {message}", color)
+        else:
+            box_line(f"  No {noun.lower()} captured during this session ✅", GREEN)
+
+    # ------------------------------------------------------------------
+    # Event rows
+    # ------------------------------------------------------------------
+
+    def psdk_event(self, time_str: str, display_str: str, repeat: bool) -> None:
+        """Display a PSDK event in the left column (grey when repeated)."""
+        if not repeat:
+            self.emit("")
+        color = GREY if repeat else YELLOW
+        self.emit(
+            f"{CYAN}[{time_str}]{NC} {color}{display_str:<{COL_WIDTH - 16}}{NC}"
+            f"{self._sep}{self._empty_isdk}{self._sep}{self._empty_mux}"
+        )
+
+    def isdk_event(self, time_str: str, display_str: str, repeat: bool) -> None:
+        """Display an ISDK event in the middle column."""
+        if not repeat:
+            self.emit("")
+        self.emit(
+            f"{self._empty_psdk}{self._sep} {CYAN}[{time_str}]{NC} "
+            f"{YELLOW}{display_str:<{ISDK_COL_WIDTH - 18}}{NC}{self._sep}{self._empty_mux}"
+        )
+
+    def mux_event(self, time_str: str, display_str: str, blank_line: bool = True) -> None:
+        """Display a MUX event in the right column."""
+        if blank_line:
+            self.emit("")
+        self.emit(
+            f"{self._empty_psdk}{self._sep}{self._empty_isdk}{self._sep} "
+            f"{CYAN}[{time_str}]{NC} {GREEN}{display_str}{NC}"
+        )
+
+    def event_fields(self, event_type: str, fields: List[Tuple[str, str]]) -> None:
+        """
+        Display extracted event fields under an event row.
+
+        Args:
+            event_type: Column to render in (psdk, isdk, mux)
+            fields: (field, value) pairs with non-empty values
+        """
+        total = len(fields)
+        for idx, (field, value) in enumerate(fields, start=1):
+            tree_char = "└" if idx == total else "├"
+            field_line = f"   {tree_char} {field}: {value}"
+
+            if event_type == "isdk":
+                padding = max(ISDK_COL_WIDTH - len(field_line) - 1, 0)
+                self.emit(
+                    f"{self._empty_psdk}{self._sep}{GREY}{field_line}{NC}{' ' * padding}"
+                    f"{self._sep}{self._empty_mux}"
+                )
+            elif event_type == "mux":
+                self.emit(
+                    f"{self._empty_psdk}{self._sep}{self._empty_isdk}{self._sep}"
+                    f"{GREY}{field_line}{NC}"
+                )
+            else:
+                padding = max(COL_WIDTH - len(field_line) - 1, 0)
+                self.emit(
+                    f"{GREY}{field_line}{NC}{' ' * padding}{self._sep}"
+                    f"{self._empty_isdk}{self._sep}{self._empty_mux}"
+                )
+
+    def custom_match(self, time_str: str, line: str) -> None:
+        """Display a line matched by a custom --pattern filter."""
+        self.emit("")
+        self.emit(f"{CYAN}[{time_str}]{NC} {MAGENTA}[CUSTOM]{NC} {line}")
+
+
+def _check_status(check: dict) -> Tuple[str, str]:
+    """Resolve the status label and color of an ISDK field cross-check."""
+    isdk_value = check["isdk_value"]
+    expected_value = check["expected_value"]
+
+    if isdk_value and expected_value:
+        if isdk_value == expected_value:
+            return "✅ MATCH", GREEN
+        return "❌ MISMATCH", RED
+    if not isdk_value:
+        return f"⚠️  No ISDK {check['isdk_short']}", YELLOW
+    return f"⚠️  No {check['expected_missing']}", YELLOW
@@ -0,0 +1,623 @@
+"""
+In-process PSDK event monitor engine.
+
+A Python port of the state machine in scripts/monitor_psdk_events.sh. The
+bash monitor forks sed/jq/date for most lines it displays; this engine keeps
+all state in one process, matches with precompiled patterns and writes the
+rendered output in batches.
+"""
+
+import re
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+from roku_psdk_log_instrument.monitor.classifier import (
+    CONTENT_LOAD, CUSTOM, ERROR, ISDK, ISDK_MARKER, MUX, PLAYBACK_END, PLAYBACK_INITIATE,
+    PLAYER_CREATE, PLAYER_DESTROY, PSDK, WARNING, LineClassifier
+)
+from roku_psdk_log_instrument.monitor.config import MonitorConfig
+from roku_psdk_log_instrument.monitor.display import MonitorDisplay
+from roku_psdk_log_instrument.monitor.fields import EventFields
+
+
+# Event name extraction
+_KEY_EVENT_RE = re.compile(r"key\s+([a-zA-Z0-9_]+)")
+_ISDK_EVENT_RE = re.compile(r"\[PSDK::ISDK\]\s*Event:\s*([a-zA-Z0-9_.]+)")
+_JSON_EVENT_RE = re.compile(r'"event":"([^"]+)"')
+SESSION_ID_RE = re.compile(r'"playbackSessionId":"([^"]+)"')
+PLAYBACK_TYPE_RE = re.compile(r'"[pP]laybackType":"([^"]+)"')
+_MUX_EVENT_RES = (
+    re.compile(r"\[mux-analytics\] EVENT ([a-zA-Z_]*)"),
+    re.compile(r"\[mux-analytics\] ([a-zA-Z_]*)"),
+    re.compile(r"mux: *([a-zA-Z_]*)"),
+    re.compile(r"MUX: *([a-zA-Z_]*)"),
+)
+
+# Content load block fields: (metadata key, ((priority, pattern), ...)).
+# A value is only replaced by one of equal or better (lower) priority, so
+# 'subtitle' (episode name) wins over 'originalSubtitle' (series name).
+_CONTENT_FIELD_RES: Tuple[Tuple[str, Tuple[Tuple[int, "re.Pattern[str]"], ...]], ...] = (
+    ("id", (
+        (0, re.compile(r'^\s*id:\s*"([^"]+)"')),
+        (0, re.compile(r'"id":"([^"]+)"')),
+    )),
+    ("title", (
+        (0, re.compile(r'^\s*title:\s*"([^"]+)"')),
+        (0, re.compile(r'"title":"([^"]+)"')),
+    )),
+    ("subtitle", (
+        (0, re.compile(r'^\s*subtitle:\s*"([^"]+)"')),
+        (0, re.compile(r'^\s*subTitle:\s*"([^"]+)"')),
+        (1, re.compile(r'^\s*originalSubtitle:\s*"([^"]+)"')),
+        (0, re.compile(r'"subtitle":"([^"]+)"')),
+        (0, re.compile(r'"subTitle":"([^"]+)"')),
+        (1, re.compile(r'"originalSubtitle":"([^"]+)"')),
+    )),
+    ("contentType", (
+        (0, re.compile(r'^\s*contentType:\s*"([^"]+)"')),
+        (0, re.compile(r'"contentType":"([^"]+)"')),
+    )),
+    ("playbackType", (
+        (0, re.compile(r'^\s*playbackType:\s*"([^"]+)"')),
+        (0, re.compile(r'^\s*PlaybackType:\s*"([^"]+)"')),
+        (0, re.compile(r'"playbackType":"([^"]+)"')),
+        (0, re.compile(r'"PlaybackType":"([^"]+)"')),
+    )),
+    ("initialPlaybackPosition", (
+        (0, re.compile(r"^\s*initialPlaybackPosition:\s*([0-9]+)")),
+        (0, re.compile(r'"initialPlaybackPosition":([0-9]+)')),
+    )),
+)
+
+# Warning / error message extraction during an active playback
+_ERROR_MESSAGE_RES = (
+    (re.compile(r"BRIGHTSCRIPT:\s*ERROR:\s*(.+)"), "[BrightScript] {}", 1),
+    (re.compile(r"(ERROR|Error|FATAL):\s*(.+)"), "{}", 2),
+    (re.compile(r"\[(ERROR|Error|FATAL)\]\s*(.+)"), "{}", 2),
+)
+_WARNING_MESSAGE_RES = (
+    (re.compile(r"Warning\soccurred\s(.+)"), "[Roku] {}", 1),
+    (re.compile(r"Type\smismatch\soccurred\s(.+)"), "[Roku] Type mismatch: {}", 1),
+    (re.compile(r"(WARN|WARNING|Warning|warning):\s*(.+)"), "{}", 2),
+    (re.compile(r"\[(WARN|WARNING|Warning)\]\s*(.+)"), "{}", 2),
+)
+_SEPARATOR_RE = re.compile(r"^=+$")
+
+# ISDK fields cross-checked against the PSDK side when a playback ends:
+# (ISDK field, label, short name, expected name, missing-expected label, expected source)
+ISDK_FIELD_CHECKS = (
+    ("content.editId", "content.editId ↔ metadata.id", "editId",
+     "Meta", "Metadata ID", "metadata_id"),
+    ("playback.playbackId", "playback.playbackId ↔ sessionId", "playbackId",
+     "PSDK", "PSDK playbackId", "playback_session_id"),
+)
+
+
+def _first_match(patterns: Iterable[Tuple["re.Pattern[str]", str, int]], line: str) -> str:
+    for pattern, template, group in patterns:
+        match = pattern.search(line)
+        if match:
+            return template.format(match.group(group))
+    return line
+
+
+def parse_content_line(line: str, content: Dict[str, str], priorities: Dict[str, int]) -> None:
+    """
+    Read a content metadata field from one line of a content load block.
+
+    Args:
+        line: Line inside a ``Player Controller: Load`` block
+        content: Metadata collected so far, updated in place
+        priorities: Priority of each collected field, updated in place
+    """
+    for name, patterns in _CONTENT_FIELD_RES:
+        for priority, pattern in patterns:
+            match = pattern.search(line)
+            if match:
+                if priority <= priorities.get(name, priority):
+                    content[name] = match.group(1)
+                    priorities[name] = priority
+                break
+
+
+def extract_mux_event_name(line: str) -> str:
+    """
+    Extract a MUX event name from a mux-analytics log line.
+
+    Args:
+        line: Log line containing a MUX marker
+
+    Returns:
+        Event name, or an empty string if none was found
+    """
+    for pattern in _MUX_EVENT_RES:
+        match = pattern.search(line)
+        if match and match.group(1):
+            return match.group(1)
+    return ""
+
+
+class PSDKEventMonitor:
+    """
+    Player/playback/content-load state machine with three-column display.
+
+    Feed raw log lines with ``process_line`` (or ``process_lines``); the
+    rendered output is buffered and written to ``stream`` on ``flush``.
+    """
+
+    def __init__(
+        self,
+        config: Optional[MonitorConfig] = None,
+        custom_patterns: Sequence[str] = (),
+        stream: Optional[TextIO] = None,
+        term_width: Optional[int] = None
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            config: Monitor configuration (loaded from monitor_config.json if None)
+            custom_patterns: Extra substrings to show as [CUSTOM] lines
+            stream: Output stream (defaults to stdout)
+            term_width: Terminal width for the playback summary box
+        """
+        self.config = config or MonitorConfig.load()
+        self.custom_patterns = tuple(p for p in custom_patterns if p)
+        self.stream = stream or sys.stdout
+        self._pending: List[str] = []
+        self.display = MonitorDisplay(self._pending.append, term_width=term_width)
+        self.fields = EventFields(self.config)
+        self.lines_processed = 0
+        self._clock_second = -1
+        self._clock_prefix = ""
+
+        cfg = self.config
+        self.classifier = LineClassifier(cfg, self.custom_patterns)
+        self._valid_playback_types = frozenset(cfg.valid_playback_types)
+        self._valid_content_types = frozenset(cfg.valid_content_types)
+
+        # Player session tracking
+        self.player_active = False
+        self.player_session_id = ""
+        self.player_event_count = 0
+        self.player_start_time = 0.0
+        self.playback_session_ids: List[str] = []
+
+        # Playback session tracking
+        self.playback_active = False
+        self.playback_session_id = ""
+        self.playback_event_count = 0
+        self.playback_start_time = 0.0
+        self.playback_number = 0
+
+        # Content metadata of the last content load, and of the active playback
+        self.content_load_active = False
+        self.content: Dict[str, str] = {}
+        self._content_priority: Dict[str, int] = {}
+        self.session_metadata: Dict[str, str] = {}
+
+        self.last_event_name = ""
+        self._reset_playback_tracking()
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def show_header(self, log_file: str, clear: bool = True) -> None:
+        """
+        Queue the monitor banner.
+
+        Args:
+            log_file: Log file being monitored
+            clear: Clear the screen first
+        """
+        config_name = self.config.path.name if self.config.path else ""
+        self.display.initial_header(log_file, config_name, self.custom_patterns, clear=clear)
+
+    def flush(self) -> None:
+        """Write all pending output to the stream in one call."""
+        if self._pending:
+            self._pending.append("")
+            self.stream.write("\n".join(self._pending))
+            self._pending.clear()
+            self.stream.flush()
+
+    def _now(self) -> str:
+        # HH:MM:SS.mmm wall-clock time; the seconds prefix is formatted once per second
+        now = time.time()
+        second = int(now)
+        if second != self._clock_second:
+            self._clock_second = second
+            self._clock_prefix = time.strftime("%H:%M:%S", time.localtime(second))
+        return f"{self._clock_prefix}.{int((now - second) * 1000):03d}"
+
+    # ------------------------------------------------------------------
+    # Line processing
+    # ------------------------------------------------------------------
+
+    def process_lines(self, lines: Iterable[str]) -> int:
+        """
+        Process a batch of log lines and flush the output once.
+
+        Args:
+            lines: Raw log lines (trailing newlines are stripped)
+
+        Returns:
+            Number of lines processed
+        """
+        count = 0
+        process = self.process_line
+        for line in lines:
+            process(line.rstrip("\r\n"))
+            count += 1
+        self.flush()
+        return count
+
+    def process_line(self, line: str) -> None:
+        """
+        Run one log line through the state machine.
+
+        Args:
+            line: Raw log line without trailing newline
+        """
+        self.lines_processed += 1
+        mask = self.classifier.classify(line)
+
+        # Content load start
+        if mask & CONTENT_LOAD:
+            self.content_load_active = True
+            self.content = {}
+            self._content_priority = {}
+            return
+
+        # Content metadata fields inside a content load block
+        if self.content_load_active:
+            if line == "}":
+                self.content_load_active = False
+            else:
+                parse_content_line(line, self.content, self._content_priority)
+            return
+
+        if mask & PLAYER_CREATE:
+            self._on_player_created(line)
+            return
+
+        if mask & PLAYBACK_INITIATE:
+            self._on_playback_initiated(line)
+            return
+
+        if self.playback_active and mask & PLAYBACK_END:
+            self._display_event(line, self.playback_number)
+            self._end_playback()
+            return
+
+        if self.player_active and mask & (PLAYER_DESTROY | PLAYBACK_END) == PLAYER_DESTROY:
+            self._display_event(line, self.playback_number)
+            self._end_player()
+            return
+
+        if mask & (PSDK | MUX | CUSTOM):
+            self._on_matched_line(line, mask)
+
+        if self.playback_active and mask & (ERROR | WARNING):
+            self._capture_warning_or_error(line, mask)
+
+    def _on_matched_line(self, line: str, mask: int) -> None:
+        is_psdk = mask & PSDK
+        if is_psdk:
+            # Auto-create player session if connected mid-stream
+            if not self.player_active:
+                self._start_player()
+            self.player_event_count += 1
+            if self.playback_active:
+                self.playback_event_count += 1
+
+        if mask & CUSTOM:
+            self.display.custom_match(self._now(), line)
+            # Reset last event name so next PSDK event gets proper spacing
+            self.last_event_name = ""
+        elif is_psdk:
+            self._display_event(line, self.playback_number if self.playback_active else 0)
+
+        if mask & ISDK:
+            self._track_isdk(line)
+
+        if mask & MUX:
+            mux_event = extract_mux_event_name(line) or "mux_event"
+            self.mux_events.append(mux_event)
+            self._display_mux(line, mux_event)
+
+    # ------------------------------------------------------------------
+    # Lifecycle transitions
+    # ------------------------------------------------------------------
+
+    def _start_player(self, session_id: Optional[str] = None) -> None:
+        self.player_active = True
+        self.player_start_time = time.time()
+        self.player_event_count = 0
+        self.playback_number = 0
+        self.playback_session_ids = []
+        self.last_event_name = ""
+        self.display.player_created(self._now(), session_id)
+
+    def _on_player_created(self, line: str) -> None:
+        if self.playback_active:
+            self._abort_playback()
+            self.playback_active = False
+
+        if self.player_active:
+            self._show_player_destroyed()
+
+        match = SESSION_ID_RE.search(line)
+        self.player_session_id = match.group(1) if match else "unknown"
+        self._start_player(self.player_session_id)
+        self._display_event(line, 0)
+
+    def _on_playback_initiated(self, line: str) -> None:
+        if not self.player_active:
+            self._start_player()
+
+        if self.playback_active:
+            self._abort_playback()
+
+        self.playback_active = True
+        self.playback_start_time = time.time()
+        self.playback_event_count = 0
+        self.playback_number += 1
+        match = SESSION_ID_RE.search(line)
+        self.playback_session_id = match.group(1) if match else "unknown"
+        self.last_event_name = ""
+        self._reset_playback_tracking()
+
+        if not self.content.get("playbackType"):
+            type_match = PLAYBACK_TYPE_RE.search(line)
+            if type_match:
+                self.content["playbackType"] = type_match.group(1)
+
+        self.playback_session_ids.append(self.playback_session_id)
+        self.session_metadata = self.content
+
+        self.display.playback_started(
+            self._now(), self.playback_session_id, self.playback_number, self.content
+        )
+        self._display_event(line, self.playback_number)
+
+        # Clear content metadata (session metadata is kept for validation)
+        self.content = {}
+        self._content_priority = {}
+
+    def _abort_playback(self) -> None:
+        duration = int(time.time() - self.playback_start_time)
+        self.display.playback_aborted(
+            self.playback_session_id, self.playback_number, self.playback_event_count, duration
+        )
+        self.playback_event_count = 0
+        self.session_metadata = {}
+
+    def _end_playback(self) -> None:
+        self.playback_active = False
+        duration = int(time.time() - self.playback_start_time)
+        self.display.playback_summary(self.playback_summary(duration))
+        self.playback_event_count = 0
+        self.session_metadata = {}
+        self._reset_playback_tracking()
+
+    def _show_player_destroyed(self) -> None:
+        duration = int(time.time() - self.player_start_time)
+        self.display.player_destroyed(
+            self.player_event_count, duration, self.playback_number, self.playback_session_ids
+        )
+
+    def _end_player(self) -> None:
+        self.player_active = False
+        self._show_player_destroyed()
+        self.player_event_count = 0
+        self.playback_number = 0
+        self.playback_session_ids = []
+
+    # ------------------------------------------------------------------
+    # Per-playback tracking
+    # ------------------------------------------------------------------
+
+    def _reset_playback_tracking(self) -> None:
+        self.isdk_events: List[str] = []
+        self.isdk_content_id = ""
+        self.isdk_playback_id = ""
+        self.mux_events: List[str] = []
+        self.warnings: List[str] = []
+        self.errors: List[str] = []
+
+    def _track_isdk(self, line: str) -> None:
+        match = _ISDK_EVENT_RE.search(line)
+        if not match:
+            return
+
+        name = match.group(1)
+        if name.endswith("payload"):
+            name = name[:-len("payload")]
+        self.isdk_events.append(name)
+
+        # Capture first occurrence of the cross-validated fields
+        if not self.isdk_content_id:
+            self.isdk_content_id = self.fields.value("isdk", line, "content.editId")
+        if not self.isdk_playback_id:
+            self.isdk_playback_id = self.fields.value("isdk", line, "playback.playbackId")
+
+    def _capture_warning_or_error(self, line: str, mask: int) -> None:
+        if mask & ERROR:
+            message = _first_match(_ERROR_MESSAGE_RES, line)
+            if not message.startswith("{"):
+                self.errors.append(message)
+        else:
+            message = _first_match(_WARNING_MESSAGE_RES, line)
+            if not message.startswith("{") and not _SEPARATOR_RE.match(message):
+                self.warnings.append(message)
+
+    def validate_content_metadata(self) -> Dict:
+        """
+        Validate the content metadata of the active playback.
+
+        Returns:
+            Dictionary with missing/invalid fields and an overall error flag
+        """
+        cfg = self.config
+        metadata = self.session_metadata
+        missing_required = [f for f in cfg.required_fields if not metadata.get(f)]
+        missing_optional = [f for f in cfg.optional_fields if not metadata.get(f)]
+
+        invalid_playback_type = ""
+        playback_type = metadata.get("playbackType")
+        if (
+            cfg.playback_type_enum_enabled
+            and playback_type
+            and playback_type not in self._valid_playback_types
+        ):
+            invalid_playback_type = playback_type
+
+        invalid_content_type = ""
+        content_type = metadata.get("contentType")
+        if (
+            cfg.content_type_enum_enabled
+            and content_type
+            and content_type not in self._valid_content_types
+        ):
+            invalid_content_type = content_type
+
+        total = len(cfg.required_fields) + len(cfg.optional_fields)
+        return {
+            "has_errors": bool(missing_required or invalid_playback_type or invalid_content_type),
+            "missing_required": missing_required,
+            "missing_optional": missing_optional,
+            "invalid_playback_type": invalid_playback_type,
+            "invalid_content_type": invalid_content_type,
+            "present": total - len(missing_optional),
+            "total": total,
+        }
+
+    def playback_summary(self, duration: int) -> Dict:
+        """
+        Build the summary of the active playback.
+
+        Args:
+            duration: Playback duration in seconds
+
+        Returns:
+            Summary dictionary rendered by MonitorDisplay.playback_summary
+        """
+        cfg = self.config
+        summary: Dict = {
+            "session_id": self.playback_session_id,
+            "session_num": self.playback_number,
+            "duration": duration,
+            "event_count": self.playback_event_count,
+            "isdk_event_count": len(self.isdk_events),
+            "validation": None,
+            "isdk": None,
+            "errors": list(self.errors),
+            "warnings": list(self.warnings),
+        }
+
+        if cfg.show_validation_results and cfg.validation_enabled:
+            summary["validation"] = self.validate_content_metadata()
+
+        if cfg.isdk_validation_enabled:
+            field_checks = []
+            if cfg.isdk_field_validation_enabled:
+                expected = {
+                    "metadata_id": self.session_metadata.get("id", ""),
+                    "playback_session_id": self.playback_session_id,
+                }
+                isdk_values = {
+                    "content.editId": self.isdk_content_id,
+                    "playback.playbackId": self.isdk_playback_id,
+                }
+                for idx, (field, label, short, exp_name, exp_missing, source) in enumerate(
+                    ISDK_FIELD_CHECKS
+                ):
+                    field_checks.append({
+                        "label": label,
+                        "isdk_short": short,
+                        "isdk_value": isdk_values[field],
+                        "expected_name": exp_name,
+                        "expected_missing": exp_missing,
+                        "expected_value": expected[source],
+                        "last": idx == len(ISDK_FIELD_CHECKS) - 1,
+                    })
+
+            summary["isdk"] = {
+                "show_event_list": cfg.isdk_show_event_list,
+                "event_count": len(self.isdk_events),
+                "unique_events": list(dict.fromkeys(self.isdk_events)),
+                "field_checks": field_checks,
+            }
+
+        return summary
+
+    # ------------------------------------------------------------------
+    # Event rows
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def extract_event_name(line: str) -> str:
+        """
+        Extract the display name of an event from a log line.
+
+        Args:
+            line: PSDK/ISDK log line
+
+        Returns:
+            Event name ("[ISDK] " prefixed for ISDK events) or the line itself
+        """
+        match = _KEY_EVENT_RE.search(line)
+        if match:
+            return match.group(1)
+
+        match = _ISDK_EVENT_RE.search(line)
+        if match:
+            name = match.group(1)
+            if name.endswith("payload"):
+                name = name[:-len("payload")]
+            return f"[ISDK] {name}"
+
+        match = _JSON_EVENT_RE.search(line)
+        if match:
+            return match.group(1)
+
+        return line
+
+    def _display_event(self, line: str, session_num: int) -> None:
+        time_str = self._now()
+        event_name = self.extract_event_name(line)
+        is_repeat = event_name == self.last_event_name
+        self.last_event_name = event_name
+
+        prefix = f"[S{session_num}] " if session_num > 0 else ""
+        display_str = prefix + event_name
+        raw_event_name = event_name[len("[ISDK] "):] if event_name.startswith("[ISDK] ") else event_name
+
+        if "[mux-analytics]" in line or "mux:" in line or "MUX:" in line:
+            self.display.mux_event(time_str, display_str, blank_line=not is_repeat)
+            mux_event = extract_mux_event_name(line)
+            if not is_repeat and mux_event:
+                self._display_fields(line, "mux", mux_event)
+        elif ISDK_MARKER in line:
+            self.display.isdk_event(time_str, display_str, is_repeat)
+            self._display_fields(line, "isdk", raw_event_name)
+        else:
+            self.display.psdk_event(time_str, display_str, is_repeat)
+            if not is_repeat:
+                self._display_fields(line, "psdk", raw_event_name)
+
+    def _display_mux(self, line: str, mux_event: str) -> None:
+        prefix = f"[S{self.playback_number}] " if self.playback_number > 0 else ""
+        self.display.mux_event(self._now(), prefix + mux_event)
+        self._display_fields(line, "mux", mux_event)
+
+    def _display_fields(self, line: str, event_type: str, event_name: str) -> None:
+        if not self.config.event_fields_enabled:
+            return
+
+        values = self.fields.select(event_type, event_name, line)
+        if values:
+            self.display.event_fields(event_type, list(values.items()))
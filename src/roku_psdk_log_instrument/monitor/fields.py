@@ -0,0 +1,246 @@
+"""
+Compiled event field selection for the event_fields configuration.
+
+Each configured field path is compiled once into a tuple of keys. A
+payload is decoded at most once per line or record, and only when the
+event has fields configured.
+"""
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from roku_psdk_log_instrument.monitor.config import MonitorConfig
+
+
+EVENT_TYPES = ("psdk", "isdk", "mux")
+
+_DECODER = json.JSONDecoder()
+_MISSING = object()
+
+
+def decode_json(text: str) -> Any:
+    """
+    Decode the first JSON object in a string (or array, if there is no object).
+
+    Text before the first ``{`` and after the end of the value is ignored,
+    so a payload can be decoded straight from its log line.
+
+    Args:
+        text: Text containing JSON
+
+    Returns:
+        Decoded value, or None if there is no valid JSON
+    """
+    start = text.find("{")
+    if start == -1:
+        start = text.find("[")
+        if start == -1:
+            return None
+    try:
+        return _DECODER.raw_decode(text, start)[0]
+    except ValueError:
+        return None
+
+
+def parse_mux_payload(text: str) -> Dict[str, str]:
+    """
+    Parse the ``key: value`` / ``key=value`` pairs of a MUX event.
+
+    Args:
+        text: MUX log line or record text
+
+    Returns:
+        Dict of field names to values
+    """
+    if "{" in text:
+        text = text.split("{", 1)[1]
+        text = text.rsplit("}", 1)[0]
+
+    fields = {}
+    for part in text.split(","):
+        colon = part.find(":")
+        equals = part.find("=")
+        if colon == -1 or (equals != -1 and equals < colon):
+            colon = equals
+        if colon == -1:
+            continue
+        key = part[:colon].split()
+        if key:
+            fields[key[-1].strip('"')] = part[colon + 1:].strip().strip('"')
+    return fields
+
+
+def format_value(value: Any) -> str:
+    """
+    Format a decoded JSON value as it appears in the payload.
+
+    Args:
+        value: Decoded JSON value
+
+    Returns:
+        Strings unquoted, everything else as compact JSON
+    """
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"))
+
+
+class FieldPath:
+    """
+    A dotted field path (``playheaddata.contentplayheadms``) compiled to keys.
+
+    Paths are resolved from the root of the payload at any depth; a
+    numeric key indexes into an array.
+    """
+
+    __slots__ = ("path", "keys")
+
+    def __init__(self, path: str):
+        """
+        Compile a field path.
+
+        Args:
+            path: Dot-separated keys
+        """
+        self.path = path
+        self.keys = tuple(int(key) if key.isdigit() else key for key in path.split("."))
+
+    def get(self, data: Any) -> Optional[str]:
+        """
+        Look up the field in decoded JSON.
+
+        Args:
+            data: Decoded payload
+
+        Returns:
+            Formatted value, or None if the field is missing
+        """
+        for key in self.keys:
+            if isinstance(data, dict):
+                data = data.get(str(key) if isinstance(key, int) else key, _MISSING)
+            elif isinstance(data, list) and isinstance(key, int) and key < len(data):
+                data = data[key]
+            else:
+                return None
+            if data is _MISSING:
+                return None
+        return format_value(data)
+
+
+class EventFields:
+    """
+    Selects the configured ``event_fields`` of PSDK, ISDK and MUX events.
+
+    Replaces per-field regexes over the raw line: the field lists of
+    ``psdk_events``, ``isdk_events`` and ``mux_events`` are compiled once,
+    and the payload of a line is decoded once however many fields are read.
+    """
+
+    def __init__(self, config: Optional[MonitorConfig] = None):
+        """
+        Compile the field configuration.
+
+        Args:
+            config: Monitor configuration (defaults if None)
+        """
+        config = config or MonitorConfig()
+        self.enabled = config.event_fields_enabled
+        self._paths: Dict[str, Dict[str, Tuple[FieldPath, ...]]] = {
+            event_type: {
+                name: tuple(FieldPath(path) for path in paths or ())
+                for name, paths in config.event_fields.get(event_type, {}).items()
+            }
+            for event_type in EVENT_TYPES
+        }
+        self._extra_paths: Dict[str, FieldPath] = {}
+        self._line: Optional[str] = None
+        self._line_is_mux = False
+        self._data: Any = None
+
+    def paths_for(self, event_type: str, event_name: str) -> Tuple[FieldPath, ...]:
+        """
+        Get the compiled fields of an event.
+
+        Args:
+            event_type: Event type (psdk, isdk, mux)
+            event_name: Event name as it appears in the log
+
+        Returns:
+            Field paths (the type's default list for unconfigured events)
+        """
+        paths = self._paths.get(event_type, {})
+        selected = paths.get(event_name)
+        if selected is None:
+            selected = paths.get("default", ())
+        return selected
+
+    def select(self, event_type: str, event_name: str, line: str) -> Dict[str, str]:
+        """
+        Select the configured fields of an event line.
+
+        Args:
+            event_type: Event type (psdk, isdk, mux)
+            event_name: Event name
+            line: Raw log line
+
+        Returns:
+            Field paths to values, in configuration order; missing or empty fields are left out
+        """
+        paths = self.paths_for(event_type, event_name)
+        if not paths:
+            return {}
+        return _select(paths, self._payload(event_type, line))
+
+    def value(self, event_type: str, line: str, path: str) -> str:
+        """
+        Read one field of an event line, configured or not.
+
+        Args:
+            event_type: Event type (psdk, isdk, mux)
+            line: Raw log line
+            path: Dotted field path
+
+        Returns:
+            Field value or an empty string
+        """
+        field = self._extra_paths.get(path)
+        if field is None:
+            field = self._extra_paths[path] = FieldPath(path)
+        return _select((field,), self._payload(event_type, line)).get(path, "")
+
+    def select_record(self, record) -> Dict[str, str]:
+        """
+        Select the configured fields of an event record.
+
+        Args:
+            record: LogRecord of a PSDK, ISDK or MUX event
+
+        Returns:
+            Field paths to values
+        """
+        event_type = record.kind.value.split("_", 1)[0]
+        paths = self.paths_for(event_type, record.name)
+        if not paths:
+            return {}
+        data = parse_mux_payload(record.text) if event_type == "mux" else record.data()
+        return _select(paths, data)
+
+    def _payload(self, event_type: str, line: str) -> Any:
+        # The monitor reads several fields of one line in a row; decode it once
+        is_mux = event_type == "mux"
+        if line is not self._line or is_mux != self._line_is_mux:
+            self._line = line
+            self._line_is_mux = is_mux
+            self._data = parse_mux_payload(line) if is_mux else decode_json(line)
+        return self._data
+
+
+def _select(paths: Tuple[FieldPath, ...], data: Any) -> Dict[str, str]:
+    values = {}
+    if isinstance(data, dict) and data:
+        for field in paths:
+            # MUX payloads are flat, so a dotted name may be a key of its own
+            value = format_value(data[field.path]) if field.path in data else field.get(data)
+            if value:
+                values[field.path] = value
+    return values
@@ -0,0 +1,175 @@
+"""
+Follow a growing log file (``tail -f``) and feed it to the monitor.
+"""
+
+import io
+import os
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from roku_psdk_log_instrument.monitor.engine import PSDKEventMonitor
+from roku_psdk_log_instrument.telnet.segments import find_segment, last_segment_index, open_segment
+
+
+def _open_text(binary_file):
+    # newline="" keeps \r so lines split on \n exactly like the capture wrote them
+    return io.TextIOWrapper(binary_file, encoding="utf-8", errors="ignore", newline="")
+
+
+def _rotated(path: Path, current) -> bool:
+    # The active log was renamed to a segment (and maybe already replaced)
+    try:
+        return os.stat(path).st_ino != os.fstat(current.fileno()).st_ino
+    except FileNotFoundError:
+        return True
+
+
+def _open_active(path: Path, index: int, backlog: List[Path], poll_interval: float):
+    """
+    Open the active log, queueing segments closed since ``index`` in backlog.
+
+    Args:
+        path: Active session log
+        index: Segment number the next unread data was (or will be) rotated to
+        backlog: Closed segments still to read; extended in place
+        poll_interval: Seconds to wait while the log is being replaced
+
+    Returns:
+        Tuple of (text file, segment number the opened file will be rotated to)
+    """
+    while True:
+        segment = find_segment(path, index)
+        if segment is not None:
+            backlog.append(segment)
+            index += 1
+            continue
+        try:
+            active = _open_text(open(path, "rb"))
+        except FileNotFoundError:
+            # Between the rename and the new log being created
+            time.sleep(poll_interval)
+            continue
+        # If segment `index` appeared meanwhile, we opened a newer log than expected
+        if find_segment(path, index) is None:
+            return active, index
+        active.close()
+
+
+def follow_file(
+    path: Path,
+    poll_interval: float = 0.1,
+    from_start: bool = True,
+    stop_when_idle: Optional[float] = None
+) -> Iterator[List[str]]:
+    """
+    Yield batches of complete lines appended to a file.
+
+    Each batch contains every complete line available at the time of the
+    read, so a burst of log lines is handed over in one piece. Like
+    ``tail -F``, the file is reopened when a rotating capture replaces it;
+    segments closed in between are read first so no lines are skipped.
+    When starting from the beginning, earlier segments are replayed too.
+
+    Args:
+        path: File to follow (waited for if it does not exist yet)
+        poll_interval: Seconds to sleep when no new data is available
+        from_start: Start at the beginning of the file instead of its end
+        stop_when_idle: Stop after this many idle seconds (follow forever if None)
+
+    Yields:
+        Lists of lines without trailing newlines
+    """
+    path = Path(path)
+    while not path.exists():
+        time.sleep(poll_interval)
+
+    backlog: List[Path] = []
+    active, index = _open_active(path, last_segment_index(path) + 1, backlog, poll_interval)
+    if from_start:
+        backlog = [
+            segment for segment in (find_segment(path, i) for i in range(1, index))
+            if segment is not None
+        ]
+    else:
+        backlog = []
+        active.seek(0, 2)
+
+    current = active
+    partial = ""
+    idle_since = time.monotonic()
+
+    try:
+        while True:
+            if current is active and backlog:
+                current = _open_text(open_segment(backlog.pop(0)))
+
+            data = current.read(65536)
+
+            if not data and current is not active:
+                # Closed segment finished: continue with the next one or the log
+                current.close()
+                current = active
+                continue
+
+            if not data and _rotated(path, active):
+                # Lines written just before the rename are still in the old file
+                data = active.read()
+                active.close()
+                active, index = _open_active(path, index + 1, backlog, poll_interval)
+                current = active
+
+            if not data:
+                if stop_when_idle is not None and time.monotonic() - idle_since >= stop_when_idle:
+                    if partial:
+                        yield [partial]
+                    return
+                time.sleep(poll_interval)
+                continue
+
+            idle_since = time.monotonic()
+            data = partial + data
+            lines = data.split("\n")
+            partial = lines.pop()
+
+            if lines:
+                yield lines
+    finally:
+        if current is not active:
+            current.close()
+        active.close()
+
+
+def run_monitor(
+    log_file: Path,
+    monitor: Optional[PSDKEventMonitor] = None,
+    poll_interval: float = 0.1,
+    stop_when_idle: Optional[float] = None
+) -> PSDKEventMonitor:
+    """
+    Monitor a log file until interrupted.
+
+    Args:
+        log_file: Session log file to follow
+        monitor: Monitor instance (a default one is created if None)
+        poll_interval: Seconds to sleep when no new data is available
+        stop_when_idle: Stop after this many idle seconds (follow forever if None)
+
+    Returns:
+        The monitor that processed the file
+    """
+    monitor = monitor or PSDKEventMonitor()
+
+    print(f"Waiting for log file: {log_file}")
+    monitor.show_header(str(log_file))
+    monitor.flush()
+
+    try:
+        for lines in follow_file(log_file, poll_interval, stop_when_idle=stop_when_idle):
+            monitor.process_lines(lines)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        monitor.flush()
+
+    return monitor
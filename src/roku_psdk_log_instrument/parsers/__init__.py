@@ -2,7 +2,12 @@
 Log parsing modules.
 """
 
+from roku_psdk_log_instrument.parsers.columnar import ColumnarBatch, StringTable
 from roku_psdk_log_instrument.parsers.log_parser import LogParser
+from roku_psdk_log_instrument.parsers.parallel import ParallelParser, ParseStats
+from roku_psdk_log_instrument.parsers.records import LogRecord, RecordAssembler, RecordKind
+from roku_psdk_log_instrument.parsers.timestamps import TimestampDecoder
 
-__all__ = ["LogParser"]
+__all__ = ["LogParser", "ColumnarBatch", "StringTable", "ParallelParser", "ParseStats",
+           "LogRecord", "RecordAssembler", "RecordKind", "TimestampDecoder"]
 
@@ -0,0 +1,604 @@
+"""
+Columnar batch parsing: a chunk of log lines in, column arrays out.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from roku_psdk_log_instrument.models.log_entry import LogEntry, LogLevel
+from roku_psdk_log_instrument.parsers.timestamps import TimestampDecoder
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it every line takes the per-line path
+    np = None
+
+
+LEVELS = tuple(LogLevel)
+_LEVEL_CODES: Dict[str, int] = {level.name: code for code, level in enumerate(LEVELS)}
+_DEFAULT_LEVEL = LEVELS.index(LogLevel.INFO)
+
+NO_STRING = -1
+
+_EPOCH = datetime(1970, 1, 1)
+_EVENT_RE = re.compile(rb"key[ \t]+([A-Za-z0-9_]+)")
+
+# First line in the layout of LogParser.DEFAULT_PATTERN, for the fraction width
+_LAYOUT_RE = re.compile(rb"^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.(\d+) \[", re.MULTILINE)
+
+
+class StringTable:
+    """
+    Interned strings referenced by ID from columnar batches.
+
+    One table is shared by all batches of a file, so equal components or
+    event names have the same ID everywhere and can be compared as ints.
+    """
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self._ids: Dict[bytes, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, value: bytes) -> int:
+        """
+        Get the ID of a string, adding it if needed.
+
+        Args:
+            value: UTF-8 encoded string
+
+        Returns:
+            String ID
+        """
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.values)
+            self.values.append(value.decode("utf-8", "ignore"))
+        return string_id
+
+    def id_of(self, value: str) -> int:
+        """
+        Look up the ID of a string without adding it.
+
+        Args:
+            value: String
+
+        Returns:
+            String ID, or NO_STRING if the string never occurred
+        """
+        return self._ids.get(value.encode("utf-8"), NO_STRING)
+
+    def __getitem__(self, string_id: int) -> Optional[str]:
+        return None if string_id == NO_STRING else self.values[string_id]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ColumnarBatch:
+    """
+    Parsed log lines of one chunk, stored column by column.
+
+    Columns are ``array`` objects and support the buffer protocol, so
+    ``numpy.frombuffer(batch.timestamps, dtype="int64")`` wraps them
+    without copying:
+
+    - ``timestamps``: int64 nanoseconds since the epoch (naive timestamps
+      are encoded as UTC, so they convert back unchanged)
+    - ``levels``: uint8 index into ``LEVELS``
+    - ``components`` / ``events``: int32 IDs in ``strings`` (NO_STRING if absent);
+      the component is a leading ``[TAG]`` of the message, the event the
+      name after ``key`` in PSDK lines
+    - ``message_starts`` / ``message_ends``: byte offsets of the message in ``buffer``
+    - ``line_numbers``: one-based line numbers in the parsed file
+
+    ``line_count`` is the number of lines in the chunk, parsed or not.
+
+    Messages and LogEntry objects are only built when asked for.
+    """
+
+    def __init__(self, buffer: bytes, strings: StringTable):
+        """
+        Initialize an empty batch.
+
+        Args:
+            buffer: Chunk the messages are stored in
+            strings: Intern table for components and events
+        """
+        self.buffer = buffer
+        self.strings = strings
+        self.timestamps = array("q")
+        self.levels = array("B")
+        self.components = array("i")
+        self.events = array("i")
+        self.message_starts = array("Q")
+        self.message_ends = array("Q")
+        self.line_numbers = array("Q")
+        self.line_count = 0
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def message(self, index: int) -> str:
+        """
+        Decode the message of one row.
+
+        Args:
+            index: Row index
+
+        Returns:
+            Message text
+        """
+        return self.buffer[self.message_starts[index]:self.message_ends[index]].decode("utf-8", "ignore")
+
+    def timestamp(self, index: int) -> datetime:
+        """
+        Convert the timestamp of one row to a datetime.
+
+        Args:
+            index: Row index
+
+        Returns:
+            Naive datetime
+        """
+        return _EPOCH + timedelta(microseconds=self.timestamps[index] // 1000)
+
+    def level(self, index: int) -> LogLevel:
+        """
+        Get the level of one row.
+
+        Args:
+            index: Row index
+
+        Returns:
+            LogLevel
+        """
+        return LEVELS[self.levels[index]]
+
+    def entry(self, index: int) -> LogEntry:
+        """
+        Build the LogEntry of one row, equal to what parse_line() returns.
+
+        Args:
+            index: Row index
+
+        Returns:
+            LogEntry with the line number in its metadata
+        """
+        return LogEntry(
+            timestamp=self.timestamp(index),
+            level=self.level(index),
+            message=self.message(index),
+            metadata={"line_number": self.line_numbers[index]}
+        )
+
+    def entries(self) -> Iterator[LogEntry]:
+        """
+        Build LogEntry objects row by row.
+
+        Yields:
+            LogEntry objects
+        """
+        for index in range(len(self)):
+            yield self.entry(index)
+
+    def rows_with_event(self, name: str) -> List[int]:
+        """
+        Find the rows of one event without decoding any message.
+
+        Args:
+            name: Event name
+
+        Returns:
+            Row indexes
+        """
+        event_id = self.strings.id_of(name)
+        if event_id == NO_STRING:
+            return []
+        return [index for index, value in enumerate(self.events) if value == event_id]
+
+
+def parse_chunk(
+    pattern: "re.Pattern[str]",
+    data: bytes,
+    first_line: int = 1,
+    strings: Optional[StringTable] = None,
+    default_layout: bool = False
+) -> ColumnarBatch:
+    """
+    Parse a chunk of complete lines into a ColumnarBatch.
+
+    Rows are the lines parse_line() accepts, with the same timestamp,
+    level and message. With NumPy installed and ``default_layout`` set,
+    lines in the layout of LogParser.DEFAULT_PATTERN are parsed for the
+    whole chunk at once; other lines are matched one by one.
+
+    Args:
+        pattern: Line pattern with timestamp, level and message groups
+        data: Log lines, ending at a line boundary
+        first_line: Line number of the first line in data
+        strings: Intern table shared with other batches of the same file
+        default_layout: Whether pattern is LogParser.DEFAULT_PATTERN
+
+    Returns:
+        ColumnarBatch of the lines that matched
+    """
+    batch = ColumnarBatch(data, strings if strings is not None else StringTable())
+    if default_layout and np is not None:
+        _parse_vectorized(batch, pattern, first_line)
+    else:
+        _fill_per_line(batch, pattern, first_line)
+        _intern_components(batch)
+        _intern_events(batch)
+    return batch
+
+
+def _line_bounds(data: bytes) -> Iterator[Tuple[int, int]]:
+    start = 0
+    find = data.find
+    size = len(data)
+    while start < size:
+        end = find(b"\n", start)
+        if end == -1:
+            end = size
+        yield start, end
+        start = end + 1
+
+
+def _match_line(
+    pattern: "re.Pattern[str]", decode: Callable[[str], Optional[int]], data: bytes, start: int, end: int
+) -> Optional[Tuple]:
+    # parse_line() on one line, returning (ns, level code, message start, message end)
+    # surrogateescape keeps one character per undecodable byte, so offsets map back exactly
+    line = data[start:end].decode("utf-8", "surrogateescape")
+    stripped = line.strip()
+    match = pattern.match(stripped)
+    if not match:
+        return None
+    ns = decode(match.group(1))
+    if ns is None:
+        return None
+    code = _LEVEL_CODES.get(match.group(2).upper(), _DEFAULT_LEVEL)
+
+    lead = len(line) - len(line.lstrip())
+    message_start, message_end = match.span(3)
+    if not line.isascii():
+        message_start = len(stripped[:message_start].encode("utf-8", "surrogateescape"))
+        message_end = len(stripped[:message_end].encode("utf-8", "surrogateescape"))
+        lead = len(line[:lead].encode("utf-8", "surrogateescape"))
+    offset = start + lead
+    return ns, code, offset + message_start, offset + message_end
+
+
+def _fill_per_line(batch: ColumnarBatch, pattern: "re.Pattern[str]", first_line: int) -> None:
+    data = batch.buffer
+    append_row = _row_appender(batch)
+    decode = TimestampDecoder().decode_datetime
+    for line_num, (start, end) in enumerate(_line_bounds(data), start=first_line):
+        batch.line_count += 1
+        if start == end:
+            continue
+        row = _match_line(pattern, decode, data, start, end)
+        if row:
+            append_row(line_num, *row)
+
+
+def _row_appender(batch: ColumnarBatch):
+    timestamps = batch.timestamps.append
+    levels = batch.levels.append
+    message_starts = batch.message_starts.append
+    message_ends = batch.message_ends.append
+    line_numbers = batch.line_numbers.append
+
+    def append_row(line_num: int, ns: int, code: int, start: int, end: int) -> None:
+        line_numbers(line_num)
+        timestamps(ns)
+        levels(code)
+        message_starts(start)
+        message_ends(end)
+
+    return append_row
+
+
+def _intern_components(batch: ColumnarBatch) -> None:
+    data = batch.buffer
+    intern = batch.strings.intern
+    find = data.find
+    components = array("i", [NO_STRING]) * len(batch)
+    for index, (start, end) in enumerate(zip(batch.message_starts, batch.message_ends)):
+        if start < end and data[start] == 91:  # "["
+            close = find(b"]", start, end)
+            if close > start:
+                components[index] = intern(data[start + 1:close])
+    batch.components = components
+
+
+def _intern_events(batch: ColumnarBatch) -> None:
+    data = batch.buffer
+    intern = batch.strings.intern
+    starts = batch.message_starts
+    ends = batch.message_ends
+    events = array("i", [NO_STRING]) * len(batch)
+    for match in _EVENT_RE.finditer(data):
+        index = bisect_right(starts, match.start()) - 1
+        if index >= 0 and match.end() <= ends[index] and events[index] == NO_STRING:
+            events[index] = intern(match.group(1))
+    batch.events = events
+
+
+# Vectorized parsing of the default layout, used when NumPy is installed
+
+_PADDING = 64
+_HASH_PRIME = 1099511628211
+_WINDOW = 32
+
+if np is not None:
+    from numpy.lib.stride_tricks import as_strided
+
+    # Levels as little-endian words of their names, sorted for searchsorted()
+    _WORD_MASKS = np.array([(1 << 8 * size) - 1 for size in range(9)], dtype=np.uint64)
+    _LEVEL_WORDS, _LEVEL_SIZES, _LEVEL_WORD_CODES = (
+        np.array(column, dtype=dtype) for column, dtype in zip(
+            zip(*sorted(
+                (int.from_bytes(level.name.encode(), "little"), len(level.name), code)
+                for code, level in enumerate(LEVELS)
+            )),
+            (np.uint64, np.int64, np.uint8)
+        )
+    )
+
+
+def _windows(padded, width: int):
+    # Every width-byte window of padded as one read-only 2D view
+    return as_strided(padded, shape=(len(padded) - width + 1, width), strides=(1, 1), writeable=False)
+
+
+def _parse_vectorized(batch: ColumnarBatch, pattern: "re.Pattern[str]", first_line: int) -> None:
+    # Lines laid out as "YYYY-MM-DD HH:MM:SS.fff [LEVEL] message" are parsed
+    # with array operations over the whole chunk; the rest go through
+    # _match_line(), and the two sets of rows are merged in line order.
+    data = batch.buffer
+    buf = np.frombuffer(data, dtype=np.uint8)
+    # Zero padding lets fixed-width windows run past the last line
+    padded = np.concatenate((buf, np.zeros(_PADDING, dtype=np.uint8)))
+    newlines = np.flatnonzero(buf == 10)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buf)]))
+    if data.endswith(b"\n"):
+        starts, ends = starts[:-1], ends[:-1]
+    batch.line_count = len(starts)
+
+    layout = _LAYOUT_RE.search(data)
+    rows = _vectorized_rows(padded, starts, ends, len(layout.group(1))) if layout else None
+    if rows is None:
+        lines = np.empty(0, dtype=np.int64)
+        rows = (lines, lines, np.empty(0, dtype=np.uint8), lines, lines)
+    lines, timestamps, levels, message_starts, message_ends = rows
+
+    pending = np.ones(len(starts), dtype=bool)
+    pending[lines] = False
+    pending &= ends > starts
+    extra = []
+    decode = TimestampDecoder().decode_datetime
+    for line in np.flatnonzero(pending).tolist():
+        row = _match_line(pattern, decode, data, int(starts[line]), int(ends[line]))
+        if row:
+            extra.append((line,) + row)
+
+    if extra:
+        columns = list(zip(*extra))
+        lines = np.concatenate((lines, np.array(columns[0], dtype=np.int64)))
+        timestamps = np.concatenate((timestamps, np.array(columns[1], dtype=np.int64)))
+        levels = np.concatenate((levels, np.array(columns[2], dtype=np.uint8)))
+        message_starts = np.concatenate((message_starts, np.array(columns[3], dtype=np.int64)))
+        message_ends = np.concatenate((message_ends, np.array(columns[4], dtype=np.int64)))
+        order = np.argsort(lines, kind="stable")
+        lines, timestamps, levels = lines[order], timestamps[order], levels[order]
+        message_starts, message_ends = message_starts[order], message_ends[order]
+
+    batch.line_numbers.frombytes((lines + first_line).astype(np.uint64).tobytes())
+    batch.timestamps.frombytes(timestamps.astype(np.int64).tobytes())
+    batch.levels.frombytes(levels.astype(np.uint8).tobytes())
+    batch.message_starts.frombytes(message_starts.astype(np.uint64).tobytes())
+    batch.message_ends.frombytes(message_ends.astype(np.uint64).tobytes())
+
+    tagged = np.flatnonzero((padded[message_starts] == 91) & (message_starts < message_ends))
+    components = np.full(len(lines), NO_STRING, dtype=np.int32)
+    components[tagged] = _intern_until(
+        batch, padded, message_starts[tagged] + 1, message_ends[tagged], lambda window: window == 93, True
+    )
+    batch.components = array("i", components.tobytes())
+
+    keys = np.flatnonzero(buf == 107)  # "k"
+    keys = keys[(padded[keys + 1] == 101) & (padded[keys + 2] == 121)
+                & ((padded[keys + 3] == 32) | (padded[keys + 3] == 9))]
+    names = keys + 4
+    spaced = np.flatnonzero((padded[names] == 32) | (padded[names] == 9))
+    names[spaced] = _scan(padded, names[spaced], np.full(len(spaced), len(buf)),
+                          lambda window: (window != 32) & (window != 9))
+    rows = np.searchsorted(message_starts, keys, side="right") - 1
+    inside = _is_name(padded[names]) & (rows >= 0)
+    inside[inside] &= names[inside] < message_ends[rows[inside]]
+    rows, names = rows[inside], names[inside]
+    # The first event of a row wins, like the first finditer() match
+    first = np.flatnonzero(np.diff(rows, prepend=-1) != 0)
+    rows, names = rows[first], names[first]
+    events = np.full(len(lines), NO_STRING, dtype=np.int32)
+    events[rows] = _intern_until(
+        batch, padded, names, message_ends[rows], lambda window: ~_is_name(window), False
+    )
+    batch.events = array("i", events.tobytes())
+
+
+def _is_space(values):
+    # Characters str.strip() and \s treat as whitespace, within ASCII
+    return (values == 32) | ((values >= 9) & (values <= 13)) | ((values >= 28) & (values <= 31))
+
+
+def _is_name(values):
+    # [A-Za-z0-9_], with uint8 arithmetic wrapping below "0" and "a"
+    return ((values - 48) < 10) | (((values | 32) - 97) < 26) | (values == 95)
+
+
+def _vectorized_rows(padded, starts, ends, fraction_width: int):
+    width = 22 + fraction_width  # up to and including the "["
+    longest_level = max(len(level.name) for level in LEVELS)
+    if width + longest_level + 2 > _PADDING or longest_level > 8:
+        return None
+    candidates = np.flatnonzero(ends - starts >= width + 3)
+    line_starts = starts[candidates]
+    line_ends = ends[candidates]
+    head = _windows(padded, width + longest_level + 2)[line_starts]
+
+    ok = (
+        (head[:, 4] == 45) & (head[:, 7] == 45) & (head[:, 10] == 32) & (head[:, 13] == 58)
+        & (head[:, 16] == 58) & (head[:, 19] == 46) & (head[:, width - 2] == 32) & (head[:, width - 1] == 91)
+    )
+    positions = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18] + list(range(20, 20 + fraction_width))
+    digits = head[:, positions].astype(np.int32) - 48
+    ok &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+    digits[~ok] = 0
+
+    def number(first: int, count: int):
+        value = digits[:, first]
+        for column in range(first + 1, first + count):
+            value = value * 10 + digits[:, column]
+        return value.astype(np.int64)
+
+    year, month, day = number(0, 4), number(4, 2), number(6, 2)
+    hour, minute, second = number(8, 2), number(10, 2), number(12, 2)
+    fraction = number(14, min(fraction_width, 9)) * 10 ** (9 - min(fraction_width, 9))
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[np.clip(month, 0, 12)]
+    ok &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= month_days + (leap & (month == 2)))
+    ok &= (hour <= 23) & (minute <= 59) & (second <= 59)
+
+    # Days since the epoch of a proleptic Gregorian date
+    shifted = year - (month <= 2)
+    era = shifted // 400
+    year_of_era = shifted - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = era * 146097 + day_of_era - 719468
+    timestamps = (days * 86400 + hour * 3600 + minute * 60 + second) * 1_000_000_000 + fraction
+
+    # The level is looked up as a little-endian word of the bytes before "]"
+    close = np.argmax(head[:, width:width + longest_level + 1] == 93, axis=1)
+    word = np.ascontiguousarray(head[:, width:width + 8]).view("<u8")[:, 0] & _WORD_MASKS[close]
+    slot = np.minimum(np.searchsorted(_LEVEL_WORDS, word), len(_LEVEL_WORDS) - 1)
+    found = (_LEVEL_WORDS[slot] == word) & (_LEVEL_SIZES[slot] == close)
+    levels = np.where(found, _LEVEL_WORD_CODES[slot], 255).astype(np.uint8)
+    tail_sizes = close + 1
+    ok &= levels != 255
+    ok &= _is_space(head[np.arange(len(candidates)), width + tail_sizes])
+    message_starts = line_starts + width + tail_sizes + 1
+    message_ends = line_ends.astype(np.int64)
+    ok &= message_ends > message_starts
+
+    # \s+ before the message is greedy, and parse_line() strips the line
+    more = np.flatnonzero(ok)
+    while len(more):
+        more = more[(message_starts[more] < message_ends[more]) & _is_space(padded[message_starts[more]])]
+        message_starts[more] += 1
+    more = np.flatnonzero(ok)
+    while len(more):
+        more = more[(message_ends[more] > message_starts[more]) & _is_space(padded[message_ends[more] - 1])]
+        message_ends[more] -= 1
+    ok &= message_ends > message_starts
+
+    return (
+        candidates[ok], timestamps[ok], levels[ok], message_starts[ok], message_ends[ok]
+    )
+
+
+def _scan(padded, positions, limits, stop, step: int = 16):
+    # For each position, the first index before its limit where stop() holds
+    # for the byte, or the limit; windows of step bytes are tested at once
+    windows = _windows(padded, step)
+    result = np.array(limits, dtype=np.int64)
+    offsets = np.array(positions, dtype=np.int64)
+    active = np.flatnonzero(offsets < result)
+    while len(active):
+        hit = stop(windows[offsets[active]])
+        found = hit.any(axis=1)
+        done = active[found]
+        result[done] = np.minimum(offsets[done] + np.argmax(hit[found], axis=1), result[done])
+        active = active[~found]
+        offsets[active] += step
+        active = active[offsets[active] < result[active]]
+    return result
+
+
+def _intern_until(batch: ColumnarBatch, padded, starts, limits, stop, require_stop: bool):
+    # Intern buffer[start:end] for each start, where end is the first byte
+    # before the limit that stop() holds for; without one, the span runs to
+    # the limit, or is left out (NO_STRING) if require_stop is set
+    ids = np.full(len(starts), NO_STRING, dtype=np.int32)
+    if not len(starts):
+        return ids
+    window = _windows(padded, _WINDOW)[starts]
+    hit = stop(window)
+    stopped = hit.any(axis=1)
+    lengths = np.where(stopped, np.argmax(hit, axis=1), _WINDOW)
+    room = limits - starts
+    stopped &= lengths < room
+    lengths = np.minimum(lengths, room)
+
+    # Spans longer than the window are measured with _scan()
+    longer = np.flatnonzero(~stopped & (room > _WINDOW))
+    ends = _scan(padded, starts[longer] + _WINDOW, limits[longer], stop)
+    if require_stop:
+        ended = ends < limits[longer]
+        longer, ends = longer[ended], ends[ended]
+    ids[longer] = _intern_spans(batch, padded, starts[longer], ends)
+
+    short = np.flatnonzero(stopped if require_stop else stopped | (room <= _WINDOW))
+    if len(short):
+        values = window[short] * (np.arange(_WINDOW) < lengths[short, None])
+        ids[short] = _intern_values(batch, starts[short], lengths[short], values)
+    return ids
+
+
+def _intern_spans(batch: ColumnarBatch, padded, starts, ends):
+    # Intern buffer[start:end] for each span, once per distinct value
+    ids = np.empty(len(starts), dtype=np.int32)
+    if not len(starts):
+        return ids
+    data = batch.buffer
+    lengths = ends - starts
+    short = lengths <= _PADDING
+    for index in np.flatnonzero(~short).tolist():
+        ids[index] = batch.strings.intern(data[starts[index]:ends[index]])
+    short = np.flatnonzero(short)
+    if len(short):
+        starts, lengths = starts[short], lengths[short]
+        width = max(8, -(-int(lengths.max()) // 8) * 8)
+        values = _windows(padded, width)[starts] * (np.arange(width) < lengths[:, None])
+        ids[short] = _intern_values(batch, starts, lengths, values)
+    return ids
+
+
+def _intern_values(batch: ColumnarBatch, starts, lengths, values):
+    # values holds each span zero-padded to a multiple of eight bytes; a span
+    # can end in NUL bytes itself, so its length is part of the key
+    words = values.view("<u8")
+    lengths = lengths.astype("<u8")
+    hashes = lengths.copy()
+    for column in range(words.shape[1]):
+        hashes = hashes * np.uint64(_HASH_PRIME) + words[:, column]
+    _, first, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+    expanded = first[inverse.ravel()]
+    if not ((values[expanded] == values).all() and (lengths[expanded] == lengths).all()):
+        # A hash collision: compare the padded bytes and the length exactly
+        keys = np.ascontiguousarray(np.concatenate([values, lengths[:, None].view(np.uint8)], axis=1))
+        _, first, inverse = np.unique(keys.view("V%d" % keys.shape[1]).ravel(), return_index=True, return_inverse=True)
+    intern = batch.strings.intern
+    data = batch.buffer
+    value_ids = np.array(
+        [intern(data[start:start + length]) for start, length in zip(starts[first].tolist(), lengths[first].tolist())],
+        dtype=np.int32
+    )
+    return value_ids[inverse.ravel()]
@@ -3,10 +3,20 @@ Log parsing functionality.
 """
 
 import re
+import sys
 from datetime import datetime
-from typing import List, Optional, TextIO
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, List, Optional, TextIO
 from pathlib import Path
-from roku_psdk_log_instrument.models.log_entry import LogEntry, LogLevel
+from roku_psdk_log_instrument.models.log_entry import CompactEntry, LogEntry, LogLevel
+from roku_psdk_log_instrument.monitor.fields import EventFields
+from roku_psdk_log_instrument.parsers.columnar import ColumnarBatch, StringTable, parse_chunk
+from roku_psdk_log_instrument.parsers.records import LogRecord, assemble_records
+from roku_psdk_log_instrument.parsers.timestamps import TimestampDecoder
+from roku_psdk_log_instrument.telnet.segments import open_session_log
+
+_LEVELS = {level.name: level for level in LogLevel}
+_EVENT_RE = re.compile(r"key[ \t]+([A-Za-z0-9_]+)")
 
 
 class LogParser:
@@ -25,26 +35,189 @@ class LogParser:
             pattern: Optional regex pattern for parsing logs
         """
         self.pattern = re.compile(pattern or self.DEFAULT_PATTERN)
+        self._timestamps = TimestampDecoder()
     
     def parse_file(self, log_path: Path) -> List[LogEntry]:
         """
         Parse a log file and return structured log entries.
         
+        A rotated capture session is read as one stream: its archived
+        segments first, then the active log. Use iter_file() for large
+        logs; this builds the whole list in memory.
+        
         Args:
-            log_path: Path to the log file
+            log_path: Path to the log file or capture session directory
             
         Returns:
             List of parsed log entries
         """
-        entries = []
+        return list(self.iter_file(log_path))
+    
+    def iter_file(
+        self,
+        log_path: Path,
+        start_line: int = 1,
+        end_line: Optional[int] = None,
+        start_offset: Optional[int] = None,
+        end_offset: Optional[int] = None
+    ) -> Iterator[LogEntry]:
+        """
+        Lazily parse a log file, optionally limited to a window.
+        
+        Entries are produced one at a time, so memory use does not grow
+        with the size of the log. A line window counts lines from 1; a byte
+        window covers the lines starting at or after start_offset and
+        before end_offset, so adjacent windows never share or lose a line.
+        Entries from a byte window carry their ``offset`` in the metadata
+        instead of a line number.
+        
+        Args:
+            log_path: Path to the log file or capture session directory
+            start_line: First line to parse
+            end_line: Last line to parse (inclusive)
+            start_offset: Byte offset where the window starts
+            end_offset: Byte offset where the window ends (exclusive)
+            
+        Yields:
+            Parsed log entries
+            
+        Raises:
+            ValueError: If start_line is less than 1
+        """
+        if start_offset is None and end_offset is None:
+            with open_session_log(log_path) as f:
+                yield from self.iter_stream(f, start_line, end_line)
+            return
+        
+        with open_session_log(log_path, binary=True) as f:
+            yield from self._iter_byte_window(f, start_offset or 0, end_offset)
+    
+    def _iter_byte_window(
+        self,
+        f: BinaryIO,
+        start_offset: int,
+        end_offset: Optional[int]
+    ) -> Iterator[LogEntry]:
+        position = 0
+        if start_offset > 0:
+            # Start on the first line beginning at or after start_offset
+            position = start_offset - 1
+            if f.seekable():
+                f.seek(position)
+            else:
+                remaining = position
+                while remaining > 0:
+                    skipped = len(f.read(min(remaining, 1024 * 1024)))
+                    if not skipped:
+                        return
+                    remaining -= skipped
+            position += len(f.readline())
+        
+        for raw in f:
+            if end_offset is not None and position >= end_offset:
+                break
+            entry = self.parse_line(raw.decode("utf-8", "ignore"))
+            if entry:
+                entry.metadata["offset"] = position
+                yield entry
+            position += len(raw)
+    
+    def iter_batches(
+        self,
+        log_path: Path,
+        batch_size: int = 10000,
+        **window
+    ) -> Iterator[List[LogEntry]]:
+        """
+        Lazily parse a log file in lists of at most batch_size entries.
+        
+        Args:
+            log_path: Path to the log file or capture session directory
+            batch_size: Maximum entries per batch
+            **window: start_line, end_line, start_offset or end_offset as for iter_file()
+            
+        Yields:
+            Lists of parsed log entries
+        """
+        entries = self.iter_file(log_path, **window)
+        while True:
+            batch = list(islice(entries, batch_size))
+            if not batch:
+                return
+            yield batch
+    
+    def parse_batch(
+        self,
+        data: bytes,
+        first_line: int = 1,
+        strings: Optional[StringTable] = None
+    ) -> ColumnarBatch:
+        """
+        Parse a chunk of log lines into column arrays.
+        
+        Rows are the lines parse_line() accepts. With NumPy installed,
+        lines in the default layout are parsed a whole chunk at a time.
+        
+        Args:
+            data: Raw log bytes ending at a line boundary
+            first_line: Line number of the first line in data
+            strings: Intern table to share with other batches
+            
+        Returns:
+            ColumnarBatch of the parsed lines
+        """
+        default_layout = self.pattern.pattern == self.DEFAULT_PATTERN
+        return parse_chunk(self.pattern, data, first_line, strings, default_layout)
+    
+    def iter_columnar(
+        self,
+        log_path: Path,
+        chunk_size: int = 2 * 1024 * 1024
+    ) -> Iterator[ColumnarBatch]:
+        """
+        Parse a log file into column arrays, one chunk at a time.
+        
+        Much faster than iter_file() on large logs since no per-line
+        objects are built; call entries() on a batch where LogEntry
+        objects are needed. All batches share one StringTable.
+        
+        Args:
+            log_path: Path to the log file or capture session directory
+            chunk_size: Bytes read per batch
+            
+        Yields:
+            ColumnarBatch objects in file order
+        """
+        strings = StringTable()
+        line = 1
+        with open_session_log(log_path, binary=True) as f:
+            while True:
+                data = f.read(chunk_size)
+                if not data:
+                    break
+                if not data.endswith(b"\n"):
+                    # Finish the last line so no line spans two batches
+                    data += f.readline()
+                batch = self.parse_batch(data, line, strings)
+                line += batch.line_count
+                yield batch
+    
+    def iter_records(self, log_path: Path, fields: Optional[EventFields] = None) -> Iterator[LogRecord]:
+        """
+        Group the raw lines of a device log into multi-line records.
         
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, start=1):
-                entry = self.parse_line(line, line_num)
-                if entry:
-                    entries.append(entry)
+        Device logs do not match the line pattern: PSDK payloads and
+        content load blocks span lines. Each record keeps its line span.
         
-        return entries
+        Args:
+            log_path: Path to the log file or capture session directory
+            fields: Selector for the configured event fields of each event record
+            
+        Yields:
+            LogRecord objects in file order
+        """
+        with open_session_log(log_path) as f:
+            yield from assemble_records(f, fields=fields)
     
     def parse_line(self, line: str, line_num: Optional[int] = None) -> Optional[LogEntry]:
         """
@@ -89,6 +262,82 @@ class LogParser:
         except Exception:
             return None
     
+    def parse_compact(self, line: str, line_num: int = 0, offset: int = -1) -> Optional[CompactEntry]:
+        """
+        Parse a single log line into a CompactEntry.
+        
+        Accepts the same lines as parse_line(), without building a
+        datetime, a metadata dict or a validated model.
+        
+        Args:
+            line: Log line to parse
+            line_num: Line number of the line, or 0
+            offset: Byte offset of the line, or -1
+            
+        Returns:
+            CompactEntry or None if parsing fails
+        """
+        match = self.pattern.match(line.strip())
+        if not match:
+            return None
+        try:
+            timestamp_str, level_str, message = match.group(1, 2, 3)
+            level = _LEVELS.get(level_str.upper(), LogLevel.INFO)
+        except (IndexError, AttributeError):
+            return None
+        timestamp_ns = self._timestamps.decode_datetime(timestamp_str)
+        if timestamp_ns is None:
+            return None
+        
+        component = None
+        if message[:1] == "[":
+            close = message.find("]")
+            if close > 0:
+                component = sys.intern(message[1:close])
+        event = None
+        if "key" in message:
+            event_match = _EVENT_RE.search(message)
+            if event_match:
+                event = sys.intern(event_match.group(1))
+        return CompactEntry(timestamp_ns, level, message, component, event, line_num, offset)
+    
+    def iter_compact(
+        self,
+        log_path: Path,
+        start_line: int = 1,
+        end_line: Optional[int] = None
+    ) -> Iterator[CompactEntry]:
+        """
+        Lazily parse a log file into CompactEntry objects.
+        
+        Uses several times less memory per entry than iter_file(); each
+        entry carries both its line number and its byte offset. Call
+        to_entry() on the entries that leave the pipeline.
+        
+        Args:
+            log_path: Path to the log file or capture session directory
+            start_line: First line to parse
+            end_line: Last line to parse (inclusive)
+            
+        Yields:
+            Parsed compact entries
+            
+        Raises:
+            ValueError: If start_line is less than 1
+        """
+        _check_start_line(start_line)
+        parse_compact = self.parse_compact
+        offset = 0
+        with open_session_log(log_path, binary=True) as f:
+            for line_num, raw in enumerate(f, start=1):
+                if end_line is not None and line_num > end_line:
+                    break
+                if line_num >= start_line:
+                    entry = parse_compact(raw.decode("utf-8", "ignore"), line_num, offset)
+                    if entry:
+                        yield entry
+                offset += len(raw)
+    
     def parse_stream(self, stream: TextIO) -> List[LogEntry]:
         """
         Parse logs from a stream.
@@ -99,12 +348,37 @@ class LogParser:
         Returns:
             List of parsed log entries
         """
-        entries = []
+        return list(self.iter_stream(stream))
+    
+    def iter_stream(
+        self,
+        stream: Iterable[str],
+        start_line: int = 1,
+        end_line: Optional[int] = None
+    ) -> Iterator[LogEntry]:
+        """
+        Lazily parse logs from a stream, optionally limited to a line range.
         
-        for line_num, line in enumerate(stream, start=1):
-            entry = self.parse_line(line, line_num)
+        Args:
+            stream: Text stream or any iterable of lines
+            start_line: First line to parse (lines are counted from 1)
+            end_line: Last line to parse (inclusive)
+            
+        Yields:
+            Parsed log entries
+            
+        Raises:
+            ValueError: If start_line is less than 1
+        """
+        _check_start_line(start_line)
+        lines = islice(stream, start_line - 1, end_line)
+        parse_line = self.parse_line
+        for line_num, line in enumerate(lines, start=start_line):
+            entry = parse_line(line, line_num)
             if entry:
-                entries.append(entry)
-        
-        return entries
+                yield entry
+
 
+def _check_start_line(start_line: int) -> None:
+    if start_line < 1:
+        raise ValueError(f"start_line must be at least 1 (lines are counted from 1), got {start_line}")
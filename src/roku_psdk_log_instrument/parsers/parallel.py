@@ -0,0 +1,349 @@
+"""
+Parallel parsing of large log files: newline-aligned chunks parsed in a process pool.
+"""
+
+import mmap
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from roku_psdk_log_instrument.models.log_entry import LogEntry
+from roku_psdk_log_instrument.parsers.columnar import LEVELS, NO_STRING, ColumnarBatch
+from roku_psdk_log_instrument.parsers.log_parser import LogParser
+from roku_psdk_log_instrument.parsers.records import LogRecord, assemble_records
+from roku_psdk_log_instrument.telnet.segments import (
+    COMPRESSED_SUFFIX, open_session_log, resolve_session_log, session_segments
+)
+
+
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+
+# First bytes of the lines that continue a multi-line record: the indented
+# body and closing "}" of a "Player Controller: Load" block, or the JSON
+# payload printed on the line after "PSDK:: key X value:"
+_CONTINUATION_BYTES = frozenset(b" \t{}]")
+
+# Last bytes of a line whose record carries on into the next line
+_OPEN_RECORD_BYTES = frozenset(b"{[:,")
+_TRAILING_SPACE = frozenset(b" \t\r")
+
+# A chunk: (path, start, end) of a memory-mappable file, or the bytes themselves
+Source = Union[Tuple[str, int, int], bytes]
+
+
+def next_record_start(data, position: int) -> int:
+    """
+    Find the first line at or after position that starts a new record.
+
+    A line does not start a record when it begins like the continuation of
+    a multi-line record, or when the line before it ends open (with ``{``,
+    ``[``, ``:`` or ``,``). Splitting only at record starts keeps blocks
+    such as the ``Player Controller: Load`` content metadata in one chunk.
+
+    Args:
+        data: bytes or mmap of complete log lines
+        position: Byte offset to start looking from
+
+    Returns:
+        Offset of the record start, or len(data) if there is none
+    """
+    size = len(data)
+    if position <= 0:
+        return 0
+    # End of the line holding position - 1, so a line starting exactly at position is a candidate
+    newline = data.find(b"\n", position - 1)
+    while newline != -1 and newline + 1 < size:
+        start = newline + 1
+        if data[start] not in _CONTINUATION_BYTES and not _ends_open(data, newline):
+            return start
+        newline = data.find(b"\n", start)
+    return size
+
+
+def _ends_open(data, newline: int) -> bool:
+    position = newline - 1
+    while position >= 0 and data[position] in _TRAILING_SPACE:
+        position -= 1
+    return position >= 0 and data[position] in _OPEN_RECORD_BYTES
+
+
+def split_chunks(data, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Split log data into chunks of about chunk_size bytes at record starts.
+
+    Args:
+        data: bytes or mmap of log lines
+        chunk_size: Target chunk size in bytes
+
+    Returns:
+        (start, end) byte ranges covering data in order
+    """
+    bounds = []
+    start = 0
+    size = len(data)
+    while start < size:
+        end = next_record_start(data, start + chunk_size) if start + chunk_size < size else size
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+class ParseStats:
+    """
+    Counts aggregated over the lines of a log.
+
+    Workers build one per chunk and the results are merged, so only the
+    counts travel between processes.
+    """
+
+    def __init__(self):
+        """Initialize empty counts."""
+        self.lines = 0
+        self.entries = 0
+        self.levels: Counter = Counter()
+        self.components: Counter = Counter()
+        self.events: Counter = Counter()
+        self.earliest_ns: Optional[int] = None
+        self.latest_ns: Optional[int] = None
+
+    def add_batch(self, batch: ColumnarBatch) -> None:
+        """
+        Count the rows of a parsed batch.
+
+        Args:
+            batch: Parsed chunk
+        """
+        self.lines += batch.line_count
+        self.entries += len(batch)
+        if not len(batch):
+            return
+        for code, count in Counter(batch.levels).items():
+            self.levels[LEVELS[code].name] += count
+        for counts, column in ((self.components, batch.components), (self.events, batch.events)):
+            for string_id, count in Counter(column).items():
+                if string_id != NO_STRING:
+                    counts[batch.strings[string_id]] += count
+        self._add_range(min(batch.timestamps), max(batch.timestamps))
+
+    def merge(self, other: "ParseStats") -> None:
+        """
+        Add the counts of another ParseStats.
+
+        Args:
+            other: Counts to add
+        """
+        self.lines += other.lines
+        self.entries += other.entries
+        self.levels.update(other.levels)
+        self.components.update(other.components)
+        self.events.update(other.events)
+        if other.earliest_ns is not None:
+            self._add_range(other.earliest_ns, other.latest_ns)
+
+    def _add_range(self, earliest: int, latest: int) -> None:
+        if self.earliest_ns is None or earliest < self.earliest_ns:
+            self.earliest_ns = earliest
+        if self.latest_ns is None or latest > self.latest_ns:
+            self.latest_ns = latest
+
+    def to_dict(self) -> Dict:
+        """
+        Convert the counts to a JSON-serializable dict.
+
+        Returns:
+            Dict of counts, most common names first
+        """
+        return {
+            "lines": self.lines,
+            "entries": self.entries,
+            "levels": dict(self.levels.most_common()),
+            "components": dict(self.components.most_common()),
+            "events": dict(self.events.most_common()),
+            "earliest_ns": self.earliest_ns,
+            "latest_ns": self.latest_ns,
+        }
+
+
+class ParallelParser:
+    """
+    Parses a large log with one process per core.
+
+    A plain log file is memory-mapped and split at record starts; each
+    worker maps the file itself and parses its range into a ColumnarBatch,
+    so no log data is sent to the workers. Rotated or compressed session
+    logs are read sequentially and the chunks are sent to the workers.
+    Results come back in file order.
+    """
+
+    def __init__(
+        self,
+        parser: Optional[LogParser] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Initialize the parallel parser.
+
+        Args:
+            parser: Parser whose line pattern is used (default LogParser())
+            workers: Worker processes (default: one per core); 1 parses in-process
+            chunk_size: Target bytes per chunk
+        """
+        self.parser = parser or LogParser()
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def iter_batches(self, log_path: Path) -> Iterator[ColumnarBatch]:
+        """
+        Parse a log into column arrays, one chunk per batch.
+
+        Each batch has its own StringTable, so compare components and
+        events by name across batches.
+
+        Args:
+            log_path: Path to the log file or capture session directory
+
+        Yields:
+            ColumnarBatch objects in file order
+        """
+        return self._run(_parse_source, log_path)
+
+    def iter_entries(self, log_path: Path) -> Iterator[LogEntry]:
+        """
+        Parse a log into LogEntry objects, equal to LogParser.iter_file().
+
+        Args:
+            log_path: Path to the log file or capture session directory
+
+        Yields:
+            Parsed log entries in file order
+        """
+        for batch in self.iter_batches(log_path):
+            yield from batch.entries()
+
+    def iter_records(self, log_path: Path) -> Iterator[LogRecord]:
+        """
+        Group a device log into multi-line records, equal to LogParser.iter_records().
+
+        Args:
+            log_path: Path to the log file or capture session directory
+
+        Yields:
+            LogRecord objects in file order
+        """
+        for records in self._run(_records_source, log_path):
+            yield from records
+
+    def stats(self, log_path: Path) -> ParseStats:
+        """
+        Count lines, levels, components and events of a log.
+
+        Args:
+            log_path: Path to the log file or capture session directory
+
+        Returns:
+            Merged ParseStats of all chunks
+        """
+        total = ParseStats()
+        for stats in self._run(_stats_source, log_path):
+            total.merge(stats)
+        return total
+
+    def _run(self, job: Callable, log_path: Path) -> Iterator:
+        pattern = self.parser.pattern.pattern
+        if self.workers == 1:
+            for first_line, source in self._tasks(log_path, map):
+                yield job(pattern, source, first_line)
+            return
+
+        with ProcessPoolExecutor(self.workers) as executor:
+            # Bounded read-ahead keeps results (and streamed chunks) from piling up
+            pending = deque()
+            for first_line, source in self._tasks(log_path, executor.map):
+                pending.append(executor.submit(job, pattern, source, first_line))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _tasks(self, log_path: Path, map_function: Callable) -> Iterator[Tuple[int, Source]]:
+        log_file = resolve_session_log(log_path)
+        if session_segments(log_file) or log_file.name.endswith(COMPRESSED_SUFFIX) or not log_file.exists():
+            yield from self._streamed_tasks(log_path)
+            return
+
+        with open(log_file, "rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                bounds = split_chunks(data, self.chunk_size)
+
+        # Workers count the lines of their ranges so each chunk knows its first line number
+        sources = [(str(log_file), start, end) for start, end in bounds]
+        first_line = 1
+        for source, count in zip(sources, list(map_function(_count_lines, sources))):
+            yield first_line, source
+            first_line += count
+
+    def _streamed_tasks(self, log_path: Path) -> Iterator[Tuple[int, Source]]:
+        first_line = 1
+        for data in _stream_chunks(open_session_log(log_path, binary=True), self.chunk_size):
+            yield first_line, data
+            first_line += data.count(b"\n")
+
+
+def _stream_chunks(f, chunk_size: int) -> Iterable[bytes]:
+    with f:
+        carry = b""
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            # The last range may end inside a record that continues in the next read
+            data = carry + data
+            bounds = split_chunks(data, chunk_size)
+            for start, end in bounds[:-1]:
+                yield data[start:end]
+            carry = data[bounds[-1][0]:]
+        if carry:
+            yield carry
+
+
+# Worker side: module-level functions so they can be pickled
+
+_PARSERS: Dict[str, LogParser] = {}
+
+
+def _read_source(source: Source) -> bytes:
+    if isinstance(source, bytes):
+        return source
+    path, start, end = source
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return data[start:end]
+
+
+def _count_lines(source: Source) -> int:
+    return _read_source(source).count(b"\n")
+
+
+def _parse_source(pattern: str, source: Source, first_line: int) -> ColumnarBatch:
+    parser = _PARSERS.get(pattern)
+    if parser is None:
+        parser = _PARSERS[pattern] = LogParser(pattern)
+    return parser.parse_batch(_read_source(source), first_line)
+
+
+def _records_source(pattern: str, source: Source, first_line: int) -> List[LogRecord]:
+    lines = _read_source(source).decode("utf-8", "ignore").split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return list(assemble_records(lines, first_line))
+
+
+def _stats_source(pattern: str, source: Source, first_line: int) -> ParseStats:
+    stats = ParseStats()
+    stats.add_batch(_parse_source(pattern, source, first_line))
+    return stats
@@ -0,0 +1,298 @@
+"""
+Multi-line record assembly for raw Roku device logs.
+
+The device stream has no per-line timestamp or level. Some records span
+several lines: a ``PSDK:: key X value:`` line can be followed by its JSON
+payload, and a ``Player Controller: Load {`` block runs until its closing
+bare ``}``. RecordAssembler groups raw lines into typed records in one
+pass, holding back at most one open record.
+"""
+
+import re
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from roku_psdk_log_instrument.monitor.classifier import CONTENT_LOAD, ISDK, MUX, PSDK, LineClassifier
+from roku_psdk_log_instrument.monitor.fields import EventFields, decode_json
+
+
+class RecordKind(str, Enum):
+    """Record type enumeration."""
+    PSDK_EVENT = "psdk_event"
+    ISDK_EVENT = "isdk_event"
+    MUX_EVENT = "mux_event"
+    CONTENT_LOAD = "content_load"
+    BRIGHTSCRIPT_ERROR = "brightscript_error"
+    LINE = "line"
+
+
+# Longest record kept together; an unterminated block is emitted as is
+MAX_RECORD_LINES = 64
+
+_KEY_EVENT_RE = re.compile(r"key\s+([a-zA-Z0-9_]+)")
+_ISDK_EVENT_RE = re.compile(r"\[PSDK::ISDK\]\s*Event:\s*([a-zA-Z0-9_.]+)")
+_MUX_EVENT_RES = (
+    re.compile(r"\[mux-analytics\] EVENT ([a-zA-Z_]*)"),
+    re.compile(r"\[mux-analytics\] ([a-zA-Z_]*)"),
+    re.compile(r"mux: *([a-zA-Z_]*)"),
+    re.compile(r"MUX: *([a-zA-Z_]*)"),
+)
+_BRIGHTSCRIPT_ERROR = "BRIGHTSCRIPT: ERROR:"
+_NO_DATA = object()
+
+
+class LogRecord:
+    """
+    One logical record made of one or more consecutive log lines.
+
+    ``first_line`` and ``last_line`` give the line span in the source,
+    counted from the assembler's first line. ``categories`` is the
+    LineClassifier mask of the first line. ``fields`` holds the selected
+    event fields when the assembler was given an EventFields selector.
+    """
+
+    __slots__ = ("kind", "name", "lines", "first_line", "last_line", "categories", "fields", "_data")
+
+    def __init__(self, kind: RecordKind, name: str, lines: List[str], first_line: int, categories: int = 0):
+        """
+        Initialize a record.
+
+        Args:
+            kind: Record type
+            name: Event name, or "" for records without one
+            lines: Raw lines without trailing newlines
+            first_line: Line number of the first line
+            categories: Classification mask of the first line
+        """
+        self.kind = kind
+        self.name = name
+        self.lines = lines
+        self.first_line = first_line
+        self.last_line = first_line + len(lines) - 1
+        self.categories = categories
+        self.fields: Optional[Dict[str, str]] = None
+        self._data = _NO_DATA
+
+    @property
+    def text(self) -> str:
+        """All lines of the record joined by newlines."""
+        return "\n".join(self.lines)
+
+    @property
+    def payload(self) -> str:
+        """
+        JSON text of a PSDK or ISDK event, across lines if it was split.
+
+        Empty for other records and events without a payload.
+        """
+        text = "".join(self.lines)
+        if self.kind is RecordKind.PSDK_EVENT:
+            _, marker, rest = text.partition("value:")
+            return rest.strip() if marker else ""
+        if self.kind is RecordKind.ISDK_EVENT:
+            start = text.find("{")
+            return text[start:].strip() if start != -1 else ""
+        return ""
+
+    def data(self) -> Any:
+        """
+        Decode the payload, once per record.
+
+        Returns:
+            Decoded JSON value, or None if there is no valid payload
+        """
+        if self._data is _NO_DATA:
+            payload = self.payload
+            self._data = decode_json(payload) if payload else None
+        return self._data
+
+    def __repr__(self) -> str:
+        return f"LogRecord({self.kind.value}, {self.name!r}, lines {self.first_line}-{self.last_line})"
+
+
+_EVENT_KINDS = frozenset((RecordKind.PSDK_EVENT, RecordKind.ISDK_EVENT, RecordKind.MUX_EVENT))
+
+
+def _depth(text: str) -> int:
+    return text.count("{") - text.count("}")
+
+
+class RecordAssembler:
+    """
+    Streaming grouper of raw log lines into LogRecord objects.
+
+    Feed lines with ``feed`` as they arrive and call ``flush`` at the end
+    of the stream, or use ``assemble`` on an iterable. A record is held
+    back only while it can still grow: while a content load block or a
+    JSON payload has unbalanced braces, or for the one line after an
+    event that ends with ``value:``.
+    """
+
+    def __init__(
+        self,
+        first_line: int = 1,
+        classifier: Optional[LineClassifier] = None,
+        max_lines: int = MAX_RECORD_LINES,
+        fields: Optional[EventFields] = None
+    ):
+        """
+        Initialize the assembler.
+
+        Args:
+            first_line: Line number of the first line fed
+            classifier: Classifier for the line markers (default configuration if None)
+            max_lines: Most lines in one record
+            fields: Selector that fills in the ``fields`` of event records
+        """
+        self.line_number = first_line - 1
+        self.classifier = classifier or LineClassifier()
+        self.fields = fields
+        self.max_lines = max_lines
+        self._open: Optional[LogRecord] = None
+        self._depth = 0
+        self._awaiting_payload = False
+
+    def feed(self, line: str) -> List[LogRecord]:
+        """
+        Add one line.
+
+        Args:
+            line: Raw log line (a trailing newline is stripped)
+
+        Returns:
+            Records completed by this line, in order
+        """
+        line = line.rstrip("\r\n")
+        self.line_number += 1
+        completed = []
+
+        record = self._open
+        if record is not None:
+            if self._awaiting_payload:
+                self._awaiting_payload = False
+                if line.lstrip().startswith(("{", "[")):
+                    self._extend(record, line, completed)
+                    return self._select_fields(completed)
+                completed.append(record)
+                self._open = None
+            else:
+                self._extend(record, line, completed)
+                return self._select_fields(completed)
+
+        self._start(line, completed)
+        return self._select_fields(completed)
+
+    def flush(self) -> List[LogRecord]:
+        """
+        Complete the record still held back at the end of the stream.
+
+        Returns:
+            The open record, if any
+        """
+        record = self._open
+        self._open = None
+        self._awaiting_payload = False
+        return self._select_fields([record]) if record is not None else []
+
+    def assemble(self, lines: Iterable[str]) -> Iterator[LogRecord]:
+        """
+        Group an iterable of lines into records.
+
+        Args:
+            lines: Raw log lines
+
+        Yields:
+            LogRecord objects in stream order
+        """
+        feed = self.feed
+        for line in lines:
+            yield from feed(line)
+        yield from self.flush()
+
+    def _select_fields(self, completed: List[LogRecord]) -> List[LogRecord]:
+        if self.fields is not None:
+            for record in completed:
+                if record.kind in _EVENT_KINDS:
+                    record.fields = self.fields.select_record(record)
+        return completed
+
+    def _extend(self, record: LogRecord, line: str, completed: List[LogRecord]) -> None:
+        record.lines.append(line)
+        record.last_line = self.line_number
+        self._depth += _depth(line)
+        done = self._depth <= 0 or len(record.lines) >= self.max_lines
+        if record.kind is RecordKind.CONTENT_LOAD and line == "}":
+            done = True
+        if done:
+            completed.append(record)
+            self._open = None
+
+    def _start(self, line: str, completed: List[LogRecord]) -> None:
+        mask = self.classifier.classify(line)
+        if mask & CONTENT_LOAD:
+            self._hold(RecordKind.CONTENT_LOAD, "", line, mask, completed)
+            return
+
+        if mask & PSDK:
+            if mask & ISDK:
+                match = _ISDK_EVENT_RE.search(line)
+                name = match.group(1) if match else ""
+                if name.endswith("payload"):
+                    name = name[:-len("payload")]
+                kind = RecordKind.ISDK_EVENT
+                open_payload = "{" not in line
+            else:
+                match = _KEY_EVENT_RE.search(line)
+                name = match.group(1) if match else ""
+                kind = RecordKind.PSDK_EVENT
+                open_payload = line.rstrip().endswith("value:")
+            if open_payload:
+                self._open = LogRecord(kind, name, [line], self.line_number, mask)
+                self._depth = 0
+                self._awaiting_payload = True
+            else:
+                self._hold(kind, name, line, mask, completed)
+            return
+
+        if mask & MUX:
+            name = ""
+            for pattern in _MUX_EVENT_RES:
+                match = pattern.search(line)
+                if match and match.group(1):
+                    name = match.group(1)
+                    break
+            completed.append(LogRecord(RecordKind.MUX_EVENT, name, [line], self.line_number, mask))
+            return
+
+        kind = RecordKind.BRIGHTSCRIPT_ERROR if _BRIGHTSCRIPT_ERROR in line else RecordKind.LINE
+        completed.append(LogRecord(kind, "", [line], self.line_number, mask))
+
+    def _hold(self, kind: RecordKind, name: str, line: str, mask: int, completed: List[LogRecord]) -> None:
+        record = LogRecord(kind, name, [line], self.line_number, mask)
+        depth = _depth(line)
+        if depth > 0 and self.max_lines > 1:
+            self._open = record
+            self._depth = depth
+        else:
+            completed.append(record)
+
+
+def assemble_records(
+    lines: Iterable[str],
+    first_line: int = 1,
+    classifier: Optional[LineClassifier] = None,
+    fields: Optional[EventFields] = None
+) -> Iterator[LogRecord]:
+    """
+    Group raw log lines into records with a new RecordAssembler.
+
+    Args:
+        lines: Raw log lines
+        first_line: Line number of the first line
+        classifier: Classifier for the line markers
+        fields: Selector that fills in the ``fields`` of event records
+
+    Yields:
+        LogRecord objects in stream order
+    """
+    return RecordAssembler(first_line, classifier, fields=fields).assemble(lines)
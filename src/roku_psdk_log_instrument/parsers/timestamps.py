@@ -0,0 +1,212 @@
+"""
+Timestamp decoding to integer epoch nanoseconds.
+
+Consecutive log lines mostly share the same second, so TimestampDecoder
+keeps the epoch value of the last ``YYYY-MM-DD HH:MM:SS`` (or
+``HH:MM:SS``) prefix it saw and only parses the fraction of the next
+stamp with that prefix; a new second of the same minute costs one more
+lookup. Naive stamps are taken as UTC, like the columnar
+timestamps column.
+"""
+
+from datetime import date, datetime
+from typing import Dict, Optional
+
+NS_PER_SECOND = 1_000_000_000
+NS_PER_DAY = 86400 * NS_PER_SECOND
+
+_EPOCH = datetime(1970, 1, 1)
+_HALF_DAY_NS = NS_PER_DAY // 2
+
+# Multiplier that scales a fraction of n digits to nanoseconds, by n
+_FRACTION_SCALE = tuple(10 ** (9 - digits) for digits in range(10))
+
+# Fractions of up to three digits, as devices and the default layout print
+# them, are looked up; a dict hit is cheaper than int() on the slice
+_FRACTIONS: Dict[str, int] = {"": 0}
+for _digits in range(1, 4):
+    for _value in range(10 ** _digits):
+        _FRACTIONS[f".{_value:0{_digits}d}"] = _value * _FRACTION_SCALE[_digits]
+del _digits, _value
+
+# ":SS" seconds to nanoseconds
+_SECONDS: Dict[str, int] = {f":{second:02d}": second * NS_PER_SECOND for second in range(60)}
+
+
+def datetime_ns(moment: datetime) -> int:
+    """
+    Convert a datetime to epoch nanoseconds.
+
+    Args:
+        moment: Naive (taken as UTC) or timezone-aware datetime
+
+    Returns:
+        Nanoseconds since 1970-01-01 UTC
+    """
+    if moment.tzinfo is not None:
+        moment = moment.replace(tzinfo=None) - moment.utcoffset()
+    delta = moment - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * NS_PER_SECOND + delta.microseconds * 1000
+
+
+def _fraction_ns(rest: str) -> Optional[int]:
+    # Fractions missing from _FRACTIONS; digits past nanoseconds are dropped
+    digits = rest[1:]
+    if rest[:1] not in (".", ",") or not digits.isdigit() or not digits.isascii():
+        return None
+    if len(digits) > 9:
+        digits = digits[:9]
+    return int(digits) * _FRACTION_SCALE[len(digits)]
+
+
+def _clock_minute_ns(minute: str) -> Optional[int]:
+    # "HH:MM" to nanoseconds into the day
+    hours, colon, minutes = minute[:2], minute[2:3], minute[3:]
+    if colon != ":" or len(minutes) != 2 or not (hours + minutes).isdigit() or not minute.isascii():
+        return None
+    if int(hours) > 23 or int(minutes) > 59:
+        return None
+    return (int(hours) * 60 + int(minutes)) * 60 * NS_PER_SECOND
+
+
+class TimestampDecoder:
+    """
+    Decodes log timestamps to epoch nanoseconds with a per-second cache.
+
+    Handles the stamps found in captures:
+
+    - ``YYYY-MM-DD HH:MM:SS.fff`` (``T`` separator too), as in the
+      LogParser default layout and host receive times written with
+      ``datetime.isoformat()``; up to 9 fraction digits are kept
+    - ``HH:MM:SS.mmm`` clock stamps, as Roku devices emit and the monitor
+      prints, placed on ``base_date``; a stamp more than 12 hours earlier
+      than the one before it is taken as the next day
+
+    Other ISO 8601 forms (such as a UTC offset) are passed to
+    ``datetime.fromisoformat()``. One decoder should read one stream in
+    order, since the clock stamp day depends on the stamps before it.
+    """
+
+    def __init__(self, base_date: Optional[date] = None):
+        """
+        Initialize the decoder.
+
+        Args:
+            base_date: Day of the first clock stamp (default 1970-01-01)
+        """
+        base_date = base_date or _EPOCH.date()
+        self._day_ns = (base_date - _EPOCH.date()).days * NS_PER_DAY
+        self._minute: Optional[str] = None
+        self._minute_ns = 0
+        self._prefix: Optional[str] = None
+        self._prefix_ns = 0
+        self._clock_minute: Optional[str] = None
+        self._clock_minute_ns = 0
+        self._clock: Optional[str] = None
+        self._clock_ns = 0
+
+    def decode(self, text: str) -> Optional[int]:
+        """
+        Decode a date-and-time or clock stamp.
+
+        Args:
+            text: Timestamp text
+
+        Returns:
+            Epoch nanoseconds, or None if text is not a timestamp
+        """
+        if text[2:3] == ":":
+            return self.decode_clock(text)
+        return self.decode_datetime(text)
+
+    def decode_datetime(self, text: str) -> Optional[int]:
+        """
+        Decode an ISO 8601 date and time.
+
+        Args:
+            text: Timestamp such as ``2024-03-01 12:00:00.123``
+
+        Returns:
+            Epoch nanoseconds, or None if text is not a valid timestamp
+        """
+        prefix = text[:19]
+        if prefix != self._prefix:
+            # A new second of the same minute is one lookup away
+            second_ns = _SECONDS.get(prefix[16:])
+            minute = prefix[:16]
+            if minute != self._minute or second_ns is None:
+                if (
+                    second_ns is None or minute[10] not in " T" or minute[4] != "-" or minute[7] != "-"
+                    or minute[13] != ":"
+                ):
+                    return _decode_iso(text)
+                try:
+                    self._minute_ns = datetime_ns(datetime.fromisoformat(minute))
+                except ValueError:
+                    return None
+                self._minute = minute
+            self._prefix = prefix
+            self._prefix_ns = self._minute_ns + second_ns
+        fraction = _FRACTIONS.get(text[19:])
+        if fraction is None:
+            fraction = _fraction_ns(text[19:])
+            if fraction is None:
+                return _decode_iso(text)
+        return self._prefix_ns + fraction
+
+    def decode_clock(self, text: str) -> Optional[int]:
+        """
+        Decode a ``HH:MM:SS.mmm`` clock stamp.
+
+        Args:
+            text: Clock stamp, with or without a fraction
+
+        Returns:
+            Epoch nanoseconds on the current day, or None if text is not a clock stamp
+        """
+        clock = text[:8]
+        if clock != self._clock:
+            second_ns = _SECONDS.get(clock[5:])
+            minute = clock[:5]
+            if minute != self._clock_minute or second_ns is None:
+                minute_ns = _clock_minute_ns(minute)
+                if minute_ns is None or second_ns is None:
+                    return None
+                self._clock_minute = minute
+                self._clock_minute_ns = minute_ns
+            clock_ns = self._clock_minute_ns + second_ns
+            if self._clock is not None and clock_ns < self._clock_ns - _HALF_DAY_NS:
+                self._day_ns += NS_PER_DAY
+            self._clock = clock
+            self._clock_ns = clock_ns
+        fraction = _FRACTIONS.get(text[8:])
+        if fraction is None:
+            fraction = _fraction_ns(text[8:])
+            if fraction is None:
+                return None
+        return self._day_ns + self._clock_ns + fraction
+
+    def decode_line(self, line: str) -> Optional[int]:
+        """
+        Decode the stamp a log line starts with, if any.
+
+        Args:
+            line: Raw log line, such as ``10:30:45.123 [ERROR] ...``
+
+        Returns:
+            Epoch nanoseconds, or None if the line does not start with a timestamp
+        """
+        if line[2:3] == ":":
+            end = line.find(" ", 8)
+            return self.decode_clock(line if end == -1 else line[:end])
+        if line[4:5] == "-":
+            end = line.find(" ", 19)
+            return self.decode_datetime(line if end == -1 else line[:end])
+        return None
+
+
+def _decode_iso(text: str) -> Optional[int]:
+    try:
+        return datetime_ns(datetime.fromisoformat(text))
+    except ValueError:
+        return None
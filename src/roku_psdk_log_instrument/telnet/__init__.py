@@ -2,8 +2,43 @@
 Telnet connection modules for Roku device log capture.
 """
 
-from roku_psdk_log_instrument.telnet.client import RokuTelnetClient
+from roku_psdk_log_instrument.telnet.client import RokuTelnetClient, SocketStats
+from roku_psdk_log_instrument.telnet.framing import LineFramer
 from roku_psdk_log_instrument.telnet.session_manager import SessionManager
+from roku_psdk_log_instrument.telnet.capture_engine import MultiDeviceCaptureEngine
+from roku_psdk_log_instrument.telnet.writers import (
+    AsyncSessionLogWriter,
+    FlushPolicy,
+    RawSessionLogWriter,
+    RotationPolicy,
+    SessionLogWriter,
+)
+from roku_psdk_log_instrument.telnet.segments import open_session_log
+from roku_psdk_log_instrument.telnet.checkpoint import SessionCheckpoint
+from roku_psdk_log_instrument.telnet.retention import RetentionManager, RetentionPolicy
+from roku_psdk_log_instrument.telnet.log_index import SessionLogIndex
+from roku_psdk_log_instrument.telnet.dispatch import LineDispatcher, OverflowPolicy
+from roku_psdk_log_instrument.telnet.async_client import AsyncRokuTelnetClient
+from roku_psdk_log_instrument.telnet.reconnect import ReconnectPolicy
 
-__all__ = ["RokuTelnetClient", "SessionManager"]
-
+__all__ = [
+    "RokuTelnetClient",
+    "AsyncRokuTelnetClient",
+    "SessionManager",
+    "MultiDeviceCaptureEngine",
+    "LineFramer",
+    "SocketStats",
+    "FlushPolicy",
+    "SessionLogWriter",
+    "RawSessionLogWriter",
+    "RotationPolicy",
+    "open_session_log",
+    "SessionCheckpoint",
+    "RetentionManager",
+    "RetentionPolicy",
+    "SessionLogIndex",
+    "AsyncSessionLogWriter",
+    "LineDispatcher",
+    "OverflowPolicy",
+    "ReconnectPolicy",
+]
@@ -0,0 +1,273 @@
+"""
+asyncio Roku Telnet Client for capturing logs from Roku devices.
+"""
+
+import asyncio
+import inspect
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Union
+
+from roku_psdk_log_instrument.telnet.client import RokuTelnetClient
+from roku_psdk_log_instrument.telnet.framing import LineFramer
+from roku_psdk_log_instrument.telnet.writers import AsyncSessionLogWriter, FlushPolicy
+
+
+LineCallback = Callable[[str], Union[None, Awaitable[None]]]
+
+
+class AsyncRokuTelnetClient:
+    """
+    asyncio client for connecting to Roku device via telnet on port 8085.
+
+    Built on ``asyncio.open_connection`` so hundreds of device streams can
+    share one event loop without a thread per device.
+
+    Example:
+        async with AsyncRokuTelnetClient("192.168.1.100") as client:
+            async for line in client.lines():
+                print(line)
+    """
+
+    DEFAULT_PORT = RokuTelnetClient.DEFAULT_PORT
+    TIMEOUT = RokuTelnetClient.TIMEOUT
+    BUFFER_SIZE = RokuTelnetClient.BUFFER_SIZE
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        timeout: int = TIMEOUT
+    ):
+        """
+        Initialize the async Roku telnet client.
+
+        Args:
+            host: Roku device IP address or hostname
+            port: Telnet port (default: 8085)
+            timeout: Connection timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._framer = LineFramer()
+        self._connected = False
+        self.writer_stats = {}
+
+    def is_connected(self) -> bool:
+        """
+        Check if telnet connection is active.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self._writer is not None and self._connected
+
+    async def connect(self) -> bool:
+        """
+        Establish telnet connection to Roku device.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        if self.is_connected():
+            print(f"Already connected to {self.host}:{self.port}")
+            return True
+
+        try:
+            print(f"Connecting to Roku device at {self.host}:{self.port}...")
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=self.timeout
+            )
+            self._connected = True
+            print(f"✓ Successfully connected to {self.host}:{self.port}")
+            return True
+
+        except asyncio.TimeoutError:
+            print(f"✗ Connection timeout: Unable to connect to {self.host}:{self.port}")
+            return False
+        except OSError as e:
+            print(f"✗ Connection error: {e}")
+            return False
+
+    async def disconnect(self) -> None:
+        """
+        Close the telnet connection.
+
+        Safe to call from a task that is being cancelled.
+        """
+        writer, self._writer, self._reader = self._writer, None, None
+        self._connected = False
+        self._framer.clear()
+
+        if writer is None:
+            return
+
+        writer.close()
+        try:
+            # Shielded so a cancelled caller still lets the transport close
+            await asyncio.shield(asyncio.wait_for(writer.wait_closed(), timeout=2))
+        except (asyncio.TimeoutError, OSError):
+            pass
+        print(f"✓ Disconnected from {self.host}:{self.port}")
+
+    async def __aenter__(self) -> "AsyncRokuTelnetClient":
+        if not await self.connect():
+            raise ConnectionError(f"Unable to connect to {self.host}:{self.port}")
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.disconnect()
+
+    async def read_lines(self) -> Optional[List[str]]:
+        """
+        Read every complete line available from one receive.
+
+        Returns:
+            List of lines (may be empty while a line is incomplete), or None if the connection is closed
+        """
+        lines = self._framer.read_lines()
+        if lines:
+            return lines
+
+        if self._reader is None:
+            return None
+
+        try:
+            data = await self._reader.read(self.BUFFER_SIZE)
+        except OSError:
+            # ECONNRESET and friends
+            self._connected = False
+            return None
+
+        if not data:
+            # Connection closed by the device
+            self._connected = False
+            return None
+
+        self._framer.feed(data)
+        return self._framer.read_lines()
+
+    async def lines(self) -> AsyncIterator[str]:
+        """
+        Iterate over log lines until the device closes the connection.
+
+        Yields:
+            Log lines without trailing whitespace
+        """
+        while True:
+            batch = await self.read_lines()
+            if batch is None:
+                return
+            for line in batch:
+                yield line
+
+    async def send_command(self, command: str) -> bool:
+        """
+        Send a command to the Roku device via telnet.
+
+        Args:
+            command: Command string to send
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        if not self.is_connected():
+            return False
+
+        # Ensure command ends with newline
+        if not command.endswith('\n'):
+            command += '\n'
+
+        try:
+            self._writer.write(command.encode('utf-8'))
+            await self._writer.drain()
+            return True
+        except OSError as e:
+            self._connected = False
+            print(f"Error sending command: {e}")
+            return False
+
+    async def capture_logs(
+        self,
+        output_file: Path,
+        callback: Optional[LineCallback] = None,
+        max_duration: Optional[float] = None,
+        flush_policy: Optional[FlushPolicy] = None
+    ) -> int:
+        """
+        Capture logs from telnet connection and write to file.
+
+        Cancelling the task running this coroutine stops the capture; the
+        log file is still flushed and closed.
+
+        Args:
+            output_file: Path to save captured logs
+            callback: Optional callback (plain or async) for each log line
+            max_duration: Optional maximum capture duration in seconds
+            flush_policy: Optional writer flush policy (defaults to 64 KB / 100 ms)
+
+        Returns:
+            Number of lines captured
+        """
+        if not self.is_connected():
+            print("✗ Not connected. Cannot capture logs.")
+            return 0
+
+        writer = AsyncSessionLogWriter(output_file, flush_policy)
+        flusher = asyncio.ensure_future(self._flush_periodically(writer))
+        counter = [0]
+
+        try:
+            await asyncio.wait_for(self._pump(writer, callback, counter), max_duration)
+        except asyncio.TimeoutError:
+            print(f"\nReached max duration of {max_duration} seconds")
+        finally:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+            # Shielded so cancellation cannot lose buffered lines
+            await asyncio.shield(writer.close())
+            self.writer_stats = writer.stats()
+
+        print(f"✓ Captured {counter[0]} log lines to {output_file}")
+        return counter[0]
+
+    async def _pump(
+        self,
+        writer: AsyncSessionLogWriter,
+        callback: Optional[LineCallback],
+        counter: List[int]
+    ) -> None:
+        while True:
+            lines = await self.read_lines()
+            if lines is None:
+                print(f"\n✗ Connection closed by device {self.host}:{self.port}")
+                return
+
+            lines = [line for line in lines if line]  # Skip empty lines
+            if not lines:
+                continue
+
+            await writer.write_lines(lines)
+            counter[0] += len(lines)
+
+            if callback:
+                for line in lines:
+                    result = callback(line)
+                    if inspect.isawaitable(result):
+                        await result
+
+    async def _flush_periodically(self, writer: AsyncSessionLogWriter) -> None:
+        # Interval flushes happen here so an idle device never leaves lines unflushed
+        interval = writer.policy.max_interval
+        if interval is None:
+            return
+        while True:
+            flush_in = writer.next_flush_in()
+            await asyncio.sleep(interval if flush_in is None else max(flush_in, 0.001))
+            await writer.maybe_flush()
@@ -0,0 +1,309 @@
+"""
+Multiplexed log capture from many Roku devices in a single thread.
+"""
+
+import selectors
+import socket
+import time
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, List, Optional, Set
+
+from roku_psdk_log_instrument.telnet.client import RokuTelnetClient
+from roku_psdk_log_instrument.telnet.framing import LineFramer
+from roku_psdk_log_instrument.telnet.session_manager import SessionManager
+from roku_psdk_log_instrument.telnet.writers import FlushPolicy, RotationPolicy, SessionLogWriter
+
+
+class DeviceCapture:
+    """
+    Capture state of one device owned by MultiDeviceCaptureEngine.
+    """
+
+    def __init__(self, client: RokuTelnetClient, session: Dict, log_file: Path):
+        """
+        Initialize the device capture state.
+
+        Args:
+            client: Connected telnet client for the device
+            session: Session dictionary created for the device
+            log_file: Path of the session log file
+        """
+        self.client = client
+        self.session = session
+        self.log_file = log_file
+        self.writer: Optional[SessionLogWriter] = None
+        self.framer = LineFramer()
+        self.line_count = 0
+
+    @property
+    def name(self) -> str:
+        """Device identifier in host:port form."""
+        return f"{self.client.host}:{self.client.port}"
+
+
+class MultiDeviceCaptureEngine:
+    """
+    Captures logs from many Roku devices using one selector loop.
+
+    Every device socket is registered with a ``selectors`` selector (epoll
+    on Linux, kqueue on macOS). The capture thread sleeps in ``select``
+    until a socket has data, so idle devices cost no CPU and no polling.
+    Each device gets its own session in the SessionManager.
+    """
+
+    def __init__(
+        self,
+        session_manager: Optional[SessionManager] = None,
+        callback: Optional[Callable[[str, str], None]] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+        rotation: Optional[RotationPolicy] = None
+    ):
+        """
+        Initialize the capture engine.
+
+        Args:
+            session_manager: Session manager for per-device sessions
+            callback: Optional callback called with (device, line) for each log line
+            flush_policy: Flush policy for every device log (defaults to 64 KB / 100 ms)
+            rotation: Optional rotation policy for every device log
+        """
+        self.session_manager = session_manager or SessionManager()
+        self.callback = callback
+        self.flush_policy = flush_policy
+        self.rotation = rotation
+        self._selector = selectors.DefaultSelector()
+        self._devices: Dict[str, DeviceCapture] = {}
+        self._pending: List[DeviceCapture] = []
+        # host:port of devices between add_device() and _pending
+        self._reserved: Set[str] = set()
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+
+        # Self-pipe so stop() and add_device() can wake a blocked select()
+        self._waker_r, self._waker_w = socket.socketpair()
+        self._waker_r.setblocking(False)
+        self._waker_w.setblocking(False)
+        self._selector.register(self._waker_r, selectors.EVENT_READ, None)
+
+    @property
+    def devices(self) -> List[DeviceCapture]:
+        """Devices currently captured."""
+        with self._lock:
+            return list(self._devices.values()) + list(self._pending)
+
+    def add_device(
+        self,
+        host: str,
+        port: int = RokuTelnetClient.DEFAULT_PORT,
+        description: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Connect to a device and start capturing it into a new session.
+
+        Can be called before or while the engine is running.
+
+        Args:
+            host: Roku device IP address or hostname
+            port: Telnet port
+            description: Optional session description
+
+        Returns:
+            Session dictionary, or None if the connection failed
+
+        Raises:
+            ValueError: If host:port is already being captured
+        """
+        name = f"{host}:{port}"
+        self._reserve(name)
+        try:
+            client = RokuTelnetClient(host, port)
+            if not client.connect():
+                return None
+
+            session = self.session_manager.create_session(host, port, description)
+            log_file = self.session_manager.get_session_log_path(session)
+            device = DeviceCapture(client, session, log_file)
+            device.writer = SessionLogWriter(
+                log_file,
+                self.flush_policy,
+                self.rotation,
+                lambda segment: self.session_manager.record_segment(session, segment),
+                checkpoint=self.session_manager.create_checkpoint(session)
+            )
+
+            with self._lock:
+                self._pending.append(device)
+        finally:
+            with self._lock:
+                self._reserved.discard(name)
+        self._wake()
+
+        return session
+
+    def _reserve(self, name: str) -> None:
+        # A second capture of one device would replace the first in _devices,
+        # leaking its socket and leaving its session open. The name is held
+        # while connecting, so concurrent calls for one device cannot both pass
+        with self._lock:
+            if (
+                name in self._reserved or name in self._devices
+                or any(device.name == name for device in self._pending)
+            ):
+                raise ValueError(f"Device {name} is already being captured")
+            self._reserved.add(name)
+
+    def _wake(self) -> None:
+        try:
+            self._waker_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _register_pending(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        for device in pending:
+            self._devices[device.name] = device
+            self._selector.register(device.client.socket, selectors.EVENT_READ, device)
+
+    def run(self, max_duration: Optional[int] = None) -> Dict[str, int]:
+        """
+        Run the capture loop until stopped or all devices disconnect.
+
+        Args:
+            max_duration: Optional maximum capture duration in seconds
+
+        Returns:
+            Mapping of device (host:port) to captured line count
+        """
+        deadline = time.monotonic() + max_duration if max_duration else None
+        counts: Dict[str, int] = {}
+
+        try:
+            self._register_pending()
+
+            while not self._stop_event.is_set() and (self._devices or self._pending):
+                timeout = self._next_flush_in()
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        print(f"\nReached max duration of {max_duration} seconds")
+                        break
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+
+                for key, _ in self._selector.select(timeout):
+                    device = key.data
+                    if device is None:
+                        self._drain_waker()
+                        self._register_pending()
+                    else:
+                        self._read_device(device, counts)
+
+                for device in self._devices.values():
+                    device.writer.maybe_flush()
+
+        except KeyboardInterrupt:
+            print("\n\n✓ Log capture stopped by user")
+        finally:
+            for device in list(self._devices.values()):
+                self._close_device(device, counts)
+            self._register_pending()
+            for device in list(self._devices.values()):
+                self._close_device(device, counts)
+
+        return counts
+
+    def _next_flush_in(self) -> Optional[float]:
+        # Earliest interval flush due across devices; None sleeps until data arrives
+        due = [
+            flush_in for flush_in in
+            (device.writer.next_flush_in() for device in self._devices.values())
+            if flush_in is not None
+        ]
+        return min(due) if due else None
+
+    def _drain_waker(self) -> None:
+        try:
+            while self._waker_r.recv(1024):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _read_device(self, device: DeviceCapture, counts: Dict[str, int]) -> None:
+        try:
+            received = device.framer.recv_into(device.client.socket, RokuTelnetClient.BUFFER_SIZE)
+        except BlockingIOError:
+            return
+        except (socket.error, OSError):
+            received = 0
+
+        if not received:
+            # Connection closed by the device
+            self._close_device(device, counts)
+            return
+
+        lines = device.framer.read_lines()
+        if not lines:
+            return
+
+        lines = [line for line in lines if line]
+        device.writer.write_lines(lines)
+        device.line_count += len(lines)
+
+        callback = self.callback
+        if callback:
+            name = device.name
+            for line in lines:
+                callback(name, line)
+
+    def _close_device(self, device: DeviceCapture, counts: Dict[str, int]) -> None:
+        if self._devices.pop(device.name, None) is None:
+            return
+
+        try:
+            self._selector.unregister(device.client.socket)
+        except (KeyError, ValueError):
+            pass
+
+        if device.writer:
+            device.writer.close()
+
+        counts[device.name] = device.line_count
+        device.client.disconnect()
+        self.session_manager.end_session(device.session, line_count=device.line_count)
+        print(f"✓ Captured {device.line_count} log lines from {device.name} to {device.log_file}")
+
+    def start(self, max_duration: Optional[int] = None) -> None:
+        """
+        Run the capture loop in a background thread.
+
+        Args:
+            max_duration: Optional maximum capture duration in seconds
+        """
+        if self._thread and self._thread.is_alive():
+            print("Capture already in progress")
+            return
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self.run, args=(max_duration,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the capture loop and end all device sessions.
+        """
+        self._stop_event.set()
+        self._wake()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def close(self) -> None:
+        """
+        Stop capturing and release the selector.
+        """
+        self.stop()
+        self._selector.close()
+        self._waker_r.close()
+        self._waker_w.close()
@@ -0,0 +1,235 @@
+"""
+SQLite index of capture sessions.
+"""
+
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+DateLike = Union[datetime, str]
+
+
+class SessionCatalog:
+    """
+    Index of capture sessions stored in a SQLite file next to the sessions.
+
+    ``session_info.json`` in each session directory stays the source of
+    truth; the catalog mirrors it so listing, filtering and cleanup are a
+    single indexed query instead of reading every session directory. It
+    can be rebuilt from the directories at any time.
+    """
+
+    FILE_NAME = "sessions.db"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id  TEXT PRIMARY KEY,
+            host        TEXT,
+            port        INTEGER,
+            start_time  TEXT,
+            end_time    TEXT,
+            status      TEXT,
+            description TEXT,
+            line_count  INTEGER,
+            directory   TEXT,
+            info        TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS sessions_start ON sessions (start_time);
+        CREATE INDEX IF NOT EXISTS sessions_host ON sessions (host, start_time);
+        CREATE INDEX IF NOT EXISTS sessions_status ON sessions (status, start_time);
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the catalog.
+
+        Args:
+            path: SQLite database file (created on first use)
+        """
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        """
+        Check whether the catalog database has been created.
+
+        Returns:
+            True if the database file exists
+        """
+        return self.path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: callers run on capture,
+        # archiver and CLI threads, and several processes may share the file
+        conn = sqlite3.connect(str(self.path), timeout=10)
+        conn.executescript(self._SCHEMA)
+        return conn
+
+    @staticmethod
+    def _row(session: Dict) -> Tuple:
+        info = {k: v for k, v in session.items() if k != "directory"}
+        directory = session.get("directory")
+        return (
+            session["session_id"],
+            session.get("host"),
+            session.get("port"),
+            session.get("start_time"),
+            session.get("end_time"),
+            session.get("status"),
+            session.get("description"),
+            session.get("line_count", 0),
+            str(directory) if directory else None,
+            json.dumps(info),
+        )
+
+    def upsert(self, session: Dict) -> None:
+        """
+        Add or update a session.
+
+        Args:
+            session: Session dictionary as saved in session_info.json
+        """
+        self.upsert_many([session])
+
+    def upsert_many(self, sessions: Iterable[Dict]) -> None:
+        """
+        Add or update several sessions in one transaction.
+
+        Args:
+            sessions: Session dictionaries
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._row(session) for session in sessions]
+            )
+
+    def remove(self, session_id: str) -> None:
+        """
+        Remove a session from the catalog.
+
+        Args:
+            session_id: Session ID
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    @staticmethod
+    def _where(
+        host: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+        description: Optional[str] = None,
+        exclude_status: Optional[str] = None
+    ) -> Tuple[str, List]:
+        clauses = []
+        params: List = []
+
+        if host is not None:
+            clauses.append("host = ?")
+            params.append(host)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if exclude_status is not None:
+            clauses.append("(status IS NULL OR status != ?)")
+            params.append(exclude_status)
+        # ISO timestamps sort lexically, so range filters use the index
+        if since is not None:
+            clauses.append("start_time >= ?")
+            params.append(since.isoformat() if isinstance(since, datetime) else since)
+        if until is not None:
+            clauses.append("start_time < ?")
+            params.append(until.isoformat() if isinstance(until, datetime) else until)
+        if description:
+            escaped = description.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("description LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        host: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+        description: Optional[str] = None,
+        exclude_status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        Find sessions, newest first.
+
+        Args:
+            host: Only sessions captured from this host
+            status: Only sessions with this status
+            since: Only sessions started at or after this time
+            until: Only sessions started before this time
+            description: Only sessions whose description contains this text (case-insensitive)
+            exclude_status: Skip sessions with this status
+            limit: Maximum number of sessions to return
+            offset: Number of matching sessions to skip
+
+        Returns:
+            Session dictionaries with a ``directory`` Path
+        """
+        where, params = self._where(host, status, since, until, description, exclude_status)
+        sql = f"SELECT info, directory FROM sessions{where} ORDER BY start_time DESC, session_id DESC"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        sessions = []
+        for info, directory in rows:
+            session = json.loads(info)
+            if directory:
+                session["directory"] = Path(directory)
+            sessions.append(session)
+        return sessions
+
+    def count(
+        self,
+        host: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+        description: Optional[str] = None,
+        exclude_status: Optional[str] = None
+    ) -> int:
+        """
+        Count sessions matching the same filters as query().
+
+        Returns:
+            Number of matching sessions
+        """
+        where, params = self._where(host, status, since, until, description, exclude_status)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM sessions{where}", params).fetchone()[0]
+
+    def rebuild(self, sessions: Iterable[Dict]) -> int:
+        """
+        Replace the catalog contents.
+
+        Args:
+            sessions: Every session dictionary, e.g. read from the session directories
+
+        Returns:
+            Number of sessions indexed
+        """
+        rows = [self._row(session) for session in sessions]
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM sessions")
+            conn.executemany(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
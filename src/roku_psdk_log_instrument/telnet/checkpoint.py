@@ -0,0 +1,236 @@
+"""
+Incremental capture checkpoints: running session statistics saved while capturing.
+"""
+
+import time
+from datetime import datetime
+from threading import Condition, Thread
+from typing import Callable, Dict, Optional, Tuple
+
+from roku_psdk_log_instrument.monitor.classifier import ERROR_RE, ERROR_SCREEN, JSON_DATA_RE
+
+
+# Category -> markers; a line is counted once if it contains any of them
+CATEGORY_MARKERS: Dict[str, Tuple[bytes, ...]] = {
+    "psdk": (b"PSDK::",),
+    "isdk": (b"[PSDK::ISDK]",),
+    "mux": (b"[mux-analytics]", b"mux:", b"MUX:"),
+    "error": tuple(marker.encode("utf-8") for marker in ERROR_SCREEN),
+}
+
+
+def is_error_line(line: str) -> bool:
+    """
+    Check a line the way LineClassifier assigns its ERROR category.
+
+    Args:
+        line: Log line that contains one of the error screen markers
+
+    Returns:
+        True for an error line; JSON payloads with an "error" field are not
+    """
+    return not JSON_DATA_RE.search(line) and ERROR_RE.search(line) is not None
+
+
+# Category -> test a line with a marker must also pass to be counted
+CATEGORY_CONFIRM: Dict[str, Callable[[str], bool]] = {
+    "error": is_error_line,
+}
+
+
+def count_marked_lines(
+    data: bytes,
+    markers: Tuple[bytes, ...],
+    confirm: Optional[Callable[[str], bool]] = None
+) -> int:
+    """
+    Count the lines of a batch that contain any of the markers.
+
+    Only the matches are visited (each find() runs in C), so a batch
+    without matches costs one scan per marker.
+
+    Args:
+        data: Newline separated log lines
+        markers: Byte strings to look for
+        confirm: Optional test each decoded matching line must pass
+
+    Returns:
+        Number of matching lines
+    """
+    if len(markers) == 1 and confirm is None:
+        marker = markers[0]
+        count = 0
+        pos = data.find(marker)
+        while pos != -1:
+            count += 1
+            end = data.find(b"\n", pos)
+            if end == -1:
+                break
+            pos = data.find(marker, end)
+        return count
+
+    # Lines keyed by the position of their terminator so each counts once
+    line_ends = set()
+    for marker in markers:
+        pos = data.find(marker)
+        while pos != -1:
+            end = data.find(b"\n", pos)
+            if end == -1:
+                end = len(data)
+            line_ends.add(end)
+            pos = data.find(marker, end)
+    if confirm is None:
+        return len(line_ends)
+    return sum(
+        1 for end in line_ends
+        if confirm(data[data.rfind(b"\n", 0, end) + 1:end].decode("utf-8", "ignore").rstrip("\r"))
+    )
+
+
+class SessionCheckpoint:
+    """
+    Running statistics of a capture, handed to a save callback periodically.
+
+    The log writer feeds every batch it writes through observe(), so the
+    counts always describe what is on disk: line count, byte offset in the
+    session's logical log (across rotated segments), the time the last
+    line was written and per-category line counts. A checkpoint is saved
+    at most every ``interval`` seconds and once more when the writer is
+    closed, which lets a killed capture be closed from its last checkpoint
+    without rescanning the log.
+
+    Periodic saves run on a background thread: the save callback fsyncs
+    session_info.json and updates the session catalog, which can wait on
+    a slow disk or a locked database, and observe() is called from the
+    capture thread. Only the newest pending snapshot is kept. The final
+    save() runs on the caller's thread, after the pending one.
+
+    In raw mode a batch can end mid-line, so a line split across two
+    batches may be counted in a category twice or not at all.
+    """
+
+    def __init__(
+        self,
+        on_save: Callable[[Dict], None],
+        interval: float = 5.0
+    ):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            on_save: Callback receiving each checkpoint dictionary
+            interval: Minimum seconds between periodic saves
+        """
+        self.on_save = on_save
+        self.interval = interval
+        self.line_count = 0
+        self.byte_offset = 0
+        self.last_line_time: Optional[str] = None
+        self.counts = {category: 0 for category in CATEGORY_MARKERS}
+        self.saves = 0
+        self._last_save = time.monotonic()
+        self._dirty = False
+        self._cond = Condition()
+        self._pending: Optional[Dict] = None
+        self._saving = False
+        self._stopping = False
+        self._thread: Optional[Thread] = None
+
+    def observe(self, data: bytes, line_count: int) -> None:
+        """
+        Account for a batch written to the log.
+
+        Args:
+            data: Encoded lines as written to the file
+            line_count: Number of lines in data
+        """
+        self.line_count += line_count
+        self.byte_offset += len(data)
+        self.last_line_time = datetime.now().isoformat()
+        counts = self.counts
+        for category, markers in CATEGORY_MARKERS.items():
+            counts[category] += count_marked_lines(data, markers, CATEGORY_CONFIRM.get(category))
+        self._dirty = True
+
+    def maybe_save(self) -> bool:
+        """
+        Queue a background save if something changed and the interval has passed.
+
+        Returns:
+            True if a checkpoint was queued
+        """
+        if not self._dirty or time.monotonic() - self._last_save < self.interval:
+            return False
+        snapshot = self.snapshot()
+        self._last_save = time.monotonic()
+        self._dirty = False
+        with self._cond:
+            self._pending = snapshot
+            self._stopping = False
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return True
+
+    def wait(self) -> None:
+        """
+        Wait until the queued background save has finished.
+        """
+        with self._cond:
+            while self._pending is not None or self._saving:
+                self._cond.wait()
+
+    def save(self) -> None:
+        """
+        Save a checkpoint now, after any queued background save.
+
+        Stops the background thread; a later maybe_save() starts a new one.
+        """
+        self.wait()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._save(self.snapshot())
+        self._last_save = time.monotonic()
+        self._dirty = False
+
+    def _save(self, snapshot: Dict) -> None:
+        self.on_save(snapshot)
+        self.saves += 1
+
+    def _run(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while self._pending is None and not self._stopping:
+                    cond.wait()
+                if self._pending is None:
+                    self._thread = None
+                    return
+                snapshot, self._pending = self._pending, None
+                self._saving = True
+            try:
+                self._save(snapshot)
+            except Exception as e:
+                # The next checkpoint or the final save tries again
+                print(f"Warning: Could not save checkpoint: {e}")
+            finally:
+                with cond:
+                    self._saving = False
+                    cond.notify_all()
+
+    def snapshot(self) -> Dict:
+        """
+        Current statistics as a JSON serializable dictionary.
+
+        Returns:
+            Checkpoint dictionary
+        """
+        return {
+            "line_count": self.line_count,
+            "byte_offset": self.byte_offset,
+            "last_line_time": self.last_line_time,
+            "counts": dict(self.counts),
+            "updated_at": datetime.now().isoformat(),
+        }
@@ -2,13 +2,76 @@
 Roku Telnet Client for capturing logs from Roku devices.
 """
 
+import selectors
 import socket
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Tuple
 from threading import Thread, Event
 
+from roku_psdk_log_instrument.telnet.checkpoint import SessionCheckpoint
+from roku_psdk_log_instrument.telnet.framing import LineFramer
+from roku_psdk_log_instrument.telnet.writers import (
+    FlushPolicy,
+    RawSessionLogWriter,
+    RotationPolicy,
+    SessionLogWriter,
+)
+from roku_psdk_log_instrument.telnet.reconnect import ReconnectPolicy, format_gap_marker
+
+
+class SocketStats:
+    """
+    Counts socket system calls made by a RokuTelnetClient.
+    
+    Used to spot regressions where the capture loop starts issuing
+    syscalls per line instead of per receive.
+    """
+    
+    def __init__(self):
+        """Initialize all counters to zero."""
+        self.reset()
+    
+    def reset(self) -> None:
+        """
+        Reset all counters to zero.
+        """
+        self.recv = 0   # recv_into calls
+        self.wait = 0   # readiness waits (epoll_wait/kqueue/select)
+        self.send = 0   # send calls
+        self.mode = 0   # settimeout/setblocking calls
+        self.lines = 0  # lines returned to callers
+    
+    @property
+    def syscalls(self) -> int:
+        """Total socket syscalls counted."""
+        return self.recv + self.wait + self.send + self.mode
+    
+    def syscalls_per_line(self) -> float:
+        """
+        Average number of socket syscalls per line read.
+        
+        Returns:
+            Syscalls per line (0.0 if no lines were read)
+        """
+        return self.syscalls / self.lines if self.lines else 0.0
+    
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Convert counters to a dictionary.
+        
+        Returns:
+            Dictionary of counter name to value
+        """
+        return {
+            "recv": self.recv,
+            "wait": self.wait,
+            "send": self.send,
+            "mode": self.mode,
+            "lines": self.lines,
+        }
+
 
 class RokuTelnetClient:
     """
@@ -39,24 +102,29 @@ class RokuTelnetClient:
         self.socket: Optional[socket.socket] = None
         self._stop_event = Event()
         self._capture_thread: Optional[Thread] = None
-        self._buffer = b""
+        self._framer = LineFramer()
+        self._connected = False
+        self._selector: Optional[selectors.BaseSelector] = None
+        self.stats = SocketStats()
+        self.writer_stats: Dict[str, int] = {}
+        self.disconnect_reason: Optional[str] = None
+        self.gaps: List[Dict] = []
     
     def is_connected(self) -> bool:
         """
         Check if telnet connection is active.
         
+        Liveness is tracked from the results of reads and writes (EOF,
+        connection reset), so this check makes no system calls.
+        
         Returns:
             True if connected, False otherwise
         """
-        if self.socket is None:
-            return False
-        
-        try:
-            # Try to send empty data to check if connection is alive
-            self.socket.send(b'')
-            return True
-        except (socket.error, AttributeError, OSError):
-            return False
+        return self.socket is not None and self._connected
+    
+    def _mark_closed(self, reason: str) -> None:
+        self._connected = False
+        self.disconnect_reason = reason
     
     def connect(self) -> bool:
         """
@@ -79,23 +147,29 @@ class RokuTelnetClient:
             # Connect to device
             self.socket.connect((self.host, self.port))
             
-            # Set to non-blocking mode after connection
+            # Set to non-blocking mode once; reads wait on the selector
             self.socket.setblocking(False)
+            self.stats.mode += 2
+            
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.socket, selectors.EVENT_READ)
+            self._connected = True
+            self.disconnect_reason = None
             
             print(f"✓ Successfully connected to {self.host}:{self.port}")
             return True
             
         except socket.timeout:
             print(f"✗ Connection timeout: Unable to connect to {self.host}:{self.port}")
-            self.socket = None
+            self._close_socket()
             return False
         except socket.error as e:
             print(f"✗ Connection error: {e}")
-            self.socket = None
+            self._close_socket()
             return False
         except Exception as e:
             print(f"✗ Unexpected error: {e}")
-            self.socket = None
+            self._close_socket()
             return False
     
     def disconnect(self) -> None:
@@ -107,15 +181,128 @@ class RokuTelnetClient:
         if self._capture_thread and self._capture_thread.is_alive():
             self._capture_thread.join(timeout=2)
         
+        if self.socket:
+            self._close_socket()
+            print(f"✓ Disconnected from {self.host}:{self.port}")
+    
+    def _close_socket(self) -> None:
+        self._connected = False
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        
         if self.socket:
             try:
                 self.socket.close()
-                print(f"✓ Disconnected from {self.host}:{self.port}")
             except Exception as e:
                 print(f"Warning: Error during disconnect: {e}")
             finally:
                 self.socket = None
-                self._buffer = b""
+                self._framer.clear()
+    
+    def reconnect(
+        self,
+        policy: ReconnectPolicy,
+        deadline: Optional[float] = None
+    ) -> Dict:
+        """
+        Reconnect after the connection dropped, backing off between attempts.
+        
+        Args:
+            policy: Backoff policy
+            deadline: Optional time.time() value after which to stop trying
+            
+        Returns:
+            Gap dictionary with start, end, duration, attempts, reason and
+            whether the connection was recovered
+        """
+        reason = self.disconnect_reason or "connection lost"
+        started = datetime.now()
+        start_time = time.monotonic()
+        attempts = 0
+        recovered = False
+        
+        self._close_socket()
+        print(f"\n⚠️  Connection lost ({reason}), reconnecting...")
+        
+        for delay in policy.delays():
+            if deadline is not None:
+                delay = min(delay, deadline - time.time())
+                if delay < 0:
+                    break
+            
+            # Wakes early when stop_capture()/disconnect() is called
+            if self._stop_event.wait(delay):
+                break
+            
+            attempts += 1
+            if self.connect():
+                recovered = True
+                break
+            self._close_socket()
+        
+        gap = {
+            "start": started.isoformat(),
+            "end": datetime.now().isoformat(),
+            "duration": round(time.monotonic() - start_time, 3),
+            "attempts": attempts,
+            "reason": reason,
+            "recovered": recovered,
+        }
+        self.gaps.append(gap)
+        
+        if recovered:
+            print(f"✓ Reconnected after {gap['duration']:.1f}s ({attempts} attempt(s))")
+        else:
+            print(f"✗ Could not reconnect after {attempts} attempt(s)")
+        
+        return gap
+    
+    def _recv(self) -> int:
+        self.stats.recv += 1
+        return self._framer.recv_into(self.socket, self.BUFFER_SIZE)
+    
+    def _wait_readable(self, timeout: float) -> bool:
+        self.stats.wait += 1
+        return bool(self._selector.select(timeout))
+    
+    def _fill(self, timeout: Optional[float]) -> Optional[int]:
+        """
+        Receive one chunk of data into the framer.
+        
+        Reads first and only waits when the socket has nothing buffered,
+        so a busy device costs one recv per chunk.
+        
+        Args:
+            timeout: Maximum time to wait for data in seconds
+            
+        Returns:
+            Number of bytes received (0 on timeout), None if the connection closed
+        """
+        deadline = None
+        
+        while True:
+            try:
+                received = self._recv()
+                if received:
+                    return received
+                # EOF: connection closed by the device
+                self._mark_closed("connection closed by device")
+                return None
+            except BlockingIOError:
+                pass
+            except InterruptedError:
+                continue
+            except OSError as e:
+                # ECONNRESET and friends
+                self._mark_closed(e.strerror or str(e))
+                return None
+            
+            if deadline is None:
+                deadline = time.monotonic() + timeout
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._wait_readable(remaining):
+                return 0
     
     def read_line(self, timeout: Optional[float] = None) -> Optional[str]:
         """
@@ -127,63 +314,127 @@ class RokuTelnetClient:
         Returns:
             Line as string or None if error/timeout
         """
-        if not self.is_connected() or self.socket is None:
+        if self.socket is None:
             return None
         
         try:
             # Check if we have a complete line in buffer
-            while b'\n' not in self._buffer:
-                # Set socket timeout
-                self.socket.settimeout(timeout or 1.0)
-                
-                try:
-                    # Read data from socket
-                    data = self.socket.recv(self.BUFFER_SIZE)
-                    
-                    if not data:
-                        # Connection closed
-                        return None
-                    
-                    self._buffer += data
-                    
-                except socket.timeout:
-                    # No data available
-                    if not self._buffer:
-                        return None
-                    break
-                except BlockingIOError:
-                    # No data available in non-blocking mode
-                    time.sleep(0.01)
-                    continue
+            line = self._framer.next_line()
             
-            # Extract line from buffer
-            if b'\n' in self._buffer:
-                line, self._buffer = self._buffer.split(b'\n', 1)
-                # Use rstrip() to preserve leading whitespace (indentation) 
-                # while removing trailing whitespace (like \r)
-                return line.decode('utf-8', errors='ignore').rstrip()
+            while line is None:
+                if not self._fill(timeout or 1.0):
+                    return None
+                line = self._framer.next_line()
             
-            return None
+            # Leading whitespace (indentation) is preserved, trailing
+            # whitespace (like \r) is removed by the framer
+            self.stats.lines += 1
+            return line
             
-        except (socket.error, OSError) as e:
-            return None
         except Exception as e:
             print(f"Error reading line: {e}")
             return None
     
+    def read_lines(self, timeout: Optional[float] = None) -> Optional[List[str]]:
+        """
+        Read every complete line available from one receive.
+        
+        Args:
+            timeout: Read timeout in seconds
+            
+        Returns:
+            List of lines (empty on timeout), or None if the connection is closed
+        """
+        if self.socket is None:
+            return None
+        
+        # Lines left over from read_line() are returned without a recv
+        lines = self._framer.read_lines()
+        
+        if not lines:
+            received = self._fill(timeout or 1.0)
+            if received is None:
+                return None
+            if received:
+                lines = self._framer.read_lines()
+        
+        self.stats.lines += len(lines)
+        return lines
+    
+    def _read_raw(
+        self,
+        writer: RawSessionLogWriter,
+        timeout: float,
+        decode: bool
+    ) -> Optional[Tuple[int, List[str]]]:
+        """
+        Receive one chunk and hand the bytes to the writer unchanged.
+        
+        Args:
+            writer: Raw writer receiving the bytes
+            timeout: Read timeout in seconds
+            decode: Also frame and decode complete lines (for callbacks)
+            
+        Returns:
+            Tuple of (line terminators received, decoded lines), or None if the connection is closed
+        """
+        received = self._fill(timeout)
+        if received is None:
+            return None
+        if not received:
+            return 0, []
+        
+        with self._framer.recent(received) as chunk:
+            count = writer.write_bytes(chunk)
+        
+        if not decode:
+            # Nobody needs the text: drop the bytes instead of framing them
+            self._framer.clear()
+            return count, []
+        
+        lines = self._framer.read_lines()
+        self.stats.lines += len(lines)
+        return count, lines
+    
     def capture_logs(
         self,
         output_file: Path,
         callback: Optional[Callable[[str], None]] = None,
-        max_duration: Optional[int] = None
+        max_duration: Optional[int] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+        reconnect: Optional[ReconnectPolicy] = None,
+        on_gap: Optional[Callable[[Dict], None]] = None,
+        writer_factory: Optional[Callable[[Path, Optional[FlushPolicy]], SessionLogWriter]] = None,
+        raw: bool = False,
+        rotation: Optional[RotationPolicy] = None,
+        on_segment: Optional[Callable[[Dict], None]] = None,
+        checkpoint: Optional[SessionCheckpoint] = None
     ) -> None:
         """
         Capture logs from telnet connection and write to file.
         
+        With a reconnect policy, a dropped connection is re-established and
+        capture continues in the same file. Each outage is written to the log
+        as a gap marker line and passed to on_gap.
+        
+        In raw mode received bytes go to the file exactly as the device sent
+        them (carriage returns, blank lines and invalid UTF-8 included), and
+        lines are only decoded when there is a callback to receive them.
+        
         Args:
             output_file: Path to save captured logs
             callback: Optional callback function for each log line
             max_duration: Optional maximum capture duration in seconds
+            flush_policy: Optional writer flush policy (defaults to 64 KB / 100 ms)
+            reconnect: Optional reconnect policy (default: stop when the connection drops)
+            on_gap: Optional callback receiving the gap dictionary of each outage
+            writer_factory: Optional SessionLogWriter subclass or factory taking (path, policy),
+                plus (rotation, on_segment) when a rotation policy is given and a
+                ``checkpoint`` keyword when checkpointing
+            raw: Write received bytes unchanged instead of decoded lines
+            rotation: Optional rotation policy splitting the log into segments
+            on_segment: Optional callback receiving each segment's manifest entry
+            checkpoint: Optional checkpoint saving running session statistics
         """
         if not self.is_connected():
             print("✗ Not connected. Cannot capture logs.")
@@ -194,48 +445,102 @@ class RokuTelnetClient:
         
         start_time = time.time()
         line_count = 0
+        writer = None
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                while not self._stop_event.is_set():
-                    # Check max duration
-                    if max_duration and (time.time() - start_time) > max_duration:
-                        print(f"\nReached max duration of {max_duration} seconds")
+            default_writer = RawSessionLogWriter if raw else SessionLogWriter
+            extra = {"checkpoint": checkpoint} if checkpoint else {}
+            if rotation:
+                writer = (writer_factory or default_writer)(output_file, flush_policy, rotation, on_segment, **extra)
+            else:
+                writer = (writer_factory or default_writer)(output_file, flush_policy, **extra)
+            
+            if raw and self._framer.pending:
+                # Bytes left over from read_line() calls before the capture
+                with self._framer.recent(self._framer.pending) as chunk:
+                    writer.write_bytes(chunk)
+                if not callback:
+                    self._framer.clear()
+            
+            while not self._stop_event.is_set():
+                # Check max duration
+                if max_duration and (time.time() - start_time) > max_duration:
+                    print(f"\nReached max duration of {max_duration} seconds")
+                    break
+                
+                # Wake up in time to flush buffered lines for tail-based monitors
+                flush_in = writer.next_flush_in()
+                timeout = 1.0 if flush_in is None else max(flush_in, 0.001)
+                if raw:
+                    # The writer already has the bytes; lines are only decoded for the callback
+                    result = self._read_raw(writer, timeout, decode=callback is not None)
+                    received, lines = result if result is not None else (0, None)
+                else:
+                    lines = self.read_lines(timeout=timeout)
+                
+                if lines is None:
+                    if reconnect is None:
+                        print("\n✗ Connection closed by device")
                         break
                     
-                    # Read line from telnet
-                    line = self.read_line(timeout=1.0)
+                    # Everything before the outage is on disk before we wait
+                    writer.flush()
+                    deadline = start_time + max_duration if max_duration else None
+                    gap = self.reconnect(reconnect, deadline)
                     
-                    if line is None:
-                        continue
+                    marker = format_gap_marker(gap)
+                    writer.write_line(marker)
+                    if callback:
+                        callback(marker)
+                    if on_gap:
+                        on_gap(gap)
+                    
+                    if not gap["recovered"]:
+                        break
+                    continue
+                
+                lines = [line for line in lines if line]  # Skip empty lines
+                if not raw:
+                    received = len(lines)
+                    writer.write_lines(lines)
+                
+                # Call callback if provided
+                if callback:
+                    for line in lines:
+                        callback(line)
+                
+                if received:
+                    previous = line_count
+                    line_count += received
                     
-                    if line:  # Skip empty lines
-                        # Write to file
-                        f.write(f"{line}\n")
-                        f.flush()
-                        
-                        # Call callback if provided
-                        if callback:
-                            callback(line)
-                        
-                        line_count += 1
-                        
-                        # Print progress
-                        if line_count % 100 == 0:
-                            print(f"Captured {line_count} log lines...", end='\r')
+                    # Print progress
+                    if line_count // 100 != previous // 100:
+                        print(f"Captured {line_count} log lines...", end='\r')
+                
+                writer.maybe_flush()
         
         except KeyboardInterrupt:
             print("\n\n✓ Log capture stopped by user")
         except Exception as e:
             print(f"\n✗ Error during log capture: {e}")
         finally:
+            if writer:
+                writer.close()
+                self.writer_stats = writer.stats()
             print(f"\n✓ Captured {line_count} log lines to {output_file}")
     
     def start_capture_async(
         self,
         output_file: Path,
         callback: Optional[Callable[[str], None]] = None,
-        max_duration: Optional[int] = None
+        max_duration: Optional[int] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+        reconnect: Optional[ReconnectPolicy] = None,
+        on_gap: Optional[Callable[[Dict], None]] = None,
+        raw: bool = False,
+        rotation: Optional[RotationPolicy] = None,
+        on_segment: Optional[Callable[[Dict], None]] = None,
+        checkpoint: Optional[SessionCheckpoint] = None
     ) -> None:
         """
         Start log capture in a background thread.
@@ -244,6 +549,13 @@ class RokuTelnetClient:
             output_file: Path to save captured logs
             callback: Optional callback function for each log line
             max_duration: Optional maximum capture duration in seconds
+            flush_policy: Optional writer flush policy (defaults to 64 KB / 100 ms)
+            reconnect: Optional reconnect policy (default: stop when the connection drops)
+            on_gap: Optional callback receiving the gap dictionary of each outage
+            raw: Write received bytes unchanged instead of decoded lines
+            rotation: Optional rotation policy splitting the log into segments
+            on_segment: Optional callback receiving each segment's manifest entry
+            checkpoint: Optional checkpoint saving running session statistics
         """
         if self._capture_thread and self._capture_thread.is_alive():
             print("Capture already in progress")
@@ -252,7 +564,8 @@ class RokuTelnetClient:
         self._stop_event.clear()
         self._capture_thread = Thread(
             target=self.capture_logs,
-            args=(output_file, callback, max_duration),
+            args=(output_file, callback, max_duration, flush_policy, reconnect, on_gap),
+            kwargs={"raw": raw, "rotation": rotation, "on_segment": on_segment, "checkpoint": checkpoint},
             daemon=True
         )
         self._capture_thread.start()
@@ -275,7 +588,7 @@ class RokuTelnetClient:
         Returns:
             True if sent successfully, False otherwise
         """
-        if not self.is_connected() or self.socket is None:
+        if not self.is_connected():
             return False
         
         try:
@@ -284,9 +597,14 @@ class RokuTelnetClient:
                 command += '\n'
             
             # Send command
-            self.socket.send(command.encode('utf-8'))
+            self.stats.send += 1
+            self.socket.sendall(command.encode('utf-8'))
             return True
+        except BlockingIOError as e:
+            print(f"Error sending command: {e}")
+            return False
         except (socket.error, OSError) as e:
+            self._mark_closed(e.strerror or str(e))
             print(f"Error sending command: {e}")
             return False
     
@@ -0,0 +1,223 @@
+"""
+Bounded hand-off of captured lines from the capture thread to a display consumer.
+"""
+
+from collections import deque
+from threading import Condition, Thread
+from typing import Callable, Dict, Iterable, Optional
+
+
+class OverflowPolicy:
+    """
+    What LineDispatcher does with a new line when its queue is full.
+    """
+
+    DROP_OLDEST = "drop_oldest"   # discard the oldest queued line, keep the display current
+    DROP_NEWEST = "drop_newest"   # discard the incoming line
+    COALESCE = "coalesce"         # fold overflow into one "lines skipped" marker
+    BLOCK = "block"               # make the capture thread wait for space (never drop)
+
+    ALL = (DROP_OLDEST, DROP_NEWEST, COALESCE, BLOCK)
+
+
+class _Skipped:
+    """Queue marker standing in for coalesced lines."""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 1
+
+
+class LineDispatcher:
+    """
+    Runs a per-line consumer (e.g. terminal display) on its own thread.
+
+    The capture thread calls ``put`` which only appends to a bounded ring
+    queue, so a slow terminal can no longer stall socket reads. File writes
+    happen before ``put`` in the capture loop and are never affected by the
+    overflow policy; only display lines are dropped or coalesced.
+    """
+
+    DEFAULT_CAPACITY = 10000
+    SKIPPED_FORMAT = "... {count} lines skipped (display could not keep up) ..."
+
+    def __init__(
+        self,
+        consumer: Callable[[str], None],
+        capacity: int = DEFAULT_CAPACITY,
+        policy: str = OverflowPolicy.DROP_OLDEST,
+        on_skip: Optional[Callable[[int], None]] = None
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            consumer: Callable run on the dispatcher thread for each line
+            capacity: Maximum number of queued lines
+            policy: One of OverflowPolicy.ALL
+            on_skip: Called with the count of coalesced lines instead of
+                passing SKIPPED_FORMAT to the consumer
+        """
+        if policy not in OverflowPolicy.ALL:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.consumer = consumer
+        self.capacity = capacity
+        self.policy = policy
+        self.on_skip = on_skip
+        self._queue: deque = deque()
+        self._cond = Condition()
+        self._thread: Optional[Thread] = None
+        self._stopping = False
+
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.high_watermark = 0
+
+    def put(self, line: str) -> bool:
+        """
+        Queue a line for the consumer.
+
+        Matches the capture_logs callback signature, so a dispatcher can be
+        passed directly as ``callback=dispatcher.put``.
+
+        Args:
+            line: Log line (or any item the consumer accepts)
+
+        Returns:
+            True if the line was queued, False if it was dropped or coalesced
+        """
+        with self._cond:
+            if self._stopping:
+                # The consumer thread is gone or draining; nothing would deliver it
+                self.dropped += 1
+                return False
+            queue = self._queue
+            if len(queue) >= self.capacity:
+                if not self._overflow():
+                    return False
+
+            queue.append(line)
+            self.enqueued += 1
+            if len(queue) > self.high_watermark:
+                self.high_watermark = len(queue)
+            self._cond.notify()
+            return True
+
+    def put_many(self, lines: Iterable[str]) -> None:
+        """
+        Queue several lines.
+
+        Args:
+            lines: Log lines
+        """
+        for line in lines:
+            self.put(line)
+
+    def _overflow(self) -> bool:
+        # Called with the lock held and the queue full. Returns True if the
+        # incoming line should still be appended.
+        queue = self._queue
+        policy = self.policy
+
+        if policy == OverflowPolicy.DROP_OLDEST:
+            dropped = queue.popleft()
+            self.dropped += dropped.count if isinstance(dropped, _Skipped) else 1
+            return True
+
+        if policy == OverflowPolicy.DROP_NEWEST:
+            self.dropped += 1
+            return False
+
+        if policy == OverflowPolicy.COALESCE:
+            # One marker may sit past capacity; later overflow folds into it
+            self.coalesced += 1
+            if queue and isinstance(queue[-1], _Skipped):
+                queue[-1].count += 1
+            else:
+                queue.append(_Skipped())
+                self._cond.notify()
+            return False
+
+        # BLOCK: wait for the consumer to make room
+        while len(queue) >= self.capacity and not self._stopping:
+            self._cond.wait()
+        if self._stopping:
+            self.dropped += 1
+            return False
+        return True
+
+    def start(self) -> None:
+        """
+        Start the consumer thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        queue = self._queue
+        cond = self._cond
+        consumer = self.consumer
+        on_skip = self.on_skip
+
+        while True:
+            with cond:
+                while not queue and not self._stopping:
+                    cond.wait()
+                if not queue:
+                    return
+                batch = list(queue)
+                queue.clear()
+                # Wake a capture thread blocked by the BLOCK policy
+                cond.notify_all()
+
+            for item in batch:
+                try:
+                    if isinstance(item, _Skipped):
+                        if on_skip is not None:
+                            on_skip(item.count)
+                            continue
+                        consumer(self.SKIPPED_FORMAT.format(count=item.count))
+                    else:
+                        consumer(item)
+                        self.delivered += 1
+                except Exception as e:
+                    print(f"Error in display callback: {e}")
+
+    def stop(self, timeout: Optional[float] = 5) -> None:
+        """
+        Deliver the remaining queued lines and stop the consumer thread.
+
+        Lines put after stop() are counted as dropped, whatever the policy.
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+        """
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get dispatcher statistics.
+
+        Returns:
+            Dictionary with enqueued, delivered, dropped, coalesced and high-watermark counts
+        """
+        return {
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "high_watermark": self.high_watermark,
+        }
@@ -0,0 +1,159 @@
+"""
+Line framing for telnet byte streams.
+"""
+
+import socket
+from typing import List, Optional
+
+
+class LineFramer:
+    """
+    Splits a byte stream into lines without re-copying the pending buffer.
+
+    Data is received straight into a reusable ``bytearray`` via
+    ``recv_into``. Consumed lines advance a start offset instead of
+    rebuilding the buffer, and a scan offset remembers how far the buffer
+    has already been searched for a newline, so a multi-kilobyte line
+    arriving in many chunks is scanned only once.
+    """
+
+    INITIAL_SIZE = 64 * 1024
+    RECV_SIZE = 4096
+
+    def __init__(self, initial_size: int = INITIAL_SIZE):
+        """
+        Initialize the framer.
+
+        Args:
+            initial_size: Initial buffer capacity in bytes
+        """
+        self._buf = bytearray(initial_size)
+        self._start = 0  # first unconsumed byte
+        self._end = 0    # end of received data
+        self._scan = 0   # no newline in [_start, _scan)
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes not yet returned as a line."""
+        return self._end - self._start
+
+    def clear(self) -> None:
+        """
+        Drop all buffered data.
+        """
+        self._start = self._end = self._scan = 0
+
+    def _reserve(self, size: int) -> None:
+        # Make room for `size` bytes after _end: compact, then grow if needed
+        if len(self._buf) - self._end >= size:
+            return
+
+        pending = self._end - self._start
+        if self._start:
+            self._buf[:pending] = self._buf[self._start:self._end]
+            self._scan -= self._start
+            self._start, self._end = 0, pending
+
+        if len(self._buf) - self._end < size:
+            capacity = len(self._buf)
+            while capacity - self._end < size:
+                capacity *= 2
+            self._buf.extend(bytes(capacity - len(self._buf)))
+
+    def recv_into(self, sock: socket.socket, size: int = RECV_SIZE) -> int:
+        """
+        Receive data from a socket directly into the buffer.
+
+        Args:
+            sock: Socket to read from
+            size: Maximum number of bytes to receive
+
+        Returns:
+            Number of bytes received (0 means the peer closed the connection)
+        """
+        self._reserve(size)
+        with memoryview(self._buf) as view:
+            received = sock.recv_into(view[self._end:self._end + size])
+        self._end += received
+        return received
+
+    def feed(self, data: bytes) -> None:
+        """
+        Append data that was received elsewhere.
+
+        Args:
+            data: Raw bytes to append
+        """
+        size = len(data)
+        self._reserve(size)
+        self._buf[self._end:self._end + size] = data
+        self._end += size
+
+    def recent(self, size: int) -> memoryview:
+        """
+        View the last bytes appended to the buffer, exactly as received.
+
+        The view must be released (``with framer.recent(n) as chunk:``)
+        before the next receive, which may need to resize the buffer.
+
+        Args:
+            size: Number of bytes, at most ``pending``
+
+        Returns:
+            Read-only view of the bytes
+        """
+        return memoryview(self._buf)[self._end - size:self._end].toreadonly()
+
+    def next_line(self) -> Optional[str]:
+        """
+        Return the next complete line, if any.
+
+        Returns:
+            Decoded line without trailing whitespace, or None if no complete line is buffered
+        """
+        index = self._buf.find(b'\n', self._scan, self._end)
+        if index < 0:
+            self._scan = self._end
+            return None
+
+        with memoryview(self._buf) as view:
+            line = str(view[self._start:index], 'utf-8', 'ignore').rstrip()
+        self._consume(index + 1)
+        return line
+
+    def read_lines(self) -> List[str]:
+        """
+        Return every complete line currently buffered.
+
+        Returns:
+            List of decoded lines without trailing whitespace
+        """
+        buf = self._buf
+        end = self._end
+        start = self._start
+        lines = []
+
+        index = buf.find(b'\n', self._scan, end)
+        if index < 0:
+            self._scan = end
+            return lines
+
+        with memoryview(buf) as view:
+            while index >= 0:
+                lines.append(str(view[start:index], 'utf-8', 'ignore').rstrip())
+                start = index + 1
+                index = buf.find(b'\n', start, end)
+
+        if start >= end:
+            self.clear()
+        else:
+            self._start = start
+            self._scan = end
+        return lines
+
+    def _consume(self, position: int) -> None:
+        if position >= self._end:
+            # Buffer drained: rewind so the next recv starts at offset 0
+            self.clear()
+        else:
+            self._start = self._scan = position
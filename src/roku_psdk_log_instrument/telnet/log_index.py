@@ -0,0 +1,429 @@
+"""
+Inverted index over finished session logs: events, playback sessions, content IDs and errors.
+"""
+
+import re
+import sqlite3
+import zlib
+from array import array
+from contextlib import closing
+from datetime import datetime
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from roku_psdk_log_instrument.telnet.segments import open_segment, session_segments
+from roku_psdk_log_instrument.telnet.session_manager import SessionManager
+
+
+# Term kinds
+EVENT = "event"
+PLAYBACK_SESSION = "session"
+CONTENT = "content"
+ERROR = "error"
+
+_KEY_EVENT_RE = re.compile(r"key\s+([a-zA-Z0-9_]+)")
+_ISDK_EVENT_RE = re.compile(r"\[PSDK::ISDK\]\s*Event:\s*([a-zA-Z0-9_.]+)")
+_MUX_EVENT_RE = re.compile(r"(?:\[mux-analytics\](?: EVENT)?|mux:|MUX:) *([a-zA-Z_]+)")
+_SESSION_ID_RE = re.compile(r'"(?:playbackSessionId|playbackId)":"([^"]+)"')
+_CONTENT_ID_RE = re.compile(r'"(?:videoid|videoId|editId)":"([^"]+)"')
+_METADATA_ID_RE = re.compile(r'^\s*id:\s*"([^"]+)"|"id":"([^"]+)"')
+_ERROR_TOKEN_RE = re.compile(r"[a-z0-9_&]{2,}")
+_JSON_DATA_RE = re.compile(r'^\s*\{|"events":|"http')
+
+# Byte offset of every MARK_INTERVAL-th line is stored to seek near a line
+MARK_INTERVAL = 1024
+
+
+def line_terms(line: str) -> Iterator[Tuple[str, str]]:
+    """
+    Extract the index terms of one log line (content metadata blocks excepted).
+
+    Args:
+        line: Decoded log line
+
+    Yields:
+        (kind, value) tuples; error tokens are lowercased
+    """
+    if "PSDK::" in line:
+        match = _ISDK_EVENT_RE.search(line) if "ISDK" in line else _KEY_EVENT_RE.search(line)
+        if match:
+            name = match.group(1)
+            yield EVENT, name[:-len("payload")] if name.endswith("payload") else name
+        for match in _SESSION_ID_RE.finditer(line):
+            yield PLAYBACK_SESSION, match.group(1)
+        for match in _CONTENT_ID_RE.finditer(line):
+            yield CONTENT, match.group(1)
+    elif "mux" in line or "MUX:" in line:
+        match = _MUX_EVENT_RE.search(line)
+        if match:
+            yield EVENT, match.group(1)
+
+    if ("rror" in line or "RROR" in line or "FATAL" in line or "fatal" in line) and not _JSON_DATA_RE.search(line):
+        for token in set(_ERROR_TOKEN_RE.findall(line.lower())):
+            yield ERROR, token
+
+
+def error_tokens(text: str) -> List[str]:
+    """
+    Split an error query into the tokens stored by the index.
+
+    Args:
+        text: Error text, e.g. "Type Mismatch"
+
+    Returns:
+        Lowercased tokens
+    """
+    return _ERROR_TOKEN_RE.findall(text.lower())
+
+
+class SessionLogIndex:
+    """
+    Inverted index of the logs of finished capture sessions.
+
+    For every term (event name, playbackSessionId, content ID, token of an
+    error line) the index stores the lines it occurs on, per log file, as
+    zlib-compressed delta-encoded arrays. Every 1024th line's byte offset
+    is stored too, so a hit is read back by seeking close to it instead of
+    scanning the log. The index lives in ``.temp/search.db`` and is brought
+    up to date lazily: update() indexes sessions that finished since the
+    last call and drops sessions that were deleted.
+    """
+
+    FILE_NAME = "search.db"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS terms (
+            term_id INTEGER PRIMARY KEY,
+            kind    TEXT NOT NULL,
+            value   TEXT NOT NULL,
+            UNIQUE (kind, value)
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            file_id    INTEGER PRIMARY KEY,
+            session_id TEXT NOT NULL,
+            name       TEXT NOT NULL,
+            first_line INTEGER NOT NULL,
+            lines      INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS files_session ON files (session_id);
+        CREATE TABLE IF NOT EXISTS postings (
+            term_id INTEGER NOT NULL,
+            file_id INTEGER NOT NULL,
+            count   INTEGER NOT NULL,
+            lines   BLOB NOT NULL,
+            PRIMARY KEY (term_id, file_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS postings_file ON postings (file_id);
+        CREATE TABLE IF NOT EXISTS marks (
+            file_id INTEGER NOT NULL,
+            mark    INTEGER NOT NULL,
+            offset  INTEGER NOT NULL,
+            PRIMARY KEY (file_id, mark)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS indexed (
+            session_id TEXT PRIMARY KEY,
+            indexed_at TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, session_manager: SessionManager):
+        """
+        Initialize the index.
+
+        Args:
+            session_manager: Session manager owning the sessions
+        """
+        self.session_manager = session_manager
+        self.path = session_manager.temp_dir / self.FILE_NAME
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=10)
+        conn.executescript(self._SCHEMA)
+        return conn
+
+    def update(self, on_session: Optional[Callable[[Dict], None]] = None) -> int:
+        """
+        Index finished sessions not indexed yet and forget deleted ones.
+
+        Args:
+            on_session: Optional callback receiving each session before it is indexed
+
+        Returns:
+            Number of sessions indexed
+        """
+        manager = self.session_manager
+        if not manager.temp_dir.exists():
+            return 0
+        sessions = manager.list_sessions()
+        known = {s["session_id"] for s in sessions}
+
+        with closing(self._connect()) as conn:
+            indexed = {row[0] for row in conn.execute("SELECT session_id FROM indexed")}
+            for session_id in indexed - known:
+                self._remove(conn, session_id)
+            conn.commit()
+
+            count = 0
+            for session in reversed(sessions):
+                if session.get("status") == "active" or session["session_id"] in indexed:
+                    continue
+                if on_session:
+                    on_session(session)
+                self._index_session(conn, session)
+                count += 1
+        return count
+
+    def reindex(self, on_session: Optional[Callable[[Dict], None]] = None) -> int:
+        """
+        Drop the index and index every finished session again.
+
+        Args:
+            on_session: Optional callback receiving each session before it is indexed
+
+        Returns:
+            Number of sessions indexed
+        """
+        if self.path.exists():
+            self.path.unlink()
+        return self.update(on_session)
+
+    @staticmethod
+    def _remove(conn: sqlite3.Connection, session_id: str) -> None:
+        file_ids = [(row[0],) for row in conn.execute(
+            "SELECT file_id FROM files WHERE session_id = ?", (session_id,)
+        )]
+        conn.executemany("DELETE FROM postings WHERE file_id = ?", file_ids)
+        conn.executemany("DELETE FROM marks WHERE file_id = ?", file_ids)
+        conn.execute("DELETE FROM files WHERE session_id = ?", (session_id,))
+        conn.execute("DELETE FROM indexed WHERE session_id = ?", (session_id,))
+
+    def _index_session(self, conn: sqlite3.Connection, session: Dict) -> None:
+        log_path = self.session_manager.get_session_log_path(session)
+        paths = session_segments(log_path)
+        if log_path.exists():
+            paths.append(log_path)
+
+        first_line = 0
+        with conn:
+            self._remove(conn, session["session_id"])
+            for path in paths:
+                first_line += self._index_file(conn, session["session_id"], path, first_line)
+            conn.execute(
+                "INSERT INTO indexed VALUES (?, ?)",
+                (session["session_id"], datetime.now().isoformat())
+            )
+
+    def _index_file(self, conn: sqlite3.Connection, session_id: str, path: Path, first_line: int) -> int:
+        # Delta-encoded line numbers per term; the last line seen per term
+        postings: Dict[Tuple[str, str], array] = {}
+        last: Dict[Tuple[str, str], int] = {}
+        marks = []
+        offset = 0
+        in_metadata = False
+        lineno = -1
+
+        with open_segment(path) as f:
+            for lineno, raw in enumerate(f):
+                if not lineno % MARK_INTERVAL:
+                    marks.append((lineno // MARK_INTERVAL, offset))
+                offset += len(raw)
+                line = raw.decode("utf-8", "ignore")
+
+                terms = list(line_terms(line))
+                # The content ID of a "Player Controller: Load" block; like
+                # the monitor, the block runs until a bare "}" line
+                if "Player Controller: Load" in line:
+                    in_metadata = True
+                elif in_metadata and line.rstrip("\r\n") == "}":
+                    in_metadata = False
+                if in_metadata:
+                    match = _METADATA_ID_RE.search(line)
+                    if match:
+                        terms.append((CONTENT, match.group(1) or match.group(2)))
+                        in_metadata = False
+
+                for term in terms:
+                    previous = last.get(term)
+                    if previous == lineno:
+                        continue
+                    if previous is None:
+                        postings[term] = array("I", [lineno])
+                    else:
+                        postings[term].append(lineno - previous)
+                    last[term] = lineno
+
+        line_count = lineno + 1
+        cursor = conn.execute(
+            "INSERT INTO files (session_id, name, first_line, lines) VALUES (?, ?, ?, ?)",
+            (session_id, path.name, first_line, line_count)
+        )
+        file_id = cursor.lastrowid
+
+        conn.executemany("INSERT OR IGNORE INTO terms (kind, value) VALUES (?, ?)", postings.keys())
+        term_ids = self._term_ids(conn, postings.keys())
+        conn.executemany(
+            "INSERT INTO postings VALUES (?, ?, ?, ?)",
+            [
+                (term_ids[term], file_id, len(lines), zlib.compress(lines.tobytes()))
+                for term, lines in postings.items()
+            ]
+        )
+        conn.executemany(
+            "INSERT INTO marks VALUES (?, ?, ?)",
+            [(file_id, mark, mark_offset) for mark, mark_offset in marks]
+        )
+        return line_count
+
+    @staticmethod
+    def _term_ids(conn: sqlite3.Connection, terms: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        ids = {}
+        for kind, value in terms:
+            row = conn.execute(
+                "SELECT term_id FROM terms WHERE kind = ? AND value = ?", (kind, value)
+            ).fetchone()
+            if row:
+                ids[(kind, value)] = row[0]
+        return ids
+
+    def search(
+        self,
+        event: Optional[str] = None,
+        playback_session: Optional[str] = None,
+        content: Optional[str] = None,
+        error: Optional[str] = None,
+        host: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Find lines matching every given criterion.
+
+        Args:
+            event: PSDK, ISDK or MUX event name
+            playback_session: playbackSessionId (or ISDK playbackId)
+            content: Content ID (metadata id, videoid or editId)
+            error: Words that must all appear in an error line
+            host: Only sessions captured from this host
+            limit: Maximum number of hits
+
+        Returns:
+            Hit dictionaries with session_id, host, file (Path), line
+            (one-based in the file), session_line (one-based across
+            segments) and offset of the mark to seek from, newest session first
+        """
+        terms = []
+        if event:
+            terms.append((EVENT, event))
+        if playback_session:
+            terms.append((PLAYBACK_SESSION, playback_session))
+        if content:
+            terms.append((CONTENT, content))
+        if error:
+            terms.extend((ERROR, token) for token in error_tokens(error))
+        if not terms or not self.path.exists():
+            return []
+
+        with closing(self._connect()) as conn:
+            term_ids = self._term_ids(conn, terms)
+            if len(term_ids) < len(set(terms)):
+                return []
+
+            # Rarest term first keeps the intersections small
+            per_term: List[Dict[int, bytes]] = []
+            for term_id in term_ids.values():
+                rows = conn.execute("SELECT file_id, lines FROM postings WHERE term_id = ?", (term_id,))
+                per_term.append(dict(rows.fetchall()))
+            per_term.sort(key=len)
+
+            file_ids = set(per_term[0])
+            for postings in per_term[1:]:
+                file_ids &= postings.keys()
+            if not file_ids:
+                return []
+
+            placeholders = ",".join("?" * len(file_ids))
+            files = {
+                row[0]: row[1:] for row in conn.execute(
+                    f"SELECT file_id, session_id, name, first_line FROM files WHERE file_id IN ({placeholders})",
+                    list(file_ids)
+                )
+            }
+
+            sessions = {s["session_id"]: s for s in self.session_manager.list_sessions(host=host)}
+            hits = []
+            for file_id in sorted(file_ids, key=lambda f: (files[f][0], -files[f][2]), reverse=True):
+                session_id, name, first_line = files[file_id]
+                session = sessions.get(session_id)
+                if session is None:
+                    continue
+                lines = None
+                for postings in per_term:
+                    decoded = set(_decode(postings[file_id]))
+                    lines = decoded if lines is None else lines & decoded
+                directory = session.get("directory") or self.session_manager.temp_dir / session_id
+                for line in sorted(lines):
+                    mark = conn.execute(
+                        "SELECT offset FROM marks WHERE file_id = ? AND mark = ?",
+                        (file_id, line // MARK_INTERVAL)
+                    ).fetchone()
+                    hits.append({
+                        "session_id": session_id,
+                        "host": session.get("host"),
+                        "file": directory / name,
+                        "line": line + 1,
+                        "session_line": first_line + line + 1,
+                        "offset": mark[0] if mark else 0,
+                    })
+                    if limit is not None and len(hits) >= limit:
+                        return hits
+        return hits
+
+    def terms(self, kind: str, prefix: str = "", limit: int = 50) -> List[Tuple[str, int]]:
+        """
+        List indexed values of one kind, most frequent first.
+
+        Args:
+            kind: Term kind ("event", "session", "content" or "error")
+            prefix: Only values starting with this text
+            limit: Maximum number of values
+
+        Returns:
+            List of (value, occurrences) tuples
+        """
+        if not self.path.exists():
+            return []
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT value, SUM(count) AS n FROM terms JOIN postings USING (term_id) "
+                "WHERE kind = ? AND value LIKE ? ESCAPE '\\' GROUP BY term_id ORDER BY n DESC LIMIT ?",
+                (kind, f"{escaped}%", limit)
+            ).fetchall()
+
+
+def _decode(blob: bytes) -> Iterator[int]:
+    deltas = array("I")
+    deltas.frombytes(zlib.decompress(blob))
+    return accumulate(deltas)
+
+
+def read_hit(hit: Dict) -> str:
+    """
+    Read the log line of a search hit.
+
+    Seeks to the stored mark before the line and skips at most 1023 lines,
+    so this is fast even in a multi-gigabyte plain log. Seeking in a gzip
+    segment decompresses it from the start, so there the cost grows with
+    the hit's position in the segment; rotation keeps segments bounded.
+
+    Args:
+        hit: Hit dictionary from SessionLogIndex.search()
+
+    Returns:
+        Log line without its line terminator
+    """
+    with open_segment(hit["file"]) as f:
+        f.seek(hit["offset"])
+        for _ in range((hit["line"] - 1) % MARK_INTERVAL):
+            f.readline()
+        return f.readline().decode("utf-8", "ignore").rstrip("\r\n")
@@ -0,0 +1,115 @@
+"""
+Reconnect policy and gap markers for unattended log capture.
+"""
+
+import json
+import math
+import random
+from typing import Dict, Iterator, Optional
+
+
+GAP_MARKER_PREFIX = "[CAPTURE_GAP]"
+
+
+class ReconnectPolicy:
+    """
+    Exponential backoff with jitter between reconnect attempts.
+
+    The n-th delay is ``initial_delay * multiplier ** n`` capped at
+    ``max_delay``, then randomized by +/- ``jitter`` (a fraction) so many
+    capture hosts do not hammer a rebooting device in lockstep.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.2,
+        max_attempts: Optional[int] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize the reconnect policy.
+
+        Args:
+            initial_delay: Delay before the first attempt in seconds
+            max_delay: Upper bound for a single delay in seconds
+            multiplier: Backoff factor between attempts
+            jitter: Random spread applied to each delay, as a fraction (0.2 = +/-20%)
+            max_attempts: Give up after this many attempts (None retries forever)
+            rng: Random generator (for reproducible tests)
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self._rng = rng or random.Random()
+        # Attempts past this one all wait max_delay; capping the exponent
+        # keeps multiplier ** attempt from overflowing on long outages
+        self._last_growth: Optional[int] = None
+        if multiplier > 1:
+            self._last_growth = 0
+            if 0 < initial_delay < max_delay:
+                self._last_growth = math.ceil(math.log(max_delay / initial_delay, multiplier)) + 1
+
+    def delay(self, attempt: int) -> float:
+        """
+        Delay before a reconnect attempt.
+
+        Args:
+            attempt: Zero-based attempt number
+
+        Returns:
+            Delay in seconds
+        """
+        if self._last_growth is not None:
+            attempt = min(attempt, self._last_growth)
+        base = min(self.initial_delay * (self.multiplier ** attempt), self.max_delay)
+        if self.jitter:
+            base *= 1 + self._rng.uniform(-self.jitter, self.jitter)
+        return max(base, 0.0)
+
+    def delays(self) -> Iterator[float]:
+        """
+        Yield the delay before each reconnect attempt.
+
+        Yields:
+            Delay in seconds, until max_attempts is reached
+        """
+        attempt = 0
+        while self.max_attempts is None or attempt < self.max_attempts:
+            yield self.delay(attempt)
+            attempt += 1
+
+
+def format_gap_marker(gap: Dict) -> str:
+    """
+    Format a capture gap as a log line.
+
+    Args:
+        gap: Gap dictionary with start, end, duration, attempts and reason
+
+    Returns:
+        Marker line, e.g. ``[CAPTURE_GAP] {"start": ..., "duration": 12.5, ...}``
+    """
+    return f"{GAP_MARKER_PREFIX} {json.dumps(gap, sort_keys=True)}"
+
+
+def parse_gap_marker(line: str) -> Optional[Dict]:
+    """
+    Parse a gap marker line written by format_gap_marker.
+
+    Args:
+        line: Log line
+
+    Returns:
+        Gap dictionary, or None if the line is not a gap marker
+    """
+    if not line.startswith(GAP_MARKER_PREFIX):
+        return None
+    try:
+        return json.loads(line[len(GAP_MARKER_PREFIX):])
+    except ValueError:
+        return None
@@ -0,0 +1,248 @@
+"""
+Retention of capture sessions: age, per-host and disk quota limits.
+"""
+
+import os
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Event, Thread
+from typing import Dict, List, Optional
+
+from roku_psdk_log_instrument.telnet.segments import COMPRESSED_SUFFIX
+from roku_psdk_log_instrument.telnet.session_manager import SessionManager
+
+
+TRASH_DIR_NAME = ".trash"
+
+
+class RetentionPolicy:
+    """
+    Limits on the sessions kept in the ``.temp`` directory.
+
+    Sessions older than ``max_age_days`` are evicted, then all but the
+    newest ``max_per_host`` sessions of each device, then - while the
+    sessions still take more than ``max_bytes`` - the oldest sessions with
+    compressed segments followed by the oldest uncompressed ones. Active
+    sessions are never evicted but count towards the limits.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        max_age_days: Optional[float] = None
+    ):
+        """
+        Initialize the retention policy.
+
+        Args:
+            max_bytes: Disk quota for all sessions together (None to disable)
+            max_per_host: Sessions kept per device host (None to disable)
+            max_age_days: Evict sessions started longer ago than this (None to disable)
+        """
+        self.max_bytes = max_bytes
+        self.max_per_host = max_per_host
+        self.max_age_days = max_age_days
+
+
+def session_usage(directory: Path) -> Dict:
+    """
+    Measure a session directory.
+
+    Args:
+        directory: Session directory
+
+    Returns:
+        Dictionary with ``bytes`` on disk and whether any segment is ``compressed``
+    """
+    size = 0
+    compressed = False
+    stack = [str(directory)]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    size += entry.stat(follow_symlinks=False).st_size
+                    compressed = compressed or entry.name.endswith(COMPRESSED_SUFFIX)
+            except OSError:
+                continue
+    return {"bytes": size, "compressed": compressed}
+
+
+class RetentionManager:
+    """
+    Applies a RetentionPolicy to the sessions of a SessionManager.
+
+    plan() works out what would be evicted without touching anything, so
+    it doubles as a dry-run report. Evicted sessions are first renamed
+    into ``.temp/.trash`` and dropped from the catalog, which is instant,
+    and only then deleted file by file. start() does all of this on a
+    background thread so long captures can enforce a quota as they go.
+    """
+
+    def __init__(self, session_manager: SessionManager, policy: RetentionPolicy):
+        """
+        Initialize the retention manager.
+
+        Args:
+            session_manager: Session manager owning the sessions
+            policy: Limits to enforce
+        """
+        self.session_manager = session_manager
+        self.policy = policy
+        self.trash_dir = session_manager.temp_dir / TRASH_DIR_NAME
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+
+    def usage(self) -> List[Dict]:
+        """
+        Measure every session, newest first.
+
+        Returns:
+            Dictionaries with ``session``, ``bytes`` and ``compressed``
+        """
+        manager = self.session_manager
+        measured = []
+        for session in manager.list_sessions():
+            directory = session.get("directory") or manager.temp_dir / session["session_id"]
+            measured.append({"session": session, **session_usage(directory)})
+        return measured
+
+    def plan(self) -> List[Dict]:
+        """
+        Work out which sessions the policy evicts.
+
+        Returns:
+            Eviction dictionaries with ``session``, ``bytes``, ``compressed``
+            and ``reason`` ("age", "host" or "quota"), in eviction order
+        """
+        policy = self.policy
+        measured = self.usage()
+        evictions: Dict[str, Dict] = {}
+
+        def evict(item: Dict, reason: str) -> None:
+            evictions[item["session"]["session_id"]] = {**item, "reason": reason}
+
+        def evictable(item: Dict) -> bool:
+            session = item["session"]
+            return session.get("status") != "active" and session["session_id"] not in evictions
+
+        if policy.max_age_days is not None:
+            cutoff = (datetime.now() - timedelta(days=policy.max_age_days)).isoformat()
+            for item in reversed(measured):
+                if evictable(item) and item["session"].get("start_time", "") < cutoff:
+                    evict(item, "age")
+
+        if policy.max_per_host is not None:
+            kept: Dict[str, int] = {}
+            for item in measured:
+                session = item["session"]
+                if session["session_id"] in evictions:
+                    continue
+                host = session.get("host")
+                kept[host] = kept.get(host, 0) + 1
+                if kept[host] > policy.max_per_host and evictable(item):
+                    evict(item, "host")
+
+        if policy.max_bytes is not None:
+            remaining = sum(item["bytes"] for item in measured) - sum(
+                item["bytes"] for item in evictions.values()
+            )
+            # Compressed sessions first, oldest first within each group
+            candidates = sorted(
+                (item for item in measured if evictable(item)),
+                key=lambda item: (not item["compressed"], item["session"].get("start_time", ""))
+            )
+            for item in candidates:
+                if remaining <= policy.max_bytes:
+                    break
+                evict(item, "quota")
+                remaining -= item["bytes"]
+
+        return list(evictions.values())
+
+    def enforce(self) -> List[Dict]:
+        """
+        Evict the sessions returned by plan().
+
+        Returns:
+            Eviction dictionaries of the sessions removed
+        """
+        # Sessions of killed captures would otherwise stay "active" and never expire
+        self.session_manager.recover_orphaned_sessions()
+        # Leftovers of an interrupted run could clash with the names moved in now
+        self.purge_trash()
+
+        evicted = []
+        for eviction in self.plan():
+            if self._stop_event.is_set():
+                break
+            if self._evict(eviction["session"]):
+                evicted.append(eviction)
+        self.purge_trash()
+        return evicted
+
+    def _evict(self, session: Dict) -> bool:
+        manager = self.session_manager
+        directory = session.get("directory") or manager.temp_dir / session["session_id"]
+        self.trash_dir.mkdir(exist_ok=True)
+        try:
+            os.replace(directory, self.trash_dir / directory.name)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: Could not evict session {session['session_id']}: {e}")
+            return False
+        manager.catalog.remove(session["session_id"])
+        return True
+
+    def purge_trash(self) -> None:
+        """
+        Delete evicted sessions, including ones left by an interrupted run.
+        """
+        if not self.trash_dir.exists():
+            return
+        for entry in os.scandir(self.trash_dir):
+            if self._stop_event.is_set():
+                return
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+    def start(self, interval: float = 60.0) -> None:
+        """
+        Enforce the policy now and every ``interval`` seconds on a background thread.
+
+        Args:
+            interval: Seconds between enforcement runs
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop the background thread after the session it is deleting.
+
+        Args:
+            timeout: Seconds to wait for the thread
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def _run(self, interval: float) -> None:
+        while not self._stop_event.is_set():
+            try:
+                for eviction in self.enforce():
+                    print(f"Retention: removed session {eviction['session']['session_id']} ({eviction['reason']})")
+            except Exception as e:
+                print(f"Warning: Retention run failed: {e}")
+            self._stop_event.wait(interval)
@@ -0,0 +1,294 @@
+"""
+Rotated log segments: background compression and reading a session as one stream.
+"""
+
+import gzip
+import io
+import json
+import os
+import queue
+import shutil
+from pathlib import Path
+from threading import Thread
+from typing import Callable, Dict, List, Optional
+
+
+SESSION_INFO_FILE = "session_info.json"
+COMPRESSED_SUFFIX = ".gz"
+
+
+def segment_path(log_path: Path, index: int) -> Path:
+    """
+    Path of a closed segment of a session log.
+
+    Args:
+        log_path: Active session log, e.g. ``roku_logs_<id>.log``
+        index: One-based segment number
+
+    Returns:
+        Segment path, e.g. ``roku_logs_<id>.00001.log``
+    """
+    log_path = Path(log_path)
+    return log_path.with_name(f"{log_path.stem}.{index:05d}{log_path.suffix}")
+
+
+class SegmentArchiver:
+    """
+    Compresses closed log segments with gzip on a background thread.
+
+    The capture thread only renames the segment; compression of a
+    multi-hundred-megabyte segment happens here so socket reads never wait
+    for it. Each segment is written to a temporary file, renamed into
+    place and only then is the uncompressed segment removed, so a reader
+    always finds one complete copy.
+    """
+
+    def __init__(self, compresslevel: int = 6):
+        """
+        Initialize the archiver and start its worker thread.
+
+        Args:
+            compresslevel: gzip compression level (1 fastest, 9 smallest)
+        """
+        self.compresslevel = compresslevel
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        path: Path,
+        segment: Dict,
+        on_done: Optional[Callable[[Dict], None]] = None
+    ) -> None:
+        """
+        Queue a closed segment for compression.
+
+        Args:
+            path: Uncompressed segment file
+            segment: Manifest entry; ``file``, ``compressed`` and
+                ``compressed_bytes`` are updated when compression finishes
+            on_done: Optional callback receiving the updated manifest entry
+        """
+        self._queue.put((Path(path), segment, on_done))
+
+    def close(self) -> None:
+        """
+        Finish queued compressions and stop the worker thread.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, segment, on_done = item
+            try:
+                compressed = self.compress(path)
+            except OSError as e:
+                # The uncompressed segment stays listed in the manifest
+                print(f"Warning: Could not compress {path.name}: {e}")
+                continue
+
+            segment["file"] = compressed.name
+            segment["compressed"] = True
+            segment["compressed_bytes"] = compressed.stat().st_size
+            if on_done:
+                on_done(segment)
+            path.unlink()
+
+    def compress(self, path: Path) -> Path:
+        """
+        gzip a file next to itself.
+
+        Args:
+            path: File to compress (left in place)
+
+        Returns:
+            Path of the compressed file
+        """
+        target = path.with_name(path.name + COMPRESSED_SUFFIX)
+        temp = target.with_name(target.name + ".tmp")
+        with open(path, "rb") as src, gzip.open(temp, "wb", compresslevel=self.compresslevel) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(temp, target)
+        return target
+
+
+def session_segments(log_path: Path) -> List[Path]:
+    """
+    List the closed segments of a session log, oldest first.
+
+    Segments come from the manifest in the session's ``session_info.json``.
+    A segment compressed since the manifest was written is found under its
+    ``.gz`` name.
+
+    Args:
+        log_path: Active session log
+
+    Returns:
+        Paths of existing segments (empty for a log that was never rotated)
+    """
+    log_path = Path(log_path)
+    info_file = log_path.parent / SESSION_INFO_FILE
+    try:
+        info = json.loads(info_file.read_text())
+    except (OSError, ValueError):
+        return []
+    if info.get("log_file") != log_path.name:
+        return []
+
+    paths = []
+    for segment in sorted(info.get("segments", []), key=lambda s: s["index"]):
+        path = log_path.parent / segment["file"]
+        if not path.exists() and not path.name.endswith(COMPRESSED_SUFFIX):
+            path = path.with_name(path.name + COMPRESSED_SUFFIX)
+        if path.exists():
+            paths.append(path)
+    return paths
+
+
+def find_segment(log_path: Path, index: int) -> Optional[Path]:
+    """
+    Find a closed segment on disk, compressed or not.
+
+    Args:
+        log_path: Active session log
+        index: One-based segment number
+
+    Returns:
+        Segment path, or None if the segment does not exist
+    """
+    path = segment_path(log_path, index)
+    if path.exists():
+        return path
+    compressed = path.with_name(path.name + COMPRESSED_SUFFIX)
+    return compressed if compressed.exists() else None
+
+
+def last_segment_index(log_path: Path) -> int:
+    """
+    Highest segment number on disk for a session log.
+
+    Args:
+        log_path: Active session log
+
+    Returns:
+        Segment number, or 0 if the log was never rotated
+    """
+    log_path = Path(log_path)
+    last = 0
+    for path in log_path.parent.glob(f"{log_path.stem}.*{log_path.suffix}*"):
+        index = path.name[len(log_path.stem) + 1:].split(".", 1)[0]
+        if index.isdigit():
+            last = max(last, int(index))
+    return last
+
+
+def open_segment(path: Path):
+    """
+    Open a log segment for binary reading, decompressing gzip segments.
+
+    A segment compressed after it was found is opened under its ``.gz`` name.
+
+    Args:
+        path: Segment or log file
+
+    Returns:
+        Binary file object
+    """
+    path = Path(path)
+    if path.name.endswith(COMPRESSED_SUFFIX):
+        return gzip.open(path, "rb")
+    try:
+        return open(path, "rb")
+    except FileNotFoundError:
+        compressed = path.with_name(path.name + COMPRESSED_SUFFIX)
+        if not compressed.exists():
+            raise
+        return gzip.open(compressed, "rb")
+
+
+def resolve_session_log(path: Path) -> Path:
+    """
+    Turn a session directory into its active log path.
+
+    Args:
+        path: Session directory or log file
+
+    Returns:
+        Log file path
+    """
+    path = Path(path)
+    if path.is_dir():
+        info = json.loads((path / SESSION_INFO_FILE).read_text())
+        return path / info["log_file"]
+    return path
+
+
+class _ChainedReader(io.RawIOBase):
+    """Read-only binary stream over several files, gzip ones decompressed."""
+
+    def __init__(self, paths: List[Path]):
+        super().__init__()
+        self._paths = list(paths)
+        self._current = None
+        # Opened eagerly so a missing log fails like open() does
+        self._open_next()
+
+    def readable(self) -> bool:
+        return True
+
+    def _open_next(self) -> None:
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        if not self._paths:
+            return
+        self._current = open_segment(self._paths.pop(0))
+
+    def readinto(self, buffer) -> int:
+        while self._current is not None:
+            count = self._current.readinto(buffer)
+            if count:
+                return count
+            self._open_next()
+        return 0
+
+    def close(self) -> None:
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        self._paths = []
+        super().close()
+
+
+def open_session_log(path: Path, binary: bool = False):
+    """
+    Open a session log as one logical stream across rotated segments.
+
+    Archived segments (gzip or not) are read in order, followed by the
+    active log file. A log without a segment manifest is opened as is.
+
+    Args:
+        path: Session log file or session directory
+        binary: Return a binary stream instead of text
+
+    Returns:
+        File-like object; text streams decode UTF-8 and drop invalid bytes
+    """
+    log_path = resolve_session_log(path)
+    paths = session_segments(log_path)
+    if log_path.exists() or not paths:
+        paths.append(log_path)
+
+    if len(paths) == 1:
+        # A log that was never rotated is opened directly, which keeps it seekable
+        stream = open_segment(paths[0])
+    else:
+        stream = io.BufferedReader(_ChainedReader(paths), buffer_size=1024 * 1024)
+    if binary:
+        return stream
+    return io.TextIOWrapper(stream, encoding="utf-8", errors="ignore")
@@ -3,9 +3,38 @@ Session manager for organizing telnet log captures.
 """
 
 import json
-from datetime import datetime
+import os
+import socket
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, List
+from threading import RLock
+from typing import Optional, Dict, List, Union
+
+from roku_psdk_log_instrument.telnet.catalog import SessionCatalog
+from roku_psdk_log_instrument.telnet.checkpoint import SessionCheckpoint
+
+
+def _process_alive(pid: int) -> bool:
+    """
+    Check whether a process is running on this machine.
+    
+    Args:
+        pid: Process ID
+        
+    Returns:
+        True if the process exists (or its state cannot be determined)
+    """
+    if os.name == "nt":
+        # os.kill() terminates the process on Windows instead of probing it
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # EPERM: the process exists but belongs to another user
+        return True
+    return True
 
 
 class SessionManager:
@@ -25,7 +54,10 @@ class SessionManager:
         """
         self.base_path = base_path or Path.cwd()
         self.temp_dir = self.base_path / self.TEMP_DIR_NAME
+        self.catalog = SessionCatalog(self.temp_dir / SessionCatalog.FILE_NAME)
         self._current_session: Optional[Dict] = None
+        # Segment archiving updates sessions from a background thread
+        self._lock = RLock()
     
     def initialize_temp_directory(self) -> Path:
         """
@@ -41,6 +73,10 @@ class SessionManager:
         if not gitignore_path.exists():
             gitignore_path.write_text("*\n!.gitignore\n")
         
+        if not self.catalog.exists():
+            # First use, or sessions created before the catalog existed
+            self.rebuild_catalog()
+        
         return self.temp_dir
     
     def create_session(
@@ -65,7 +101,9 @@ class SessionManager:
         
         # Create session info
         timestamp = datetime.now()
-        session_id = timestamp.strftime("%Y%m%d_%H%M%S")
+        session_id, session_dir = self._reserve_session_dir(
+            timestamp.strftime("%Y%m%d_%H%M%S")
+        )
         
         session_info = {
             "session_id": session_id,
@@ -75,25 +113,48 @@ class SessionManager:
             "description": description or f"Roku log capture from {host}",
             "status": "active",
             "log_file": f"roku_logs_{session_id}.log",
-            "line_count": 0
+            "line_count": 0,
+            # Lets recover_orphaned_sessions() tell a killed capture from a running one
+            "pid": os.getpid(),
+            "hostname": socket.gethostname()
         }
         
-        # Create session directory
-        session_dir = self.temp_dir / session_id
-        session_dir.mkdir(exist_ok=True)
+        session_info["directory"] = session_dir
         
         # Save session info
-        info_file = session_dir / self.SESSION_INFO_FILE
-        info_file.write_text(json.dumps(session_info, indent=2))
+        self._save_session_info(session_info)
         
         self._current_session = session_info
-        self._current_session["directory"] = session_dir
         
         print(f"✓ Created session: {session_id}")
         print(f"  Directory: {session_dir}")
         
         return self._current_session
     
+    def _reserve_session_dir(self, base_id: str):
+        """
+        Create a unique session directory.
+        
+        Sessions started in the same second (e.g. one per device in a
+        multi-device capture) get a numeric suffix.
+        
+        Args:
+            base_id: Timestamp based session ID
+            
+        Returns:
+            Tuple of (session_id, session_dir)
+        """
+        session_id = base_id
+        suffix = 1
+        while True:
+            session_dir = self.temp_dir / session_id
+            try:
+                session_dir.mkdir()
+                return session_id, session_dir
+            except FileExistsError:
+                suffix += 1
+                session_id = f"{base_id}_{suffix}"
+    
     def get_session_log_path(self, session: Optional[Dict] = None) -> Path:
         """
         Get the log file path for a session.
@@ -133,31 +194,171 @@ class SessionManager:
             print("No active session to end")
             return
         
-        # Update session info
-        session["end_time"] = datetime.now().isoformat()
-        session["status"] = "completed"
+        with self._lock:
+            # Update session info
+            session["end_time"] = datetime.now().isoformat()
+            session["status"] = "completed"
+            
+            if line_count is not None:
+                session["line_count"] = line_count
+            
+            # Save updated session info
+            self._save_session_info(session)
+        
+        print(f"✓ Session ended: {session['session_id']}")
+        
+        if session == self._current_session:
+            self._current_session = None
+    
+    def record_gap(self, session: Optional[Dict], gap: Dict) -> None:
+        """
+        Record a connection outage in a session.
+        
+        Args:
+            session: Session dictionary (uses current session if None)
+            gap: Gap dictionary with start, end, duration, attempts and reason
+        """
+        session = session or self._current_session
+        
+        if not session:
+            print("No active session to record gap in")
+            return
+        
+        with self._lock:
+            session.setdefault("gaps", []).append(gap)
+            self._save_session_info(session)
+    
+    def record_segment(self, session: Optional[Dict], segment: Dict) -> None:
+        """
+        Add or update a rotated log segment in the session manifest.
+        
+        Segments are keyed by index, so the entry written when a segment is
+        closed is replaced once it has been compressed.
+        
+        Args:
+            session: Session dictionary (uses current session if None)
+            segment: Segment dictionary with index, file, lines and bytes
+        """
+        session = session or self._current_session
+        
+        if not session:
+            print("No active session to record segment in")
+            return
+        
+        with self._lock:
+            segments = session.setdefault("segments", [])
+            for i, existing in enumerate(segments):
+                if existing["index"] == segment["index"]:
+                    segments[i] = segment
+                    break
+            else:
+                segments.append(segment)
+            self._save_session_info(session)
+    
+    def checkpoint(self, session: Optional[Dict], checkpoint: Dict) -> None:
+        """
+        Save a capture checkpoint in a session.
+        
+        Args:
+            session: Session dictionary (uses current session if None)
+            checkpoint: Checkpoint dictionary from SessionCheckpoint
+        """
+        session = session or self._current_session
+        
+        if not session:
+            print("No active session to checkpoint")
+            return
+        
+        with self._lock:
+            session["checkpoint"] = checkpoint
+            session["line_count"] = checkpoint["line_count"]
+            self._save_session_info(session)
+    
+    def create_checkpoint(self, session: Optional[Dict] = None, interval: float = 5.0) -> SessionCheckpoint:
+        """
+        Create a checkpoint that saves into a session while it is captured.
+        
+        Args:
+            session: Session dictionary (uses current session if None)
+            interval: Minimum seconds between periodic saves
+            
+        Returns:
+            SessionCheckpoint to pass to capture_logs() or a log writer
+        """
+        session = session or self._current_session
+        return SessionCheckpoint(lambda checkpoint: self.checkpoint(session, checkpoint), interval)
+    
+    def _is_orphaned(self, session: Dict, stale_after: Optional[float]) -> bool:
+        pid = session.get("pid")
+        if pid and session.get("hostname") == socket.gethostname() and not _process_alive(pid):
+            return True
+        if stale_after is None:
+            return False
+        
+        last_update = (session.get("checkpoint") or {}).get("updated_at") or session.get("start_time")
+        if not last_update:
+            return False
+        return datetime.now() - datetime.fromisoformat(last_update) > timedelta(seconds=stale_after)
+    
+    def recover_orphaned_sessions(self, stale_after: Optional[float] = None) -> List[Dict]:
+        """
+        Close active sessions whose capture process is gone.
         
-        if line_count is not None:
-            session["line_count"] = line_count
+        A session is orphaned when the process that created it no longer
+        runs on this machine, or, with stale_after, when it has not been
+        checkpointed for that long (sessions from other machines or from
+        before checkpoints existed). Orphans are marked "interrupted" using
+        their last checkpoint; the log itself is not read.
         
-        # Save updated session info
+        Args:
+            stale_after: Also recover sessions without a checkpoint for this many seconds
+            
+        Returns:
+            List of recovered session dictionaries
+        """
+        recovered = []
+        
+        for session in self.get_active_sessions():
+            if not self._is_orphaned(session, stale_after):
+                continue
+            
+            checkpoint = session.get("checkpoint") or {}
+            with self._lock:
+                session["status"] = "interrupted"
+                session["end_time"] = (
+                    checkpoint.get("last_line_time")
+                    or checkpoint.get("updated_at")
+                    or session["start_time"]
+                )
+                session["line_count"] = checkpoint.get("line_count", session.get("line_count", 0))
+                session["recovered_at"] = datetime.now().isoformat()
+                self._save_session_info(session)
+            recovered.append(session)
+        
+        return recovered
+    
+    def _save_session_info(self, session: Dict) -> None:
         session_dir = session.get("directory") or (
             self.temp_dir / session["session_id"]
         )
         info_file = session_dir / self.SESSION_INFO_FILE
+        temp_file = info_file.with_name(info_file.name + ".tmp")
         
-        # Remove directory key before saving (not JSON serializable)
-        save_session = {k: v for k, v in session.items() if k != "directory"}
-        info_file.write_text(json.dumps(save_session, indent=2))
-        
-        print(f"✓ Session ended: {session['session_id']}")
-        
-        if session == self._current_session:
-            self._current_session = None
+        with self._lock:
+            # Remove directory key before saving (not JSON serializable)
+            save_session = {k: v for k, v in session.items() if k != "directory"}
+            
+            # Write-then-rename so a crash mid-save never leaves a truncated file
+            with open(temp_file, "w") as f:
+                f.write(json.dumps(save_session, indent=2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, info_file)
+            self.catalog.upsert({**save_session, "directory": session_dir})
     
-    def list_sessions(self) -> List[Dict]:
+    def _scan_sessions(self) -> List[Dict]:
         """
-        List all capture sessions.
+        Read every session_info.json under the temp directory.
         
         Returns:
             List of session information dictionaries
@@ -181,11 +382,79 @@ class SessionManager:
                 except json.JSONDecodeError:
                     continue
         
-        # Sort by start time (newest first)
-        sessions.sort(key=lambda x: x.get("start_time", ""), reverse=True)
+        return sessions
+    
+    def rebuild_catalog(self) -> int:
+        """
+        Rebuild the session catalog from the session directories.
+        
+        Returns:
+            Number of sessions indexed
+        """
+        self.temp_dir.mkdir(exist_ok=True)
+        return self.catalog.rebuild(self._scan_sessions())
+    
+    def list_sessions(
+        self,
+        host: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[Union[datetime, str]] = None,
+        until: Optional[Union[datetime, str]] = None,
+        description: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        List capture sessions from the catalog, newest first.
+        
+        Args:
+            host: Only sessions captured from this host
+            status: Only sessions with this status ("active", "completed" or "interrupted")
+            since: Only sessions started at or after this time
+            until: Only sessions started before this time
+            description: Only sessions whose description contains this text
+            limit: Maximum number of sessions to return
+            offset: Number of matching sessions to skip (for pagination)
+            
+        Returns:
+            List of session information dictionaries
+        """
+        if not self.temp_dir.exists():
+            return []
+        if not self.catalog.exists():
+            self.rebuild_catalog()
+        
+        sessions = self.catalog.query(host, status, since, until, description, limit=limit, offset=offset)
+        
+        # Directories removed by hand drop out of the catalog on the next listing
+        missing = [s for s in sessions if not (s.get("directory") or self.temp_dir / s["session_id"]).exists()]
+        for session in missing:
+            self.catalog.remove(session["session_id"])
+        if missing:
+            return self.list_sessions(host, status, since, until, description, limit, offset)
         
         return sessions
     
+    def count_sessions(
+        self,
+        host: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[Union[datetime, str]] = None,
+        until: Optional[Union[datetime, str]] = None,
+        description: Optional[str] = None
+    ) -> int:
+        """
+        Count capture sessions matching the list_sessions() filters.
+        
+        Returns:
+            Number of matching sessions
+        """
+        if not self.temp_dir.exists():
+            return 0
+        if not self.catalog.exists():
+            self.rebuild_catalog()
+        return self.catalog.count(host, status, since, until, description)
+    
     def get_active_sessions(self) -> List[Dict]:
         """
         Get all active capture sessions.
@@ -193,8 +462,7 @@ class SessionManager:
         Returns:
             List of active session information dictionaries
         """
-        all_sessions = self.list_sessions()
-        return [s for s in all_sessions if s.get("status") == "active"]
+        return self.list_sessions(status="active")
     
     def cleanup_old_sessions(self, days: int = 7) -> int:
         """
@@ -209,25 +477,13 @@ class SessionManager:
         if not self.temp_dir.exists():
             return 0
         
-        from datetime import timedelta
-        import shutil
+        from roku_psdk_log_instrument.telnet.retention import RetentionManager, RetentionPolicy
         
-        cutoff_date = datetime.now() - timedelta(days=days)
-        cleaned_count = 0
+        evicted = RetentionManager(self, RetentionPolicy(max_age_days=days)).enforce()
+        for eviction in evicted:
+            print(f"Cleaned up session: {eviction['session']['session_id']}")
         
-        for session in self.list_sessions():
-            try:
-                start_time = datetime.fromisoformat(session["start_time"])
-                
-                if start_time < cutoff_date and session.get("status") != "active":
-                    session_dir = session["directory"]
-                    shutil.rmtree(session_dir)
-                    cleaned_count += 1
-                    print(f"Cleaned up session: {session['session_id']}")
-            except Exception as e:
-                print(f"Warning: Error cleaning session {session.get('session_id')}: {e}")
-        
-        return cleaned_count
+        return len(evicted)
     
     def get_current_session(self) -> Optional[Dict]:
         """
@@ -263,6 +519,7 @@ class SessionManager:
             
             if session_dir.exists():
                 shutil.rmtree(session_dir)
+                self.catalog.remove(session["session_id"])
                 print(f"✓ Deleted session: {session['session_id']}")
                 
                 if session == self._current_session:
@@ -0,0 +1,568 @@
+"""
+Buffered log writers for telnet capture sessions.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from roku_psdk_log_instrument.telnet.checkpoint import SessionCheckpoint
+from roku_psdk_log_instrument.telnet.segments import SegmentArchiver, segment_path
+
+
+class FlushPolicy:
+    """
+    Decides when buffered log lines are written to disk.
+
+    Buffered lines are flushed once ``max_bytes`` are pending or the oldest
+    pending line is ``max_interval`` seconds old, whichever comes first.
+    The interval bounds how stale the file can be for tail-based monitors.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = 64 * 1024,
+        max_interval: Optional[float] = 0.1,
+        fsync_on_close: bool = False
+    ):
+        """
+        Initialize the flush policy.
+
+        Args:
+            max_bytes: Flush when this many bytes are pending (None to disable)
+            max_interval: Flush when pending data is this many seconds old (None to disable)
+            fsync_on_close: fsync the file when the writer is closed
+        """
+        self.max_bytes = max_bytes
+        self.max_interval = max_interval
+        self.fsync_on_close = fsync_on_close
+
+    @classmethod
+    def per_line(cls, fsync_on_close: bool = False) -> "FlushPolicy":
+        """
+        Policy that flushes after every line, like the original capture loop.
+
+        Args:
+            fsync_on_close: fsync the file when the writer is closed
+
+        Returns:
+            FlushPolicy instance
+        """
+        return cls(max_bytes=0, max_interval=None, fsync_on_close=fsync_on_close)
+
+
+class RotationPolicy:
+    """
+    Decides when the active session log is closed as a segment.
+
+    The log is rotated once it holds ``max_bytes`` or has been open for
+    ``max_age`` seconds, whichever comes first. Closed segments are
+    gzip-compressed in the background unless ``compress`` is False.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        compress: bool = True
+    ):
+        """
+        Initialize the rotation policy.
+
+        Args:
+            max_bytes: Rotate when the active segment reaches this size (None to disable)
+            max_age: Rotate when the active segment is this many seconds old (None to disable)
+            compress: gzip closed segments on a background thread
+        """
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.compress = compress
+
+    def due(self, size: int, opened_at: float) -> bool:
+        """
+        Check whether the active segment should be rotated.
+
+        Args:
+            size: Bytes written to the active segment
+            opened_at: time.monotonic() value when the segment was opened
+
+        Returns:
+            True if the segment is due for rotation
+        """
+        if not size:
+            return False
+        if self.max_bytes is not None and size >= self.max_bytes:
+            return True
+        return self.max_age is not None and time.monotonic() - opened_at >= self.max_age
+
+
+class SessionLogWriter:
+    """
+    Writes captured log lines to a session log file in batches.
+
+    Lines are kept in memory and written with a single ``write`` call on
+    a raw binary file when the flush policy says so, instead of one write
+    per line.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        policy: Optional[FlushPolicy] = None,
+        rotation: Optional[RotationPolicy] = None,
+        on_segment: Optional[Callable[[Dict], None]] = None,
+        checkpoint: Optional[SessionCheckpoint] = None
+    ):
+        """
+        Initialize the writer and open the log file.
+
+        Args:
+            path: Log file path (truncated if it exists)
+            policy: Flush policy (defaults to 64 KB / 100 ms)
+            rotation: Optional rotation policy (default: one ever-growing file)
+            on_segment: Optional callback receiving the manifest entry of each
+                closed segment, again once it has been compressed
+            checkpoint: Optional checkpoint fed with every written batch and
+                saved periodically and on close
+        """
+        self.path = Path(path)
+        self.policy = policy or FlushPolicy()
+        self.rotation = rotation
+        self.on_segment = on_segment
+        self.checkpoint = checkpoint
+        self._file = open(self.path, 'wb', buffering=0)
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._pending_since: Optional[float] = None
+
+        self._archiver: Optional[SegmentArchiver] = None
+        if rotation and rotation.compress:
+            self._archiver = SegmentArchiver()
+        self._segment_index = 0
+        self._segment_lines = 0
+        self._segment_bytes = 0
+        self._segment_opened = time.monotonic()
+        self._segment_start = datetime.now()
+
+        self.lines_written = 0
+        self.bytes_written = 0
+        self.flushes = 0
+        self.fsyncs = 0
+        self.rotations = 0
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer has been closed."""
+        return self._file.closed
+
+    def write_line(self, line: str) -> None:
+        """
+        Buffer one log line.
+
+        Args:
+            line: Log line without trailing newline
+        """
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        self._pending.append(line)
+        self._pending_size += len(line) + 1
+
+        max_bytes = self.policy.max_bytes
+        if max_bytes is not None and self._pending_size >= max_bytes:
+            self.flush()
+
+    def write_lines(self, lines: List[str]) -> None:
+        """
+        Buffer a batch of log lines.
+
+        Args:
+            lines: Log lines without trailing newlines
+        """
+        if not lines:
+            return
+        self.buffer_lines(lines)
+
+        max_bytes = self.policy.max_bytes
+        if max_bytes is not None and self._pending_size >= max_bytes:
+            self.flush()
+
+    def buffer_lines(self, lines: List[str]) -> None:
+        """
+        Buffer lines without applying the size policy.
+
+        Args:
+            lines: Log lines without trailing newlines
+        """
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        self._pending.extend(lines)
+        self._pending_size += sum(map(len, lines)) + len(lines)
+
+    def next_flush_in(self) -> Optional[float]:
+        """
+        Time until pending lines must be flushed by the interval policy.
+
+        Capture loops use this as their read timeout so idle periods do not
+        leave lines sitting in memory.
+
+        Returns:
+            Seconds until the next flush is due (0 if overdue), or None if nothing is due
+        """
+        if self._pending_since is None or self.policy.max_interval is None:
+            return None
+        elapsed = time.monotonic() - self._pending_since
+        return max(self.policy.max_interval - elapsed, 0.0)
+
+    def maybe_flush(self) -> bool:
+        """
+        Flush if the interval policy says pending lines are due.
+
+        Returns:
+            True if a flush happened
+        """
+        due = self.next_flush_in()
+        if due is not None and due <= 0:
+            self.flush()
+            return True
+        return False
+
+    @property
+    def pending_bytes(self) -> int:
+        """Approximate size of buffered lines not yet written."""
+        return self._pending_size
+
+    def take_pending(self) -> Optional[Tuple[bytes, int]]:
+        """
+        Remove buffered lines from the writer and encode them.
+
+        Together with write_batch this lets the disk write happen on another
+        thread while new lines keep being buffered.
+
+        Returns:
+            Tuple of (encoded data, line count), or None if nothing is pending
+        """
+        if not self._pending:
+            return None
+
+        data = ("\n".join(self._pending) + "\n").encode('utf-8')
+        count = len(self._pending)
+        self._pending = []
+        self._pending_size = 0
+        self._pending_since = None
+        return data, count
+
+    def write_batch(self, data: bytes, line_count: int) -> None:
+        """
+        Write a batch returned by take_pending with one write call.
+
+        Args:
+            data: Encoded lines
+            line_count: Number of lines in data
+        """
+        view = memoryview(data)
+        while view:
+            written = self._file.write(view)
+            view = view[written:]
+
+        self.lines_written += line_count
+        self.bytes_written += len(data)
+        self.flushes += 1
+
+        if self.rotation:
+            self._segment_lines += line_count
+            self._segment_bytes += len(data)
+            if self.rotation.due(self._segment_bytes, self._segment_opened):
+                self.rotate()
+
+        if self.checkpoint:
+            self.checkpoint.observe(data, line_count)
+            self.checkpoint.maybe_save()
+
+    def rotate(self) -> Optional[Dict]:
+        """
+        Close the active log as a numbered segment and start a new one.
+
+        Rotation happens between batches, so a segment written by the line
+        writer always ends with a complete line. The segment is handed to
+        the background archiver for compression.
+
+        Returns:
+            Manifest entry of the closed segment, or None if it was empty
+        """
+        if not self._segment_bytes:
+            return None
+
+        self._file.close()
+        self._segment_index += 1
+        closed = segment_path(self.path, self._segment_index)
+        os.replace(self.path, closed)
+        self._file = open(self.path, 'wb', buffering=0)
+
+        segment = {
+            "index": self._segment_index,
+            "file": closed.name,
+            "start_time": self._segment_start.isoformat(),
+            "end_time": datetime.now().isoformat(),
+            "lines": self._segment_lines,
+            "bytes": self._segment_bytes,
+            "compressed": False,
+        }
+        self._segment_lines = 0
+        self._segment_bytes = 0
+        self._segment_opened = time.monotonic()
+        self._segment_start = datetime.now()
+        self.rotations += 1
+
+        if self.on_segment:
+            self.on_segment(dict(segment))
+        if self._archiver:
+            self._archiver.submit(closed, dict(segment), self.on_segment)
+        return segment
+
+    def flush(self) -> None:
+        """
+        Write all pending lines to the file with one write call.
+        """
+        batch = self.take_pending()
+        if batch:
+            self.write_batch(*batch)
+
+    def close(self) -> None:
+        """
+        Flush pending lines, optionally fsync, and close the file.
+        """
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+            if self.policy.fsync_on_close:
+                os.fsync(self._file.fileno())
+                self.fsyncs += 1
+        finally:
+            self._file.close()
+            if self._archiver:
+                # Wait for queued segments so the manifest is final
+                self._archiver.close()
+        if self.checkpoint:
+            # Final statistics, however recent the last periodic save was
+            self.checkpoint.save()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with lines, bytes, flushes, fsyncs and rotations
+        """
+        return {
+            "lines_written": self.lines_written,
+            "bytes_written": self.bytes_written,
+            "flushes": self.flushes,
+            "fsyncs": self.fsyncs,
+            "rotations": self.rotations,
+        }
+
+    def __enter__(self) -> "SessionLogWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RawSessionLogWriter(SessionLogWriter):
+    """
+    Writes received byte chunks to a session log file unchanged.
+
+    Used by raw capture: nothing is decoded or re-encoded on the write
+    path, so the file holds exactly what the device sent, including
+    carriage returns and bytes that are not valid UTF-8. Text lines
+    (gap markers) can still be written and always start on a new line.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        policy: Optional[FlushPolicy] = None,
+        rotation: Optional[RotationPolicy] = None,
+        on_segment: Optional[Callable[[Dict], None]] = None,
+        checkpoint: Optional[SessionCheckpoint] = None
+    ):
+        """
+        Initialize the writer and open the log file.
+
+        Args:
+            path: Log file path (truncated if it exists)
+            policy: Flush policy (defaults to 64 KB / 100 ms)
+            rotation: Optional rotation policy; segments may split a line
+            on_segment: Optional callback receiving segment manifest entries
+            checkpoint: Optional checkpoint fed with every written batch
+        """
+        super().__init__(path, policy, rotation, on_segment, checkpoint)
+        self._raw = bytearray()
+        self._at_line_start = True
+
+    def write_bytes(self, data) -> int:
+        """
+        Buffer a chunk of received bytes.
+
+        Args:
+            data: Bytes-like object, possibly ending mid-line
+
+        Returns:
+            Number of line terminators in data
+        """
+        if not data:
+            return 0
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+
+        offset = len(self._raw)
+        self._raw += data
+        self._pending_size = len(self._raw)
+        self._at_line_start = self._raw[-1] == 0x0A
+        count = self._raw.count(b'\n', offset)
+
+        max_bytes = self.policy.max_bytes
+        if max_bytes is not None and self._pending_size >= max_bytes:
+            self.flush()
+        return count
+
+    def write_line(self, line: str) -> None:
+        """
+        Buffer one text line, starting a new line if a chunk ended mid-line.
+
+        Args:
+            line: Log line without trailing newline
+        """
+        self.write_lines([line])
+
+    def buffer_lines(self, lines: List[str]) -> None:
+        """
+        Buffer text lines without applying the size policy.
+
+        Args:
+            lines: Log lines without trailing newlines
+        """
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        if not self._at_line_start:
+            self._raw += b'\n'
+        self._raw += ("\n".join(lines) + "\n").encode('utf-8')
+        self._pending_size = len(self._raw)
+        self._at_line_start = True
+
+    def take_pending(self) -> Optional[Tuple[bytes, int]]:
+        """
+        Remove buffered bytes from the writer.
+
+        Returns:
+            Tuple of (data, line terminator count), or None if nothing is pending
+        """
+        if not self._raw:
+            return None
+
+        data, self._raw = self._raw, bytearray()
+        self._pending_size = 0
+        self._pending_since = None
+        return data, data.count(b'\n')
+
+
+class AsyncSessionLogWriter:
+    """
+    asyncio front-end for SessionLogWriter.
+
+    Lines are buffered on the event loop; disk writes and fsync run in the
+    default executor so a slow disk never blocks other device streams.
+    """
+
+    def __init__(self, path: Path, policy: Optional[FlushPolicy] = None):
+        """
+        Initialize the writer and open the log file.
+
+        Args:
+            path: Log file path (truncated if it exists)
+            policy: Flush policy (defaults to 64 KB / 100 ms)
+        """
+        self.policy = policy or FlushPolicy()
+        self._writer = SessionLogWriter(path, self.policy)
+        self._lock = asyncio.Lock()
+        self._inflight: Optional[asyncio.Future] = None
+
+    @property
+    def path(self) -> Path:
+        """Log file path."""
+        return self._writer.path
+
+    async def write_lines(self, lines: List[str]) -> None:
+        """
+        Buffer a batch of log lines, flushing when the size policy says so.
+
+        Args:
+            lines: Log lines without trailing newlines
+        """
+        if not lines:
+            return
+        # Buffer without triggering the synchronous size flush
+        self._writer.buffer_lines(lines)
+
+        max_bytes = self.policy.max_bytes
+        if max_bytes is not None and self._writer.pending_bytes >= max_bytes:
+            await self.flush()
+
+    def next_flush_in(self) -> Optional[float]:
+        """
+        Time until pending lines must be flushed by the interval policy.
+
+        Returns:
+            Seconds until the next flush is due (0 if overdue), or None if nothing is due
+        """
+        return self._writer.next_flush_in()
+
+    async def maybe_flush(self) -> bool:
+        """
+        Flush if the interval policy says pending lines are due.
+
+        Returns:
+            True if a flush happened
+        """
+        due = self.next_flush_in()
+        if due is not None and due <= 0:
+            await self.flush()
+            return True
+        return False
+
+    async def flush(self) -> None:
+        """
+        Write all pending lines in the default executor.
+        """
+        async with self._lock:
+            # Taken on the loop thread so lines buffered meanwhile are kept
+            batch = self._writer.take_pending()
+            if batch:
+                loop = asyncio.get_running_loop()
+                self._inflight = loop.run_in_executor(None, self._writer.write_batch, *batch)
+                await self._inflight
+
+    async def close(self) -> None:
+        """
+        Flush pending lines, optionally fsync, and close the file.
+        """
+        # A cancelled flush leaves its executor write running; let it finish
+        if self._inflight is not None:
+            await asyncio.wait({self._inflight})
+        await self.flush()
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._writer.close)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with lines, bytes, flushes, fsyncs and rotations
+        """
+        return self._writer.stats()
@@ -0,0 +1,8 @@
+"""
+Test and benchmark helpers: synthetic Roku traffic and a fake Roku server.
+"""
+
+from roku_psdk_log_instrument.testing.synthetic import generate_lines, playback_lines
+from roku_psdk_log_instrument.testing.fake_roku import FakeRokuServer, parse_stamp, stamp_line
+
+__all__ = ["generate_lines", "playback_lines", "FakeRokuServer", "parse_stamp", "stamp_line"]
@@ -0,0 +1,9 @@
+"""
+Run the fake Roku server: ``python -m roku_psdk_log_instrument.testing``.
+"""
+
+import sys
+
+from roku_psdk_log_instrument.testing.fake_roku import main
+
+sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Fake Roku telnet server that replays log traffic for tests and benchmarks.
+
+Usage:
+    python -m roku_psdk_log_instrument.testing [--port 8085] [--fixture LOG]
+        [--rate LINES_PER_S] [--burst N] [--line-length MIN MAX]
+        [--disconnect-every N] [--lines N] [--loop] [--stamp]
+"""
+
+import argparse
+import itertools
+import random
+import socket
+import sys
+import time
+from pathlib import Path
+from threading import Event, Thread
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from roku_psdk_log_instrument.telnet.client import RokuTelnetClient
+from roku_psdk_log_instrument.testing.synthetic import generate_lines
+
+
+STAMP_PREFIX = "[t="
+
+
+def stamp_line(line: str, timestamp_ns: int) -> str:
+    """
+    Prefix a line with a monotonic send timestamp.
+
+    Args:
+        line: Log line
+        timestamp_ns: time.monotonic_ns() value at send time
+
+    Returns:
+        Stamped line, e.g. ``[t=123456789] PSDK:: ...``
+    """
+    return f"{STAMP_PREFIX}{timestamp_ns}] {line}"
+
+
+def parse_stamp(line: str) -> Optional[int]:
+    """
+    Extract the send timestamp from a stamped line.
+
+    Args:
+        line: Log line
+
+    Returns:
+        time.monotonic_ns() value at send time, or None if the line is not stamped
+    """
+    if not line.startswith(STAMP_PREFIX):
+        return None
+    end = line.find("]", len(STAMP_PREFIX))
+    try:
+        return int(line[len(STAMP_PREFIX):end])
+    except ValueError:
+        return None
+
+
+class FakeRokuServer:
+    """
+    TCP server that streams log lines to a connecting client like port 8085 on a Roku.
+
+    Lines come from any iterable (a fixture file, synthetic traffic) and
+    are shared across connections, so a client that reconnects continues
+    where the previous connection stopped.
+    """
+
+    def __init__(
+        self,
+        lines: Iterable[str],
+        host: str = "127.0.0.1",
+        port: int = RokuTelnetClient.DEFAULT_PORT,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        line_length: Optional[Tuple[int, int]] = None,
+        disconnect_every: Optional[int] = None,
+        stamp: bool = False,
+        newline: str = "\r\n",
+        seed: int = 0
+    ):
+        """
+        Initialize the fake Roku server.
+
+        Args:
+            lines: Log lines to send (consumed once; use itertools.cycle to loop)
+            host: Address to listen on
+            port: Port to listen on (0 picks a free port)
+            rate: Average lines per second (None sends as fast as possible)
+            burst: Lines sent together in one write; bursts are spaced to keep the average rate
+            line_length: Optional (min, max) range; shorter lines are padded to a random length in it
+            disconnect_every: Drop the client connection after this many lines
+            stamp: Prefix every line with its send time (see parse_stamp)
+            newline: Line terminator
+            seed: Seed for the line-length distribution
+        """
+        self.host = host
+        self.port = port
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.line_length = line_length
+        self.disconnect_every = disconnect_every
+        self.stamp = stamp
+        self.newline = newline
+        self._lines: Iterator[str] = iter(lines)
+        self._rng = random.Random(seed)
+        self._listener: Optional[socket.socket] = None
+        self._thread: Optional[Thread] = None
+        self._stop_event = Event()
+        self.finished = Event()
+
+        self.lines_sent = 0
+        self.bytes_sent = 0
+        self.connections = 0
+
+    def start(self) -> "FakeRokuServer":
+        """
+        Start listening and serving clients in a background thread.
+
+        Returns:
+            The server (``port`` holds the bound port)
+        """
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((self.host, self.port))
+        self._listener.listen(1)
+        self._listener.settimeout(0.2)
+        self.port = self._listener.getsockname()[1]
+
+        self._thread = Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the listening socket.
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        if self._listener:
+            self._listener.close()
+
+    def __enter__(self) -> "FakeRokuServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """
+        Accept clients one at a time until the lines run out or stop() is called.
+        """
+        while not self._stop_event.is_set() and not self.finished.is_set():
+            try:
+                conn, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            self.connections += 1
+            with conn:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                try:
+                    self._stream(conn)
+                except OSError:
+                    # Client went away; wait for the next one
+                    pass
+
+    def _shape(self, line: str) -> str:
+        if self.line_length:
+            target = self._rng.randint(*self.line_length)
+            if len(line) < target:
+                line = line + " " + "." * (target - len(line) - 1)
+        return line
+
+    def _stream(self, conn: socket.socket) -> None:
+        sent_on_connection = 0
+        interval = self.burst / self.rate if self.rate else 0.0
+        next_send = time.monotonic()
+
+        while not self._stop_event.is_set():
+            count = self.burst
+            if self.disconnect_every:
+                count = min(count, self.disconnect_every - sent_on_connection)
+
+            batch: List[str] = [self._shape(line) for line in itertools.islice(self._lines, count)]
+            if not batch:
+                self.finished.set()
+                return
+
+            if self.stamp:
+                now = time.monotonic_ns()
+                batch = [stamp_line(line, now) for line in batch]
+
+            data = (self.newline.join(batch) + self.newline).encode("utf-8")
+            conn.sendall(data)
+            self.lines_sent += len(batch)
+            self.bytes_sent += len(data)
+            sent_on_connection += len(batch)
+
+            if self.disconnect_every and sent_on_connection >= self.disconnect_every:
+                return
+
+            if interval:
+                next_send += interval
+                delay = next_send - time.monotonic()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+
+
+def fixture_lines(path: Path) -> List[str]:
+    """
+    Read the lines of a captured log to replay.
+
+    Args:
+        path: Log file path
+
+    Returns:
+        Lines without trailing newlines
+    """
+    return Path(path).read_text(encoding="utf-8", errors="ignore").splitlines()
+
+
+def main() -> int:
+    """Run a fake Roku server in the foreground."""
+    parser = argparse.ArgumentParser(description="Fake Roku telnet log server")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=RokuTelnetClient.DEFAULT_PORT, help="Port (default: 8085)")
+    parser.add_argument("--fixture", type=Path, help="Replay this log file instead of synthetic traffic")
+    parser.add_argument("--lines", type=int, help="Stop after this many lines")
+    parser.add_argument("--loop", action="store_true", help="Replay the fixture forever")
+    parser.add_argument("--rate", type=float, help="Average lines per second (default: unthrottled)")
+    parser.add_argument("--burst", type=int, default=1, help="Lines per write")
+    parser.add_argument("--line-length", type=int, nargs=2, metavar=("MIN", "MAX"),
+                        help="Pad lines to a random length in this range")
+    parser.add_argument("--disconnect-every", type=int, help="Drop the client after N lines")
+    parser.add_argument("--stamp", action="store_true", help="Prefix lines with their send time")
+    args = parser.parse_args()
+
+    if args.fixture:
+        source: Iterable[str] = fixture_lines(args.fixture)
+        if args.loop:
+            source = itertools.cycle(source)
+    else:
+        source = generate_lines(args.lines or sys.maxsize)
+    if args.lines:
+        source = itertools.islice(source, args.lines)
+
+    server = FakeRokuServer(
+        source,
+        host=args.host,
+        port=args.port,
+        rate=args.rate,
+        burst=args.burst,
+        line_length=tuple(args.line_length) if args.line_length else None,
+        disconnect_every=args.disconnect_every,
+        stamp=args.stamp,
+    ).start()
+    # Machine-readable for benchmarks that start the server with --port 0
+    print(f"LISTENING {server.host}:{server.port}", flush=True)
+
+    try:
+        while not server.finished.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+    print(f"SENT {server.lines_sent} lines, {server.bytes_sent} bytes, "
+          f"{server.connections} connection(s)", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
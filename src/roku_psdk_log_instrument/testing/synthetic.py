@@ -0,0 +1,77 @@
+"""
+Synthetic Roku log traffic for benchmarks and the fake Roku server.
+"""
+
+import json
+import uuid
+from typing import Iterator, List
+
+
+def playback_lines(progress_events: int = 200, seed: int = 0) -> List[str]:
+    """
+    Build the log lines of one player session with a single playback.
+
+    Args:
+        progress_events: Number of playbackProgressEvent lines in the burst
+        seed: Value mixed into generated IDs
+
+    Returns:
+        List of log lines without trailing newlines
+    """
+    session_id = str(uuid.UUID(int=seed + 1))
+    content_id = str(uuid.UUID(int=seed + 2))
+
+    lines = [
+        '[PLAYER_SDK] PlayerSDK.Core.PlayerBuilder: new',
+        'Player Controller: Load {',
+        '    contentMetadata: {',
+        f'        id: "{content_id}"',
+        '        title: "Barry"',
+        '        subtitle: "Chapter One: Make Your Mark"',
+        '        contentType: "episode"',
+        '        playbackType: "userInitiated"',
+        '        initialPlaybackPosition: 0',
+        '    }',
+        '}',
+        f'PSDK:: key playbackInitiatedEvent value: {{"playbackSessionId":"{session_id}"}}',
+        '[PSDK::ISDK] Event: beam.events.playback.initiated_3.3payload'
+        + json.dumps({"content": {"editId": content_id},
+                      "playback": {"playbackId": session_id, "trigger": "USER_INITIATED"}},
+                     separators=(",", ":")),
+        '[mux-analytics] EVENT viewstart{view_session_id:9a1b2c3d, viewer_time:1733602522506}',
+    ]
+
+    for i in range(progress_events):
+        payload = {"playbackSessionId": session_id,
+                   "playheaddata": {"contentplayheadms": i * 1000, "streamplayheadms": i * 1000}}
+        lines.append(
+            "PSDK:: key playbackProgressEvent value: " + json.dumps(payload, separators=(",", ":"))
+        )
+        if i % 10 == 0:
+            lines.append(f"[mux-analytics] EVENT playing{{view_session_id:9a1b2c3d, playhead_time:{i * 1000}}}")
+        if i % 25 == 0:
+            lines.append("Texture manager: released 3 bitmaps (1.2 MB)")
+
+    lines.append(f'PSDK:: key playbackSessionEndEvent value: {{"playbackSessionId":"{session_id}"}}')
+    lines.append('PSDK:: key playerSessionEndEvent value: {}')
+    return lines
+
+
+def generate_lines(total: int, progress_events: int = 200) -> Iterator[str]:
+    """
+    Yield at least ``total`` lines made of repeated player sessions.
+
+    Args:
+        total: Minimum number of lines to generate
+        progress_events: Progress events per playback
+
+    Yields:
+        Log lines without trailing newlines
+    """
+    produced = 0
+    seed = 0
+    while produced < total:
+        for line in playback_lines(progress_events, seed):
+            yield line
+            produced += 1
+        seed += 2
@@ -3,6 +3,6 @@ Log validation modules.
 """
 
 from roku_psdk_log_instrument.validation.validator import LogValidator, ValidationResult
+from roku_psdk_log_instrument.validation.online import OnlineValidator
 
-__all__ = ["LogValidator", "ValidationResult"]
-
+__all__ = ["LogValidator", "ValidationResult", "OnlineValidator"]
@@ -0,0 +1,149 @@
+"""
+Incremental playback session validation of a live capture.
+
+OnlineValidator takes one raw line at a time, as the capture callback
+delivers them, and returns the verdict of a playback session on the line
+that ends it. Each line goes through the record assembler and session
+tracker once; a session's rules are applied once, when it completes, so
+the work per line stays constant however long the capture runs.
+"""
+
+from time import perf_counter_ns
+from typing import Dict, List, Optional
+
+from roku_psdk_log_instrument.parsers.records import RecordAssembler
+from roku_psdk_log_instrument.validation.rules import PlaybackSession, SessionTracker
+from roku_psdk_log_instrument.validation.validator import LogValidator, ValidationResult
+
+
+class OnlineValidator:
+    """
+    Validates playback sessions line by line while a log is captured.
+
+    The content load block, the playbackInitiated and playbackSessionEnd
+    boundaries and the ISDK ID cross-checks are tracked as in
+    ``LogValidator.validate_session_lines``, which gives the same results
+    for the same lines. Feed it from a LineDispatcher thread rather than
+    the capture thread; lines the dispatcher had to skip are reported with
+    ``skip`` and cut the open session short. The gap marker a capture
+    writes after reconnecting arrives as a line and cuts it short too.
+
+    The time spent in ``feed`` is counted per line, so ``stats`` shows
+    whether validation keeps up with the device.
+    """
+
+    def __init__(self, validator: Optional[LogValidator] = None, first_line: int = 1):
+        """
+        Initialize the validator.
+
+        Args:
+            validator: Validator whose rules and classifier to use (defaults if None)
+            first_line: Line number of the first line fed
+        """
+        self.validator = validator or LogValidator()
+        self._assembler = RecordAssembler(first_line, classifier=self.validator.classifier)
+        self._tracker = SessionTracker(self.validator.rules.isdk_fields)
+
+        self.lines = 0
+        self.records = 0
+        self.sessions = 0
+        self.invalid = 0
+        self.skipped = 0
+        self.busy_ns = 0
+        self.max_line_ns = 0
+
+    def feed(self, line: str) -> List[ValidationResult]:
+        """
+        Add one captured line.
+
+        Args:
+            line: Raw log line (a trailing newline is stripped)
+
+        Returns:
+            Results of the sessions this line completed or cut short, usually none
+        """
+        start = perf_counter_ns()
+        results = []
+        for record in self._assembler.feed(line):
+            self.records += 1
+            session = self._tracker.feed(record)
+            if session is not None:
+                results.append(self._verdict(session))
+
+        elapsed = perf_counter_ns() - start
+        self.lines += 1
+        self.busy_ns += elapsed
+        if elapsed > self.max_line_ns:
+            self.max_line_ns = elapsed
+        return results
+
+    def skip(self, count: int) -> List[ValidationResult]:
+        """
+        Account for lines that were captured but never fed.
+
+        The record held back is completed and the open session is cut
+        short, with a warning naming the skipped lines; tracking resumes
+        at the next playback.
+
+        Args:
+            count: Number of skipped lines
+
+        Returns:
+            Results of the sessions the gap completed or cut short
+        """
+        self.skipped += count
+        results = self._flush()
+        session = self._tracker.finish()
+        if session is not None:
+            session.skipped += count
+            results.append(self._verdict(session))
+        self._assembler.line_number += count
+        return results
+
+    def finish(self) -> List[ValidationResult]:
+        """
+        End the stream.
+
+        Returns:
+            Results of the sessions still open at the end of the capture
+        """
+        results = self._flush()
+        session = self._tracker.finish()
+        if session is not None:
+            results.append(self._verdict(session))
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get validation statistics and per-line cost.
+
+        Returns:
+            Dictionary with line, record, session and skip counts, total
+            busy nanoseconds and the mean and worst nanoseconds per line
+        """
+        return {
+            "lines": self.lines,
+            "records": self.records,
+            "sessions": self.sessions,
+            "invalid": self.invalid,
+            "skipped": self.skipped,
+            "busy_ns": self.busy_ns,
+            "mean_line_ns": self.busy_ns // self.lines if self.lines else 0,
+            "max_line_ns": self.max_line_ns,
+        }
+
+    def _flush(self) -> List[ValidationResult]:
+        results = []
+        for record in self._assembler.flush():
+            self.records += 1
+            session = self._tracker.feed(record)
+            if session is not None:
+                results.append(self._verdict(session))
+        return results
+
+    def _verdict(self, session: PlaybackSession) -> ValidationResult:
+        result = self.validator.session_result(session)
+        self.sessions += 1
+        if not result.is_valid:
+            self.invalid += 1
+        return result
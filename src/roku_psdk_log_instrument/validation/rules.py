@@ -0,0 +1,307 @@
+"""
+Playback session rules compiled from monitor_config.json.
+
+The rules of the bash monitor's playback summary: required and optional
+content metadata fields, the playbackType and contentType enums, and the
+ISDK cross-checks of ``content.editId`` against the content metadata ID
+and ``playback.playbackId`` against the playback session ID. They are
+compiled once into tuples, frozensets and field accessors, and applied
+to the sessions SessionTracker finds in a stream of log records.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from roku_psdk_log_instrument.monitor.classifier import (
+    CONTENT_LOAD, ISDK, PLAYBACK_END, PLAYBACK_INITIATE, PLAYER_CREATE, PSDK
+)
+from roku_psdk_log_instrument.monitor.config import MonitorConfig
+from roku_psdk_log_instrument.monitor.engine import (
+    ISDK_FIELD_CHECKS, PLAYBACK_TYPE_RE, SESSION_ID_RE, parse_content_line
+)
+from roku_psdk_log_instrument.monitor.fields import FieldPath
+from roku_psdk_log_instrument.parsers.records import LogRecord
+from roku_psdk_log_instrument.telnet.reconnect import GAP_MARKER_PREFIX
+
+# "playbackType":"X" / "contentType":"X" in a JSON payload
+_ENUM_VALUE_RES = {
+    "playbackType": PLAYBACK_TYPE_RE,
+    "contentType": re.compile(r'"contentType":"([^"]+)"'),
+}
+
+
+class PlaybackSession:
+    """
+    State of one playback session, from its initiated event to its end.
+
+    ``isdk_values`` holds the first value of each cross-checked ISDK field.
+    ``ended`` is False for a session cut short by the next playback, a new
+    player or the end of the log. ``skipped`` counts lines of the session
+    that never reached the tracker, as when a live validator falls behind,
+    and ``gaps`` the capture gap markers that cut it short.
+    """
+
+    __slots__ = (
+        "number", "session_id", "metadata", "first_line", "last_line",
+        "event_count", "isdk_event_count", "isdk_values", "ended", "skipped", "gaps"
+    )
+
+    def __init__(self, number: int, session_id: str, metadata: Dict[str, str], first_line: int):
+        """
+        Start a session.
+
+        Args:
+            number: Playback number within the log, from 1
+            session_id: playbackSessionId, or "unknown"
+            metadata: Content metadata of the content load before the playback
+            first_line: Line number of the playback initiated event
+        """
+        self.number = number
+        self.session_id = session_id
+        self.metadata = metadata
+        self.first_line = first_line
+        self.last_line = first_line
+        self.event_count = 0
+        self.isdk_event_count = 0
+        self.isdk_values: Dict[str, str] = {}
+        self.ended = False
+        self.skipped = 0
+        self.gaps = 0
+
+
+class SessionTracker:
+    """
+    Finds playback sessions in a stream of LogRecord objects.
+
+    Follows the lifecycle of the monitor engine: a content load block,
+    read up to its closing ``}`` line across as many records as it
+    takes, supplies the metadata of the next playback, the playback initiated
+    event starts a session and the playback end event completes it. A
+    new playback or player before the end event cuts the session short,
+    and so does a capture gap marker, since lines were lost while the
+    capture reconnected.
+    """
+
+    def __init__(self, isdk_fields: Iterable[str] = ()):
+        """
+        Initialize the tracker.
+
+        Args:
+            isdk_fields: Dotted ISDK payload fields to record per session
+        """
+        self._isdk_fields = tuple(FieldPath(path) for path in isdk_fields)
+        self._content: Dict[str, str] = {}
+        self._priorities: Dict[str, int] = {}
+        self._in_content = False
+        self._number = 0
+        self.session: Optional[PlaybackSession] = None
+
+    def feed(self, record: LogRecord) -> Optional[PlaybackSession]:
+        """
+        Add one record.
+
+        Args:
+            record: Record classified with the configuration's LineClassifier
+
+        Returns:
+            The session this record completed or cut short, if any
+        """
+        mask = record.categories
+        session = self.session
+        if record.lines[0].startswith(GAP_MARKER_PREFIX):
+            self._in_content = False
+            self.session = None
+            if session is not None:
+                session.gaps += 1
+            return session
+        if mask & CONTENT_LOAD:
+            self._content = {}
+            self._priorities = {}
+            self._in_content = True
+            self._read_content(record.lines[1:])
+            return None
+        if self._in_content:
+            # A block longer than the assembler's record cap continues here
+            self._read_content(record.lines)
+            return None
+
+        if mask & (PLAYER_CREATE | PLAYBACK_INITIATE):
+            self.session = None
+            if mask & PLAYBACK_INITIATE:
+                self._start(record)
+            return session
+
+        if session is None:
+            return None
+        session.last_line = record.last_line
+        if mask & PLAYBACK_END:
+            session.ended = True
+            self.session = None
+            return session
+        if mask & PSDK:
+            session.event_count += 1
+            if mask & ISDK:
+                self._track_isdk(session, record)
+        return None
+
+    def finish(self) -> Optional[PlaybackSession]:
+        """
+        End the stream.
+
+        Returns:
+            The session still open at the end of the log, if any
+        """
+        session = self.session
+        self.session = None
+        return session
+
+    def _read_content(self, lines: List[str]) -> None:
+        # Like the monitor, a content load block runs until a bare "}" line
+        for line in lines:
+            if line == "}":
+                self._in_content = False
+                return
+            parse_content_line(line, self._content, self._priorities)
+
+    def _start(self, record: LogRecord) -> None:
+        text = record.text
+        match = SESSION_ID_RE.search(text)
+        metadata = self._content
+        if not metadata.get("playbackType"):
+            type_match = PLAYBACK_TYPE_RE.search(text)
+            if type_match:
+                metadata["playbackType"] = type_match.group(1)
+        self._number += 1
+        self.session = PlaybackSession(
+            self._number, match.group(1) if match else "unknown", metadata, record.first_line
+        )
+        self.session.last_line = record.last_line
+        self._content = {}
+
+    def _track_isdk(self, session: PlaybackSession, record: LogRecord) -> None:
+        session.isdk_event_count += 1
+        values = session.isdk_values
+        if len(values) == len(self._isdk_fields):
+            return
+        data = record.data()
+        for field in self._isdk_fields:
+            if field.path not in values:
+                value = field.get(data)
+                if value:
+                    values[field.path] = value
+
+
+class SessionRules:
+    """
+    Content metadata and ISDK rules of monitor_config.json, compiled once.
+
+    Each rule is one check; a failed check gives one error. Missing
+    optional fields, missing cross-check values and sessions without an
+    end event are warnings, or errors in strict mode.
+    """
+
+    def __init__(self, config: Optional[MonitorConfig] = None, strict: bool = False):
+        """
+        Compile the rules.
+
+        Args:
+            config: Monitor configuration (defaults if None)
+            strict: Report warnings as errors
+        """
+        config = config or MonitorConfig()
+        self.strict = strict
+        self.required_fields: Tuple[str, ...] = ()
+        self.optional_fields: Tuple[str, ...] = ()
+        self.enums: Tuple[Tuple[str, frozenset], ...] = ()
+        if config.validation_enabled:
+            self.required_fields = tuple(config.required_fields)
+            self.optional_fields = tuple(config.optional_fields)
+            self.enums = tuple(
+                (field, frozenset(values))
+                for field, enabled, values in (
+                    ("playbackType", config.playback_type_enum_enabled, config.valid_playback_types),
+                    ("contentType", config.content_type_enum_enabled, config.valid_content_types),
+                )
+                if enabled
+            )
+        # (ISDK field, label, ISDK name, missing-expected label, expected source)
+        self.isdk_checks: Tuple[Tuple[str, str, str, str, str], ...] = ()
+        if config.isdk_validation_enabled and config.isdk_field_validation_enabled:
+            self.isdk_checks = tuple(
+                (field, label, short, missing, source)
+                for field, label, short, _, missing, source in ISDK_FIELD_CHECKS
+            )
+        self._enum_patterns = tuple((_ENUM_VALUE_RES[field], values) for field, values in self.enums)
+
+    @property
+    def isdk_fields(self) -> Tuple[str, ...]:
+        """ISDK payload fields the cross-checks read."""
+        return tuple(check[0] for check in self.isdk_checks)
+
+    def check(self, session: PlaybackSession) -> Tuple[List[str], List[str], int]:
+        """
+        Apply every rule to a session.
+
+        Args:
+            session: Completed or cut-short playback session
+
+        Returns:
+            Tuple of (errors, warnings, number of checks)
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        lenient = warnings if not self.strict else errors
+        metadata = session.metadata
+        # One check per field, enum and cross-check, and one for the end event
+        checks = len(self.required_fields) + len(self.optional_fields) + len(self.enums) + len(self.isdk_checks) + 1
+
+        for field in self.required_fields:
+            if not metadata.get(field):
+                errors.append(f"Missing required field: {field}")
+        for field in self.optional_fields:
+            if not metadata.get(field):
+                lenient.append(f"Missing optional field: {field}")
+        for field, values in self.enums:
+            value = metadata.get(field)
+            if value and value not in values:
+                errors.append(f"Invalid {field}: '{value}'")
+
+        expected = {"metadata_id": metadata.get("id", ""), "playback_session_id": session.session_id}
+        for field, label, short, missing, source in self.isdk_checks:
+            isdk_value = session.isdk_values.get(field, "")
+            expected_value = expected[source]
+            if source == "playback_session_id" and expected_value == "unknown":
+                expected_value = ""
+            if isdk_value and expected_value:
+                if isdk_value != expected_value:
+                    errors.append(f"{label}: MISMATCH ({short} '{isdk_value}', expected '{expected_value}')")
+            elif not isdk_value:
+                lenient.append(f"{label}: No ISDK {short}")
+            else:
+                lenient.append(f"{label}: No {missing}")
+
+        if not session.ended:
+            lenient.append("Playback ended without playbackSessionEndEvent")
+        if session.gaps:
+            lenient.append(f"{session.gaps} capture gap(s) during session, lines may be missing")
+        if session.skipped:
+            lenient.append(f"{session.skipped} line(s) skipped, session only partly validated")
+        return errors, warnings, checks
+
+    def check_line(self, line: str) -> bool:
+        """
+        Apply the rules that can be judged from one line: enum values in a payload.
+
+        Args:
+            line: Log line or message
+
+        Returns:
+            True unless a playbackType or contentType value is outside its enum
+        """
+        if 'Type":' not in line:
+            return True
+        for pattern, values in self._enum_patterns:
+            match = pattern.search(line)
+            if match and match.group(1) not in values:
+                return False
+        return True
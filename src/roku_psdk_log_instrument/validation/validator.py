@@ -2,20 +2,36 @@
 Log validation functionality.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from pathlib import Path
 from pydantic import BaseModel
 from roku_psdk_log_instrument.models.log_entry import LogEntry
+from roku_psdk_log_instrument.monitor.classifier import LineClassifier
+from roku_psdk_log_instrument.monitor.config import MonitorConfig
+from roku_psdk_log_instrument.parsers.log_parser import LogParser
+from roku_psdk_log_instrument.parsers.records import RecordAssembler
+from roku_psdk_log_instrument.telnet.segments import open_session_log
+from roku_psdk_log_instrument.validation.rules import PlaybackSession, SessionRules, SessionTracker
 
 
 class ValidationResult(BaseModel):
-    """Model representing validation results."""
+    """
+    Model representing validation results.
+    
+    For a playback session, the entries are the rule checks and the
+    session fields say which session the result is for.
+    """
     
     is_valid: bool
     errors: List[str] = []
     warnings: List[str] = []
     total_entries: int = 0
     valid_entries: int = 0
+    session_id: Optional[str] = None
+    session_number: int = 0
+    first_line: int = 0
+    last_line: int = 0
+    event_count: int = 0
     
     @property
     def success_rate(self) -> float:
@@ -28,31 +44,52 @@ class ValidationResult(BaseModel):
 class LogValidator:
     """
     Validates log files against expected patterns and schemas.
+    
+    The rules are the content metadata and ISDK validation sections of
+    monitor_config.json, compiled once by SessionRules. validate_sessions()
+    applies them to every playback session of a device log in one
+    streaming pass.
     """
     
-    def __init__(self, schema: Optional[Dict[str, Any]] = None, strict: bool = False):
+    def __init__(
+        self,
+        schema: Optional[Dict[str, Any]] = None,
+        strict: bool = False,
+        config: Optional[MonitorConfig] = None
+    ):
         """
         Initialize the log validator.
         
         Args:
-            schema: Optional validation schema
-            strict: Enable strict validation mode
+            schema: Optional validation schema in the monitor_config.json format
+            strict: Enable strict validation mode (warnings become errors)
+            config: Monitor configuration to take the rules from
+                (default: schema if given, else the monitor_config.json found)
         """
         self.schema = schema or {}
         self.strict = strict
+        if config is None:
+            config = MonitorConfig(self.schema) if self.schema else MonitorConfig.load()
+        self.config = config
+        self.rules = SessionRules(config, strict)
+        self.classifier = LineClassifier(config)
     
-    def validate_file(self, log_path: Path) -> ValidationResult:
+    def validate_file(self, log_path: Path, parser: Optional[LogParser] = None) -> ValidationResult:
         """
         Validate a log file.
         
+        The file is parsed and validated one entry at a time, so memory use
+        does not grow with the size of the log.
+        
         Args:
-            log_path: Path to the log file
+            log_path: Path to the log file or capture session directory
+            parser: Optional parser (defaults to LogParser())
             
         Returns:
             ValidationResult object
         """
-        # TODO: Implement file validation logic
-        return ValidationResult(is_valid=True, total_entries=0, valid_entries=0)
+        parser = parser or LogParser()
+        return self.validate_stream(parser.iter_file(log_path))
     
     def validate_entry(self, entry: LogEntry) -> bool:
         """
@@ -64,10 +101,9 @@ class LogValidator:
         Returns:
             True if valid, False otherwise
         """
-        # TODO: Implement entry validation logic
-        return True
+        return self.rules.check_line(entry.message)
     
-    def validate_entries(self, entries: List[LogEntry]) -> ValidationResult:
+    def validate_entries(self, entries: Iterable[LogEntry]) -> ValidationResult:
         """
         Validate a list of log entries.
         
@@ -77,14 +113,97 @@ class LogValidator:
         Returns:
             ValidationResult object
         """
-        result = ValidationResult(total_entries=len(entries), is_valid=True)
+        return self.validate_stream(entries, max_errors=None)
+    
+    def validate_stream(
+        self,
+        entries: Iterable[LogEntry],
+        max_errors: Optional[int] = 1000
+    ) -> ValidationResult:
+        """
+        Validate log entries as they are produced, e.g. by LogParser.iter_file().
+        
+        Args:
+            entries: Iterable of log entries, consumed once
+            max_errors: Maximum number of error messages kept (None for all);
+                invalid entries beyond it are still counted
+            
+        Returns:
+            ValidationResult object
+        """
+        result = ValidationResult(is_valid=True)
+        total = 0
+        valid = 0
         
         for entry in entries:
+            total += 1
             if self.validate_entry(entry):
-                result.valid_entries += 1
+                valid += 1
             else:
                 result.is_valid = False
-                result.errors.append(f"Invalid entry: {entry}")
+                if max_errors is None or len(result.errors) < max_errors:
+                    result.errors.append(f"Invalid entry: {entry}")
         
+        result.total_entries = total
+        result.valid_entries = valid
         return result
-
+    
+    def validate_sessions(self, log_path: Path) -> Iterator[ValidationResult]:
+        """
+        Validate every playback session of a device log.
+        
+        The log is read once, line by line, so multi-GB captures are
+        validated in constant memory.
+        
+        Args:
+            log_path: Path to the log file or capture session directory
+            
+        Yields:
+            One ValidationResult per playback session, in log order
+        """
+        with open_session_log(log_path) as f:
+            yield from self.validate_session_lines(f)
+    
+    def validate_session_lines(self, lines: Iterable[str]) -> Iterator[ValidationResult]:
+        """
+        Validate the playback sessions in raw device log lines.
+        
+        Args:
+            lines: Raw log lines, consumed once
+            
+        Yields:
+            One ValidationResult per playback session, in log order
+        """
+        tracker = SessionTracker(self.rules.isdk_fields)
+        feed = tracker.feed
+        for record in RecordAssembler(classifier=self.classifier).assemble(lines):
+            session = feed(record)
+            if session is not None:
+                yield self.session_result(session)
+        session = tracker.finish()
+        if session is not None:
+            yield self.session_result(session)
+    
+    def session_result(self, session: PlaybackSession) -> ValidationResult:
+        """
+        Apply the rules to one playback session.
+        
+        Args:
+            session: Completed or cut-short playback session
+            
+        Returns:
+            ValidationResult of the session
+        """
+        errors, warnings, checks = self.rules.check(session)
+        return ValidationResult(
+            is_valid=not errors,
+            errors=errors,
+            warnings=warnings,
+            total_entries=checks,
+            valid_entries=checks - len(errors),
+            session_id=session.session_id,
+            session_number=session.number,
+            first_line=session.first_line,
+            last_line=session.last_line,
+            event_count=session.event_count
+        )
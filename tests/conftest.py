@@ -0,0 +1,83 @@
+"""
+Shared fixtures for tests.
+"""
+
+import socket
+import struct
+import threading
+import pytest
+
+
+class LoopbackServer:
+    """TCP server on 127.0.0.1 standing in for a Roku device, one client at a time."""
+
+    def __init__(self):
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(1)
+        self.host, self.port = self._listener.getsockname()
+        self.conn = None
+        self.connections = 0
+        self._accepted = threading.Event()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        try:
+            self.conn, _ = self._listener.accept()
+        except OSError:
+            return
+        self.connections += 1
+        self._accepted.set()
+
+    def wait_for_connection(self, timeout: float = 5) -> bool:
+        """Wait until a client is connected."""
+        return self._accepted.wait(timeout=timeout)
+
+    def drop(self) -> None:
+        """Close the client connection but keep listening for a reconnect."""
+        assert self._accepted.wait(timeout=5), "client never connected"
+        self._accepted.clear()
+        self.conn.close()
+        self.conn = None
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def send(self, data: bytes) -> None:
+        """Send raw bytes to the connected client."""
+        assert self._accepted.wait(timeout=5), "client never connected"
+        self.conn.sendall(data)
+
+    def recv(self, size: int = 4096) -> bytes:
+        """Receive bytes sent by the client."""
+        assert self._accepted.wait(timeout=5), "client never connected"
+        self.conn.settimeout(5)
+        return self.conn.recv(size)
+
+    def reset(self) -> None:
+        """Abort the client connection with a TCP RST (ECONNRESET)."""
+        assert self._accepted.wait(timeout=5), "client never connected"
+        self.conn.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.conn.close()
+        self.conn = None
+
+    def close(self) -> None:
+        """Close the client connection and the listener."""
+        if self.conn:
+            self.conn.close()
+        self._listener.close()
+
+
+@pytest.fixture
+def loopback_server():
+    """Factory fixture creating loopback servers closed at teardown."""
+    servers = []
+
+    def factory() -> LoopbackServer:
+        server = LoopbackServer()
+        servers.append(server)
+        return server
+
+    yield factory
+
+    for server in servers:
+        server.close()
@@ -0,0 +1,98 @@
+"""
+Tests for the asyncio telnet client.
+"""
+
+import asyncio
+import pytest
+from roku_psdk_log_instrument.telnet import AsyncRokuTelnetClient
+
+
+def run(coro):
+    """Run a coroutine on a fresh event loop."""
+    return asyncio.run(coro)
+
+
+class TestAsyncRokuTelnetClient:
+    """Test cases for AsyncRokuTelnetClient class."""
+
+    def test_client_initialization(self):
+        """Test client can be initialized without a loop."""
+        client = AsyncRokuTelnetClient(host="192.168.1.100")
+        assert client.port == 8085
+        assert client.is_connected() is False
+
+    def test_lines_iterator(self, loopback_server):
+        """Test async for yields framed lines until EOF."""
+        server = loopback_server()
+
+        async def scenario():
+            async with AsyncRokuTelnetClient(server.host, server.port) as client:
+                server.send(b"  first\r\nsec")
+                server.send(b"ond\n")
+                server.close()
+                lines = [line async for line in client.lines()]
+                return lines, client.is_connected()
+
+        lines, connected = run(scenario())
+        assert lines == ["  first", "second"]
+        assert connected is False
+
+    def test_send_command(self, loopback_server):
+        """Test commands are written with a trailing newline."""
+        server = loopback_server()
+
+        async def scenario():
+            async with AsyncRokuTelnetClient(server.host, server.port) as client:
+                return await client.send_command("bt")
+
+        assert run(scenario()) is True
+        assert server.recv() == b"bt\n"
+
+    def test_connect_failure(self):
+        """Test connecting to a closed port returns False."""
+        assert run(AsyncRokuTelnetClient("127.0.0.1", 1).connect()) is False
+
+    def test_capture_logs_many_devices(self, tmp_path, loopback_server):
+        """Test many device streams share one event loop."""
+        servers = [loopback_server() for _ in range(20)]
+        seen = []
+
+        async def on_line(line):
+            seen.append(line)
+
+        async def capture(index, server):
+            client = AsyncRokuTelnetClient(server.host, server.port)
+            assert await client.connect()
+            server.send(b"".join(b"device %d line %d\n" % (index, i) for i in range(100)))
+            server.close()
+            count = await client.capture_logs(tmp_path / f"device_{index}.log", callback=on_line)
+            await client.disconnect()
+            return count
+
+        async def scenario():
+            return await asyncio.gather(*(capture(i, s) for i, s in enumerate(servers)))
+
+        assert run(scenario()) == [100] * 20
+        assert len(seen) == 2000
+        assert (tmp_path / "device_7.log").read_text().splitlines()[-1] == "device 7 line 99"
+
+    def test_cancellation_flushes_log(self, tmp_path, loopback_server):
+        """Test cancelling a capture still writes buffered lines and closes cleanly."""
+        server = loopback_server()
+        log_file = tmp_path / "capture.log"
+
+        async def scenario():
+            client = AsyncRokuTelnetClient(server.host, server.port)
+            assert await client.connect()
+            task = asyncio.ensure_future(client.capture_logs(log_file))
+            server.send(b"before cancel\n")
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await client.disconnect()
+            return client.writer_stats
+
+        stats = run(scenario())
+        assert log_file.read_text() == "before cancel\n"
+        assert stats["lines_written"] == 1
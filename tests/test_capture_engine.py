@@ -0,0 +1,112 @@
+"""
+Tests for the multi-device capture engine.
+"""
+
+import threading
+import time
+import pytest
+from roku_psdk_log_instrument.telnet import MultiDeviceCaptureEngine, RokuTelnetClient, SessionManager
+
+
+class TestMultiDeviceCaptureEngine:
+    """Test cases for MultiDeviceCaptureEngine class."""
+
+    def test_captures_each_device_into_own_session(self, tmp_path, loopback_server):
+        """Test lines from two devices land in separate sessions."""
+        servers = [loopback_server(), loopback_server()]
+        seen = []
+        engine = MultiDeviceCaptureEngine(
+            SessionManager(base_path=tmp_path),
+            callback=lambda device, line: seen.append((device, line))
+        )
+
+        sessions = [engine.add_device(s.host, s.port) for s in servers]
+        assert sessions[0]["session_id"] != sessions[1]["session_id"]
+
+        # Partial line split across sends must be reassembled
+        servers[0].send(b"PSDK:: key playerSessionCreateEvent\r\nfirst ")
+        servers[1].send(b"device two line\n")
+        servers[0].send(b"half\n")
+        for server in servers:
+            server.close()
+
+        counts = engine.run(max_duration=5)
+        engine.close()
+
+        first, second = (f"127.0.0.1:{s.port}" for s in servers)
+        assert counts == {first: 2, second: 1}
+        assert (second, "device two line") in seen
+
+        log_file = engine.session_manager.get_session_log_path(sessions[0])
+        assert log_file.read_text() == "PSDK:: key playerSessionCreateEvent\nfirst half\n"
+        assert sessions[0]["status"] == "completed"
+        assert sessions[0]["line_count"] == 2
+
+    def test_stop_wakes_idle_loop(self, tmp_path, loopback_server):
+        """Test stop() returns promptly while devices are idle."""
+        server = loopback_server()
+        engine = MultiDeviceCaptureEngine(SessionManager(base_path=tmp_path))
+        engine.add_device(server.host, server.port)
+
+        engine.start()
+        time.sleep(0.1)
+        start = time.monotonic()
+        engine.stop()
+
+        assert time.monotonic() - start < 1
+        assert engine.devices == []
+        engine.close()
+
+    def test_duplicate_device_rejected(self, tmp_path, loopback_server):
+        """Test adding a device twice raises instead of replacing the first capture."""
+        server = loopback_server()
+        engine = MultiDeviceCaptureEngine(SessionManager(base_path=tmp_path))
+        session = engine.add_device(server.host, server.port)
+
+        with pytest.raises(ValueError):
+            engine.add_device(server.host, server.port)
+
+        assert [device.session for device in engine.devices] == [session]
+        assert len(engine.session_manager.list_sessions()) == 1
+        engine.close()
+
+    def test_concurrent_duplicate_rejected(self, tmp_path, loopback_server, monkeypatch):
+        """Test a device is reserved while it connects, so a concurrent add of it fails."""
+        server = loopback_server()
+        engine = MultiDeviceCaptureEngine(SessionManager(base_path=tmp_path))
+        connecting = threading.Event()
+        release = threading.Event()
+        connect = RokuTelnetClient.connect
+
+        def slow_connect(client):
+            connecting.set()
+            release.wait(timeout=5)
+            return connect(client)
+
+        monkeypatch.setattr(RokuTelnetClient, "connect", slow_connect)
+        first = threading.Thread(target=engine.add_device, args=(server.host, server.port))
+        first.start()
+        assert connecting.wait(timeout=5)
+
+        with pytest.raises(ValueError):
+            engine.add_device(server.host, server.port)
+        release.set()
+        first.join()
+
+        assert len(engine.devices) == 1
+        assert len(engine.session_manager.list_sessions()) == 1
+        engine.close()
+
+    def test_failed_connection_releases_device(self, tmp_path):
+        """Test a device whose connection failed can be added again."""
+        engine = MultiDeviceCaptureEngine(SessionManager(base_path=tmp_path))
+        assert engine.add_device("127.0.0.1", 1) is None
+        assert engine.add_device("127.0.0.1", 1) is None
+        engine.close()
+
+    def test_failed_connection_returns_none(self, tmp_path):
+        """Test unreachable devices are skipped."""
+        engine = MultiDeviceCaptureEngine(SessionManager(base_path=tmp_path))
+        assert engine.add_device("127.0.0.1", 1) is None
+        assert engine.devices == []
+        engine.close()
@@ -0,0 +1,94 @@
+"""
+Tests for the SQLite session catalog.
+"""
+
+import json
+import shutil
+from datetime import datetime, timedelta
+from roku_psdk_log_instrument.telnet import SessionManager
+from roku_psdk_log_instrument.telnet.catalog import SessionCatalog
+
+
+def make_session(manager, host, start, status="completed", description=None):
+    """Create a session and backdate its start time."""
+    session = manager.create_session(host, description=description)
+    session["start_time"] = start.isoformat()
+    if status == "completed":
+        manager.end_session(session, line_count=10)
+    else:
+        manager.record_gap(session, {"reason": "test"})  # saves the backdated info
+    return session
+
+
+class TestSessionCatalog:
+    """Test cases for SessionCatalog and its use by SessionManager."""
+
+    def test_filters_and_pagination(self, tmp_path):
+        """Test host, status, date range and description filters with pages."""
+        manager = SessionManager(base_path=tmp_path)
+        base = datetime(2024, 11, 1, 12, 0, 0)
+        for day in range(10):
+            make_session(
+                manager,
+                "10.0.0.1" if day % 2 else "10.0.0.2",
+                base + timedelta(days=day),
+                status="active" if day == 9 else "completed",
+                description=f"Soak run {day}",
+            )
+
+        assert manager.count_sessions() == 10
+        assert [s["start_time"][:10] for s in manager.list_sessions(limit=3)] == [
+            "2024-11-10", "2024-11-09", "2024-11-08"
+        ]
+        assert [s["start_time"][:10] for s in manager.list_sessions(limit=3, offset=9)] == ["2024-11-01"]
+
+        assert {s["host"] for s in manager.list_sessions(host="10.0.0.1")} == {"10.0.0.1"}
+        assert manager.count_sessions(host="10.0.0.1") == 5
+        assert [s["description"] for s in manager.get_active_sessions()] == ["Soak run 9"]
+        window = manager.list_sessions(since=base + timedelta(days=2), until=base + timedelta(days=4))
+        assert [s["description"] for s in window] == ["Soak run 3", "Soak run 2"]
+        assert [s["description"] for s in manager.list_sessions(description="RUN 7")] == ["Soak run 7"]
+        assert manager.list_sessions(description="100%") == []
+
+    def test_rebuild_from_directories(self, tmp_path):
+        """Test a lost catalog is rebuilt from session_info.json files."""
+        manager = SessionManager(base_path=tmp_path)
+        session = manager.create_session("10.0.0.1")
+        manager.end_session(session, line_count=42)
+        (tmp_path / ".temp" / SessionCatalog.FILE_NAME).unlink()
+
+        sessions = SessionManager(base_path=tmp_path).list_sessions()
+        assert len(sessions) == 1
+        assert sessions[0]["line_count"] == 42
+        assert sessions[0]["directory"] == session["directory"]
+
+    def test_catalog_tracks_delete_and_cleanup(self, tmp_path):
+        """Test deleted, cleaned up and hand-removed sessions leave the catalog."""
+        manager = SessionManager(base_path=tmp_path)
+        old = make_session(manager, "10.0.0.1", datetime.now() - timedelta(days=30))
+        old_active = make_session(manager, "10.0.0.1", datetime.now() - timedelta(days=30), status="active")
+        recent = make_session(manager, "10.0.0.2", datetime.now())
+        removed = make_session(manager, "10.0.0.3", datetime.now())
+        manager.create_session("10.0.0.4")
+
+        assert manager.cleanup_old_sessions(days=7) == 1
+        assert not old["directory"].exists()
+        assert old_active["directory"].exists()
+
+        assert manager.delete_session(recent)
+        shutil.rmtree(removed["directory"])
+
+        remaining = {s["session_id"] for s in manager.list_sessions()}
+        assert remaining == {old_active["session_id"], manager.get_current_session()["session_id"]}
+        assert manager.count_sessions() == 2
+
+    def test_catalog_matches_session_info(self, tmp_path):
+        """Test the catalog stores the same data as session_info.json."""
+        manager = SessionManager(base_path=tmp_path)
+        session = manager.create_session("10.0.0.1", description="playback")
+        manager.record_segment(session, {"index": 1, "file": "roku.00001.log", "lines": 3})
+
+        info = json.loads((session["directory"] / "session_info.json").read_text())
+        listed = manager.list_sessions()[0]
+        listed.pop("directory")
+        assert listed == info
@@ -0,0 +1,174 @@
+"""
+Tests for capture checkpoints and recovery of interrupted sessions.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from roku_psdk_log_instrument.telnet import (
+    RokuTelnetClient,
+    SessionCheckpoint,
+    SessionLogWriter,
+    SessionManager,
+)
+from roku_psdk_log_instrument.telnet.checkpoint import CATEGORY_MARKERS, count_marked_lines, is_error_line
+
+
+LINES = [
+    "PSDK:: playbackInitiatedEvent",
+    "[PSDK::ISDK] Event: beam.events.playback.initiated",
+    "[mux-analytics] EVENT viewstart mux: again",
+    "ERROR: decoder failed, error 3",
+    "plain line",
+]
+
+
+def dead_pid() -> int:
+    """PID of a process that has already exited."""
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def read_info(session) -> dict:
+    """Read a session's session_info.json."""
+    return json.loads((session["directory"] / "session_info.json").read_text())
+
+
+class TestSessionCheckpoint:
+    """Test cases for SessionCheckpoint."""
+
+    def test_count_marked_lines(self):
+        """Test lines with several markers are counted once."""
+        data = b"a mux: b MUX: c\nno\n[mux-analytics] x\nMUX: tail"
+        assert count_marked_lines(data, (b"[mux-analytics]", b"mux:", b"MUX:")) == 3
+        assert count_marked_lines(b"PSDK:: a PSDK:: b\nPSDK:: c\n", (b"PSDK::",)) == 2
+        assert count_marked_lines(b"nothing here\n", (b"RROR", b"rror")) == 0
+
+    def test_error_lines_match_classifier(self):
+        """Test FATAL lines count as errors and JSON payloads with an error field do not."""
+        data = "\n".join([
+            "FATAL: player crashed",
+            "ERROR: decoder failed",
+            'PSDK:: key playbackErrorEvent value: {"error":"timeout"}',
+            '{"events":[{"error":"network"}]}',
+            "[ERROR] bad segment ❌",
+            "terror is not a level",
+        ]).encode("utf-8")
+        assert count_marked_lines(data, CATEGORY_MARKERS["error"], is_error_line) == 3
+
+    def test_writer_feeds_checkpoint(self, tmp_path):
+        """Test the writer saves periodic and final checkpoints of what it wrote."""
+        saved = []
+        checkpoint = SessionCheckpoint(saved.append, interval=0)
+        writer = SessionLogWriter(tmp_path / "capture.log", checkpoint=checkpoint)
+
+        writer.write_lines(LINES)
+        writer.flush()
+        checkpoint.wait()
+        assert saved[-1]["line_count"] == 5
+
+        writer.write_lines(LINES[:1])
+        writer.close()
+
+        final = saved[-1]
+        assert final["line_count"] == 6
+        assert final["byte_offset"] == (tmp_path / "capture.log").stat().st_size
+        assert final["counts"] == {"psdk": 3, "isdk": 1, "mux": 1, "error": 1}
+        assert final["last_line_time"] is not None
+
+    def test_interval_limits_saves(self, tmp_path):
+        """Test only the final save happens within the interval."""
+        saved = []
+        checkpoint = SessionCheckpoint(saved.append, interval=3600)
+        with SessionLogWriter(tmp_path / "capture.log", checkpoint=checkpoint) as writer:
+            for line in LINES:
+                writer.write_line(line)
+                writer.flush()
+        assert len(saved) == 1
+        assert saved[0]["line_count"] == 5
+
+    def test_slow_save_does_not_block_writer(self, tmp_path):
+        """Test periodic saves run off the writing thread and the final save comes last."""
+        release = threading.Event()
+        saved = []
+
+        def slow_save(snapshot):
+            release.wait(timeout=5)
+            saved.append(snapshot)
+
+        checkpoint = SessionCheckpoint(slow_save, interval=0)
+        writer = SessionLogWriter(tmp_path / "capture.log", checkpoint=checkpoint)
+        start = time.monotonic()
+        for line in LINES:
+            writer.write_line(line)
+            writer.flush()
+        assert time.monotonic() - start < 1
+
+        release.set()
+        writer.close()
+        assert saved[-1]["line_count"] == 5
+        assert len(saved) <= 3
+
+    def test_capture_writes_checkpoints(self, tmp_path, loopback_server):
+        """Test capture_logs keeps session_info.json up to date."""
+        manager = SessionManager(base_path=tmp_path)
+        session = manager.create_session("10.0.0.1")
+        server = loopback_server()
+        client = RokuTelnetClient(server.host, server.port)
+        assert client.connect()
+
+        server.send("".join(line + "\r\n" for line in LINES).encode())
+        server.close()
+        client.capture_logs(
+            manager.get_session_log_path(session),
+            max_duration=5,
+            raw=True,
+            checkpoint=manager.create_checkpoint(session)
+        )
+
+        info = read_info(session)
+        assert info["status"] == "active"
+        assert info["line_count"] == 5
+        assert info["checkpoint"]["counts"]["isdk"] == 1
+        assert not list(session["directory"].glob("*.tmp"))
+
+
+class TestSessionRecovery:
+    """Test cases for SessionManager.recover_orphaned_sessions()."""
+
+    def test_recovers_session_of_dead_process(self, tmp_path):
+        """Test a killed capture is closed from its last checkpoint."""
+        manager = SessionManager(base_path=tmp_path)
+        orphan = manager.create_session("10.0.0.1")
+        running = manager.create_session("10.0.0.2")
+        orphan["pid"] = dead_pid()
+        saved = []
+        checkpoint = SessionCheckpoint(saved.append)
+        checkpoint.observe("\n".join(LINES).encode() + b"\n", len(LINES))
+        manager.checkpoint(orphan, checkpoint.snapshot())
+
+        recovered = SessionManager(base_path=tmp_path).recover_orphaned_sessions()
+
+        assert [s["session_id"] for s in recovered] == [orphan["session_id"]]
+        info = read_info(orphan)
+        assert info["status"] == "interrupted"
+        assert info["line_count"] == 5
+        assert info["end_time"] == checkpoint.last_line_time
+        assert read_info(running)["status"] == "active"
+        assert manager.list_sessions(status="interrupted")[0]["session_id"] == orphan["session_id"]
+
+    def test_stale_sessions_need_opt_in(self, tmp_path):
+        """Test sessions without a usable pid are only recovered when stale."""
+        manager = SessionManager(base_path=tmp_path)
+        session = manager.create_session("10.0.0.1")
+        del session["pid"]
+        session["start_time"] = (datetime.now() - timedelta(hours=2)).isoformat()
+        manager.record_gap(session, {"reason": "test"})  # saves the edited info
+
+        assert manager.recover_orphaned_sessions() == []
+        assert manager.recover_orphaned_sessions(stale_after=3600)[0]["line_count"] == 0
+        assert read_info(session)["end_time"] == session["start_time"]
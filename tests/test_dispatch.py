@@ -0,0 +1,162 @@
+"""
+Tests for the bounded display dispatcher.
+"""
+
+import threading
+import time
+import pytest
+from roku_psdk_log_instrument.telnet import LineDispatcher, OverflowPolicy, RokuTelnetClient
+
+
+def gated_dispatcher(policy: str, capacity: int = 3):
+    """Dispatcher whose consumer blocks until the returned gate is set."""
+    gate = threading.Event()
+    seen = []
+
+    def consumer(line):
+        gate.wait(timeout=5)
+        seen.append(line)
+
+    dispatcher = LineDispatcher(consumer, capacity, policy)
+    return dispatcher, gate, seen
+
+
+def fill_while_blocked(dispatcher, lines):
+    """Queue the first line, let the consumer pick it up and block, then queue the rest."""
+    dispatcher.start()
+    dispatcher.put(lines[0])
+    time.sleep(0.05)
+    for line in lines[1:]:
+        dispatcher.put(line)
+
+
+class TestLineDispatcher:
+    """Test cases for LineDispatcher class."""
+
+    def test_delivers_in_order(self):
+        """Test lines reach the consumer in order on its own thread."""
+        seen = []
+        dispatcher = LineDispatcher(seen.append)
+        dispatcher.start()
+        dispatcher.put_many(f"line {i}" for i in range(1000))
+        dispatcher.stop()
+
+        assert seen == [f"line {i}" for i in range(1000)]
+        assert dispatcher.stats()["delivered"] == 1000
+
+    def test_drop_oldest(self):
+        """Test the oldest queued lines are dropped under pressure."""
+        dispatcher, gate, seen = gated_dispatcher(OverflowPolicy.DROP_OLDEST)
+        fill_while_blocked(dispatcher, ["a", "b", "c", "d", "e", "f"])
+        gate.set()
+        dispatcher.stop()
+
+        assert seen == ["a", "d", "e", "f"]
+        assert dispatcher.dropped == 2
+
+    def test_drop_newest(self):
+        """Test incoming lines are dropped under pressure."""
+        dispatcher, gate, seen = gated_dispatcher(OverflowPolicy.DROP_NEWEST)
+        fill_while_blocked(dispatcher, ["a", "b", "c", "d", "e", "f"])
+        gate.set()
+        dispatcher.stop()
+
+        assert seen == ["a", "b", "c", "d"]
+        assert dispatcher.dropped == 2
+
+    def test_coalesce(self):
+        """Test overflow is folded into a single skipped-lines marker."""
+        dispatcher, gate, seen = gated_dispatcher(OverflowPolicy.COALESCE)
+        fill_while_blocked(dispatcher, ["a", "b", "c", "d", "e", "f", "g"])
+        gate.set()
+        time.sleep(0.05)
+        dispatcher.put("h")
+        dispatcher.stop()
+
+        assert seen[:4] == ["a", "b", "c", "d"]
+        assert seen[4] == LineDispatcher.SKIPPED_FORMAT.format(count=3)
+        assert seen[5:] == ["h"]
+        assert dispatcher.coalesced == 3
+        assert dispatcher.dropped == 0
+
+    def test_coalesce_reports_skips(self):
+        """Test on_skip receives the coalesced count instead of a marker line."""
+        dispatcher, gate, seen = gated_dispatcher(OverflowPolicy.COALESCE)
+        skips = []
+        dispatcher.on_skip = skips.append
+        fill_while_blocked(dispatcher, ["a", "b", "c", "d", "e", "f", "g"])
+        gate.set()
+        dispatcher.stop()
+
+        assert seen == ["a", "b", "c", "d"]
+        assert skips == [3]
+
+    def test_block_never_drops(self):
+        """Test the block policy applies backpressure instead of dropping."""
+        seen = []
+        dispatcher = LineDispatcher(lambda line: (time.sleep(0.001), seen.append(line)), 2, OverflowPolicy.BLOCK)
+        dispatcher.start()
+        dispatcher.put_many(str(i) for i in range(50))
+        dispatcher.stop()
+
+        assert seen == [str(i) for i in range(50)]
+        assert dispatcher.dropped == 0
+
+    def test_put_after_stop_drops(self):
+        """Test lines put after stop() are dropped instead of queued forever."""
+        for policy in OverflowPolicy.ALL:
+            seen = []
+            dispatcher = LineDispatcher(seen.append, 2, policy)
+            dispatcher.start()
+            dispatcher.put("a")
+            dispatcher.stop()
+
+            assert dispatcher.put_many(["b", "c", "d"]) is None
+            assert seen == ["a"]
+            assert dispatcher.stats()["enqueued"] == 1
+            assert dispatcher.dropped == 3
+
+    def test_block_put_released_by_stop(self):
+        """Test a put blocked on a full queue gives up when the dispatcher stops."""
+        dispatcher, gate, seen = gated_dispatcher(OverflowPolicy.BLOCK, capacity=1)
+        fill_while_blocked(dispatcher, ["a", "b"])
+        result = []
+        blocked = threading.Thread(target=lambda: result.append(dispatcher.put("c")))
+        blocked.start()
+        time.sleep(0.05)
+        dispatcher.stop(timeout=0)
+        blocked.join(timeout=1)
+        gate.set()
+        dispatcher.stop()
+
+        assert result == [False]
+        assert seen == ["a", "b"]
+        assert dispatcher.dropped == 1
+
+    def test_invalid_policy(self):
+        """Test unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            LineDispatcher(print, policy="drop_everything")
+
+
+def test_slow_display_does_not_slow_capture(tmp_path, loopback_server):
+    """Test a slow consumer drops display lines but the log file is complete."""
+    server = loopback_server()
+    client = RokuTelnetClient(server.host, server.port)
+    assert client.connect()
+
+    dispatcher = LineDispatcher(lambda line: time.sleep(0.01), 100, OverflowPolicy.DROP_OLDEST)
+    dispatcher.start()
+
+    server.send(b"".join(b"PSDK:: line %d\n" % i for i in range(5000)))
+    server.close()
+    start = time.monotonic()
+    client.capture_logs(tmp_path / "capture.log", callback=dispatcher.put, max_duration=5)
+    elapsed = time.monotonic() - start
+    dispatcher.stop(timeout=0)
+
+    # 5000 lines at 10ms each would take 50s if the display ran inline
+    assert elapsed < 5
+    assert len((tmp_path / "capture.log").read_text().splitlines()) == 5000
+    assert dispatcher.dropped > 0
+    client.disconnect()
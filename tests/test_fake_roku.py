@@ -0,0 +1,98 @@
+"""
+Tests for the fake Roku telnet server.
+"""
+
+import itertools
+import time
+from pathlib import Path
+from roku_psdk_log_instrument.telnet import RokuTelnetClient
+from roku_psdk_log_instrument.telnet.reconnect import ReconnectPolicy, parse_gap_marker
+from roku_psdk_log_instrument.testing import FakeRokuServer, generate_lines, parse_stamp, stamp_line
+from roku_psdk_log_instrument.testing.fake_roku import fixture_lines
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "psdk_session.log"
+
+
+def read_all(client: RokuTelnetClient):
+    """Read lines until the server closes the connection."""
+    lines = []
+    while True:
+        batch = client.read_lines(timeout=5)
+        if batch is None:
+            return lines
+        lines.extend(batch)
+
+
+class TestFakeRokuServer:
+    """Test cases for FakeRokuServer class."""
+
+    def test_stamp_round_trip(self):
+        """Test send stamps can be parsed back."""
+        line = stamp_line("PSDK:: key playerSessionCreateEvent", 123456789)
+        assert line == "[t=123456789] PSDK:: key playerSessionCreateEvent"
+        assert parse_stamp(line) == 123456789
+        assert parse_stamp("PSDK:: key playerSessionCreateEvent") is None
+
+    def test_replays_fixture(self):
+        """Test a fixture log is replayed line for line."""
+        expected = [line.rstrip() for line in fixture_lines(FIXTURE)]
+        with FakeRokuServer(expected, port=0, burst=7) as server:
+            client = RokuTelnetClient(server.host, server.port)
+            assert client.connect()
+            received = read_all(client)
+            client.disconnect()
+
+        assert received == [line for line in expected if line]
+        assert server.lines_sent == len(expected)
+        assert server.finished.is_set()
+
+    def test_line_length_padding(self):
+        """Test short lines are padded into the requested length range."""
+        with FakeRokuServer(["x"] * 200, port=0, burst=50, line_length=(40, 60)) as server:
+            client = RokuTelnetClient(server.host, server.port)
+            assert client.connect()
+            received = read_all(client)
+            client.disconnect()
+
+        assert len(received) == 200
+        assert all(40 <= len(line) <= 60 for line in received)
+        assert len(set(map(len, received))) > 1
+
+    def test_rate_limit(self):
+        """Test the average send rate is held."""
+        with FakeRokuServer(itertools.islice(generate_lines(100), 100), port=0, rate=500, burst=10) as server:
+            client = RokuTelnetClient(server.host, server.port)
+            assert client.connect()
+            start = time.monotonic()
+            received = read_all(client)
+            elapsed = time.monotonic() - start
+            client.disconnect()
+
+        assert len(received) == 100
+        # 100 lines at 500 lines/s: ten bursts 20 ms apart
+        assert 0.15 <= elapsed < 2.0
+
+    def test_disconnect_every_with_reconnect(self, tmp_path):
+        """Test periodic disconnects are bridged by the client's reconnect policy."""
+        lines = [f"PSDK:: line {i}" for i in range(30)]
+        log_file = tmp_path / "capture.log"
+
+        with FakeRokuServer(lines, port=0, burst=4, disconnect_every=10) as server:
+            client = RokuTelnetClient(server.host, server.port)
+            assert client.connect()
+            gaps = []
+            policy = ReconnectPolicy(initial_delay=0.05, jitter=0, max_attempts=20)
+            client.start_capture_async(log_file, reconnect=policy, on_gap=gaps.append)
+
+            deadline = time.monotonic() + 10
+            while len(gaps) < 2 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            time.sleep(0.3)
+            client.disconnect()
+
+        captured = log_file.read_text().splitlines()
+        assert [line for line in captured if parse_gap_marker(line) is None] == lines
+        assert server.connections >= 3
+        assert len(gaps) >= 2
+        assert all(gap["recovered"] for gap in gaps[:2])
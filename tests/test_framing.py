@@ -0,0 +1,76 @@
+"""
+Tests for telnet line framing.
+"""
+
+import pytest
+from roku_psdk_log_instrument.telnet import LineFramer, RokuTelnetClient
+
+
+class TestLineFramer:
+    """Test cases for LineFramer class."""
+
+    def test_read_lines_keeps_partial_line(self):
+        """Test complete lines are returned and the tail is kept."""
+        framer = LineFramer()
+        framer.feed(b"  indented\r\nsecond\npart")
+
+        assert framer.read_lines() == ["  indented", "second"]
+        assert framer.pending == 4
+
+        framer.feed(b"ial\n")
+        assert framer.next_line() == "partial"
+        assert framer.next_line() is None
+        assert framer.pending == 0
+
+    def test_huge_line_across_many_chunks(self):
+        """Test a line larger than the buffer grows it and is framed once."""
+        framer = LineFramer(initial_size=16)
+        payload = b'{"k":"' + b"x" * 100000 + b'"}'
+
+        for i in range(0, len(payload), 4096):
+            framer.feed(payload[i:i + 4096])
+            assert framer.read_lines() == []
+        framer.feed(b"\nnext\n")
+
+        assert framer.read_lines() == [payload.decode(), "next"]
+
+    def test_compacts_instead_of_growing(self):
+        """Test consumed space is reused before the buffer grows."""
+        framer = LineFramer(initial_size=32)
+        for _ in range(100):
+            framer.feed(b"0123456789\n")
+            assert framer.read_lines() == ["0123456789"]
+            framer.feed(b"abc")
+            framer.feed(b"\n")
+            assert framer.next_line() == "abc"
+
+        assert len(framer._buf) == 32
+
+    def test_invalid_utf8_is_ignored(self):
+        """Test undecodable bytes are dropped like the original reader."""
+        framer = LineFramer()
+        framer.feed(b"bad \xff byte\n")
+        assert framer.read_lines() == ["bad  byte"]
+
+
+class TestClientReadLines:
+    """Test cases for RokuTelnetClient.read_lines."""
+
+    def test_read_lines_from_socket(self, loopback_server):
+        """Test one receive returns every complete line."""
+        server = loopback_server()
+        client = RokuTelnetClient(server.host, server.port)
+        assert client.connect()
+
+        server.send(b"one\ntwo\nthr")
+        lines = []
+        while len(lines) < 2:
+            lines += client.read_lines(timeout=1.0)
+        assert lines == ["one", "two"]
+
+        server.send(b"ee\n")
+        assert client.read_line(timeout=1.0) == "three"
+
+        server.close()
+        assert client.read_lines(timeout=1.0) is None
+        client.disconnect()
@@ -0,0 +1,105 @@
+"""
+Tests for the cross-session log index.
+"""
+
+from itertools import islice
+from roku_psdk_log_instrument.telnet import RotationPolicy, SessionLogWriter, SessionManager
+from roku_psdk_log_instrument.telnet.log_index import SessionLogIndex, line_terms, read_hit
+from roku_psdk_log_instrument.testing import generate_lines
+
+
+ERROR_LINE = "BRIGHTSCRIPT: ERROR: Type Mismatch. Operator \"+\" (runtime error &h18) in pkg:/source/main.brs(42)"
+
+
+def capture_session(manager, host, lines, rotation=None):
+    """Write lines into a new finished session."""
+    session = manager.create_session(host)
+    writer = SessionLogWriter(
+        manager.get_session_log_path(session),
+        rotation=rotation,
+        on_segment=lambda segment: manager.record_segment(session, segment)
+    )
+    with writer:
+        for line in lines:
+            writer.write_line(line)
+    manager.end_session(session, line_count=len(lines))
+    return session
+
+
+class TestSessionLogIndex:
+    """Test cases for SessionLogIndex."""
+
+    def test_line_terms(self):
+        """Test event, playback session, content and error terms are extracted."""
+        line = ('PSDK:: key playbackInfoResolutionEndEvent value: '
+                '{"playbackSessionId":"s-1","videoid":"v-1"}')
+        assert set(line_terms(line)) == {
+            ("event", "playbackInfoResolutionEndEvent"), ("session", "s-1"), ("content", "v-1")
+        }
+        isdk = '[PSDK::ISDK] Event: beam.events.playback.initiated_3.3payload{"playback":{"playbackId":"s-1"}}'
+        assert set(line_terms(isdk)) == {("event", "beam.events.playback.initiated_3.3"), ("session", "s-1")}
+        assert ("event", "viewstart") in set(line_terms("[mux-analytics] EVENT viewstart{x:1}"))
+        assert {("error", "mismatch"), ("error", "&h18")} <= set(line_terms(ERROR_LINE))
+
+    def test_search_across_rotated_sessions(self, tmp_path):
+        """Test hits in compressed segments are found and read back by line."""
+        manager = SessionManager(base_path=tmp_path)
+        lines = list(islice(generate_lines(6000), 6000))
+        lines[4321] = ERROR_LINE
+        first = capture_session(manager, "10.0.0.1", lines, RotationPolicy(max_bytes=100_000))
+        second = capture_session(manager, "10.0.0.2", lines[:3000])
+        assert first["segments"]
+
+        index = SessionLogIndex(manager)
+        assert index.update() == 2
+        assert index.update() == 0
+
+        hits = index.search(error="type MISMATCH")
+        assert [hit["session_line"] for hit in hits] == [4322]
+        assert read_hit(hits[0]) == ERROR_LINE
+
+        session_id = '00000000-0000-0000-0000-000000000001'
+        hits = index.search(event="playbackInitiatedEvent", playback_session=session_id)
+        assert [hit["session_id"] for hit in hits] == [second["session_id"], first["session_id"]]
+        for hit in hits:
+            assert read_hit(hit) == lines[hit["session_line"] - 1]
+
+        progress = index.search(event="playbackProgressEvent", host="10.0.0.1")
+        assert len(progress) == sum("playbackProgressEvent" in line for line in lines)
+        assert all(read_hit(hit) == lines[hit["session_line"] - 1] for hit in progress[::500])
+
+        assert index.search(event="playbackInitiatedEvent", content="no-such-id") == []
+        assert index.terms("event", prefix="playbackSession")[0][0] == "playbackSessionEndEvent"
+
+    def test_content_id_within_load_block(self, tmp_path):
+        """Test the content ID is taken from anywhere in a load block, and only from inside it."""
+        manager = SessionManager(base_path=tmp_path)
+        extra = [f'        extraField{i}: "value {i}"' for i in range(40)]
+        lines = (
+            ["Player Controller: Load {", "    contentMetadata: {"] + extra
+            + ['        id: "long-block"', "    }", "}"]
+            + ["Player Controller: Load {", "    contentMetadata: {", "    }", "}"]
+            + ['PSDK:: key playbackInitiatedEvent value: {"id":"after-block"}']
+        )
+        capture_session(manager, "10.0.0.1", lines)
+
+        index = SessionLogIndex(manager)
+        index.update()
+
+        hits = index.search(content="long-block")
+        assert [hit["session_line"] for hit in hits] == [43]
+        assert index.search(content="after-block") == []
+
+    def test_deleted_and_active_sessions(self, tmp_path):
+        """Test active sessions are skipped and deleted sessions forgotten."""
+        manager = SessionManager(base_path=tmp_path)
+        done = capture_session(manager, "10.0.0.1", [ERROR_LINE])
+        manager.create_session("10.0.0.2")
+
+        index = SessionLogIndex(manager)
+        assert index.update() == 1
+        assert len(index.search(error="runtime error")) == 1
+
+        manager.delete_session(done)
+        index.update()
+        assert index.search(error="runtime error") == []
@@ -0,0 +1,179 @@
+"""
+Tests for the PSDK event monitor engine.
+"""
+
+import io
+import re
+import pytest
+from pathlib import Path
+from roku_psdk_log_instrument.monitor import (
+    EventFields, LineClassifier, MonitorConfig, PSDKEventMonitor, follow_file
+)
+from roku_psdk_log_instrument.monitor.classifier import category_names
+from roku_psdk_log_instrument.parsers import LogParser
+
+
+FIXTURE_LOG = Path(__file__).parent / "fixtures" / "psdk_session.log"
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+
+def run_fixture(**kwargs) -> str:
+    """Run the fixture log through a monitor and return plain-text output."""
+    out = io.StringIO()
+    monitor = PSDKEventMonitor(MonitorConfig.load(), stream=out, term_width=160, **kwargs)
+    monitor.process_lines(FIXTURE_LOG.read_text().splitlines())
+    return ANSI_RE.sub("", out.getvalue())
+
+
+class TestMonitorConfig:
+    """Test cases for MonitorConfig class."""
+
+    def test_defaults_without_config(self):
+        """Test defaults match the bash monitor fallbacks."""
+        config = MonitorConfig()
+        assert config.playback_end_pattern == "playbackSessionEndEvent"
+        assert config.required_fields == ["id", "title", "playbackType"]
+        assert config.event_fields_enabled is False
+
+    def test_fields_for_falls_back_to_default(self):
+        """Test per-event field lookup with default fallback."""
+        config = MonitorConfig.load()
+        assert "videoid" in config.fields_for("playbackInfoResolutionEndEvent")
+        assert config.fields_for("someUnknownEvent") == ["playbackSessionId"]
+
+
+class TestLineClassifier:
+    """Test cases for LineClassifier class."""
+
+    def test_all_categories_in_one_call(self):
+        """Test lifecycle, marker, custom and problem categories of lines."""
+        classifier = LineClassifier(MonitorConfig.load(), ["SessionEnd", "", "mismatch"])
+
+        def names(line):
+            return category_names(classifier.classify(line))
+
+        assert names('PSDK:: key playbackSessionEndEvent value: {}') == ["playback_end", "psdk", "custom"]
+        assert names('PSDK:: key playerSessionEndEvent value: {}') == ["player_destroy", "psdk", "custom"]
+        assert names('[PSDK::ISDK] Event: beam.events.playback.initiated_3.3payload{}') == ["psdk", "isdk"]
+        assert names("Player Controller: Load {") == ["content_load"]
+        assert names("[mux-analytics] EVENT playing{viewer_time:1}") == ["mux"]
+        assert names("BRIGHTSCRIPT: ERROR: Type Mismatch.") == ["error"]
+        assert names("WARNING: Type mismatch occurred in SetField") == ["custom", "warning"]
+        # Error-like field names in JSON payloads are not errors
+        assert names('{"errorCode":"E1","warning":"x"}') == []
+        assert names("Texture manager: released 3 bitmaps") == []
+        assert classifier.custom_matches("playerSessionEndEvent mismatch") == ["SessionEnd", "mismatch"]
+
+
+class TestEventFields:
+    """Test cases for EventFields class."""
+
+    def test_nested_paths_and_mux_formats(self):
+        """Test dotted paths at any depth and MUX key: value / key=value payloads."""
+        fields = EventFields(MonitorConfig({"event_fields": {
+            "enabled": True,
+            "psdk_events": {"default": ["playbackSessionId"], "deep": ["a.b.c.d", "a.list.1", "a.b", "flag"]},
+            "mux_events": {"playing": ["view_session_id", "playhead_time", "missing"]},
+        }}))
+
+        line = 'PSDK:: key deep value: {"a":{"b":{"c":{"d":"x"}},"list":[1,2.5]},"flag":false} trailing'
+        assert fields.select("psdk", "deep", line) == {
+            "a.b.c.d": "x", "a.list.1": "2.5", "a.b": '{"c":{"d":"x"}}', "flag": "false"
+        }
+        assert fields.select("psdk", "other", 'PSDK:: key other value: {"playbackSessionId":"s-1"}') == {
+            "playbackSessionId": "s-1"
+        }
+        assert fields.select("psdk", "other", "PSDK:: key other value: {broken") == {}
+        assert fields.value("psdk", line, "a.b.c") == '{"d":"x"}'
+
+        mux = "[mux-analytics] EVENT playing{view_session_id:9a1b, viewer_time:17, playhead_time=2000}"
+        assert fields.select("mux", "playing", mux) == {"view_session_id": "9a1b", "playhead_time": "2000"}
+        assert fields.select("mux", "pause", mux) == {}
+
+    def test_record_fields(self):
+        """Test selected fields are attached to event records, payloads decoded once."""
+        parser = LogParser()
+        records = list(parser.iter_records(FIXTURE_LOG, fields=EventFields(MonitorConfig.load())))
+
+        progress = [r for r in records if r.name == "playbackProgressEvent"][0]
+        assert progress.fields == {
+            "playbackSessionId": "cbbae0c3-6253-4b91-82d7-0fa4a69f9e52",
+            "playheaddata.contentplayheadms": "1000",
+            "playheaddata.streamplayheadms": "1000",
+        }
+        statechange = [r for r in records if r.name == "beam.events.playback.statechange_1.4"][0]
+        assert statechange.fields["stateChange.action"] == "PLAYER_EXIT"
+        viewstart = [r for r in records if r.name == "viewstart"][0]
+        assert viewstart.fields["view_start"] == "1733602522000"
+        assert all(r.fields is None for r in records if r.name == "")
+
+
+class TestPSDKEventMonitor:
+    """Test cases for PSDKEventMonitor class."""
+
+    def test_lifecycle_boxes(self):
+        """Test player and playback lifecycle are tracked."""
+        output = run_fixture()
+
+        assert "PLAYER SESSION STARTED" in output
+        assert "PLAYBACK #1 STARTED" in output
+        assert "PLAYBACK SUMMARY" in output
+        assert "PLAYER SESSION ENDED" in output
+        assert "S1: cbbae0c3-6253-4b91-82d7-0fa4a69f9e52" in output
+
+    def test_content_metadata_validation(self):
+        """Test content load block is parsed and validated."""
+        output = run_fixture()
+
+        assert "Title: Barry" in output
+        # 'subtitle' wins over the later 'originalSubtitle' line
+        assert "Subtitle: Chapter One: Make Your Mark" in output
+        assert "Status: ✅ VALID (All fields present)" in output
+        assert output.count("✅ MATCH") == 2
+
+    def test_event_fields_in_columns(self):
+        """Test configured fields are shown for PSDK, ISDK and MUX events."""
+        output = run_fixture()
+
+        assert "└ playheaddata.streamplayheadms: 1000" in output
+        assert "└ playback.trigger: USER_INITIATED" in output
+        assert "├ view_session_id: 9a1b2c3d" in output
+
+    def test_errors_and_warnings_captured(self):
+        """Test errors and warnings during playback appear in the summary."""
+        output = run_fixture()
+
+        assert "Total Errors: 1" in output
+        assert "[BrightScript] roSGNode.CallFunc" in output
+        assert "[Roku] Type mismatch: in SetField" in output
+
+    def test_custom_pattern(self):
+        """Test custom patterns are shown as [CUSTOM] lines."""
+        output = run_fixture(custom_patterns=["Type mismatch"])
+        assert "[CUSTOM] WARNING: Type mismatch occurred in SetField" in output
+
+    def test_aborted_playback(self):
+        """Test a new playback without end event aborts the previous one."""
+        out = io.StringIO()
+        monitor = PSDKEventMonitor(MonitorConfig(), stream=out)
+        monitor.process_lines([
+            'PSDK:: key playbackInitiatedEvent value: {"playbackSessionId":"a"}',
+            'PSDK:: key playbackInitiatedEvent value: {"playbackSessionId":"b"}',
+        ])
+
+        output = ANSI_RE.sub("", out.getvalue())
+        assert "(Connected mid-stream - auto-created session)" in output
+        assert "PLAYBACK SESSION #1 ABORTED (no end event)" in output
+        assert monitor.playback_number == 2
+        assert monitor.playback_session_ids == ["a", "b"]
+
+
+def test_follow_file_yields_complete_lines(tmp_path):
+    """Test follow_file batches complete lines and holds partial ones."""
+    log_file = tmp_path / "roku.log"
+    log_file.write_text("line 1\nline 2\npartial")
+
+    batches = list(follow_file(log_file, poll_interval=0.01, stop_when_idle=0.05))
+
+    assert batches[0] == ["line 1", "line 2"]
+    assert batches[-1] == ["partial"]
@@ -2,10 +2,18 @@
 Tests for log parsing functionality.
 """
 
+import gzip
 import pytest
-from datetime import datetime
-from roku_psdk_log_instrument.parsers import LogParser
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from roku_psdk_log_instrument.parsers import LogParser, ParallelParser, RecordAssembler, RecordKind, columnar
+from roku_psdk_log_instrument.parsers.parallel import next_record_start, split_chunks
+from roku_psdk_log_instrument.parsers.timestamps import TimestampDecoder, datetime_ns
 from roku_psdk_log_instrument.models import LogEntry, LogLevel
+from roku_psdk_log_instrument.testing import playback_lines
+
+
+FIXTURE_LOG = Path(__file__).parent / "fixtures" / "psdk_session.log"
 
 
 class TestLogParser:
@@ -50,3 +58,342 @@ class TestLogParser:
         assert parser is not None
         assert parser.pattern is not None
 
+    
+    def test_iter_stream_is_lazy(self):
+        """Test iter_stream parses only the requested line range of an endless stream."""
+        parser = LogParser()
+        
+        def endless():
+            n = 0
+            while True:
+                n += 1
+                yield f"2024-11-16 10:30:45.{n:06d} [INFO] message {n}"
+        
+        entries = list(parser.iter_stream(endless(), start_line=5, end_line=7))
+        
+        assert [e.message for e in entries] == ["message 5", "message 6", "message 7"]
+        assert [e.metadata["line_number"] for e in entries] == [5, 6, 7]
+    
+    def test_line_window_starts_at_one(self, tmp_path):
+        """Test a start_line below 1 is rejected with a clear error."""
+        parser = LogParser()
+        log_file = tmp_path / "capture.log"
+        log_file.write_text("2024-11-16 10:30:45.000001 [INFO] message 1\n")
+        
+        for entries in (
+            parser.iter_stream(["line"], start_line=0),
+            parser.iter_file(log_file, start_line=0),
+            parser.iter_compact(log_file, start_line=-1),
+        ):
+            with pytest.raises(ValueError, match="start_line must be at least 1"):
+                list(entries)
+    
+    def test_iter_file_windows_and_batches(self, tmp_path):
+        """Test line windows, byte windows and batches cover the file exactly once."""
+        parser = LogParser()
+        log_file = tmp_path / "capture.log"
+        lines = [f"2024-11-16 10:30:45.{n:06d} [INFO] message {n}" for n in range(1, 101)]
+        log_file.write_text("\n".join(lines) + "\n")
+        
+        assert len(parser.parse_file(log_file)) == 100
+        assert [e.message for e in parser.iter_file(log_file, start_line=99)] == ["message 99", "message 100"]
+        
+        # Window edges fall mid-line; every line lands in exactly one window
+        size = log_file.stat().st_size
+        edges = [0, 1000, 2345, 4000, size]
+        messages = []
+        for start, end in zip(edges, edges[1:]):
+            for entry in parser.iter_file(log_file, start_offset=start, end_offset=end):
+                assert start <= entry.metadata["offset"] < end
+                messages.append(entry.message)
+        assert messages == [f"message {n}" for n in range(1, 101)]
+        
+        batches = list(parser.iter_batches(log_file, batch_size=30))
+        assert [len(batch) for batch in batches] == [30, 30, 30, 10]
+    
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_iter_columnar_matches_parse_file(self, tmp_path, monkeypatch, vectorized):
+        """Test columnar batches materialize the same entries as parse_file."""
+        if vectorized and columnar.np is None:
+            pytest.skip("NumPy is not installed")
+        if not vectorized:
+            monkeypatch.setattr(columnar, "np", None)
+        parser = LogParser()
+        log_file = tmp_path / "capture.log"
+        lines = [
+            f"2024-11-16 10:{n % 60:02d}:45.{n:03d} [{('INFO', 'DEBUG', 'ERROR')[n % 3]}] message {n}"
+            for n in range(1, 301)
+        ]
+        lines[10:10] = [
+            "continuation without timestamp",
+            "  2024-02-29 23:59:59.123456789 [WARNING]   spaced message \t\r",
+            "2024-02-30 10:00:00.000 [INFO] invalid date",
+            "2024-11-16  10:00:00.5 [info] lower-case level, two spaces",
+            "2024-11-16 10:00:00.000 [TRACE] unknown level",
+            "2024-11-16 10:00:00.000 [INFO]   ",
+            "2024-11-16 10:00:00.000 [ERROR] ünïcode \xff",
+            "",
+        ]
+        log_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        
+        batches = list(parser.iter_columnar(log_file, chunk_size=1024))
+        
+        assert len(batches) > 1
+        assert [e for batch in batches for e in batch.entries()] == parser.parse_file(log_file)
+    
+    def test_columnar_columns(self):
+        """Test timestamp, level, component and event columns of a batch."""
+        parser = LogParser()
+        data = (
+            b"2024-11-16 10:30:45.123 [ERROR] [PSDK::ISDK] key playbackStartEvent value: {}\n"
+            b"not a log line\n"
+            b"1970-01-01 00:00:01.5 [DEBUG] PSDK:: key playbackStartEvent\n"
+            b"2024-11-16 10:30:46.000 [INFO] [mux-analytics] viewstart\n"
+        )
+        
+        batch = parser.parse_batch(data, first_line=10)
+        
+        assert len(batch) == 3 and batch.line_count == 4
+        assert list(batch.line_numbers) == [10, 12, 13]
+        assert batch.timestamps[1] == 1_500_000_000
+        assert batch.timestamp(0) == datetime(2024, 11, 16, 10, 30, 45, 123000)
+        assert [batch.level(i) for i in range(3)] == [LogLevel.ERROR, LogLevel.DEBUG, LogLevel.INFO]
+        assert [batch.strings[c] for c in batch.components] == ["PSDK::ISDK", None, "mux-analytics"]
+        assert batch.events[0] == batch.events[1] != columnar.NO_STRING
+        assert batch.rows_with_event("playbackStartEvent") == [0, 1]
+        assert batch.message(2) == "[mux-analytics] viewstart"
+        
+        # A shared string table gives the same IDs across batches
+        later = parser.parse_batch(data, strings=batch.strings)
+        assert later.components[2] == batch.components[2]
+    
+    @pytest.mark.parametrize("collide", [False, True])
+    def test_columnar_strings_keep_nul_bytes(self, monkeypatch, collide):
+        """Test values that differ only in trailing NUL bytes get their own string IDs."""
+        if columnar.np is None:
+            pytest.skip("NumPy is not installed")
+        if collide:
+            # Every value hashes to its last eight bytes, so the exact comparison decides
+            monkeypatch.setattr(columnar, "_HASH_PRIME", 0)
+        components = [b"ab", b"ab\x00", b"ab\x00\x00", b"ab", b"cd\x00", b"component-one", b"component-two"]
+        data = b"".join(b"2024-11-16 10:30:45.123 [INFO] [" + name + b"] message\n" for name in components)
+        
+        batch = LogParser().parse_batch(data)
+        
+        assert [batch.strings[c] for c in batch.components] == [name.decode() for name in components]
+        assert batch.components[0] == batch.components[3]
+        assert len(set(batch.components.tolist())) == 6
+    
+    def test_parse_compact_matches_parse_line(self):
+        """Test compact entries convert to the LogEntry parse_line builds."""
+        parser = LogParser()
+        lines = [
+            "2024-11-16 10:30:45.123 [ERROR] [PSDK::ISDK] key playbackStartEvent value: {}",
+            "  2024-02-29 23:59:59.123456789 [warning]   spaced message \t\r",
+            "2024-11-16 10:00:00.000 [TRACE] unknown level",
+            "2024-02-30 10:00:00.000 [INFO] invalid date",
+            "continuation without timestamp",
+        ]
+        
+        for line_num, line in enumerate(lines, start=1):
+            compact = parser.parse_compact(line, line_num)
+            expected = parser.parse_line(line, line_num)
+            assert (compact.to_entry() if compact else None) == expected
+        
+        compact = parser.parse_compact(lines[0])
+        assert compact.timestamp_ns == 1731753045123000000
+        assert compact.component == "PSDK::ISDK" and compact.event == "playbackStartEvent"
+        assert compact.to_entry().metadata == {}
+        assert parser.parse_compact(lines[1]).timestamp_ns % 1000 == 789
+        assert parser.parse_compact(lines[2]).component is None
+    
+    def test_iter_compact_line_numbers_and_offsets(self, tmp_path):
+        """Test compact entries carry their line number and byte offset."""
+        parser = LogParser()
+        log_file = tmp_path / "capture.log"
+        lines = [f"2024-11-16 10:30:{n:02d}.000 [INFO] [mux-analytics] key viewstart ü {n}" for n in range(1, 21)]
+        lines.insert(5, "not a log line")
+        data = "\n".join(lines).encode("utf-8") + b"\n"
+        log_file.write_bytes(data)
+        
+        entries = list(parser.iter_compact(log_file))
+        
+        assert [e.to_entry().message for e in entries] == [e.message for e in parser.parse_file(log_file)]
+        for entry in entries:
+            assert data[entry.offset:].decode("utf-8").split("\n", 1)[0] == lines[entry.line_number - 1]
+        assert entries[5].line_number == 7
+        # Components and event names are interned, so equal names are one object
+        assert entries[0].component is entries[-1].component
+        assert entries[0].event is entries[-1].event
+        
+        window = list(parser.iter_compact(log_file, start_line=3, end_line=8))
+        assert [e.line_number for e in window] == [3, 4, 5, 7, 8]
+    
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_columnar_nanosecond_timestamps(self, monkeypatch, vectorized):
+        """Test both columnar paths keep every fraction digit of a timestamp."""
+        if vectorized and columnar.np is None:
+            pytest.skip("NumPy is not installed")
+        if not vectorized:
+            monkeypatch.setattr(columnar, "np", None)
+        data = (
+            b"2024-02-29 23:59:59.123456789 [INFO] nanoseconds\n"
+            b"2024-02-29 23:59:59.5 [INFO] same second\n"
+            b"2024-03-01 00:00:00.000 [INFO] next day\n"
+        )
+        
+        batch = LogParser().parse_batch(data)
+        
+        assert list(batch.timestamps) == [1709251199123456789, 1709251199500000000, 1709251200000000000]
+
+
+class TestParallelParser:
+    """Test cases for ParallelParser."""
+    
+    def test_split_keeps_multiline_records(self):
+        """Test chunks never start inside a content metadata block or payload."""
+        lines = playback_lines(progress_events=5)
+        lines.insert(12, "PSDK:: key playbackBufferingStartEvent value:")
+        lines.insert(13, '{"playbackSessionId":"s-1"}')
+        data = ("\n".join(lines * 3) + "\n").encode()
+        
+        bounds = split_chunks(data, 40)
+        
+        assert b"".join(data[start:end] for start, end in bounds) == data
+        firsts = {data[start:end].split(b"\n", 1)[0] for start, end in bounds}
+        assert b"Player Controller: Load {" in firsts
+        assert not [line for line in firsts if line[:1] in b" {}"]
+        assert next_record_start(data, 0) == 0
+        assert next_record_start(data, len(data) - 1) == len(data)
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_entries_and_stats_match_serial_parse(self, tmp_path, workers):
+        """Test ordered entries and merged statistics equal a serial parse."""
+        log_file = tmp_path / "capture.log"
+        levels = ["INFO", "DEBUG", "ERROR"]
+        lines = [
+            f"2024-11-16 10:{i // 60 % 60:02d}:{i % 60:02d}.{i % 1000:03d} [{levels[i % 3]}] {line}"
+            for i, line in enumerate(playback_lines(progress_events=300))
+        ]
+        log_file.write_text("\n".join(lines) + "\n")
+        parser = ParallelParser(workers=workers, chunk_size=4096)
+        
+        assert list(parser.iter_entries(log_file)) == LogParser().parse_file(log_file)
+        assert len(list(parser.iter_batches(log_file))) > 3
+        
+        stats = parser.stats(log_file)
+        assert stats.lines == stats.entries == len(lines)
+        assert stats.levels["ERROR"] == len(lines) // 3
+        assert stats.events["playbackProgressEvent"] == 300
+        assert stats.components["mux-analytics"] == 31
+        assert stats.to_dict()["earliest_ns"] < stats.to_dict()["latest_ns"]
+        
+        # A compressed log is read in order and its chunks are sent to the workers
+        compressed = tmp_path / "capture.log.gz"
+        compressed.write_bytes(gzip.compress(log_file.read_bytes()))
+        assert list(parser.iter_entries(compressed)) == LogParser().parse_file(log_file)
+
+
+class TestRecordAssembler:
+    """Test cases for RecordAssembler."""
+    
+    def test_fixture_records(self):
+        """Test records of a device log keep their kinds, names and line spans."""
+        parser = LogParser()
+        records = list(parser.iter_records(FIXTURE_LOG))
+        
+        assert sum(len(record.lines) for record in records) == len(FIXTURE_LOG.read_text().splitlines())
+        assert [(r.first_line, r.last_line) for r in records[:4]] == [(1, 1), (2, 2), (3, 13), (14, 14)]
+        
+        load = records[2]
+        assert load.kind is RecordKind.CONTENT_LOAD
+        assert load.lines[0] == "Player Controller: Load {" and load.lines[-1] == "}"
+        
+        buffering = [r for r in records if r.name == "playbackBufferingStartEvent"][0]
+        assert buffering.kind is RecordKind.PSDK_EVENT
+        assert buffering.last_line == buffering.first_line + 1
+        assert buffering.data()["bufferType"] == "rebuffer"
+        
+        isdk = [r for r in records if r.kind is RecordKind.ISDK_EVENT]
+        assert isdk[0].name == "beam.events.playback.initiated_3.3"
+        assert isdk[0].data()["content"]["editId"] == "fe840c63-2779-484f-aeaa-85fc1a8d2c2a"
+        assert [r.name for r in records if r.kind is RecordKind.MUX_EVENT] == ["viewstart", "playing"]
+        assert [r.kind for r in records].count(RecordKind.BRIGHTSCRIPT_ERROR) == 1
+        assert records[-1].name == "playerSessionEndEvent"
+    
+    def test_incremental_feed(self):
+        """Test records are released as soon as they cannot grow."""
+        assembler = RecordAssembler(first_line=10)
+        
+        assert assembler.feed("PSDK:: key playbackBufferingStartEvent value:\n") == []
+        assert assembler.feed('{"playbackSessionId":\n') == []
+        done = assembler.feed('"s-1"}\n')
+        assert [(r.kind, r.first_line, r.last_line) for r in done] == [(RecordKind.PSDK_EVENT, 10, 12)]
+        assert done[0].data() == {"playbackSessionId": "s-1"}
+        
+        assert assembler.feed("PSDK:: key playerSessionEndEvent value:") == []
+        done = assembler.feed("Texture manager: released 3 bitmaps")
+        assert [(r.kind, r.payload) for r in done] == [(RecordKind.PSDK_EVENT, ""), (RecordKind.LINE, "")]
+        
+        # An unterminated block is cut at max_lines
+        assembler = RecordAssembler(max_lines=3)
+        assert assembler.feed("Player Controller: Load {") == []
+        assert assembler.feed("    contentMetadata: {") == []
+        assert len(assembler.feed('        id: "c-1"')[0].lines) == 3
+        assert assembler.flush() == []
+    
+    def test_parallel_records_match_serial(self, tmp_path):
+        """Test records from a chunked parse equal a serial assembly."""
+        log_file = tmp_path / "device.log"
+        log_file.write_text("\n".join(playback_lines(progress_events=300)) + "\n")
+        serial = [(r.kind, r.first_line, r.lines) for r in LogParser().iter_records(log_file)]
+        
+        records = ParallelParser(workers=2, chunk_size=512).iter_records(log_file)
+        assert [(r.kind, r.first_line, r.lines) for r in records] == serial
+
+
+class TestTimestampDecoder:
+    """Test cases for TimestampDecoder."""
+    
+    def test_datetime_stamps_match_fromisoformat(self):
+        """Test cached-prefix decoding equals a full parse of every stamp."""
+        decoder = TimestampDecoder()
+        moment = datetime(2024, 2, 29, 23, 59, 58)
+        for step in range(2500):
+            moment += timedelta(milliseconds=7 * step % 997)
+            for stamp in (moment.isoformat(sep=" ", timespec="milliseconds"), moment.isoformat()):
+                assert decoder.decode(stamp) == datetime_ns(datetime.fromisoformat(stamp))
+    
+    def test_datetime_stamp_forms(self):
+        """Test fractions, separators, offsets and invalid stamps."""
+        decoder = TimestampDecoder()
+        
+        assert decoder.decode("2024-03-01 12:00:00.123456789") == 1709294400123456789
+        assert decoder.decode("2024-03-01T12:00:00.5") == 1709294400500000000
+        assert decoder.decode("2024-03-01 12:00:00") == 1709294400000000000
+        assert decoder.decode("2024-03-01 12:00:00,25") == 1709294400250000000
+        # Host receive times written by datetime.isoformat(), with a UTC offset
+        received = datetime(2024, 3, 1, 13, 0, 0, 250000, tzinfo=timezone(timedelta(hours=1)))
+        assert decoder.decode(received.isoformat()) == 1709294400250000000
+        for invalid in ("2024-02-30 12:00:00.1", "2024-03-01 12:00:60.1", "2024-03-01 12:00:00.1x", "PSDK::", ""):
+            assert decoder.decode(invalid) is None
+    
+    def test_clock_stamps_roll_over_midnight(self):
+        """Test HH:MM:SS.mmm stamps are placed on the base date and the days after it."""
+        decoder = TimestampDecoder(date(2024, 3, 1))
+        day = datetime_ns(datetime(2024, 3, 1))
+        
+        assert decoder.decode("23:59:59.999") == day + 86399 * 10 ** 9 + 999 * 10 ** 6
+        assert decoder.decode("23:59:59.5") == day + 86399 * 10 ** 9 + 500 * 10 ** 6
+        assert decoder.decode("00:00:00.001") == day + 86400 * 10 ** 9 + 10 ** 6
+        assert decoder.decode("00:00:01") == day + 86401 * 10 ** 9
+        assert decoder.decode("24:00:00.000") is None
+        assert decoder.decode("10:3a:45.1") is None
+    
+    def test_decode_line(self):
+        """Test the stamp a device or host line starts with is decoded."""
+        decoder = TimestampDecoder(date(1970, 1, 2))
+        
+        assert decoder.decode_line("00:00:01.250 [ERROR] BRIGHTSCRIPT: ERROR: x") == (86401 * 1000 + 250) * 10 ** 6
+        assert decoder.decode_line("2024-03-01 12:00:00 [INFO] message") == 1709294400000000000
+        assert decoder.decode_line("PSDK:: key playbackStartEvent") is None
@@ -0,0 +1,99 @@
+"""
+Tests for automatic reconnect and capture gap markers.
+"""
+
+import json
+import random
+import time
+import pytest
+from roku_psdk_log_instrument.telnet import RokuTelnetClient, SessionManager
+from roku_psdk_log_instrument.telnet.reconnect import (
+    ReconnectPolicy,
+    format_gap_marker,
+    parse_gap_marker,
+)
+
+
+class TestReconnectPolicy:
+    """Test cases for ReconnectPolicy class."""
+
+    def test_exponential_backoff_capped(self):
+        """Test delays grow exponentially up to max_delay without jitter."""
+        policy = ReconnectPolicy(initial_delay=1, max_delay=5, jitter=0, max_attempts=5)
+        assert list(policy.delays()) == [1, 2, 4, 5, 5]
+
+    def test_delay_after_many_attempts(self):
+        """Test a days-long outage keeps waiting max_delay instead of overflowing."""
+        policy = ReconnectPolicy(jitter=0)
+        assert policy.delay(1024) == policy.delay(10 ** 9) == 30.0
+
+    def test_jitter_stays_in_range(self):
+        """Test jitter spreads delays within the configured fraction."""
+        policy = ReconnectPolicy(initial_delay=10, jitter=0.2, rng=random.Random(1))
+        delays = [policy.delay(0) for _ in range(100)]
+        assert all(8 <= d <= 12 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_gap_marker_round_trip(self):
+        """Test gap markers can be parsed back."""
+        gap = {"start": "2024-11-16T14:30:22", "duration": 1.5, "attempts": 2}
+        line = format_gap_marker(gap)
+        assert line.startswith("[CAPTURE_GAP] ")
+        assert parse_gap_marker(line) == gap
+        assert parse_gap_marker("PSDK:: key playerSessionCreateEvent") is None
+
+
+class TestCaptureReconnect:
+    """Test reconnect during capture against a loopback server."""
+
+    def test_reconnects_into_same_file(self, tmp_path, loopback_server):
+        """Test a dropped connection is re-established and a gap is recorded."""
+        server = loopback_server()
+        manager = SessionManager(base_path=tmp_path)
+        session = manager.create_session(server.host, server.port)
+        log_file = manager.get_session_log_path(session)
+
+        client = RokuTelnetClient(server.host, server.port)
+        assert client.connect()
+        policy = ReconnectPolicy(initial_delay=0.05, jitter=0, max_attempts=20)
+        client.start_capture_async(
+            log_file,
+            reconnect=policy,
+            on_gap=lambda gap: manager.record_gap(session, gap),
+        )
+
+        server.send(b"before outage\n")
+        time.sleep(0.1)
+        server.drop()
+        assert server.wait_for_connection()
+        server.send(b"after outage\n")
+        time.sleep(0.3)
+        client.disconnect()
+
+        lines = log_file.read_text().splitlines()
+        assert lines[0] == "before outage"
+        assert lines[2] == "after outage"
+        gap = parse_gap_marker(lines[1])
+        assert gap["recovered"] is True
+        assert gap["attempts"] >= 1
+        assert gap["reason"] == "connection closed by device"
+
+        saved = json.loads((log_file.parent / "session_info.json").read_text())
+        assert saved["gaps"] == [gap]
+        assert server.connections == 2
+
+    def test_gives_up_after_max_attempts(self, tmp_path, loopback_server):
+        """Test capture ends with an unrecovered gap when the device stays down."""
+        server = loopback_server()
+        client = RokuTelnetClient(server.host, server.port)
+        assert client.connect()
+        assert server.wait_for_connection()
+        server.close()
+
+        policy = ReconnectPolicy(initial_delay=0.01, jitter=0, max_attempts=3)
+        client.capture_logs(tmp_path / "capture.log", reconnect=policy, max_duration=5)
+
+        assert len(client.gaps) == 1
+        assert client.gaps[0]["recovered"] is False
+        assert client.gaps[0]["attempts"] == 3
+        client.disconnect()
@@ -0,0 +1,98 @@
+"""
+Tests for the session retention manager.
+"""
+
+import time
+from datetime import datetime, timedelta
+from roku_psdk_log_instrument.telnet import SessionManager
+from roku_psdk_log_instrument.telnet.retention import RetentionManager, RetentionPolicy
+
+
+def make_session(manager, host, days_ago, size, compressed=False, status="completed"):
+    """Create a backdated session holding size bytes of logs."""
+    session = manager.create_session(host)
+    session["start_time"] = (datetime.now() - timedelta(days=days_ago)).isoformat()
+    name = session["log_file"] + (".00001.gz" if compressed else "")
+    (session["directory"] / name).write_bytes(b"x" * size)
+    if status == "completed":
+        manager.end_session(session, line_count=1)
+    else:
+        manager.record_gap(session, {"reason": "test"})  # saves the backdated info
+    return session
+
+
+def ids(evictions):
+    """Session IDs of eviction dictionaries."""
+    return [eviction["session"]["session_id"] for eviction in evictions]
+
+
+class TestRetentionManager:
+    """Test cases for RetentionManager."""
+
+    def test_quota_evicts_compressed_first(self, tmp_path):
+        """Test the quota evicts compressed sessions before older raw ones."""
+        manager = SessionManager(base_path=tmp_path)
+        oldest = make_session(manager, "10.0.0.1", 5, 10_000)
+        older = make_session(manager, "10.0.0.1", 4, 10_000)
+        packed = make_session(manager, "10.0.0.1", 3, 10_000, compressed=True)
+        active = make_session(manager, "10.0.0.1", 6, 10_000, status="active")
+        make_session(manager, "10.0.0.1", 1, 10_000)
+
+        plan = RetentionManager(manager, RetentionPolicy(max_bytes=25_000)).plan()
+
+        assert ids(plan) == [packed["session_id"], oldest["session_id"], older["session_id"]]
+        assert all(eviction["reason"] == "quota" for eviction in plan)
+        assert active["session_id"] not in ids(plan)
+        # plan() is a dry run
+        assert manager.count_sessions() == 5
+
+    def test_age_and_per_host_limits(self, tmp_path):
+        """Test age and per-host limits, with active sessions counted but kept."""
+        manager = SessionManager(base_path=tmp_path)
+        stale = make_session(manager, "10.0.0.1", 30, 100)
+        extra = make_session(manager, "10.0.0.1", 3, 100)
+        kept = make_session(manager, "10.0.0.1", 2, 100)
+        make_session(manager, "10.0.0.1", 1, 100, status="active")
+        other = make_session(manager, "10.0.0.2", 2, 100)
+
+        policy = RetentionPolicy(max_per_host=2, max_age_days=7)
+        plan = RetentionManager(manager, policy).plan()
+
+        assert {e["session"]["session_id"]: e["reason"] for e in plan} == {
+            stale["session_id"]: "age",
+            extra["session_id"]: "host",
+        }
+        assert kept["session_id"] not in ids(plan)
+        assert other["session_id"] not in ids(plan)
+
+    def test_enforce_deletes_sessions(self, tmp_path):
+        """Test evicted sessions leave the disk, the catalog and the trash."""
+        manager = SessionManager(base_path=tmp_path)
+        old = make_session(manager, "10.0.0.1", 10, 100)
+        recent = make_session(manager, "10.0.0.1", 1, 100)
+        retention = RetentionManager(manager, RetentionPolicy(max_age_days=7))
+
+        evicted = retention.enforce()
+
+        assert ids(evicted) == [old["session_id"]]
+        assert evicted[0]["bytes"] >= 100
+        assert not old["directory"].exists()
+        assert not list(retention.trash_dir.iterdir())
+        assert ids({"session": s} for s in manager.list_sessions()) == [recent["session_id"]]
+        assert manager.cleanup_old_sessions(days=0) == 1
+
+    def test_background_thread(self, tmp_path):
+        """Test start() enforces the quota without blocking the caller."""
+        manager = SessionManager(base_path=tmp_path)
+        old = make_session(manager, "10.0.0.1", 2, 5_000)
+        make_session(manager, "10.0.0.1", 1, 5_000)
+        retention = RetentionManager(manager, RetentionPolicy(max_bytes=8_000))
+
+        retention.start(interval=0.05)
+        deadline = time.monotonic() + 5
+        while old["directory"].exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        retention.stop()
+
+        assert not old["directory"].exists()
+        assert manager.count_sessions() == 1
@@ -0,0 +1,183 @@
+"""
+Tests for log rotation, segment archival and reading rotated sessions.
+"""
+
+import gzip
+import json
+import threading
+import time
+import pytest
+from roku_psdk_log_instrument.monitor.follow import follow_file
+from roku_psdk_log_instrument.parsers.log_parser import LogParser
+from roku_psdk_log_instrument.telnet import (
+    FlushPolicy,
+    RawSessionLogWriter,
+    RokuTelnetClient,
+    RotationPolicy,
+    SessionLogWriter,
+    SessionManager,
+    open_session_log,
+)
+
+
+def rotated_session(tmp_path, lines, rotation, writer_class=SessionLogWriter):
+    """Write lines into a new session with rotation and return (manager, session, log_file)."""
+    manager = SessionManager(base_path=tmp_path)
+    session = manager.create_session("127.0.0.1")
+    log_file = manager.get_session_log_path(session)
+
+    writer = writer_class(
+        log_file,
+        FlushPolicy(max_bytes=0, max_interval=None),
+        rotation,
+        lambda segment: manager.record_segment(session, segment),
+    )
+    for line in lines:
+        writer.write_line(line)
+    writer.close()
+    return manager, session, log_file
+
+
+class TestRotation:
+    """Test cases for SessionLogWriter rotation."""
+
+    def test_rotate_by_size_and_compress(self, tmp_path):
+        """Test segments are closed by size, gzipped and listed in the manifest."""
+        lines = [f"PSDK:: line {i:07d}" for i in range(100)]  # 20 bytes each
+        _, session, log_file = rotated_session(tmp_path, lines, RotationPolicy(max_bytes=400))
+
+        info = json.loads((log_file.parent / "session_info.json").read_text())
+        segments = info["segments"]
+        assert [s["index"] for s in segments] == [1, 2, 3, 4, 5]
+        assert all(s["compressed"] and s["file"].endswith(".log.gz") for s in segments)
+        assert all(s["lines"] == 20 and s["bytes"] == 400 for s in segments)
+
+        first = gzip.decompress((log_file.parent / segments[0]["file"]).read_bytes())
+        assert first.decode().splitlines() == lines[:20]
+        # Uncompressed copies are removed once archived
+        assert not list(log_file.parent.glob("*.000*.log"))
+
+    def test_rotate_by_age(self, tmp_path):
+        """Test a segment is closed once it is older than max_age."""
+        log_file = tmp_path / "roku.log"
+        writer = SessionLogWriter(
+            log_file,
+            FlushPolicy(max_bytes=0, max_interval=None),
+            RotationPolicy(max_age=0.05, compress=False),
+        )
+        writer.write_line("first")
+        time.sleep(0.1)
+        writer.write_line("second")
+        writer.close()
+
+        assert writer.rotations == 1
+        assert (tmp_path / "roku.00001.log").read_text() == "first\nsecond\n"
+        assert log_file.read_text() == ""
+
+    def test_session_reads_as_one_stream(self, tmp_path):
+        """Test segments and the active log read back as one stream."""
+        lines = [f"PSDK:: line {i:04d}" for i in range(110)]
+        _, _, log_file = rotated_session(tmp_path, lines, RotationPolicy(max_bytes=400))
+
+        with open_session_log(log_file) as f:
+            assert f.read().splitlines() == lines
+        with open_session_log(log_file.parent) as f:
+            assert f.read().splitlines() == lines
+
+    def test_raw_segments_concatenate_exactly(self, tmp_path):
+        """Test raw segments split mid-line still concatenate to the original bytes."""
+        manager = SessionManager(base_path=tmp_path)
+        session = manager.create_session("127.0.0.1")
+        log_file = manager.get_session_log_path(session)
+        payload = b"".join(b"PSDK:: \xff line %d\r\n" % i for i in range(200))
+
+        writer = RawSessionLogWriter(
+            log_file,
+            FlushPolicy(max_bytes=0, max_interval=None),
+            RotationPolicy(max_bytes=1000),
+            lambda segment: manager.record_segment(session, segment),
+        )
+        for i in range(0, len(payload), 333):
+            writer.write_bytes(payload[i:i + 333])
+        writer.close()
+
+        assert writer.rotations > 1
+        with open_session_log(log_file, binary=True) as f:
+            assert f.read() == payload
+
+    def test_parse_file_reads_all_segments(self, tmp_path):
+        """Test LogParser.parse_file sees every segment of a rotated session."""
+        lines = [f"2024-11-16 14:30:{i % 60:02d}.000 [INFO] message {i}" for i in range(90)]
+        _, _, log_file = rotated_session(tmp_path, lines, RotationPolicy(max_bytes=1000))
+
+        entries = LogParser().parse_file(log_file.parent)
+        assert [e.message for e in entries] == [f"message {i}" for i in range(90)]
+
+
+class TestFollowRotation:
+    """Test the monitor's follower across rotations."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_follow_reopens_rotated_log(self, tmp_path, compress):
+        """Test follow_file keeps reading after the log is rotated under it."""
+        log_file = tmp_path / "roku.log"
+        writer = SessionLogWriter(
+            log_file,
+            FlushPolicy(max_bytes=0, max_interval=None),
+            RotationPolicy(max_bytes=300, compress=compress),
+        )
+        lines = [f"PSDK:: line {i:04d}" for i in range(200)]
+
+        def produce():
+            for i, line in enumerate(lines):
+                writer.write_line(line)
+                if i % 20 == 0:
+                    time.sleep(0.01)
+            writer.close()
+
+        received = []
+        producer = threading.Thread(target=produce)
+        producer.start()
+        for batch in follow_file(log_file, poll_interval=0.005, stop_when_idle=0.5):
+            received.extend(batch)
+        producer.join()
+
+        assert writer.rotations > 5
+        assert received == lines
+
+    def test_follow_replays_archived_segments(self, tmp_path):
+        """Test following from the start replays segments before the active log."""
+        lines = [f"PSDK:: line {i:04d}" for i in range(110)]
+        _, _, log_file = rotated_session(tmp_path, lines, RotationPolicy(max_bytes=400))
+
+        received = []
+        for batch in follow_file(log_file, poll_interval=0.01, stop_when_idle=0.1):
+            received.extend(batch)
+        assert received == lines
+
+
+def test_capture_logs_rotates_into_manifest(tmp_path, loopback_server):
+    """Test capture_logs records rotated segments in session_info.json."""
+    server = loopback_server()
+    manager = SessionManager(base_path=tmp_path)
+    session = manager.create_session(server.host, server.port)
+    log_file = manager.get_session_log_path(session)
+
+    client = RokuTelnetClient(server.host, server.port)
+    assert client.connect()
+    server.send(b"".join(b"PSDK:: line %04d\n" % i for i in range(5000)))
+    server.close()
+    client.capture_logs(
+        log_file,
+        max_duration=5,
+        flush_policy=FlushPolicy(max_bytes=4096),
+        rotation=RotationPolicy(max_bytes=16 * 1024),
+        on_segment=lambda segment: manager.record_segment(session, segment),
+    )
+    client.disconnect()
+
+    info = json.loads((log_file.parent / "session_info.json").read_text())
+    assert len(info["segments"]) >= 4
+    assert all(s["compressed"] for s in info["segments"])
+    with open_session_log(log_file) as f:
+        assert f.read().splitlines() == [f"PSDK:: line {i:04d}" for i in range(5000)]
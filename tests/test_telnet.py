@@ -121,3 +121,67 @@ class TestSessionManager:
         assert len(active_sessions) == 1
         assert active_sessions[0]["host"] == "192.168.1.101"
 
+
+
+class TestClientSyscalls:
+    """Test socket syscall usage of RokuTelnetClient against a loopback server."""
+    
+    def test_capture_syscalls_per_line(self, tmp_path, loopback_server):
+        """Test capture makes far fewer than one socket syscall per line."""
+        server = loopback_server()
+        client = RokuTelnetClient(server.host, server.port)
+        assert client.connect()
+        mode_calls = client.stats.mode
+        
+        server.send(b"".join(b"[PLAYER_SDK] line %d\n" % i for i in range(5000)))
+        server.close()
+        
+        client.capture_logs(tmp_path / "capture.log", max_duration=5)
+        
+        assert client.stats.lines == 5000
+        assert client.stats.syscalls_per_line() < 0.1
+        # Socket mode is set once at connect, never per read
+        assert client.stats.mode == mode_calls
+        assert len((tmp_path / "capture.log").read_text().splitlines()) == 5000
+        client.disconnect()
+    
+    def test_eof_marks_disconnected(self, loopback_server):
+        """Test an orderly close by the device is detected from recv."""
+        server = loopback_server()
+        client = RokuTelnetClient(server.host, server.port)
+        assert client.connect()
+        
+        server.send(b"last line\n")
+        server.close()
+        
+        assert client.read_line(timeout=1.0) == "last line"
+        assert client.is_connected() is True
+        assert client.read_line(timeout=1.0) is None
+        assert client.is_connected() is False
+        client.disconnect()
+    
+    def test_connection_reset_marks_disconnected(self, loopback_server):
+        """Test ECONNRESET is detected from recv."""
+        server = loopback_server()
+        client = RokuTelnetClient(server.host, server.port)
+        assert client.connect()
+        
+        server.reset()
+        
+        assert client.read_lines(timeout=1.0) is None
+        assert client.is_connected() is False
+        assert client.send_command("help") is False
+        client.disconnect()
+    
+    def test_is_connected_makes_no_syscalls(self, loopback_server):
+        """Test liveness checks do not touch the socket."""
+        server = loopback_server()
+        client = RokuTelnetClient(server.host, server.port)
+        assert client.connect()
+        before = client.stats.syscalls
+        
+        for _ in range(100):
+            assert client.is_connected()
+        
+        assert client.stats.syscalls == before
+        client.disconnect()
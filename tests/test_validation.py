@@ -4,8 +4,19 @@ Tests for log validation functionality.
 
 import pytest
 from datetime import datetime
-from roku_psdk_log_instrument.validation import LogValidator, ValidationResult
+from roku_psdk_log_instrument.validation import LogValidator, OnlineValidator, ValidationResult
 from roku_psdk_log_instrument.models import LogEntry, LogLevel
+from roku_psdk_log_instrument.monitor import MonitorConfig
+from roku_psdk_log_instrument.telnet.reconnect import format_gap_marker
+from roku_psdk_log_instrument.testing import playback_lines
+
+
+def broken_playback(seed: int) -> list:
+    """Playback lines with an invalid contentType, no title and a foreign editId."""
+    lines = playback_lines(progress_events=3, seed=seed)
+    lines = [line for line in lines if "title:" not in line]
+    lines = [line.replace('contentType: "episode"', 'contentType: "documentary"') for line in lines]
+    return [line.replace('"editId":"', '"editId":"other-') for line in lines]
 
 
 class TestLogValidator:
@@ -60,3 +71,160 @@ class TestLogValidator:
         
         assert result.success_rate == 90.0
 
+    
+    def test_validate_stream(self):
+        """Test validating a generator of entries keeps a bounded error list."""
+        class RejectAll(LogValidator):
+            def validate_entry(self, entry):
+                return False
+        
+        entries = (
+            LogEntry(timestamp=datetime.now(), level=LogLevel.INFO, message=f"Message {n}")
+            for n in range(50)
+        )
+        
+        result = RejectAll().validate_stream(entries, max_errors=10)
+        
+        assert result.total_entries == 50
+        assert result.valid_entries == 0
+        assert result.is_valid is False
+        assert len(result.errors) == 10
+    
+    def test_validate_file(self, tmp_path):
+        """Test validating a file streams its parsed entries."""
+        log_file = tmp_path / "capture.log"
+        log_file.write_text("2024-11-16 10:30:45.123 [INFO] one\nnot a log line\n2024-11-16 10:30:46.123 [ERROR] two\n")
+        
+        result = LogValidator().validate_file(log_file)
+        
+        assert result.total_entries == 2
+        assert result.valid_entries == 2
+    
+    def test_validate_entry_checks_enum_values(self):
+        """Test entries with a playbackType or contentType outside the enums are invalid."""
+        validator = LogValidator(config=MonitorConfig())
+        
+        def entry(message):
+            return LogEntry(timestamp=datetime.now(), level=LogLevel.INFO, message=message)
+        
+        assert validator.validate_entry(entry('PSDK:: key playbackInitiatedEvent value: {"playbackType":"AUTO"}'))
+        assert not validator.validate_entry(entry('PSDK:: key playbackInitiatedEvent value: {"playbackType":"bogus"}'))
+        assert not validator.validate_entry(entry('value: {"contentType":"documentary"}'))
+    
+    def test_validate_session_lines(self):
+        """Test each playback session gets its own result in one pass."""
+        validator = LogValidator(config=MonitorConfig())
+        cut_short = playback_lines(progress_events=3, seed=20)[:-2]
+        lines = playback_lines(progress_events=3) + broken_playback(10) + cut_short + playback_lines(progress_events=3, seed=30)
+        
+        results = list(validator.validate_session_lines(lines))
+        
+        assert [r.session_number for r in results] == [1, 2, 3, 4]
+        valid, broken, aborted, last = results
+        assert valid.is_valid and valid.errors == [] and valid.warnings == []
+        assert valid.session_id == "00000000-0000-0000-0000-000000000001"
+        assert valid.total_entries == valid.valid_entries == 11
+        assert (valid.first_line, valid.event_count) == (12, 4)
+        assert lines[valid.last_line - 1].startswith("PSDK:: key playbackSessionEndEvent")
+        
+        assert not broken.is_valid
+        assert broken.errors[:2] == ["Missing required field: title", "Invalid contentType: 'documentary'"]
+        assert "content.editId ↔ metadata.id: MISMATCH" in broken.errors[2]
+        assert broken.valid_entries == broken.total_entries - 3
+        
+        # Cut short by the next player: a warning, or an error in strict mode
+        assert aborted.is_valid
+        assert aborted.warnings == ["Playback ended without playbackSessionEndEvent"]
+        strict = list(LogValidator(strict=True, config=MonitorConfig()).validate_session_lines(lines))
+        assert strict[2].errors == aborted.warnings
+        assert last.is_valid
+    
+    def test_long_content_load_block(self):
+        """Test metadata past the assembler's record cap still reaches the session."""
+        lines = playback_lines(progress_events=3)
+        start = lines.index("    contentMetadata: {") + 1
+        lines[start:start] = [f'        extraField{i}: "value {i}"' for i in range(70)]
+        validator = LogValidator(config=MonitorConfig())
+        
+        result, = validator.validate_session_lines(lines)
+        
+        assert result.is_valid and result.errors == [] and result.warnings == []
+        online = OnlineValidator(validator)
+        assert [r for line in lines for r in online.feed(line)] == [result]
+    
+    def test_validate_sessions_file(self, tmp_path):
+        """Test validating a capture file and a schema that disables the enums."""
+        log_file = tmp_path / "capture.log"
+        log_file.write_text("\n".join(playback_lines(progress_events=3) + broken_playback(10)) + "\n")
+        schema = {"content_metadata": {"validation": {"content_type_enum": {"enabled": False}}}}
+        
+        results = list(LogValidator(schema=schema).validate_sessions(log_file))
+        
+        assert [r.is_valid for r in results] == [True, False]
+        assert not any("contentType" in error for error in results[1].errors)
+
+
+
+class TestOnlineValidator:
+    """Test cases for OnlineValidator class."""
+    
+    def test_verdict_on_end_line(self):
+        """Test each verdict arrives with the line that ends its session, as in a full pass."""
+        validator = LogValidator(config=MonitorConfig())
+        lines = playback_lines(progress_events=3) + broken_playback(10) + playback_lines(progress_events=3, seed=20)[:-2]
+        online = OnlineValidator(validator)
+        
+        verdicts = {}
+        for number, line in enumerate(lines, 1):
+            for result in online.feed(line):
+                verdicts[number] = result
+        results = list(verdicts.values()) + online.finish()
+        
+        assert [lines[number - 1].split(" value:")[0] for number in verdicts] == ["PSDK:: key playbackSessionEndEvent"] * 2
+        assert results == list(validator.validate_session_lines(lines))
+        assert [r.is_valid for r in results] == [True, False, True]
+        
+        stats = online.stats()
+        assert stats["lines"] == len(lines)
+        assert (stats["sessions"], stats["invalid"], stats["skipped"]) == (3, 1, 0)
+        assert 0 < stats["mean_line_ns"] <= stats["max_line_ns"]
+        assert stats["busy_ns"] >= stats["max_line_ns"]
+    
+    def test_skip_cuts_session_short(self):
+        """Test skipped lines cut the open session short and keep line numbers aligned."""
+        lines = playback_lines(progress_events=3)
+        end = next(i for i, line in enumerate(lines) if "playbackSessionEndEvent" in line)
+        online = OnlineValidator(LogValidator(config=MonitorConfig()))
+        for line in lines[:end - 2]:
+            assert online.feed(line) == []
+        
+        cut, = online.skip(2)
+        
+        assert cut.warnings == [
+            "Playback ended without playbackSessionEndEvent",
+            "2 line(s) skipped, session only partly validated",
+        ]
+        assert online.feed(lines[end]) == []
+        after = lines[end + 1:] + playback_lines(progress_events=3, seed=20)
+        verdicts = [result for line in after for result in online.feed(line)]
+        
+        # Line numbers still count the skipped lines
+        assert [r.first_line for r in verdicts] == [len(lines) + 12]
+        assert online.stats()["skipped"] == 2
+    
+    def test_capture_gap_cuts_session_short(self):
+        """Test a reconnect gap marker cuts the open session short, in order with the lines."""
+        lines = playback_lines(progress_events=3)
+        end = next(i for i, line in enumerate(lines) if "playbackSessionEndEvent" in line)
+        gap = {"start": "2024-11-16T14:30:22", "duration": 12.5, "attempts": 3, "recovered": True}
+        lines.insert(end - 1, format_gap_marker(gap))
+        online = OnlineValidator(LogValidator(config=MonitorConfig()))
+        
+        results = [result for line in lines for result in online.feed(line)] + online.finish()
+        
+        cut, = results
+        assert cut.last_line == end - 1
+        assert cut.warnings == [
+            "Playback ended without playbackSessionEndEvent",
+            "1 capture gap(s) during session, lines may be missing",
+        ]
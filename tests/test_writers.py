@@ -0,0 +1,199 @@
+"""
+Tests for buffered session log writers.
+"""
+
+import time
+import pytest
+from roku_psdk_log_instrument.telnet import (
+    FlushPolicy,
+    RawSessionLogWriter,
+    RokuTelnetClient,
+    SessionLogWriter,
+)
+from roku_psdk_log_instrument.telnet.reconnect import ReconnectPolicy
+
+
+class TestSessionLogWriter:
+    """Test cases for SessionLogWriter class."""
+
+    def test_flush_by_size(self, tmp_path):
+        """Test lines are written in one batch once max_bytes is reached."""
+        log_file = tmp_path / "roku.log"
+        writer = SessionLogWriter(log_file, FlushPolicy(max_bytes=100, max_interval=None))
+
+        for i in range(9):
+            writer.write_line(f"line {i:04d}")  # 10 bytes with newline
+        assert log_file.read_text() == ""
+
+        writer.write_line("line 0009")
+        assert len(log_file.read_text().splitlines()) == 10
+        assert writer.flushes == 1
+        writer.close()
+
+    def test_flush_by_interval(self, tmp_path):
+        """Test pending lines become visible after max_interval."""
+        log_file = tmp_path / "roku.log"
+        writer = SessionLogWriter(log_file, FlushPolicy(max_bytes=None, max_interval=0.05))
+
+        writer.write_lines(["a", "b"])
+        assert writer.maybe_flush() is False
+        assert 0 < writer.next_flush_in() <= 0.05
+
+        time.sleep(0.06)
+        assert writer.maybe_flush() is True
+        assert log_file.read_text() == "a\nb\n"
+        assert writer.next_flush_in() is None
+        writer.close()
+
+    def test_close_flushes_and_reports_stats(self, tmp_path):
+        """Test close writes pending data, fsyncs and reports stats."""
+        log_file = tmp_path / "roku.log"
+        with SessionLogWriter(log_file, FlushPolicy(fsync_on_close=True)) as writer:
+            writer.write_lines(["héllo", "world"])
+
+        assert log_file.read_text(encoding="utf-8") == "héllo\nworld\n"
+        assert writer.stats() == {
+            "lines_written": 2,
+            "bytes_written": len("héllo\nworld\n".encode("utf-8")),
+            "flushes": 1,
+            "fsyncs": 1,
+            "rotations": 0,
+        }
+
+    def test_per_line_policy(self, tmp_path):
+        """Test the per-line policy flushes every line."""
+        writer = SessionLogWriter(tmp_path / "roku.log", FlushPolicy.per_line())
+        writer.write_line("a")
+        writer.write_line("b")
+        assert writer.flushes == 2
+        writer.close()
+
+
+class TestRawSessionLogWriter:
+    """Test cases for RawSessionLogWriter class."""
+
+    def test_bytes_written_unchanged(self, tmp_path):
+        """Test chunks are written byte for byte, split lines included."""
+        log_file = tmp_path / "roku.log"
+        writer = RawSessionLogWriter(log_file, FlushPolicy(max_interval=None))
+
+        assert writer.write_bytes(b"PSDK:: a\r\nPSDK:: \xff") == 1
+        assert writer.write_bytes(memoryview(b"b\r\n\r\n")) == 2
+        writer.close()
+
+        assert log_file.read_bytes() == b"PSDK:: a\r\nPSDK:: \xffb\r\n\r\n"
+        assert writer.stats()["lines_written"] == 3
+
+    def test_text_line_starts_new_line(self, tmp_path):
+        """Test a text line after a partial chunk does not join it."""
+        log_file = tmp_path / "roku.log"
+        writer = RawSessionLogWriter(log_file, FlushPolicy(max_interval=None))
+
+        writer.write_bytes(b"partial")
+        writer.write_line("[CAPTURE_GAP] {}")
+        writer.write_bytes(b"next\n")
+        writer.close()
+
+        assert log_file.read_bytes() == b"partial\n[CAPTURE_GAP] {}\nnext\n"
+
+    def test_flush_by_size(self, tmp_path):
+        """Test chunks are written in one batch once max_bytes is reached."""
+        log_file = tmp_path / "roku.log"
+        writer = RawSessionLogWriter(log_file, FlushPolicy(max_bytes=100, max_interval=None))
+
+        writer.write_bytes(b"x" * 60)
+        assert writer.flushes == 0
+        writer.write_bytes(b"x" * 60)
+        assert writer.flushes == 1
+        assert log_file.stat().st_size == 120
+        writer.close()
+
+
+def test_capture_logs_batches_writes(tmp_path, loopback_server):
+    """Test capture_logs writes a burst with far fewer flushes than lines."""
+    server = loopback_server()
+    client = RokuTelnetClient(server.host, server.port)
+    assert client.connect()
+
+    server.send(b"".join(b"PSDK:: line %d\n" % i for i in range(2000)))
+    server.close()
+    client.capture_logs(tmp_path / "capture.log", max_duration=5)
+
+    assert client.writer_stats["lines_written"] == 2000
+    assert client.writer_stats["flushes"] < 200
+    client.disconnect()
+
+
+def test_capture_logs_flushes_idle_lines(tmp_path, loopback_server):
+    """Test a line is visible to tail within the flush interval while idle."""
+    server = loopback_server()
+    client = RokuTelnetClient(server.host, server.port)
+    assert client.connect()
+    log_file = tmp_path / "capture.log"
+
+    client.start_capture_async(log_file, flush_policy=FlushPolicy(max_interval=0.05))
+    server.send(b"PSDK:: key playerSessionCreateEvent\n")
+
+    deadline = time.monotonic() + 0.5
+    while time.monotonic() < deadline and not (log_file.exists() and log_file.read_text()):
+        time.sleep(0.01)
+
+    assert log_file.read_text() == "PSDK:: key playerSessionCreateEvent\n"
+    client.disconnect()
+
+
+def test_raw_capture_preserves_bytes(tmp_path, loopback_server):
+    """Test raw capture stores exactly what the device sent."""
+    server = loopback_server()
+    client = RokuTelnetClient(server.host, server.port)
+    assert client.connect()
+    payload = b"".join(b"PSDK:: line %d \xe2\x82\r\n\r\n" % i for i in range(500))
+
+    server.send(payload + b"unterminated")
+    server.close()
+    client.capture_logs(tmp_path / "capture.log", max_duration=5, raw=True)
+
+    assert (tmp_path / "capture.log").read_bytes() == payload + b"unterminated"
+    # Nothing was decoded without a callback
+    assert client.stats.lines == 0
+    client.disconnect()
+
+
+def test_raw_capture_decodes_for_callback(tmp_path, loopback_server):
+    """Test raw capture still hands decoded lines to a callback."""
+    server = loopback_server()
+    client = RokuTelnetClient(server.host, server.port)
+    assert client.connect()
+    payload = b"PSDK:: a\r\n\r\n\xffPSDK:: b\r\n"
+    seen = []
+
+    server.send(payload)
+    server.close()
+    client.capture_logs(tmp_path / "capture.log", callback=seen.append, max_duration=5, raw=True)
+
+    assert seen == ["PSDK:: a", "PSDK:: b"]
+    assert (tmp_path / "capture.log").read_bytes() == payload
+    client.disconnect()
+
+
+def test_raw_capture_gap_marker_on_new_line(tmp_path, loopback_server):
+    """Test a gap marker after a line cut off by a disconnect starts a new line."""
+    server = loopback_server()
+    client = RokuTelnetClient(server.host, server.port)
+    assert client.connect()
+    log_file = tmp_path / "capture.log"
+
+    policy = ReconnectPolicy(initial_delay=0.05, jitter=0, max_attempts=20)
+    client.start_capture_async(log_file, reconnect=policy, raw=True)
+    server.send(b"PSDK:: cut off")
+    time.sleep(0.2)
+    server.drop()
+    assert server.wait_for_connection()
+    server.send(b"PSDK:: after\r\n")
+    time.sleep(0.3)
+    client.disconnect()
+
+    lines = log_file.read_bytes().split(b"\n")
+    assert lines[0] == b"PSDK:: cut off"
+    assert lines[1].startswith(b"[CAPTURE_GAP] ")
+    assert lines[2] == b"PSDK:: after\r"